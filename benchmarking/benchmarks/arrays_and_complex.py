@@ -0,0 +1,155 @@
+"""
+This module contains code used for benchmarking the speed of writing and
+reading array and complex valued data to and from the database used under
+the QCoDeS dataset. These values are stored as binary blobs, hence the
+benchmarks mainly measure the cost of the sqlite adapters and converters.
+"""
+import shutil
+import tempfile
+import os
+import time
+
+import numpy as np
+
+import qcodes
+from qcodes import ManualParameter
+from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.experiment_container import new_experiment
+from qcodes.dataset.sqlite.database import initialise_database
+
+
+def _make_values(paramtype: str, n_values: int) -> np.ndarray:
+    values = np.random.rand(n_values)
+    if paramtype == 'complex':
+        values = values + 1j * np.random.rand(n_values)
+    return values
+
+
+class _ArraysAndComplexBase:
+    """
+    Common setup of a measurement of one dependent parameter on one setpoint
+    for the benchmarks of this module
+    """
+
+    # For these benchmarks, we can not reuse what is being set up in setup
+    # method, hence the number of iterations is limited to 1
+    number = 1
+
+    # In order to get more stable result, the following number of repeats is
+    # used; note that repeats include setting up and tearing down
+    repeat = 8
+
+    # These are the parameters of the benchmarks: n_values to write per
+    # add_results call, n_times to call add_results
+    # Dictionary of values is used instead of tuple of lists, because in the
+    # latter case asv will run the benchmark for all the combinations of the
+    # values
+    params = [
+        {'n_values': 1000, 'n_times': 100, 'paramtype': 'array'},
+        {'n_values': 100000, 'n_times': 1, 'paramtype': 'array'},
+        {'n_values': 1, 'n_times': 10000, 'paramtype': 'complex'},
+        {'n_values': 10000, 'n_times': 1, 'paramtype': 'complex'},
+    ]
+    # we are less interested in the cpu time used and more interested in
+    # the wall clock time used to insert the data so use a timer that measures
+    # wallclock time
+    timer = time.perf_counter
+
+    def __init__(self):
+        self.parameters = list()
+        self.values = list()
+        self.experiment = None
+        self.runner = None
+        self.datasaver = None
+        self.tmpdir = None
+
+    def setup(self, bench_param):
+        # Init DB
+        self.tmpdir = tempfile.mkdtemp()
+        qcodes.config["core"]["db_location"] = os.path.join(self.tmpdir,
+                                                            'temp.db')
+        qcodes.config["core"]["db_debug"] = False
+        initialise_database()
+
+        # Create experiment
+        self.experiment = new_experiment("test-experiment",
+                                         sample_name="test-sample")
+
+        # Create measurement
+        meas = Measurement(self.experiment)
+
+        x = ManualParameter('x')
+        y = ManualParameter('y')
+
+        meas.register_parameter(x, paramtype=bench_param['paramtype'])
+        meas.register_parameter(y, setpoints=[x],
+                                paramtype=bench_param['paramtype'])
+
+        self.parameters = [x, y]
+
+        # Create the Runner context manager
+        self.runner = meas.run()
+
+        # Enter Runner and create DataSaver
+        self.datasaver = self.runner.__enter__()
+
+        # Create values for parameters
+        for _ in range(len(self.parameters)):
+            self.values.append(_make_values(bench_param['paramtype'],
+                                            bench_param['n_values']))
+
+    def teardown(self, bench_param):
+        # Exit runner context manager
+        if self.runner:
+            self.runner.__exit__(None, None, None)
+            self.runner = None
+            self.datasaver = None
+
+        # Close DB connection
+        if self.experiment:
+            self.experiment.conn.close()
+            self.experiment = None
+
+        # Remove tmpdir with database
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir)
+            self.tmpdir = None
+
+        self.parameters = list()
+        self.values = list()
+
+    def _add_data(self, bench_param):
+        for _ in range(bench_param['n_times']):
+            self.datasaver.add_result(
+                (self.parameters[0], self.values[0]),
+                (self.parameters[1], self.values[1])
+            )
+        # force writing to database so that it is written before we exit
+        # the datasaver context manager
+        self.datasaver.flush_data_to_database()
+
+
+class WriteArraysAndComplex(_ArraysAndComplexBase):
+    """
+    This benchmark measures how much time it takes to save array and
+    complex valued data to the experiment database.
+    """
+
+    def time_write(self, bench_param):
+        """Writing array or complex data for 2 parameters"""
+        self._add_data(bench_param)
+
+
+class ReadArraysAndComplex(_ArraysAndComplexBase):
+    """
+    This benchmark measures how much time it takes to load array and
+    complex valued data from the experiment database.
+    """
+
+    def setup(self, bench_param):
+        super().setup(bench_param)
+        self._add_data(bench_param)
+
+    def time_read(self, bench_param):
+        """Reading array or complex data for 2 parameters"""
+        self.datasaver.dataset.get_parameter_data()
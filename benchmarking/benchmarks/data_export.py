@@ -0,0 +1,40 @@
+"""
+This module contains code used for benchmarking the detection of the plot
+type of 2D data and its reshaping onto a grid, as done when plotting a run.
+"""
+import numpy as np
+
+from qcodes.dataset.data_export import (datatype_from_setpoints_2d,
+                                        reshape_2D_data)
+
+
+class GridDetection:
+    """
+    Benchmarks of a square 2D sweep, complete and interrupted in the middle
+    of a row, with its points in the order of the sweep and shuffled.
+    """
+
+    params = ([100, 1000], [False, True])
+    param_names = ['n_points_per_axis', 'interrupted']
+
+    def setup(self, n_points_per_axis, interrupted):
+        axis = np.linspace(0, 1, n_points_per_axis)
+        x, y = (a.ravel() for a in np.meshgrid(axis, axis, indexing='ij'))
+        if interrupted:
+            n_points = len(x) - n_points_per_axis // 2
+            x, y = x[:n_points], y[:n_points]
+        self.x = x
+        self.y = y
+        self.z = np.random.rand(len(x))
+        order = np.random.permutation(len(x))
+        self.shuffled = (x[order], y[order])
+
+    def time_datatype_from_setpoints_2d(self, n_points_per_axis, interrupted):
+        datatype_from_setpoints_2d(self.x, self.y)
+
+    def time_datatype_from_shuffled_setpoints_2d(self, n_points_per_axis,
+                                                 interrupted):
+        datatype_from_setpoints_2d(*self.shuffled)
+
+    def time_reshape_2D_data(self, n_points_per_axis, interrupted):
+        reshape_2D_data(self.x, self.y, self.z)
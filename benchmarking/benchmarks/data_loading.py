@@ -0,0 +1,108 @@
+"""
+This module contains code used for benchmarking data loading speed of the
+database used under the QCoDeS dataset.
+"""
+import shutil
+import tempfile
+import os
+import time
+
+import numpy as np
+
+import qcodes
+from qcodes import ManualParameter
+from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.experiment_container import new_experiment
+from qcodes.dataset.sqlite.database import initialise_database
+
+
+class GetParameterData:
+    """
+    This benchmark measures how much time it takes to load the data of a run
+    from the experiment database. The runs are a 1D sweep and a 2D sweep of
+    scalar ('numeric') parameters, and a 1D sweep of an array parameter
+    with a scalar outer setpoint, which needs to be expanded on loading.
+    """
+
+    # Loading does not modify the database, hence the setup can be reused
+    number = 1
+    repeat = 8
+
+    # Dictionary of values is used instead of tuple of lists, because in the
+    # latter case asv will run the benchmark for all the combinations of the
+    # values
+    params = [
+        {'kind': '1D', 'n_points': 10**6},
+        {'kind': '2D', 'n_points': 1000},
+        {'kind': 'array', 'n_points': 1000},
+    ]
+    # we are less interested in the cpu time used and more interested in
+    # the wall clock time used to load the data so use a timer that measures
+    # wallclock time
+    timer = time.perf_counter
+
+    def __init__(self):
+        self.experiment = None
+        self.dataset = None
+        self.tmpdir = None
+
+    def setup(self, bench_param):
+        # Init DB
+        self.tmpdir = tempfile.mkdtemp()
+        qcodes.config["core"]["db_location"] = os.path.join(self.tmpdir,
+                                                            'temp.db')
+        qcodes.config["core"]["db_debug"] = False
+        initialise_database()
+
+        # Create experiment
+        self.experiment = new_experiment("test-experiment",
+                                         sample_name="test-sample")
+
+        meas = Measurement(self.experiment)
+
+        x = ManualParameter('x')
+        y = ManualParameter('y')
+        z = ManualParameter('z')
+
+        kind = bench_param['kind']
+        n_points = bench_param['n_points']
+
+        if kind == 'array':
+            meas.register_parameter(x)
+            meas.register_parameter(y, paramtype='array')
+            meas.register_parameter(z, setpoints=[x, y], paramtype='array')
+        else:
+            meas.register_parameter(x)
+            meas.register_parameter(y)
+            meas.register_parameter(z, setpoints=[x, y])
+
+        with meas.run() as datasaver:
+            if kind == '1D':
+                xs = np.linspace(0, 1, n_points)
+                datasaver.add_result((x, xs), (y, 0.0),
+                                     (z, np.random.rand(n_points)))
+            else:
+                # for the 'array' kind, each row holds one array of y and z
+                ys = np.linspace(0, 1, n_points)
+                for xv in np.linspace(0, 1, n_points):
+                    datasaver.add_result((x, xv), (y, ys),
+                                         (z, np.random.rand(n_points)))
+        self.dataset = datasaver.dataset
+
+    def teardown(self, bench_param):
+        # The dataset shares the DB connection of the experiment
+        self.dataset = None
+
+        # Close DB connection
+        if self.experiment:
+            self.experiment.conn.close()
+            self.experiment = None
+
+        # Remove tmpdir with database
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir)
+            self.tmpdir = None
+
+    def time_get_parameter_data(self, bench_param):
+        """Loading all data of a run"""
+        self.dataset.get_parameter_data()
@@ -41,6 +41,9 @@ class Adding5Params:
         {'n_values': 100, 'n_times': 200, 'paramtype': 'array'},
         {'n_values': 10000, 'n_times': 2, 'paramtype': 'numeric'},
         {'n_values': 100, 'n_times': 200, 'paramtype': 'numeric'},
+        # a large sweep delivered as arrays exercises the columnar insert
+        # path of the DataSaver for 'numeric' parameters
+        {'n_values': 1000000, 'n_times': 1, 'paramtype': 'numeric'},
     ]
     # we are less interested in the cpu time used and more interested in
     # the wall clock time used to insert the data so use a timer that measures
@@ -129,3 +132,110 @@ class Adding5Params:
         # force writing to database so that it is written before we exit
         # the datasaver context manager
         self.datasaver.flush_data_to_database()
+
+
+class AddingWithSubscribers:
+    """
+    This benchmark measures how much time it takes to save data to the
+    experiment database while a number of subscribers are attached to the
+    dataset, i.e. how much the publishing of the results to the subscribers
+    costs the writer.
+    """
+
+    # For this benchmark, we can not reuse what is being set up in setup method,
+    # hence the number of iterations is limited to 1
+    number = 1
+
+    # In order to get more stable result, the following number of repeats is
+    # used; note that repeats include setting up and tearing down
+    repeat = 8
+
+    # These are the parameters of this benchmark: n_subscribers to attach,
+    # n_values to write per add_results call, n_times to call add_results
+    # Dictionary of values is used instead of tuple of lists, because in the
+    # latter case asv will run the benchmark for all the combinations of the
+    # values
+    params = [
+        {'n_subscribers': 0, 'n_values': 100, 'n_times': 200},
+        {'n_subscribers': 1, 'n_values': 100, 'n_times': 200},
+        {'n_subscribers': 5, 'n_values': 100, 'n_times': 200},
+    ]
+    # we are less interested in the cpu time used and more interested in
+    # the wall clock time used to insert the data so use a timer that measures
+    # wallclock time
+    timer = time.perf_counter
+
+    def __init__(self):
+        self.parameters = list()
+        self.values = list()
+        self.experiment = None
+        self.runner = None
+        self.datasaver = None
+        self.tmpdir = None
+
+    def setup(self, bench_param):
+        # Init DB
+        self.tmpdir = tempfile.mkdtemp()
+        qcodes.config["core"]["db_location"] = os.path.join(self.tmpdir,
+                                                            'temp.db')
+        qcodes.config["core"]["db_debug"] = False
+        initialise_database()
+
+        # Create experiment
+        self.experiment = new_experiment("test-experiment",
+                                         sample_name="test-sample")
+
+        # Create measurement
+        meas = Measurement(self.experiment)
+
+        x = ManualParameter('x')
+        y = ManualParameter('y')
+
+        meas.register_parameter(x)
+        meas.register_parameter(y, setpoints=[x])
+
+        for _ in range(bench_param['n_subscribers']):
+            meas.add_subscriber(lambda results, length, state: None,
+                                state=None)
+
+        self.parameters = [x, y]
+
+        # Create the Runner context manager
+        self.runner = meas.run()
+
+        # Enter Runner and create DataSaver
+        self.datasaver = self.runner.__enter__()
+
+        # Create values for parameters
+        for _ in range(len(self.parameters)):
+            self.values.append(np.random.rand(bench_param['n_values']))
+
+    def teardown(self, bench_param):
+        # Exit runner context manager
+        if self.runner:
+            self.runner.__exit__(None, None, None)
+            self.runner = None
+            self.datasaver = None
+
+        # Close DB connection
+        if self.experiment:
+            self.experiment.conn.close()
+            self.experiment = None
+
+        # Remove tmpdir with database
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir)
+            self.tmpdir = None
+
+        self.parameters = list()
+        self.values = list()
+
+    def time_test(self, bench_param):
+        """Adding data for 2 parameters with subscribers attached"""
+        for _ in range(bench_param['n_times']):
+            self.datasaver.add_result(
+                (self.parameters[0], self.values[0]),
+                (self.parameters[1], self.values[1])
+            )
+            # write every batch such that it is published to the subscribers
+            self.datasaver.flush_data_to_database()
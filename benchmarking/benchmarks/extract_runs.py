@@ -0,0 +1,83 @@
+"""
+This module contains code used for benchmarking the extraction of runs from
+one database file into another.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+import qcodes.dataset.database_extract_runs as database_extract_runs
+from qcodes import ManualParameter
+from qcodes.dataset.database_extract_runs import extract_runs_into_db
+from qcodes.dataset.experiment_container import new_experiment
+from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.sqlite.database import connect
+
+
+class ExtractRuns:
+    """
+    This benchmark measures how much time it takes to extract runs of scalar
+    parameters into a new database file, with the source database attached
+    to the target one, and row by row, as when it can not be attached. The
+    size of the source database scales with ``n_runs * n_points``; a source
+    of several GB takes about 10**8 points in total.
+    """
+
+    number = 1
+    repeat = 4
+
+    params = [
+        {'n_runs': 10, 'n_points': 10**5},
+        {'n_runs': 200, 'n_points': 10**3},
+    ]
+    timer = time.perf_counter
+
+    def __init__(self):
+        self.tmpdir = None
+        self.source_path = None
+        self.n_targets = 0
+
+    def setup(self, bench_param):
+        self.tmpdir = tempfile.mkdtemp()
+        self.source_path = os.path.join(self.tmpdir, 'source.db')
+        conn = connect(self.source_path)
+        experiment = new_experiment('test-experiment',
+                                    sample_name='test-sample', conn=conn)
+
+        x = ManualParameter('x')
+        y = ManualParameter('y')
+        meas = Measurement(experiment)
+        meas.register_parameter(x)
+        meas.register_parameter(y, setpoints=[x])
+
+        n_points = bench_param['n_points']
+        for _ in range(bench_param['n_runs']):
+            with meas.run() as datasaver:
+                datasaver.add_result((x, np.arange(n_points)),
+                                     (y, np.random.rand(n_points)))
+        conn.close()
+
+    def teardown(self, bench_param):
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir)
+            self.tmpdir = None
+
+    def _new_target_path(self):
+        self.n_targets += 1
+        return os.path.join(self.tmpdir, f'target_{self.n_targets}.db')
+
+    def time_extract_runs(self, bench_param):
+        extract_runs_into_db(self.source_path, self._new_target_path(),
+                             *range(1, bench_param['n_runs'] + 1))
+
+    def time_extract_runs_row_by_row(self, bench_param):
+        attach_source_db = database_extract_runs._attach_source_db
+        database_extract_runs._attach_source_db = lambda *args: False
+        try:
+            extract_runs_into_db(self.source_path, self._new_target_path(),
+                                 *range(1, bench_param['n_runs'] + 1))
+        finally:
+            database_extract_runs._attach_source_db = attach_source_db
@@ -0,0 +1,46 @@
+"""
+This module contains code used for benchmarking how long it takes to import
+QCoDeS. Every benchmark imports QCoDeS in a fresh python interpreter, such that
+the modules imported before do not affect the result.
+"""
+import subprocess
+import sys
+
+
+def _cumulative_import_time(module: str, statement: str) -> float:
+    """
+    Run ``statement`` in a new python interpreter with ``-X importtime`` and
+    return the cumulative time (in seconds) that it took to import ``module``
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                             statement],
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True)
+    # the lines of the importtime output read
+    # "import time: <self [us]> | <cumulative [us]> | <indented module name>"
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if name.strip() == module:
+            return int(cumulative) * 1e-6
+    raise RuntimeError(f'{module} was not imported by {statement!r}')
+
+
+class ImportQcodes:
+    """
+    This benchmark measures how long ``import qcodes`` takes, i.e. what every
+    script and worker process that uses QCoDeS pays before doing anything.
+    """
+
+    # each measurement spawns a new interpreter, hence a few repeats suffice
+    repeat = 5
+
+    def timeraw_import_qcodes(self):
+        return "import qcodes"
+
+    def track_importtime_qcodes(self):
+        return _cumulative_import_time('qcodes', 'import qcodes')
+
+    track_importtime_qcodes.unit = 's'  # type: ignore[attr-defined]
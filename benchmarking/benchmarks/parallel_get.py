@@ -0,0 +1,48 @@
+"""
+This module contains code used for benchmarking the overhead of getting
+several parameters concurrently at every point of a measurement. The
+parameters answer immediately, hence the benchmarks measure the cost of
+dispatching the gets to threads and collecting their values.
+"""
+from qcodes.instrument.base import Instrument
+from qcodes.utils.threading import RespondingThread, ThreadPoolParamsGetter
+
+
+def _get_with_new_threads(parameters):
+    """The way the parameters used to be gotten: one new thread each"""
+    threads = [RespondingThread(target=p.get) for p in parameters]
+    for thread in threads:
+        thread.start()
+    return [thread.output() for thread in threads]
+
+
+class ParallelGet:
+    """
+    Benchmarks of getting one parameter from each of several instruments,
+    one after the other, each in a new thread, and with the thread pool.
+    """
+
+    params = [2, 8]
+    param_names = ['n_instruments']
+
+    def setup(self, n_instruments):
+        self.instruments = []
+        for i in range(n_instruments):
+            instrument = Instrument(f'parallel_get_{i}')
+            instrument.add_parameter('value', get_cmd=lambda: 0.0)
+            self.instruments.append(instrument)
+        self.parameters = [inst.value for inst in self.instruments]
+        self.getter = ThreadPoolParamsGetter(self.parameters)
+
+    def teardown(self, n_instruments):
+        for instrument in self.instruments:
+            instrument.close()
+
+    def time_serial(self, n_instruments):
+        [p.get() for p in self.parameters]
+
+    def time_new_threads(self, n_instruments):
+        _get_with_new_threads(self.parameters)
+
+    def time_thread_pool(self, n_instruments):
+        self.getter()
@@ -0,0 +1,92 @@
+"""
+This module contains code used for benchmarking the overhead of getting and
+setting parameters and of reading their cache. The parameters do not talk to
+an instrument, hence the benchmarks measure the cost of the parameter
+machinery itself, which matters in tight measurement loops.
+"""
+from qcodes.instrument.parameter import ManualParameter, Parameter
+from qcodes.utils.validators import Numbers
+
+
+class _Counter:
+    """A stand-in for an instrument with one numerical value"""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def _make_parameter(kind: str) -> Parameter:
+    counter = _Counter()
+    if kind == 'manual':
+        return ManualParameter('p', initial_value=0.0)
+    if kind == 'plain':
+        return Parameter('p', get_cmd=counter.get, set_cmd=counter.set)
+    if kind == 'validated':
+        return Parameter('p', get_cmd=counter.get, set_cmd=counter.set,
+                         vals=Numbers(-10, 10))
+    if kind == 'scaled':
+        return Parameter('p', get_cmd=counter.get, set_cmd=counter.set,
+                         vals=Numbers(-10, 10), scale=10, offset=1)
+    if kind == 'mapped':
+        return Parameter('p', get_cmd=counter.get, set_cmd=counter.set,
+                         val_mapping={0.0: 0, 1.0: 1})
+    raise ValueError(f'Unknown kind of parameter {kind!r}')
+
+
+class ParameterOverhead:
+    """
+    Benchmarks of a single get, set and cache access of parameters of
+    various kinds: a manual parameter, parameters with get/set commands but
+    nothing else, with a validator, with scale and offset, and with a value
+    mapping.
+    """
+
+    params = ['manual', 'plain', 'validated', 'scaled', 'mapped']
+    param_names = ['kind']
+
+    def setup(self, kind):
+        self.parameter = _make_parameter(kind)
+        self.value = 1.0
+        self.parameter.set(self.value)
+
+    def time_get(self, kind):
+        self.parameter.get()
+
+    def time_set(self, kind):
+        self.parameter.set(self.value)
+
+    def time_call_get(self, kind):
+        self.parameter()
+
+    def time_cache_get(self, kind):
+        self.parameter.cache.get()
+
+    def time_cache_timestamp(self, kind):
+        self.parameter.cache.timestamp
+
+
+class ParameterLoop:
+    """
+    Benchmark of a tight loop that sets one parameter and gets another, as
+    the inner loop of a software-timed sweep does.
+    """
+
+    params = [1000, 10000]
+    param_names = ['n_points']
+
+    def setup(self, n_points):
+        self.setpoint = _make_parameter('validated')
+        self.measured = _make_parameter('plain')
+
+    def time_set_get_loop(self, n_points):
+        setpoint = self.setpoint
+        measured = self.measured
+        for i in range(n_points):
+            setpoint.set(i / n_points)
+            measured.get()
@@ -0,0 +1,114 @@
+"""
+This module contains code used for benchmarking the plotting of runs, as a
+function of their size, with and without the decimation of large data to
+the level of detail that the plot can show.
+"""
+import os
+import shutil
+import tempfile
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+import qcodes
+from qcodes.dataset.experiment_container import new_experiment
+from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.plotting import plot_dataset
+from qcodes.dataset.sqlite.database import initialise_or_create_database_at
+
+
+class PlotDataset:
+    """
+    Benchmarks of plotting a line of ``n_points`` points and a square
+    heatmap of ``n_points`` points, to the screen buffer and to a PDF file,
+    and of redrawing them after zooming in, as an interactive backend does.
+    The time it takes to plot a large run is dominated by loading its data.
+    """
+
+    params = ([10**4, 4 * 10**6], [True, False])
+    param_names = ['n_points', 'level_of_detail']
+    timeout = 600
+
+    def __init__(self):
+        self.tmpdir = None
+        self.line = None
+        self.heatmap = None
+        self.figures = {}
+
+    def setup(self, n_points, level_of_detail):
+        self.tmpdir = tempfile.mkdtemp()
+        qcodes.config.core.db_location = os.path.join(self.tmpdir, 'plot.db')
+        initialise_or_create_database_at(qcodes.config.core.db_location)
+        new_experiment('plotting', sample_name='benchmark')
+
+        meas = Measurement()
+        meas.register_custom_parameter('x')
+        meas.register_custom_parameter('y')
+        meas.register_custom_parameter('line', setpoints=('x',))
+        x = np.linspace(0, 1, n_points)
+        with meas.run() as datasaver:
+            datasaver.add_result(('x', x),
+                                 ('line', np.sin(100 * x)
+                                  + 0.1 * np.random.randn(n_points)))
+        self.line = datasaver.dataset
+
+        meas = Measurement()
+        meas.register_custom_parameter('x')
+        meas.register_custom_parameter('y')
+        meas.register_custom_parameter('heatmap', setpoints=('x', 'y'))
+        axis = np.linspace(0, 1, int(np.sqrt(n_points)))
+        xx, yy = (a.ravel() for a in np.meshgrid(axis, axis))
+        with meas.run() as datasaver:
+            datasaver.add_result(('x', xx), ('y', yy),
+                                 ('heatmap', np.random.rand(len(xx))))
+        self.heatmap = datasaver.dataset
+
+        for name, dataset in (('line', self.line), ('heatmap', self.heatmap)):
+            axes, _ = plot_dataset(dataset, level_of_detail=level_of_detail)
+            figure = axes[0].figure
+            figure.canvas.draw()
+            self.figures[name] = figure
+
+    def teardown(self, n_points, level_of_detail):
+        plt.close('all')
+        self.figures = {}
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir)
+            self.tmpdir = None
+
+    def _plot(self, dataset, level_of_detail, filename=None):
+        axes, _ = plot_dataset(dataset, level_of_detail=level_of_detail)
+        figure = axes[0].figure
+        if filename is None:
+            figure.canvas.draw()
+        else:
+            figure.savefig(os.path.join(self.tmpdir, filename))
+        plt.close(figure)
+
+    def _redraw_zoomed_in(self, name):
+        figure = self.figures[name]
+        ax = figure.axes[0]
+        x_min, x_max = ax.get_xlim()
+        ax.set_xlim(x_min, x_min + (x_max - x_min) / 3)
+        figure.canvas.draw()
+        ax.set_xlim(x_min, x_max)
+
+    def time_plot_line(self, n_points, level_of_detail):
+        self._plot(self.line, level_of_detail)
+
+    def time_plot_heatmap(self, n_points, level_of_detail):
+        self._plot(self.heatmap, level_of_detail)
+
+    def time_save_line(self, n_points, level_of_detail):
+        self._plot(self.line, level_of_detail, 'line.pdf')
+
+    def time_save_heatmap(self, n_points, level_of_detail):
+        self._plot(self.heatmap, level_of_detail, 'heatmap.pdf')
+
+    def time_redraw_line(self, n_points, level_of_detail):
+        self._redraw_zoomed_in('line')
+
+    def time_redraw_heatmap(self, n_points, level_of_detail):
+        self._redraw_zoomed_in('heatmap')
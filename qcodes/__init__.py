@@ -2,6 +2,10 @@
 
 # flake8: noqa (we don't need the "<...> imported but unused" error)
 
+import importlib
+import importlib.util
+from typing import Any, Dict, List, TYPE_CHECKING
+
 # config
 
 import qcodes.configuration as qcconfig
@@ -18,80 +22,148 @@ conditionally_start_all_logging()
 add_to_spyder_UMR_excludelist('qcodes')
 
 
-from qcodes.version import __version__
+# The public names of the qcodes namespace are imported lazily, on first
+# access (PEP 562), such that ``import qcodes`` does not pay for importing the
+# instrument, dataset, plotting and monitor modules that may never be used.
+# The keys are the names, the values the modules they are imported from.
+_lazy_imports: Dict[str, str] = {
+    'Station': 'qcodes.station',
+    'Instrument': 'qcodes.instrument.base',
+    'find_or_create_instrument': 'qcodes.instrument.base',
+    'IPInstrument': 'qcodes.instrument.ip',
+    'VisaInstrument': 'qcodes.instrument.visa',
+    'InstrumentChannel': 'qcodes.instrument.channel',
+    'ChannelList': 'qcodes.instrument.channel',
+    'Function': 'qcodes.instrument.function',
+    'Parameter': 'qcodes.instrument.parameter',
+    'ArrayParameter': 'qcodes.instrument.parameter',
+    'MultiParameter': 'qcodes.instrument.parameter',
+    'ParameterWithSetpoints': 'qcodes.instrument.parameter',
+    'HardwareSweepSetpoints': 'qcodes.instrument.parameter',
+    'DelegateParameter': 'qcodes.instrument.parameter',
+    'ManualParameter': 'qcodes.instrument.parameter',
+    'ScaledParameter': 'qcodes.instrument.parameter',
+    'combine': 'qcodes.instrument.parameter',
+    'CombinedParameter': 'qcodes.instrument.parameter',
+    'SweepFixedValues': 'qcodes.instrument.sweep_values',
+    'SweepValues': 'qcodes.instrument.sweep_values',
+    'validators': 'qcodes.utils',
+    'test_instruments': 'qcodes.instrument_drivers.test',
+    'test_instrument': 'qcodes.instrument_drivers.test',
+    'Measurement': 'qcodes.dataset.measurements',
+    'new_data_set': 'qcodes.dataset.data_set',
+    'load_by_counter': 'qcodes.dataset.data_set',
+    'load_by_id': 'qcodes.dataset.data_set',
+    'load_by_run_spec': 'qcodes.dataset.data_set',
+    'load_by_guid': 'qcodes.dataset.data_set',
+    'new_experiment': 'qcodes.dataset.experiment_container',
+    'load_experiment': 'qcodes.dataset.experiment_container',
+    'load_experiment_by_name': 'qcodes.dataset.experiment_container',
+    'load_last_experiment': 'qcodes.dataset.experiment_container',
+    'experiments': 'qcodes.dataset.experiment_container',
+    'load_or_create_experiment': 'qcodes.dataset.experiment_container',
+    'SQLiteSettings': 'qcodes.dataset.sqlite.settings',
+    'ParamSpec': 'qcodes.dataset.descriptions.param_spec',
+    'initialise_database': 'qcodes.dataset.sqlite.database',
+    'initialise_or_create_database_at': 'qcodes.dataset.sqlite.database',
+}
+
+# the monitor requires websockets, which is an optional dependency
+haswebsockets = importlib.util.find_spec('websockets') is not None
+if haswebsockets:
+    _lazy_imports['Monitor'] = 'qcodes.monitor.monitor'
 
+# the plot classes are left out if their plotting library is not installed,
+# as they used to be left out when they failed to import
 plotlib = config.gui.plotlib
-if plotlib in {'QT', 'all'}:
-    try:
-        from qcodes.plots.pyqtgraph import QtPlot
-    except Exception:
-        print('pyqtgraph plotting not supported, '
-              'try "from qcodes.plots.pyqtgraph import QtPlot" '
-              'to see the full error')
-
-if plotlib in {'matplotlib', 'all'}:
-    try:
-        from qcodes.plots.qcmatplotlib import MatPlot
-    except Exception:
-        print('matplotlib plotting not supported, '
-              'try "from qcodes.plots.qcmatplotlib import MatPlot" '
-              'to see the full error')
+if plotlib in {'QT', 'all'} and \
+        importlib.util.find_spec('pyqtgraph') is not None:
+    _lazy_imports['QtPlot'] = 'qcodes.plots.pyqtgraph'
+if plotlib in {'matplotlib', 'all'} and \
+        importlib.util.find_spec('matplotlib') is not None:
+    _lazy_imports['MatPlot'] = 'qcodes.plots.qcmatplotlib'
 
 if config.core.import_legacy_api:
-    from qcodes.loops import Loop, active_loop, active_data_set
-    from qcodes.measure import Measure
-    from qcodes.data.data_set import DataSet, new_data, load_data
-    from qcodes.actions import Task, Wait, BreakIf
-    from qcodes.data.location import FormatLocation
-    from qcodes.data.data_array import DataArray
-    from qcodes.data.format import Formatter
-    from qcodes.data.gnuplot_format import GNUPlotFormat
-    from qcodes.data.hdf5_format import HDF5Format
-    from qcodes.data.io import DiskIO
-
-
-from qcodes.station import Station
-haswebsockets = True
-try:
-    import websockets
-except ImportError:
-    haswebsockets = False
-if haswebsockets:
+    _lazy_imports.update({
+        'Loop': 'qcodes.loops',
+        'active_loop': 'qcodes.loops',
+        'active_data_set': 'qcodes.loops',
+        'Measure': 'qcodes.measure',
+        'DataSet': 'qcodes.data.data_set',
+        'new_data': 'qcodes.data.data_set',
+        'load_data': 'qcodes.data.data_set',
+        'Task': 'qcodes.actions',
+        'Wait': 'qcodes.actions',
+        'BreakIf': 'qcodes.actions',
+        'FormatLocation': 'qcodes.data.location',
+        'DataArray': 'qcodes.data.data_array',
+        'Formatter': 'qcodes.data.format',
+        'GNUPlotFormat': 'qcodes.data.gnuplot_format',
+        'HDF5Format': 'qcodes.data.hdf5_format',
+        'DiskIO': 'qcodes.data.io',
+    })
+
+if TYPE_CHECKING:
+    from qcodes.station import Station
     from qcodes.monitor.monitor import Monitor
+    from qcodes.instrument.base import Instrument, find_or_create_instrument
+    from qcodes.instrument.ip import IPInstrument
+    from qcodes.instrument.visa import VisaInstrument
+    from qcodes.instrument.channel import InstrumentChannel, ChannelList
+    from qcodes.instrument.function import Function
+    from qcodes.instrument.parameter import (
+        Parameter,
+        ArrayParameter,
+        MultiParameter,
+        ParameterWithSetpoints,
+        HardwareSweepSetpoints,
+        DelegateParameter,
+        ManualParameter,
+        ScaledParameter,
+        combine,
+        CombinedParameter)
+    from qcodes.instrument.sweep_values import SweepFixedValues, SweepValues
+    from qcodes.utils import validators
+    from qcodes.instrument_drivers.test import test_instruments, test_instrument
+    from qcodes.dataset.measurements import Measurement
+    from qcodes.dataset.data_set import new_data_set, load_by_counter, load_by_id, load_by_run_spec, load_by_guid
+    from qcodes.dataset.experiment_container import new_experiment, load_experiment, load_experiment_by_name, \
+        load_last_experiment, experiments, load_or_create_experiment
+    from qcodes.dataset.sqlite.settings import SQLiteSettings
+    from qcodes.dataset.descriptions.param_spec import ParamSpec
+    from qcodes.dataset.sqlite.database import initialise_database, \
+        initialise_or_create_database_at
+
+# ``from qcodes import *`` imports the public names, as it did when they were
+# imported along with qcodes, while ``import qcodes`` still imports none of
+# them
+__all__ = [*_lazy_imports, 'config', 'qcconfig', '__version__',
+           'conditionally_start_all_logging', 'add_to_spyder_UMR_excludelist',
+           'haswebsockets', 'plotlib', 'test']
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name])
+        if not hasattr(module, name):
+            # the name is a submodule that its package does not import
+            importlib.import_module(f'{module.__name__}.{name}')
+        value = getattr(module, name)
+        # cache the value, such that this function is not called again
+        globals()[name] = value
+        return value
+    # make submodules accessible as attributes without importing them
+    # explicitly, as they used to be imported along with the public names
+    if not name.startswith('_') and \
+            importlib.util.find_spec(f'{__name__}.{name}') is not None:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_imports))
 
 
-
-
-from qcodes.instrument.base import Instrument, find_or_create_instrument
-from qcodes.instrument.ip import IPInstrument
-from qcodes.instrument.visa import VisaInstrument
-from qcodes.instrument.channel import InstrumentChannel, ChannelList
-from qcodes.instrument.function import Function
-from qcodes.instrument.parameter import (
-    Parameter,
-    ArrayParameter,
-    MultiParameter,
-    ParameterWithSetpoints,
-    DelegateParameter,
-    ManualParameter,
-    ScaledParameter,
-    combine,
-    CombinedParameter)
-from qcodes.instrument.sweep_values import SweepFixedValues, SweepValues
-
-from qcodes.utils import validators
-
-from qcodes.instrument_drivers.test import test_instruments, test_instrument
-
-from qcodes.dataset.measurements import Measurement
-from qcodes.dataset.data_set import new_data_set, load_by_counter, load_by_id, load_by_run_spec, load_by_guid
-from qcodes.dataset.experiment_container import new_experiment, load_experiment, load_experiment_by_name, \
-    load_last_experiment, experiments, load_or_create_experiment
-from qcodes.dataset.sqlite.settings import SQLiteSettings
-from qcodes.dataset.descriptions.param_spec import ParamSpec
-from qcodes.dataset.sqlite.database import initialise_database, \
-    initialise_or_create_database_at
-
 try:
     # Check if we are in iPython
     get_ipython()  # type: ignore[name-defined]
@@ -105,10 +177,21 @@ except RuntimeError as e:
     print(e)
 
 import logging
+import sys
 
 # ensure to close all instruments when interpreter is closed
 import atexit
-atexit.register(Instrument.close_all)
+
+
+def _close_all_instruments() -> None:
+    # if the instrument module has never been imported, there are no
+    # instruments to close
+    base = sys.modules.get('qcodes.instrument.base')
+    if base is not None:
+        base.Instrument.close_all()
+
+
+atexit.register(_close_all_instruments)
 
 
 def test(**kwargs):
@@ -2,14 +2,15 @@
 import time
 
 from qcodes.utils.helpers import is_function
-from qcodes.utils.threading import thread_map
+from qcodes.utils.threading import ThreadPoolParamsGetter
 
 
 _NO_SNAPSHOT = {'type': None, 'description': 'Action without snapshot'}
 
 
 # exception when threading is attempted used to simultaneously
-# query the same instrument for several values
+# query the same instrument for several values. Such parameters are now
+# gotten one after the other instead, hence this is no longer raised
 class UnsafeThreadingException(Exception):
     pass
 
@@ -119,13 +120,9 @@ class _Measure:
         self.getters = []
         self.param_ids = []
         self.composite = []
-        paramcheck = []  # list to check if parameters are unique
         for param, action_indices in params_indices:
             self.getters.append(param.get)
 
-            if param._instrument:
-                paramcheck.append((param, param._instrument))
-
             if hasattr(param, 'names'):
                 part_ids = []
                 for i in range(len(param.names)):
@@ -139,20 +136,15 @@ class _Measure:
                 self.composite.append(False)
 
         if self.use_threads:
-            insts = [p[1] for p in paramcheck]
-            if (len(set(insts)) != len(insts)):
-                duplicates = [p for p in paramcheck if insts.count(p[1]) > 1]
-                raise UnsafeThreadingException('Can not use threading to '
-                                               'read '
-                                               'several things from the same '
-                                               'instrument. Specifically, you '
-                                               'asked for'
-                                               ' {}.'.format(duplicates))
+            # the parameters of one instrument are gotten one after the
+            # other, those of different instruments concurrently
+            self.threaded_getter = ThreadPoolParamsGetter(
+                [param for param, _ in params_indices])
 
     def __call__(self, loop_indices, **ignore_kwargs):
         out_dict = {}
         if self.use_threads:
-            out = thread_map(self.getters)
+            out = self.threaded_getter()
         else:
             out = [g() for g in self.getters]
 
@@ -3,7 +3,6 @@ import copy
 import json
 import logging
 import os
-import pkg_resources as pkgr
 from os.path import expanduser
 from pathlib import Path
 import jsonschema
@@ -38,16 +37,19 @@ class Config:
     """Name of config file"""
     schema_file_name = "qcodesrc_schema.json"
     """Name of schema file"""
-    # get abs path of packge config file
-    default_file_name = pkgr.resource_filename(__name__, config_file_name)
+    # get abs path of packge config file (qcodes is not zip safe, so the
+    # file is always next to this module; importing pkg_resources to find
+    # it would noticeably slow down importing qcodes)
+    default_file_name = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     config_file_name)
     """Filename of default config"""
     current_config_path = default_file_name
     """Path of the last loaded config file"""
     _loaded_config_files = [default_file_name]
 
     # get abs path of schema  file
-    schema_default_file_name = pkgr.resource_filename(__name__,
-                                                      schema_file_name)
+    schema_default_file_name = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), schema_file_name)
     """Filename of default schema"""
 
     # home dir, os independent
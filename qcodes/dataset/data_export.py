@@ -143,33 +143,41 @@ def _rows_from_datapoints(inputsetpoints: np.ndarray) -> np.ndarray:
     these rows do not necessarily correspond to actual rows of the scan,
     but they can nonetheless be used to identify certain scan types
 
+    Row ``k`` holds the values that occur more than ``k`` times, hence the
+    rows are found by sorting the repeated values by their occurrence
+    rather than by removing one row of values after the other.
+
     Args:
         setpoints: The raw setpoints as a one-dimensional array
 
     Returns:
-        A ndarray of the rows
+        A 2D ndarray of the rows if they all have the same length, otherwise
+        a 1D object ndarray of the rows
     """
+    values, counts = np.unique(inputsetpoints, return_counts=True)
+    if len(values) == 0:
+        return values.reshape(1, 0)
 
-    rows = []
-    setpoints = inputsetpoints.copy()
+    # first check if all values occur equally often, in which case all rows
+    # are the same
+    if np.all(counts == counts[0]):
+        return np.tile(values, (counts[0], 1))
 
-    # first check if there is only one unique array in which case we can avoid the
-    # potentially slow loop below
-    temp, inds, count = np.unique(setpoints, return_index=True,
-                                  return_counts=True)
-    num_repeats_array = np.unique(count)
-    if len(num_repeats_array) == 1 and count.sum() == len(inputsetpoints):
-        return np.tile(temp, (num_repeats_array[0], 1))
-    else:
-        rows.append(temp)
-        setpoints = np.delete(setpoints, inds)
+    # the sorted values, each repeated as often as it occurs, and for each of
+    # them the how-manyth occurrence of the value it is
+    repeated = np.repeat(values, counts)
+    starts = np.cumsum(counts) - counts
+    occurrences = np.arange(len(repeated)) - np.repeat(starts, counts)
 
-    while len(setpoints) > 0:
-        temp, inds = np.unique(setpoints, return_index=True)
-        rows.append(temp)
-        setpoints = np.delete(setpoints, inds)
+    # a stable sort by occurrence keeps the values of each row sorted
+    order = np.argsort(occurrences, kind='stable')
+    row_lengths = np.bincount(occurrences)
+    row_list = np.split(repeated[order], np.cumsum(row_lengths)[:-1])
 
-    return np.array(rows)
+    rows = np.empty(len(row_list), dtype=object)
+    for index, row in enumerate(row_list):
+        rows[index] = row
+    return rows
 
 
 def _all_in_group_or_subgroup(rows: np.ndarray) -> bool:
@@ -211,7 +219,7 @@ def _all_in_group_or_subgroup(rows: np.ndarray) -> bool:
     # are all contained in the rows of the other
     if aigos and switchindex > 0:
         for row in rows[1+switchindex:]:
-            if sum([r in rows[0] for r in row]) != len(row):
+            if not np.isin(row, rows[0]).all():
                 aigos = False
                 break
 
@@ -227,10 +235,8 @@ def _strings_as_ints(inputarray: np.ndarray) -> np.ndarray:
     Args:
         inputarray: A 1D array of strings
     """
-    newdata = np.zeros(len(inputarray))
-    for n, word in enumerate(np.unique(inputarray)):
-        newdata += ((inputarray == word).astype(int)*n)
-    return newdata
+    _, newdata = np.unique(inputarray, return_inverse=True)
+    return newdata.astype(float)
 
 
 def get_1D_plottype(xpoints: np.ndarray, ypoints: np.ndarray) -> str:
@@ -372,24 +378,19 @@ def datatype_from_setpoints_2d(xpoints: np.ndarray,
 
 def reshape_2D_data(x: np.ndarray, y: np.ndarray, z: np.ndarray
                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    xrow = np.array(_rows_from_datapoints(x)[0])
-    yrow = np.array(_rows_from_datapoints(y)[0])
+    # the first rows of the setpoints are their unique values, and the
+    # inverse indices are the positions of the points on the grid
+    xrow, x_index = np.unique(x, return_inverse=True)
+    yrow, y_index = np.unique(y, return_inverse=True)
     nx = len(xrow)
     ny = len(yrow)
 
-    # potentially slow method of filling in the data, should be optimised
     log.debug('Sorting 2D data onto grid')
 
     if isinstance(z[0], str):
         z_to_plot = np.full((ny, nx), '', dtype=z.dtype)
     else:
         z_to_plot = np.full((ny, nx), np.nan)
-    x_index = np.zeros_like(x, dtype=np.int)
-    y_index = np.zeros_like(y, dtype=np.int)
-    for i, xval in enumerate(xrow):
-        x_index[np.where(x == xval)[0]] = i
-    for i, yval in enumerate(yrow):
-        y_index[np.where(y == yval)[0]] = i
 
     z_to_plot[y_index, x_index] = z
 
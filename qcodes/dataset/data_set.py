@@ -1,14 +1,16 @@
+import bisect
 import functools
 import importlib
+import itertools
 import json
 import logging
 import os
 import time
 import uuid
-from queue import Empty, Queue
-from threading import Thread
-from typing import (Any, Callable, Dict, List, Optional, Sequence, Sized,
-                    Tuple, Union, TYPE_CHECKING, Mapping)
+from queue import Empty, Full, Queue
+from threading import Condition, Lock, Thread
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Sequence,
+                    Sized, Tuple, Union, TYPE_CHECKING, Mapping)
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -25,27 +27,31 @@ from qcodes.dataset.descriptions.versioning.converters import (new_to_old,
                                                                old_to_new,
                                                                v1_to_v0)
 from qcodes.dataset.descriptions.versioning.v0 import InterDependencies
+from qcodes.dataset.data_set_cache import DataSetCache, ParameterData
 from qcodes.dataset.guids import (
     filter_guids_by_parts, generate_guid, parse_guid)
 from qcodes.dataset.linked_datasets.links import (Link, links_to_str,
                                                   str_to_links)
+from qcodes.dataset.run_catalogue import search_runs
 from qcodes.dataset.sqlite.connection import (ConnectionPlus, atomic,
                                               atomic_transaction,
                                               transaction)
 from qcodes.dataset.sqlite.database import (
-    connect, get_DB_location, conn_from_dbpath_or_conn)
+    connect, conn_from_dbpath_or_conn)
 from qcodes.dataset.sqlite.queries import (
-    add_meta_data, add_parameter, completed, create_run,
-    get_completed_timestamp_from_run_id, get_data,
+    _column_values_to_array, _get_value_at_path, add_meta_data, add_parameter,
+    add_snapshot, completed, create_run, get_completed_timestamp_from_run_id, get_data,
     get_experiment_name_from_experiment_id, get_experiments,
     get_guid_from_run_id, get_guids_from_run_spec,
     get_last_experiment, get_metadata, get_metadata_from_run_id,
-    get_parameter_data, get_parent_dataset_links, get_run_description,
-    get_run_timestamp_from_run_id, get_runid_from_guid,
-    get_sample_name_from_experiment_id, get_setpoints, get_values,
-    mark_run_complete, remove_trigger, run_exists, set_run_timestamp,
-    update_parent_datasets, update_run_description)
+    get_parameter_data, get_parameter_data_chunks, get_parent_dataset_links,
+    get_run_description, get_run_timestamp_from_run_id, get_runid_from_guid,
+    get_sample_name_from_experiment_id, get_setpoints, get_snapshot,
+    get_value_from_snapshot, get_values, mark_run_complete, remove_trigger,
+    run_exists, set_run_timestamp, update_parent_datasets,
+    update_run_description)
 from qcodes.dataset.sqlite.query_helpers import (VALUE, insert_many_values,
+                                                 insert_many_rows,
                                                  insert_values, length, one,
                                                  select_one_where, VALUES)
 from qcodes.instrument.parameter import _BaseParameter
@@ -53,6 +59,10 @@ from qcodes.utils.deprecate import deprecate
 
 log = logging.getLogger(__name__)
 
+# how often (in seconds) a put that waits for room in the write queue checks
+# that the background writer is still there to make room
+_WRITE_QUEUE_POLL_INTERVAL = 0.1
+
 
 # TODO: as of now every time a result is inserted with add_result the db is
 # saved same for add_results. IS THIS THE BEHAVIOUR WE WANT?
@@ -75,6 +85,8 @@ SPECS = List[ParamSpec]
 # the DataSet constructor for a while, then deprecate SPECS and finally remove
 # the ParamSpec class
 SpecsOrInterDeps = Union[SPECS, InterDependencies_]
+# a column of results as accepted by DataSet.add_columnar_results
+COLUMN = Union[numpy.ndarray, Sequence[VALUE]]
 
 
 class CompletedError(RuntimeError):
@@ -87,10 +99,102 @@ class DataPathException(Exception):
     pass
 
 
+def _column_to_list(column: COLUMN) -> List[VALUE]:
+    """
+    Convert a column of results to a list of python objects. 1D numpy arrays
+    are converted in one go via ``tolist``, which is much faster than having
+    sqlite adapt each numpy scalar separately.
+    """
+    if isinstance(column, numpy.ndarray):
+        if column.ndim != 1:
+            raise ValueError('Columns of results must be one-dimensional, '
+                             f'got an array of shape {column.shape}.')
+        return column.tolist()
+    return list(column)
+
+
+def _coalesce_columnar_results(
+        results: Sequence[Mapping[str, COLUMN]]
+) -> List[Dict[str, List[VALUE]]]:
+    """
+    Merge consecutive blocks of columnar results that have the same parameter
+    names into single blocks of columns of python objects. The order of the
+    results is preserved.
+    """
+    coalesced = []
+    for key_set, group in itertools.groupby(
+            results, key=lambda block: frozenset(block)):
+        columns: Dict[str, List[VALUE]] = {key: [] for key in key_set}
+        for block in group:
+            lengths = {len(block[key]) for key in key_set}
+            if len(lengths) > 1:
+                raise ValueError('Wrong input format for results. All '
+                                 'columns of a block must have the same '
+                                 f'length. Received lengths {lengths}.')
+            for key in key_set:
+                columns[key] += _column_to_list(block[key])
+        coalesced.append(columns)
+    return coalesced
+
+
+def _parameter_data_to_dataframes(
+        datadict: ParameterData) -> Dict[str, "pd.DataFrame"]:
+    """
+    Convert data in the format of :meth:`DataSet.get_parameter_data` to
+    :py:class:`pandas.DataFrame` s, see
+    :meth:`DataSet.get_data_as_pandas_dataframe`.
+    """
+    import pandas as pd
+    dfs = {}
+    for name, subdict in datadict.items():
+        keys = list(subdict.keys())
+        if len(keys) == 0:
+            dfs[name] = pd.DataFrame()
+            continue
+        if len(keys) == 1:
+            index = None
+        elif len(keys) == 2:
+            index = pd.Index(subdict[keys[1]].ravel(), name=keys[1])
+        else:
+            indexdata = tuple(numpy.concatenate(subdict[key])
+                              if subdict[key].dtype == numpy.dtype('O')
+                              else subdict[key].ravel()
+                              for key in keys[1:])
+            index = pd.MultiIndex.from_arrays(
+                indexdata,
+                names=keys[1:])
+
+        if subdict[keys[0]].dtype == numpy.dtype('O'):
+            # ravel will not fully unpack a numpy array of arrays
+            # which are of "object" dtype. This can happen if a variable
+            # length array is stored in the db. We use concatenate to
+            # flatten these
+            mydata = numpy.concatenate(subdict[keys[0]])
+        else:
+            mydata = subdict[keys[0]].ravel()
+        df = pd.DataFrame(mydata, index=index,
+                          columns=[keys[0]])
+        dfs[name] = df
+    return dfs
+
+
 class _Subscriber(Thread):
     """
-    Class to add a subscriber to a :class:`.DataSet`. The subscriber gets called every
-    time an insert is made to the results_table.
+    Class to add a subscriber to a :class:`.DataSet`. The subscriber gets
+    called with the results that are added to the :class:`.DataSet` in this
+    process. Every batch of results is published to the subscriber by the
+    writer right after it has been committed to the database, and the
+    subscriber calls its callback in its own thread as soon as at least
+    ``min_queue_length`` results are pending, with all the pending results.
+
+    If ``max_queue_length`` is set, publishing a batch blocks while that many
+    results are pending, i.e. a callback that can not keep up with the rate
+    of results slows down the writer instead of letting the pending results
+    grow without bounds.
+
+    The results are passed to the callback as a list of tuples with one
+    value per parameter of the :class:`.DataSet`, or, if ``columnar`` is
+    True, as a dictionary from parameter names to numpy arrays of values.
 
     The _Subscriber is not meant to be instantiated directly, but rather used
     via the 'subscribe' method of the :class:`.DataSet`.
@@ -107,7 +211,9 @@ class _Subscriber(Thread):
                  state: Optional[Any] = None,
                  loop_sleep_time: int = 0,  # in milliseconds
                  min_queue_length: int = 1,
-                 callback_kwargs: Optional[Mapping[str, Any]] = None
+                 callback_kwargs: Optional[Mapping[str, Any]] = None,
+                 max_queue_length: Optional[int] = None,
+                 columnar: bool = False
                  ) -> None:
         super().__init__()
 
@@ -119,101 +225,217 @@ class _Subscriber(Thread):
 
         self.state = state
 
-        self.data_queue: Queue = Queue()
+        # batches of results, each a mapping from parameter names to
+        # columns of values, guarded by the condition
+        self._batches: List[Mapping[str, Sequence[VALUE]]] = []
+        self._condition = Condition()
         self._queue_length: int = 0
         self._stop_signal: bool = False
+        self._done_signal: bool = False
         # convert milliseconds to seconds
         self._loop_sleep_time = loop_sleep_time / 1000
         self.min_queue_length = min_queue_length
+        self.max_queue_length = max_queue_length
+        self._columnar = columnar
 
         if callback_kwargs is None or len(callback_kwargs) == 0:
             self.callback = callback
         else:
             self.callback = functools.partial(callback, **callback_kwargs)
 
-        self.callback_id = f"callback{self._id}"
-        self.trigger_id = f"sub{self._id}"
-
-        conn = dataSet.conn
-
-        conn.create_function(self.callback_id, -1, self._cache_data_to_queue)
-
-        parameters = dataSet.get_parameters()
-        sql_param_list = ",".join([f"NEW.{p.name}" for p in parameters])
-        sql_create_trigger_for_callback = f"""
-        CREATE TRIGGER {self.trigger_id}
-            AFTER INSERT ON '{self.table_name}'
-        BEGIN
-            SELECT {self.callback_id}({sql_param_list});
-        END;"""
-        atomic_transaction(conn, sql_create_trigger_for_callback)
+        self._paramspecs = dataSet.get_parameters()
 
         self.log = logging.getLogger(f"_Subscriber {self._id}")
 
-    def _cache_data_to_queue(self, *args: Any) -> None:
-        self.data_queue.put(args)
-        self._data_set_len += 1
-        self._queue_length += 1
+    def put(self, columns: Mapping[str, Sequence[VALUE]]) -> None:
+        """
+        Publish a batch of results, given as columns of values of equal
+        length, to the subscriber. If ``max_queue_length`` results are
+        pending, this blocks until the callback has consumed them.
+        """
+        n_results = len(next(iter(columns.values()), ()))
+        if n_results == 0:
+            return
+        with self._condition:
+            if self.max_queue_length is not None:
+                self._condition.wait_for(
+                    lambda: (self._queue_length < self.max_queue_length
+                             or self._stop_signal or not self.is_alive()))
+            self._batches.append(columns)
+            self._data_set_len += n_results
+            self._queue_length += n_results
+            self._condition.notify_all()
 
     def run(self) -> None:
         self.log.debug("Starting subscriber")
         self._loop()
 
-    @staticmethod
-    def _exhaust_queue(queue: Queue) -> List:
-        result_list = []
-        while True:
-            try:
-                result_list.append(queue.get(block=False))
-            except Empty:
-                break
-        return result_list
+    def _should_wake(self) -> bool:
+        min_queue_length = self.min_queue_length
+        if self.max_queue_length is not None:
+            min_queue_length = min(min_queue_length, self.max_queue_length)
+        return (self._stop_signal or self._done_signal
+                or self._queue_length >= min_queue_length)
+
+    def _rows(self, batches: Sequence[Mapping[str, Sequence[VALUE]]]
+              ) -> List[Tuple[VALUE, ...]]:
+        rows: List[Tuple[VALUE, ...]] = []
+        for columns in batches:
+            n_results = len(next(iter(columns.values())))
+            rows += zip(*(columns.get(spec.name, (None,) * n_results)
+                          for spec in self._paramspecs))
+        return rows
+
+    def _columns(self, batches: Sequence[Mapping[str, Sequence[VALUE]]]
+                 ) -> Dict[str, numpy.ndarray]:
+        output = {}
+        for spec in self._paramspecs:
+            values: List[VALUE] = []
+            for columns in batches:
+                n_results = len(next(iter(columns.values())))
+                values += columns.get(spec.name, (None,) * n_results)
+            output[spec.name] = _column_values_to_array(values, spec.type)
+        return output
 
     def _call_callback_on_queue_data(self) -> None:
-        result_list = self._exhaust_queue(self.data_queue)
-        self.callback(result_list, self._data_set_len, self.state)
+        with self._condition:
+            batches, self._batches = self._batches, []
+            self._queue_length = 0
+            length = self._data_set_len
+            self._condition.notify_all()
+        if self._columnar:
+            results: Any = self._columns(batches)
+        else:
+            results = self._rows(batches)
+        self.callback(results, length, self.state)
         self.log.debug(f"{self.callback} called with "
-                       f"result_list: {result_list}.")
+                       f"{len(batches)} batches of results.")
 
     def _loop(self) -> None:
         while True:
-            if self._stop_signal:
+            with self._condition:
+                self._condition.wait_for(self._should_wake)
+                stop = self._stop_signal
+                done = self._done_signal
+
+            if stop:
                 self._clean_up()
                 break
 
-            if self._queue_length >= self.min_queue_length:
-                self._call_callback_on_queue_data()
-                self._queue_length = 0
-
-            time.sleep(self._loop_sleep_time)
+            self._call_callback_on_queue_data()
 
-            if self.dataSet.completed:
-                self._call_callback_on_queue_data()
+            if done:
                 break
 
+            time.sleep(self._loop_sleep_time)
+
     def done_callback(self) -> None:
+        """
+        Call the callback with the results that are still pending and wait
+        for the subscriber to finish.
+        """
         self.log.debug("Done callback")
-        self._call_callback_on_queue_data()
+        with self._condition:
+            self._done_signal = True
+            self._condition.notify_all()
+        if self.is_alive():
+            self.join()
 
     def schedule_stop(self) -> None:
         if not self._stop_signal:
             self.log.debug("Scheduling stop")
-            self._stop_signal = True
+            with self._condition:
+                self._stop_signal = True
+                self._condition.notify_all()
 
     def _clean_up(self) -> None:
         self.log.debug("Stopped subscriber")
 
 
+class _WriteMetrics:
+    """
+    Counters of the writes of results of a :class:`.DataSet` to the
+    database, updated by the writer (which may be the background writer
+    thread) and read via :meth:`.DataSet.get_write_metrics`.
+    """
+
+    # upper bounds (in seconds) of the bins of the commit latency histogram
+    latency_bins = (1e-4, 1e-3, 1e-2, 1e-1, 1.0, float('inf'))
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.commits = 0
+        self.max_queue_depth = 0
+        self.total_commit_latency = 0.0
+        self.max_commit_latency = 0.0
+        self.latency_counts = [0] * len(self.latency_bins)
+        self.first_commit_start: Optional[float] = None
+        self.last_commit_end: Optional[float] = None
+
+    def record_commit(self, n_rows: int, start: float, end: float) -> None:
+        latency = end - start
+        with self._lock:
+            self.rows_written += n_rows
+            self.commits += 1
+            self.total_commit_latency += latency
+            self.max_commit_latency = max(self.max_commit_latency, latency)
+            self.latency_counts[bisect.bisect_left(self.latency_bins,
+                                                   latency)] += 1
+            if self.first_commit_start is None:
+                self.first_commit_start = start
+            self.last_commit_end = end
+
+    def record_drop(self, n_rows: int) -> None:
+        with self._lock:
+            self.rows_dropped += n_rows
+
+    def record_queue_depth(self, depth: int) -> None:
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def as_dict(self, queue_depth: int) -> Dict[str, Any]:
+        with self._lock:
+            if (self.first_commit_start is not None
+                    and self.last_commit_end is not None
+                    and self.last_commit_end > self.first_commit_start):
+                rows_per_second = self.rows_written / (
+                    self.last_commit_end - self.first_commit_start)
+            else:
+                rows_per_second = 0.0
+            mean_latency = (self.total_commit_latency / self.commits
+                            if self.commits else 0.0)
+            return {'rows_written': self.rows_written,
+                    'rows_dropped': self.rows_dropped,
+                    'commits': self.commits,
+                    'rows_per_second': rows_per_second,
+                    'queue_depth': queue_depth,
+                    'max_queue_depth': self.max_queue_depth,
+                    'mean_commit_latency': mean_latency,
+                    'max_commit_latency': self.max_commit_latency,
+                    'commit_latency_histogram': dict(
+                        zip(self.latency_bins, self.latency_counts))}
+
+
 class _BackgroundWriter(Thread):
     """
-    Write the results from the DataSet's dataqueue in a new thread
+    Write the results from the DataSet's dataqueue in a new thread. All the
+    items that are pending in the queue when the writer gets to them are
+    written in a single transaction, with consecutive items for the same
+    parameters coalesced into a single insert.
     """
 
-    def __init__(self, queue: Queue, conn: ConnectionPlus, table_name: str):
+    def __init__(self, queue: Queue, conn: ConnectionPlus, table_name: str,
+                 publish: Callable[[Sequence[str], Sequence[Sequence[VALUE]]],
+                                   None],
+                 metrics: _WriteMetrics):
         super().__init__()
         self.queue = queue
         self.path = conn.path_to_dbfile
         self.table_name = table_name
+        self.publish = publish
+        self.metrics = metrics
         self.keep_writing = True
 
     def run(self) -> None:
@@ -222,17 +444,37 @@ class _BackgroundWriter(Thread):
 
         while self.keep_writing:
 
-            item = self.queue.get()
-            if item['keys'] == 'stop':
+            items = [self.queue.get()]
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except Empty:
+                    break
+
+            results = [item for item in items if item['keys'] != 'stop']
+            if results:
+                self.write_results(results)
+                for item in results:
+                    self.publish(item['keys'], item['values'])
+
+            if len(results) < len(items):
                 self.keep_writing = False
                 self.conn.close()
-            else:
-                self.write_results(item['keys'], item['values'])
-            self.queue.task_done()
 
-    def write_results(self, keys: Sequence[str],
-                      values: Sequence[List[Any]]) -> None:
-        insert_many_values(self.conn, self.table_name, keys, values)
+            for _ in items:
+                self.queue.task_done()
+
+    def write_results(self, items: Sequence[Mapping[str, Any]]) -> None:
+        start = time.perf_counter()
+        n_rows = 0
+        with atomic(self.conn) as conn:
+            for keys, group in itertools.groupby(
+                    items, key=lambda item: item['keys']):
+                rows = [row for item in group for row in item['values']]
+                insert_many_rows(conn, self.table_name, keys, rows)
+                n_rows += len(rows)
+        self.metrics.record_commit(n_rows, start, time.perf_counter())
+
 
 class DataSet(Sized):
 
@@ -282,9 +524,16 @@ class DataSet(Sized):
 
         self._debug = False
         self.subscribers: Dict[str, _Subscriber] = {}
-        self._interdeps: InterDependencies_
+        # the run description and snapshot of an existing run are only
+        # loaded from the database and parsed on first access
+        self._parsed_interdeps: Optional[InterDependencies_] = None
+        self._snapshot: Optional[dict] = None
         self._parent_dataset_links: List[Link]
-        self._data_write_queue: Queue = Queue()
+        self._data_write_queue: Queue = Queue(
+            maxsize=qcodes.config.dataset.write_queue_size)
+        self._write_queue_policy: str = \
+            qcodes.config.dataset.write_queue_policy
+        self._write_metrics = _WriteMetrics()
 
         if run_id is not None:
             if not run_exists(self.conn, run_id):
@@ -292,8 +541,6 @@ class DataSet(Sized):
                                  f"the database")
             self._run_id = run_id
             self._completed = completed(self.conn, self.run_id)
-            run_desc = self._get_run_description_from_db()
-            self._interdeps = run_desc.interdeps
             self._metadata = get_metadata_from_run_id(self.conn, self.run_id)
             self._started = self.run_timestamp_raw is not None
             self._parent_dataset_links = str_to_links(
@@ -330,7 +577,20 @@ class DataSet(Sized):
 
         self._bg_writer = _BackgroundWriter(self._data_write_queue,
                                             self.conn,
-                                            self.table_name)
+                                            self.table_name,
+                                            self._publish_rows,
+                                            self._write_metrics)
+        self._cache = DataSetCache(self)
+
+    @property
+    def cache(self) -> DataSetCache:
+        """
+        The in-memory cache of the data of this :class:`.DataSet`, which
+        gives access to the data of a running measurement at a cost that
+        only grows with the number of new results, see
+        :class:`.DataSetCache`.
+        """
+        return self._cache
 
     @property
     def run_id(self) -> int:
@@ -361,18 +621,45 @@ class DataSet(Sized):
 
     @property
     def snapshot(self) -> Optional[dict]:
-        """Snapshot of the run as dictionary (or None)"""
-        snapshot_json = self.snapshot_raw
-        if snapshot_json is not None:
-            return json.loads(snapshot_json)
-        else:
-            return None
+        """
+        Snapshot of the run as dictionary (or None). The snapshot is parsed
+        on first access and the same dictionary is returned afterwards,
+        hence it should not be modified.
+        """
+        if self._snapshot is None:
+            snapshot_json = self.snapshot_raw
+            if snapshot_json is not None:
+                self._snapshot = json.loads(snapshot_json)
+        return self._snapshot
 
     @property
     def snapshot_raw(self) -> Optional[str]:
         """Snapshot of the run as a JSON-formatted string (or None)"""
-        return select_one_where(self.conn, "runs", "snapshot",
-                                "run_id", self.run_id)
+        return get_snapshot(self.conn, self.run_id)
+
+    def get_snapshot_value(self, *keys: Union[str, int]) -> Any:
+        """
+        Get a single value from the snapshot of the run, e.g. the value of a
+        parameter of an instrument::
+
+            dataset.get_snapshot_value('station', 'instruments', 'dac',
+                                       'parameters', 'ch1', 'value')
+
+        Unless the snapshot has been parsed already, only the requested value
+        is read from the database, which is much faster than parsing the
+        whole snapshot with :attr:`snapshot`.
+
+        Args:
+            *keys: the keys (of dictionaries) and indices (of lists) of the
+                path to the value within the snapshot
+
+        Raises:
+            KeyError: if the run has no snapshot or the snapshot has no value
+                at the given path
+        """
+        if self._snapshot is not None:
+            return _get_value_at_path(self._snapshot, keys)
+        return get_value_from_snapshot(self.conn, self.run_id, keys)
 
     @property
     def number_of_results(self) -> int:
@@ -434,6 +721,17 @@ class DataSet(Sized):
         """
         return get_run_timestamp_from_run_id(self.conn, self.run_id)
 
+    @property
+    def _interdeps(self) -> InterDependencies_:
+        if self._parsed_interdeps is None:
+            self._parsed_interdeps = \
+                self._get_run_description_from_db().interdeps
+        return self._parsed_interdeps
+
+    @_interdeps.setter
+    def _interdeps(self, interdeps: InterDependencies_) -> None:
+        self._parsed_interdeps = interdeps
+
     @property
     def description(self) -> RunDescriber:
         return RunDescriber(interdeps=self._interdeps)
@@ -564,6 +862,7 @@ class DataSet(Sized):
         echoed back.
         """
         self._debug = not self._debug
+        # closing a pooled connection only closes the handle of this dataset
         self.conn.close()
         self.conn = connect(self.path_to_db, self._debug)
 
@@ -613,15 +912,17 @@ class DataSet(Sized):
 
     def add_snapshot(self, snapshot: str, overwrite: bool = False) -> None:
         """
-        Adds a snapshot to this run
+        Adds a snapshot to this run. Identical snapshots of different runs
+        are stored only once in the database.
 
         Args:
             snapshot: the raw JSON dump of the snapshot
             overwrite: force overwrite an existing snapshot
         """
-        if self.snapshot is None or overwrite:
-            add_meta_data(self.conn, self.run_id, {'snapshot': snapshot})
-        elif self.snapshot is not None and not overwrite:
+        if self.snapshot_raw is None or overwrite:
+            add_snapshot(self.conn, self.run_id, snapshot)
+            self._snapshot = None
+        else:
             log.warning('This dataset already has a snapshot. Use overwrite'
                         '=True to overwrite that')
 
@@ -710,14 +1011,18 @@ class DataSet(Sized):
 
         self._perform_completion_actions()
         self.completed = True
+        # no more results will be added to the cache
+        self._cache.stop_live()
 
     def _perform_completion_actions(self) -> None:
         """
         Perform the necessary clean-up
         """
+        # all results must have been written, and hence published, before
+        # the subscribers are done
+        self.terminate_queue()
         for sub in self.subscribers.values():
             sub.done_callback()
-        self.terminate_queue()
 
     @deprecate(alternative='add_results')
     def add_result(self, results: Mapping[str, VALUE]) -> int:
@@ -756,10 +1061,15 @@ class DataSet(Sized):
             raise ValueError(
                 'Can not add result, missing setpoint values') from de
 
+        start = time.perf_counter()
         index = insert_values(self.conn, self.table_name,
                               list(results.keys()),
                               list(results.values())
                               )
+        self._write_metrics.record_commit(1, start, time.perf_counter())
+        self._publish_rows(list(results.keys()), [list(results.values())])
+        self._add_rows_to_cache(list(results.keys()),
+                                [list(results.values())])
         return index
 
     def add_results(self, results: Sequence[Mapping[str, VALUE]]) -> None:
@@ -791,11 +1101,72 @@ class DataSet(Sized):
         values = [[d.get(k, None) for k in expected_keys] for d in results]
 
         if self._bg_writer.is_alive():
-            item = {'keys': list(expected_keys), 'values': values}
-            self._data_write_queue.put(item)
+            if not self._enqueue_results(list(expected_keys), values):
+                return
         else:
+            start = time.perf_counter()
             insert_many_values(self.conn, self.table_name, list(expected_keys),
                                values)
+            self._write_metrics.record_commit(len(values), start,
+                                              time.perf_counter())
+            self._publish_rows(list(expected_keys), values)
+        self._add_rows_to_cache(list(expected_keys), values)
+
+    def add_columnar_results(
+            self,
+            results: Sequence[Mapping[str, COLUMN]]) -> None:
+        """
+        Adds a sequence of columnar result blocks to the :class:`.DataSet`.
+        This is the fast path used by the :class:`.DataSaver`: the columns
+        are inserted row by row via a single prepared statement without
+        ever building a dictionary per row.
+
+        Args:
+            results: list of blocks, each block mapping parameter names to
+                columns (sequences or 1D numpy arrays) of equal length. The
+                i'th row of a block consists of the i'th element of each of
+                its columns. Consecutive blocks with the same parameter names
+                are coalesced into a single insert.
+
+        If the :attr:`cache` of this :class:`.DataSet` is live, the results
+        are added to it as well.
+
+        It is an error to provide a column for a key that is not the name of a
+        parameter in this :class:`.DataSet`.
+
+        It is an error to add results to a completed :class:`.DataSet`.
+        """
+
+        if self.pristine:
+            raise RuntimeError('This DataSet has not been marked as started. '
+                               'Please mark the DataSet as started before '
+                               'adding results to it.')
+
+        if self.completed:
+            raise CompletedError('This DataSet is complete, no further '
+                                 'results can be added to it.')
+
+        coalesced = _coalesce_columnar_results(results)
+
+        if self._bg_writer.is_alive():
+            coalesced = [columns for columns in coalesced
+                         if self._enqueue_results(
+                             list(columns), list(zip(*columns.values())))]
+        else:
+            start = time.perf_counter()
+            n_rows = 0
+            with atomic(self.conn) as conn:
+                for columns in coalesced:
+                    n_rows += insert_many_rows(conn, self.table_name,
+                                               list(columns),
+                                               zip(*columns.values()))
+            self._write_metrics.record_commit(n_rows, start,
+                                              time.perf_counter())
+            for columns in coalesced:
+                self._publish_columns(columns)
+
+        if self._cache.live:
+            self._cache.add_data(coalesced)
 
     def add_result_to_queue(self,
                             results: Sequence[Mapping[str, VALUE]]) -> None:
@@ -815,8 +1186,118 @@ class DataSet(Sized):
         expected_keys = frozenset.union(*[frozenset(d) for d in results])
         values = [[d.get(k, None) for k in expected_keys] for d in results]
 
-        item = {'keys': list(expected_keys), 'values': values}
-        self._data_write_queue.put(item)
+        if self._enqueue_results(list(expected_keys), values):
+            self._add_rows_to_cache(list(expected_keys), values)
+
+    def _enqueue_results(self, keys: Sequence[str],
+                         rows: Sequence[Sequence[VALUE]]) -> bool:
+        """
+        Put rows of results in the queue of the background writer. If the
+        queue is full, either wait for room in the queue or drop the results,
+        depending on the ``dataset.write_queue_policy`` config setting.
+
+        Returns:
+            False if the results have been dropped, True otherwise
+        """
+        item = {'keys': keys, 'values': rows}
+        if self._write_queue_policy == 'drop':
+            try:
+                self._data_write_queue.put_nowait(item)
+            except Full:
+                self._write_metrics.record_drop(len(rows))
+                log.warning(f'The write queue of {self.guid} is full, '
+                            f'dropping {len(rows)} results.')
+                return False
+        else:
+            self._put_in_write_queue(item)
+        self._write_metrics.record_queue_depth(self._data_write_queue.qsize())
+        return True
+
+    def _put_in_write_queue(self, item: Mapping[str, Any]) -> None:
+        """
+        Put an item in the queue of the background writer, waiting for room
+        in the queue if it is full. Raises if the background writer has
+        stopped, since it would never make room or write the item.
+        """
+        writer = self._bg_writer
+        while True:
+            # a writer that has not been started yet may still be started
+            if writer.ident is not None and not writer.is_alive():
+                raise RuntimeError(f'The background writer of {self.guid} '
+                                   f'has stopped, the results can not be '
+                                   f'written')
+            try:
+                self._data_write_queue.put(
+                    item, timeout=_WRITE_QUEUE_POLL_INTERVAL)
+                return
+            except Full:
+                pass
+
+    def get_write_metrics(self) -> Dict[str, Any]:
+        """
+        Returns counters of the writes of results of this :class:`.DataSet`
+        to the database, which tell e.g. whether the background writer keeps
+        up with the rate at which results are added.
+
+        Returns:
+            Dictionary with the number of rows written (``rows_written``) and
+            dropped because the write queue was full (``rows_dropped``), the
+            number of transactions (``commits``), the average write rate
+            between the start of the first and the end of the last commit
+            (``rows_per_second``), the current and maximal number of batches
+            of results waiting in the write queue (``queue_depth`` and
+            ``max_queue_depth``), the mean and max commit latency in seconds
+            and a histogram of the commit latencies
+            (``commit_latency_histogram``), mapping the upper bound of each
+            bin in seconds to the number of commits in the bin.
+        """
+        return self._write_metrics.as_dict(self._data_write_queue.qsize())
+
+    def _add_rows_to_cache(self, keys: Sequence[str],
+                           rows: Sequence[Sequence[VALUE]]) -> None:
+        """
+        Add rows of results to the :attr:`cache` of this :class:`.DataSet`
+        if it is live. As in the database, only the rows that have a value
+        for the top level parameter of a tree belong to that tree.
+        """
+        if not (self._cache.live and rows):
+            return
+        interdeps = self._interdeps
+        blocks = []
+        for spec in interdeps.non_dependencies:
+            if spec.name not in keys:
+                continue
+            tree = [spec.name] + [ps.name for ps in
+                                  interdeps.dependencies.get(spec, ())]
+            indices = [keys.index(name) for name in tree if name in keys]
+            toplevel_index = keys.index(spec.name)
+            tree_rows = [[row[i] for i in indices] for row in rows
+                         if row[toplevel_index] is not None]
+            if tree_rows:
+                blocks.append(dict(zip(
+                    [keys[i] for i in indices],
+                    (list(column) for column in zip(*tree_rows)))))
+        self._cache.add_data(blocks)
+
+    def _publish_rows(self, keys: Sequence[str],
+                      rows: Sequence[Sequence[VALUE]]) -> None:
+        """
+        Publish rows of results that have been written to the database to
+        the subscribers of this :class:`.DataSet`
+        """
+        if self.subscribers:
+            self._publish_columns(dict(zip(keys, zip(*rows))))
+
+    def _publish_columns(self, columns: Mapping[str, Sequence[VALUE]]
+                         ) -> None:
+        """
+        Publish columns of results that have been written to the database to
+        the subscribers of this :class:`.DataSet`
+        """
+        # the results may be published from the background writer thread,
+        # so iterate over a copy in case subscribers are being added
+        for subscriber in list(self.subscribers.values()):
+            subscriber.put(columns)
 
     def terminate_queue(self) -> None:
         """
@@ -824,8 +1305,9 @@ class DataSet(Sized):
         background writing thread has been started. Else do nothing.
         """
         if self._bg_writer.is_alive():
-            self._data_write_queue.put({'keys': 'stop', 'values': []})
-            self._data_write_queue.join()
+            self._put_in_write_queue({'keys': 'stop', 'values': []})
+            # the writer stops once it has written all the results before
+            # the stop signal, or if writing them fails
             self._bg_writer.join()
 
     @staticmethod
@@ -931,14 +1413,44 @@ class DataSet(Sized):
             to numpy arrays containing the data points of type numeric,
             array or string.
         """
-        if len(params) == 0:
-            valid_param_names = [ps.name
-                                 for ps in self._interdeps.non_dependencies]
-        else:
-            valid_param_names = self._validate_parameters(*params)
+        valid_param_names = self._toplevel_parameter_names(*params)
         return get_parameter_data(self.conn, self.table_name,
                                   valid_param_names, start, end)
 
+    def get_parameter_data_chunks(
+            self,
+            *params: Union[str, ParamSpec, _BaseParameter],
+            chunk_size: int = 10000) -> Iterator[ParameterData]:
+        """
+        Iterate over the values stored in the :class:`.DataSet` for the
+        specified parameters and their dependencies in chunks of (at most)
+        ``chunk_size`` results, such that the memory needed does not depend
+        on the size of the :class:`.DataSet`. Each chunk has the format of
+        :py:meth:`.get_parameter_data`; parameters that have no results in
+        a chunk map to an empty dictionary.
+
+        Args:
+            *params: string parameter names, QCoDeS Parameter objects, and
+                ParamSpec objects. If no parameters are supplied data for
+                all parameters that are not a dependency of another
+                parameter will be returned.
+            chunk_size: the number of results (rows of the results table)
+                per chunk
+
+        Yields:
+            Dictionary from requested parameters to Dict of parameter names
+            to numpy arrays containing the data points of the chunk.
+        """
+        valid_param_names = self._toplevel_parameter_names(*params)
+        return get_parameter_data_chunks(self.conn, self.table_name,
+                                         valid_param_names, chunk_size)
+
+    def _toplevel_parameter_names(
+            self, *params: Union[str, ParamSpec, _BaseParameter]) -> List[str]:
+        if len(params) == 0:
+            return [ps.name for ps in self._interdeps.non_dependencies]
+        return self._validate_parameters(*params)
+
     def get_data_as_pandas_dataframe(self,
                                      *params: Union[str,
                                                     ParamSpec,
@@ -982,41 +1494,37 @@ class DataSet(Sized):
             a column and a indexed by a :py:class:`pandas.MultiIndex` formed
             by the dependencies.
         """
-        import pandas as pd
-        dfs = {}
         datadict = self.get_parameter_data(*params,
                                            start=start,
                                            end=end)
-        for name, subdict in datadict.items():
-            keys = list(subdict.keys())
-            if len(keys) == 0:
-                dfs[name] = pd.DataFrame()
-                continue
-            if len(keys) == 1:
-                index = None
-            elif len(keys) == 2:
-                index = pd.Index(subdict[keys[1]].ravel(), name=keys[1])
-            else:
-                indexdata = tuple(numpy.concatenate(subdict[key])
-                                  if subdict[key].dtype == numpy.dtype('O')
-                                  else subdict[key].ravel()
-                                  for key in keys[1:])
-                index = pd.MultiIndex.from_arrays(
-                    indexdata,
-                    names=keys[1:])
-
-            if subdict[keys[0]].dtype == numpy.dtype('O'):
-                # ravel will not fully unpack a numpy array of arrays
-                # which are of "object" dtype. This can happen if a variable
-                # length array is stored in the db. We use concatenate to
-                # flatten these
-                mydata = numpy.concatenate(subdict[keys[0]])
-            else:
-                mydata = subdict[keys[0]].ravel()
-            df = pd.DataFrame(mydata, index=index,
-                              columns=[keys[0]])
-            dfs[name] = df
-        return dfs
+        return _parameter_data_to_dataframes(datadict)
+
+    def get_data_as_pandas_dataframe_chunks(
+            self,
+            *params: Union[str, ParamSpec, _BaseParameter],
+            chunk_size: int = 10000) -> Iterator[Dict[str, "pd.DataFrame"]]:
+        """
+        Iterate over the values stored in the :class:`.DataSet` for the
+        specified parameters and their dependencies in chunks of (at most)
+        ``chunk_size`` results, with each chunk in the format of
+        :py:meth:`.get_data_as_pandas_dataframe`. See
+        :py:meth:`.get_parameter_data_chunks`.
+
+        Args:
+            *params: string parameter names, QCoDeS Parameter objects, and
+                ParamSpec objects. If no parameters are supplied data for
+                all parameters that are not a dependency of another
+                parameter will be returned.
+            chunk_size: the number of results (rows of the results table)
+                per chunk
+
+        Yields:
+            Dictionary from requested parameter names to
+            :py:class:`pandas.DataFrame` s of the data points of the chunk.
+        """
+        for datadict in self.get_parameter_data_chunks(*params,
+                                                       chunk_size=chunk_size):
+            yield _parameter_data_to_dataframes(datadict)
 
     def write_data_to_text_file(self, path: str,
                                 single_file: bool = False,
@@ -1055,27 +1563,51 @@ class DataSet(Sized):
                                in a single file but no filename provided.
         """
         import pandas as pd
-        dfdict = self.get_data_as_pandas_dataframe()
-        dfs_to_save = list()
-        for parametername, df in dfdict.items():
-            if not single_file:
+        # the data is written chunk by chunk, such that it never needs to be
+        # held in memory as a whole
+        parameter_names = self._toplevel_parameter_names()
+        if not single_file:
+            for parametername in parameter_names:
                 dst = os.path.join(path, f'{parametername}.dat')
-                df.to_csv(path_or_buf=dst, header=False, sep='\t')
-            else:
-                dfs_to_save.append(df)
-        if single_file:
-            df_length = len(dfs_to_save[0])
-            if any(len(df) != df_length for df in dfs_to_save):
-                raise DataLengthException("You cannot concatenate data " +
-                                          "with different length to a " +
-                                          "single file.")
-            if single_file_name == None:
-                raise DataPathException("Please provide the desired file name " +
-                                        "for the concatenated data.")
-            else:
-                dst = os.path.join(path, f'{single_file_name}.dat')
-                df_to_save = pd.concat(dfs_to_save, axis=1)
-                df_to_save.to_csv(path_or_buf=dst, header=False, sep='\t')
+                with open(dst, 'w', newline='') as f:
+                    for df in self._dataframe_chunks(parametername):
+                        df.to_csv(path_or_buf=f, header=False, sep='\t')
+            return
+
+        if single_file_name is None:
+            raise DataPathException("Please provide the desired file name " +
+                                    "for the concatenated data.")
+        dst = os.path.join(path, f'{single_file_name}.dat')
+        streams = [self._dataframe_chunks(name) for name in parameter_names]
+        pending = [pd.DataFrame() for _ in streams]
+        with open(dst, 'w', newline='') as f:
+            while True:
+                # combine the data of all parameters row by row, taking as
+                # many rows as are available from each of them
+                for i, stream in enumerate(streams):
+                    if len(pending[i]) == 0:
+                        pending[i] = next(stream, pending[i])
+                n_rows = min(len(df) for df in pending)
+                if n_rows == 0:
+                    break
+                df_to_save = pd.concat([df.iloc[:n_rows] for df in pending],
+                                       axis=1)
+                df_to_save.to_csv(path_or_buf=f, header=False, sep='\t')
+                pending = [df.iloc[n_rows:] for df in pending]
+        if any(len(df) > 0 for df in pending):
+            os.remove(dst)
+            raise DataLengthException("You cannot concatenate data " +
+                                      "with different length to a " +
+                                      "single file.")
+
+    def _dataframe_chunks(self, parameter_name: str) -> Iterator["pd.DataFrame"]:
+        """
+        Iterate over the non-empty chunks of the data of the given
+        parameter as :py:class:`pandas.DataFrame` s
+        """
+        for dfs in self.get_data_as_pandas_dataframe_chunks(parameter_name):
+            if len(dfs[parameter_name]) > 0:
+                yield dfs[parameter_name]
 
     @deprecate('This method does not accurately represent the dataset.',
                'Use `get_parameter_data` instead.')
@@ -1116,11 +1648,39 @@ class DataSet(Sized):
                   min_wait: int = 0,
                   min_count: int = 1,
                   state: Optional[Any] = None,
-                  callback_kwargs: Optional[Mapping[str, Any]] = None
+                  callback_kwargs: Optional[Mapping[str, Any]] = None,
+                  max_count: Optional[int] = None,
+                  columnar: bool = False
                   ) -> str:
+        """
+        Subscribe a callback to the results that are added to this
+        :class:`.DataSet` in this process. The callback is called from a
+        separate thread as ``callback(results, length, state)``, with the
+        results that have been written since the previous call and the
+        number of results in the :class:`.DataSet`.
+
+        Args:
+            callback: the function to call
+            min_wait: the minimum time between two calls of the callback,
+                in milliseconds
+            min_count: the minimum number of results to pass to the callback
+                at once (unless the :class:`.DataSet` is completed)
+            state: an object that is passed to the callback
+            callback_kwargs: additional keyword arguments for the callback
+            max_count: if given, the writer of the results blocks while this
+                many results have not been passed to the callback yet
+            columnar: if True, the results are passed as a dictionary from
+                parameter names to numpy arrays of values, else as a list of
+                tuples with one value per parameter
+
+        Returns:
+            the id of the subscriber
+        """
         subscriber_id = uuid.uuid4().hex
         subscriber = _Subscriber(self, subscriber_id, callback, state,
-                                 min_wait, min_count, callback_kwargs)
+                                 min_wait, min_count, callback_kwargs,
+                                 max_queue_length=max_count,
+                                 columnar=columnar)
         self.subscribers[subscriber_id] = subscriber
         subscriber.start()
         return subscriber_id
@@ -1161,17 +1721,17 @@ class DataSet(Sized):
         """
         Remove subscriber with the provided uuid
         """
-        with atomic(self.conn) as conn:
-            sub = self.subscribers[uuid]
-            remove_trigger(conn, sub.trigger_id)
-            sub.schedule_stop()
-            sub.join()
-            del self.subscribers[uuid]
+        sub = self.subscribers[uuid]
+        sub.schedule_stop()
+        sub.join()
+        del self.subscribers[uuid]
 
     def unsubscribe_all(self) -> None:
         """
         Remove all subscribers
         """
+        # subscribers of earlier versions of QCoDeS were fed by triggers,
+        # which fail if they are left in the database
         sql = "select * from sqlite_master where type = 'trigger';"
         triggers = atomic_transaction(self.conn, sql).fetchall()
         with atomic(self.conn) as conn:
@@ -1223,7 +1783,7 @@ def load_by_id(run_id: int, conn: Optional[ConnectionPlus] = None) -> DataSet:
     if run_id is None:
         raise ValueError('run_id has to be a positive integer, not None.')
 
-    conn = conn or connect(get_DB_location())
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
 
     d = DataSet(conn=conn, run_id=run_id)
     return d
@@ -1265,7 +1825,7 @@ def load_by_run_spec(*,
     Returns:
         :class:`.DataSet` matching the provided specification.
     """
-    conn = conn or connect(get_DB_location())
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
     guids = get_guids_from_run_spec(conn,
                                     captured_run_id=captured_run_id,
                                     captured_counter=captured_counter,
@@ -1305,7 +1865,7 @@ def load_by_guid(guid: str, conn: Optional[ConnectionPlus] = None) -> DataSet:
         NameError: if no run with the given GUID exists in the database
         RuntimeError: if several runs with the given GUID are found
     """
-    conn = conn or connect(get_DB_location())
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
 
     # this function raises a RuntimeError if more than one run matches the GUID
     run_id = get_runid_from_guid(conn, guid)
@@ -1336,7 +1896,7 @@ def load_by_counter(counter: int, exp_id: int,
     Returns:
         :class:`.DataSet` of the given counter in the given experiment
     """
-    conn = conn or connect(get_DB_location())
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
     sql = """
     SELECT run_id
     FROM
@@ -1399,12 +1959,16 @@ def generate_dataset_table(guids: Sequence[str],
     headers = ["captured_run_id", "captured_counter", "experiment_name",
                "sample_name",
                "sample_id", "location", "work_station"]
+    summaries = {summary.guid: summary
+                 for summary in search_runs(guids=guids, conn=conn)}
     table = []
     for guid in guids:
-        ds = load_by_guid(guid, conn=conn)
+        if guid not in summaries:
+            raise NameError(f'No run with GUID: {guid} found in database.')
+        summary = summaries[guid]
         parsed_guid = parse_guid(guid)
-        table.append([ds.captured_run_id, ds.captured_counter, ds.exp_name,
-                      ds.sample_name,
+        table.append([summary.captured_run_id, summary.captured_counter,
+                      summary.exp_name, summary.sample_name,
                       parsed_guid['sample'], parsed_guid['location'],
                       parsed_guid['work_station']])
     return tabulate(table, headers=headers)
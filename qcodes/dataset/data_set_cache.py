@@ -0,0 +1,216 @@
+"""
+This module contains the in-memory cache of the data of a
+:class:`.DataSet`. The cache is meant for code that repeatedly accesses the
+data of a running measurement, e.g. live plotting, for which reloading all
+the data with :meth:`.DataSet.get_parameter_data` on every refresh would
+take longer and longer as the measurement progresses.
+"""
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from qcodes.dataset.sqlite.connection import atomic
+from qcodes.dataset.sqlite.queries import (_column_values_to_array,
+                                           _expand_scalar_columns,
+                                           get_parameter_tree_data)
+from qcodes.dataset.sqlite.query_helpers import VALUE, length
+
+if TYPE_CHECKING:
+    from qcodes.dataset.data_set import DataSet
+
+
+ParameterData = Dict[str, Dict[str, np.ndarray]]
+
+
+def _to_array_of_rows(values: np.ndarray) -> np.ndarray:
+    """
+    Turn an array into a one-dimensional array of (object dtype) holding the
+    rows of the array, which is how columns of arrays of different shapes
+    are represented.
+    """
+    if values.dtype == np.dtype('O') and values.ndim == 1:
+        return values
+    rows = np.empty(len(values), dtype=object)
+    for i, row in enumerate(values):
+        rows[i] = row
+    return rows
+
+
+class _GrowableArray:
+    """
+    A numpy array that can be appended to along its first axis. The
+    underlying buffer is over-allocated geometrically such that appending
+    costs amortised O(number of appended values). If the appended values
+    require a different dtype or have rows of a different shape, the buffer
+    is converted accordingly.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._buffer = values.copy()
+        self._length = len(values)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        A view of the values held by the buffer. Appending values does not
+        modify views that have been returned before.
+        """
+        return self._buffer[:self._length]
+
+    def append(self, values: np.ndarray) -> None:
+        if values.shape[1:] != self._buffer.shape[1:]:
+            self._buffer = _to_array_of_rows(self.values)
+            values = _to_array_of_rows(values)
+
+        dtype = np.result_type(self._buffer.dtype, values.dtype)
+        new_length = self._length + len(values)
+
+        if new_length > len(self._buffer) or dtype != self._buffer.dtype:
+            capacity = max(new_length, 2 * len(self._buffer))
+            buffer = np.empty((capacity,) + self._buffer.shape[1:],
+                              dtype=dtype)
+            buffer[:self._length] = self.values
+            self._buffer = buffer
+
+        self._buffer[self._length:new_length] = values
+        self._length = new_length
+
+
+class DataSetCache:
+    """
+    The in-memory cache of the data of a :class:`.DataSet`. It holds the data
+    of each parameter that is not a dependency of another parameter, along
+    with the data of its dependencies, in the same format as
+    :meth:`.DataSet.get_parameter_data`.
+
+    The cache can be kept up to date in two ways. While the dataset is
+    written by a :class:`.DataSaver` in this process, the cache is live:
+    every batch of results that is added to the dataset is added to the
+    cache as well, so the database is never read. Otherwise, each call to
+    :meth:`data` loads from the database only the rows that have been added
+    to the results table since the previous call. Either way, the cost of a
+    refresh is proportional to the number of new results.
+
+    The DataSetCache is not meant to be instantiated directly, but rather
+    used via the ``cache`` property of the :class:`.DataSet`.
+    """
+
+    def __init__(self, dataset: 'DataSet') -> None:
+        self._dataset = dataset
+        self._data: Dict[str, Dict[str, _GrowableArray]] = {}
+        # the highest id of the rows of the results table loaded so far
+        self._max_rowid = 0
+        self._live = False
+
+    @property
+    def live(self) -> bool:
+        """
+        Is the cache fed with the results of a measurement running in this
+        process rather than being loaded from the database?
+        """
+        return self._live
+
+    def data(self) -> ParameterData:
+        """
+        Returns the cached data of all the parameters that are not a
+        dependency of another parameter, see
+        :meth:`.DataSet.get_parameter_data`. Unless the cache is live, the
+        results that have been added to the database since the last call are
+        loaded first.
+
+        Note that the arrays returned are views of the cache, which should
+        not be modified.
+        """
+        if not self._live:
+            self.load_data_from_db()
+        return {name: {param: array.values
+                       for param, array in self._data.get(name, {}).items()}
+                for name in self._toplevel_names()}
+
+    def load_data_from_db(self) -> None:
+        """
+        Load the rows that have been added to the results table of the
+        dataset since the last load and append them to the cache.
+        """
+        conn = self._dataset.conn
+        table_name = self._dataset.table_name
+        interdeps = self._dataset.description.interdeps
+
+        with atomic(conn) as atomic_conn:
+            max_rowid = length(atomic_conn, table_name)
+            if max_rowid <= self._max_rowid:
+                return
+            # rows are only ever appended, hence bounding the row ids from
+            # above gives a consistent view of all parameter trees even if
+            # results are being written meanwhile
+            for name in self._toplevel_names():
+                self._append(name, get_parameter_tree_data(
+                    atomic_conn, table_name, interdeps, name,
+                    min_rowid=self._max_rowid + 1, max_rowid=max_rowid))
+        self._max_rowid = max_rowid
+
+    def start_live(self) -> None:
+        """
+        Make the cache live, i.e. from now on expect all the results of the
+        dataset to be added with :meth:`add_data` and no longer read the
+        database. Results that are already in the database are loaded first.
+        """
+        if not self._live:
+            self.load_data_from_db()
+            self._live = True
+
+    def stop_live(self) -> None:
+        """
+        Stop the cache from being live, once all the results of the dataset
+        have been added to it and written to the database, e.g. because the
+        dataset has been completed. From then on, :meth:`data` loads the
+        rows that are added to the database later, if any.
+        """
+        if self._live:
+            self._max_rowid = length(self._dataset.conn,
+                                     self._dataset.table_name)
+            self._live = False
+
+    def add_data(self, results: Sequence[Mapping[str, List[VALUE]]]) -> None:
+        """
+        Add results to the cache, without reading them from the database.
+
+        Args:
+            results: blocks of results, each mapping parameter names to lists
+                of values of equal length, as written to the database by
+                :meth:`.DataSet.add_columnar_results`, or written by
+                any of the other methods of the dataset that add results.
+        """
+        interdeps = self._dataset.description.interdeps
+        for block in results:
+            for name in self._toplevel_names():
+                if name not in block or len(block[name]) == 0:
+                    continue
+                n_rows = len(block[name])
+                spec = interdeps._id_to_paramspec[name]
+                paramspecs = [spec] \
+                    + list(interdeps.dependencies.get(spec, ()))
+                types = [ps.type for ps in paramspecs]
+                arrays = [_column_values_to_array(
+                              block.get(ps.name, [None] * n_rows), ps.type)
+                          for ps in paramspecs]
+                self._append(name, dict(zip(
+                    [ps.name for ps in paramspecs],
+                    _expand_scalar_columns(arrays, types))))
+
+    def _toplevel_names(self) -> List[str]:
+        interdeps = self._dataset.description.interdeps
+        return [ps.name for ps in interdeps.non_dependencies]
+
+    def _append(self, name: str, new_data: Mapping[str, np.ndarray]) -> None:
+        if not new_data:
+            return
+        tree = self._data.setdefault(name, {})
+        for param, values in new_data.items():
+            if param in tree:
+                tree[param].append(values)
+            else:
+                tree[param] = _GrowableArray(values)
@@ -1,8 +1,12 @@
 from typing import Union, Optional
 from warnings import warn
+import logging
 import os
+import sqlite3
+import sys
 
 import numpy as np
+from tqdm import tqdm
 
 from qcodes.dataset.descriptions.versioning.converters import new_to_old
 from qcodes.dataset.data_set import DataSet
@@ -10,24 +14,37 @@ from qcodes.dataset.experiment_container import load_or_create_experiment
 from qcodes.dataset.sqlite.connection import atomic, ConnectionPlus
 from qcodes.dataset.sqlite.database import connect, \
     get_db_version_and_newest_available_version
-from qcodes.dataset.sqlite.queries import add_meta_data, create_run, \
+from qcodes.dataset.sqlite.queries import add_snapshot, create_run, \
     get_exp_ids_from_run_ids, get_matching_exp_ids, get_runid_from_guid, \
     is_run_id_in_database, mark_run_complete, new_experiment
 from qcodes.dataset.sqlite.query_helpers import select_many_where, \
     sql_placeholder_string
 from qcodes.dataset.linked_datasets.links import links_to_str
 
+log = logging.getLogger(__name__)
+
+# the name under which the source DB is attached to the connection to the
+# target DB, such that its tables can be copied with SQL statements
+SOURCE_SCHEMA = 'extract_source'
+
 
 def extract_runs_into_db(source_db_path: str,
                          target_db_path: str, *run_ids: int,
                          upgrade_source_db: bool = False,
-                         upgrade_target_db: bool = False) -> None:
+                         upgrade_target_db: bool = False,
+                         show_progress: bool = False) -> None:
     """
     Extract a selection of runs into another DB file. All runs must come from
     the same experiment. They will be added to an experiment with the same name
     and ``sample_name`` in the target db. If such an experiment does not exist, it
     will be created.
 
+    The source DB is attached to the target DB, such that the results of a
+    run are copied by SQLite itself, without passing through Python. Each run
+    is copied in a transaction of its own, and runs that are already in the
+    target DB are skipped. Hence, an extraction that was interrupted is
+    resumed by calling this function again with the same arguments.
+
     Args:
         source_db_path: Path to the source DB file
         target_db_path: Path to the target DB file. The target DB file will be
@@ -37,6 +54,7 @@ def extract_runs_into_db(source_db_path: str,
           not the newest, should it be upgraded?
         upgrade_target_db: If the target DB is found to be in a version that is
           not the newest, should it be upgraded?
+        show_progress: Whether to show a progress bar of the runs copied
     """
     # Check for versions
     (s_v, new_v) = get_db_version_and_newest_available_version(source_db_path)
@@ -97,7 +115,13 @@ def extract_runs_into_db(source_db_path: str,
     # matching both the name and sample_name
 
     try:
+        datasets = [DataSet(run_id=run_id, conn=source_conn)
+                    for run_id in run_ids]
+
         with atomic(target_conn) as target_conn:
+            # no run is copied unless all of them can be
+            for dataset in datasets:
+                _check_dataset_completed(dataset)
 
             target_exp_id = _create_exp_if_needed(target_conn,
                                                   exp_attrs['name'],
@@ -106,17 +130,48 @@ def extract_runs_into_db(source_db_path: str,
                                                   exp_attrs['start_time'],
                                                   exp_attrs['end_time'])
 
+        source_attached = _attach_source_db(target_conn, source_db_path)
+        try:
             # Finally insert the runs
-            for run_id in run_ids:
-                _extract_single_dataset_into_db(DataSet(run_id=run_id,
-                                                        conn=source_conn),
-                                                target_conn,
-                                                target_exp_id)
+            for dataset in tqdm(datasets, file=sys.stdout,
+                                disable=not show_progress):
+                with atomic(target_conn) as target_conn:
+                    _extract_single_dataset_into_db(dataset,
+                                                    target_conn,
+                                                    target_exp_id,
+                                                    source_attached)
+        finally:
+            if source_attached:
+                target_conn.execute(f'DETACH DATABASE {SOURCE_SCHEMA}')
     finally:
         source_conn.close()
         target_conn.close()
 
 
+def _attach_source_db(target_conn: ConnectionPlus,
+                      source_db_path: str) -> bool:
+    """
+    Attach the source DB to the connection to the target DB as
+    ``SOURCE_SCHEMA``. Returns whether it was attached; if not, the results
+    are copied through Python.
+    """
+    try:
+        target_conn.execute(f'ATTACH DATABASE ? AS {SOURCE_SCHEMA}',
+                            (source_db_path,))
+    except sqlite3.OperationalError as e:
+        log.warning(f'Could not attach the source DB {source_db_path}, '
+                    f'the runs are copied row by row: {e}')
+        return False
+    return True
+
+
+def _check_dataset_completed(dataset: DataSet) -> None:
+    if not dataset.completed:
+        raise ValueError('Dataset not completed. An incomplete dataset '
+                         'can not be copied. The incomplete dataset has '
+                         f'GUID: {dataset.guid} and run_id: {dataset.run_id}')
+
+
 def _create_exp_if_needed(target_conn: ConnectionPlus,
                           exp_name: str,
                           sample_name: str,
@@ -156,7 +211,8 @@ def _create_exp_if_needed(target_conn: ConnectionPlus,
 
 def _extract_single_dataset_into_db(dataset: DataSet,
                                     target_conn: ConnectionPlus,
-                                    target_exp_id: int) -> None:
+                                    target_exp_id: int,
+                                    source_attached: bool = False) -> None:
     """
     NB: This function should only be called from within
     meth:`extract_runs_into_db`
@@ -171,12 +227,12 @@ def _extract_single_dataset_into_db(dataset: DataSet,
         target_conn: connection to the DB. Must be atomically guarded
         target_exp_id: The ``exp_id`` of the (target DB) experiment in which to
           insert the run
+        source_attached: Is the DB of the dataset attached to ``target_conn``
+          as ``SOURCE_SCHEMA``? If so, the results and the snapshot are copied
+          with SQL statements.
     """
 
-    if not dataset.completed:
-        raise ValueError('Dataset not completed. An incomplete dataset '
-                         'can not be copied. The incomplete dataset has '
-                         f'GUID: {dataset.guid} and run_id: {dataset.run_id}')
+    _check_dataset_completed(dataset)
 
     source_conn = dataset.conn
 
@@ -193,7 +249,6 @@ def _extract_single_dataset_into_db(dataset: DataSet,
     parspecs = [parspecs_dict[p] for p in param_names]
 
     metadata = dataset.metadata
-    snapshot_raw = dataset.snapshot_raw
     captured_run_id = dataset.captured_run_id
     captured_counter = dataset.captured_counter
     parent_dataset_links = links_to_str(dataset.parent_dataset_links)
@@ -209,45 +264,122 @@ def _extract_single_dataset_into_db(dataset: DataSet,
             captured_counter=captured_counter,
             parent_dataset_links=parent_dataset_links)
 
-    _populate_results_table(source_conn,
-                            target_conn,
-                            dataset.table_name,
-                            target_table_name)
+    if not (source_attached
+            and _copy_results_table(target_conn, dataset.table_name,
+                                    target_table_name)):
+        _populate_results_table(source_conn,
+                                target_conn,
+                                dataset.table_name,
+                                target_table_name)
     mark_run_complete(target_conn, target_run_id)
     _rewrite_timestamps(target_conn,
                         target_run_id,
                         dataset.run_timestamp_raw,
                         dataset.completed_timestamp_raw)
 
-    if snapshot_raw is not None:
-        add_meta_data(target_conn, target_run_id, {'snapshot': snapshot_raw})
+    if not (source_attached
+            and _copy_snapshot(target_conn, dataset.run_id, target_run_id)):
+        snapshot_raw = dataset.snapshot_raw
+        if snapshot_raw is not None:
+            add_snapshot(target_conn, target_run_id, snapshot_raw)
+
+
+def _copy_results_table(target_conn: ConnectionPlus,
+                        source_table_name: str,
+                        target_table_name: str) -> bool:
+    """
+    Copy over all the entries of the results table of the attached source DB
+    with a single ``INSERT ... SELECT`` statement. Returns False without
+    copying anything if the source table has columns that the target table
+    does not have.
+    """
+    source_columns = [row[1] for row in target_conn.execute(
+        f'PRAGMA {SOURCE_SCHEMA}.table_info("{source_table_name}")')]
+    target_columns = {row[1] for row in target_conn.execute(
+        f'PRAGMA main.table_info("{target_table_name}")')}
+    # the first column is "id"
+    columns = source_columns[1:]
+    if not source_columns or not set(columns) <= target_columns:
+        return False
+    if not columns:
+        # a run without parameters has no results to copy
+        return True
+
+    column_list = ','.join(f'"{column}"' for column in columns)
+    target_conn.execute(f"""
+                        INSERT INTO main."{target_table_name}" ({column_list})
+                        SELECT {column_list}
+                        FROM {SOURCE_SCHEMA}."{source_table_name}"
+                        ORDER BY id
+                        """)
+    return True
+
+
+def _copy_snapshot(target_conn: ConnectionPlus, source_run_id: int,
+                   target_run_id: int) -> bool:
+    """
+    Copy the snapshot of a run from the attached source DB, without reading
+    it into Python. Returns False if the source run does not refer to a
+    snapshot in the snapshots table.
+    """
+    row = target_conn.execute(f"""
+                              SELECT snapshot_hash
+                              FROM {SOURCE_SCHEMA}.runs
+                              WHERE run_id = ?
+                              """, (source_run_id,)).fetchone()
+    if row is None or row[0] is None:
+        return False
+
+    snapshot_hash = row[0]
+    target_conn.execute(f"""
+                        INSERT OR IGNORE INTO main.snapshots
+                        (snapshot_hash, snapshot)
+                        SELECT snapshot_hash, snapshot
+                        FROM {SOURCE_SCHEMA}.snapshots
+                        WHERE snapshot_hash = ?
+                        """, (snapshot_hash,))
+    target_conn.execute("""
+                        UPDATE main.runs
+                        SET snapshot_hash = ?, snapshot = NULL
+                        WHERE run_id = ?
+                        """, (snapshot_hash, target_run_id))
+    return True
 
 
 def _populate_results_table(source_conn: ConnectionPlus,
                             target_conn: ConnectionPlus,
                             source_table_name: str,
-                            target_table_name: str) -> None:
+                            target_table_name: str,
+                            chunk_size: int = 10000) -> None:
     """
-    Copy over all the entries of the results table
+    Copy over all the entries of the results table. The entries are copied
+    in chunks of ``chunk_size`` rows, such that the whole table is never held
+    in memory. This is used if the source DB can not be attached to the
+    target DB, or if the columns of the results tables do not match.
     """
     get_data_query = f"""
                      SELECT *
                      FROM "{source_table_name}"
+                     ORDER BY id
                      """
 
     source_cursor = source_conn.cursor()
     target_cursor = target_conn.cursor()
 
-    for row in source_cursor.execute(get_data_query):
-        column_names = ','.join(row.keys()[1:])  # the first key is "id"
-        values = tuple(val for val in row[1:])
-        value_placeholders = sql_placeholder_string(len(values))
-        insert_data_query = f"""
-                             INSERT INTO "{target_table_name}"
-                             ({column_names})
-                             values {value_placeholders}
-                             """
-        target_cursor.execute(insert_data_query, values)
+    source_cursor.execute(get_data_query)
+    column_names = [description[0]
+                    for description in source_cursor.description]
+    insert_data_query = f"""
+                         INSERT INTO "{target_table_name}"
+                         ({','.join(column_names[1:])})
+                         values {sql_placeholder_string(len(column_names) - 1)}
+                         """  # the first column is "id"
+
+    rows = source_cursor.fetchmany(chunk_size)
+    while rows:
+        target_cursor.executemany(insert_data_query,
+                                  (tuple(row[1:]) for row in rows))
+        rows = source_cursor.fetchmany(chunk_size)
 
 
 def _rewrite_timestamps(target_conn: ConnectionPlus, target_run_id: int,
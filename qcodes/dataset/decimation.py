@@ -0,0 +1,213 @@
+"""
+This module reduces large data to the level of detail that a plot can show,
+such that plotting it takes a time and a file size that do not grow with the
+size of the data:
+
+* :class:`MinMaxDecimator` reduces a 1D trace to the minimum and the maximum
+  in each of a number of bins along the x axis. The envelope of the trace,
+  including single spikes, is kept.
+* :func:`block_average_2D` reduces a map on a grid to the averages of blocks
+  of neighbouring points.
+
+Both work on the data in chunks of bounded size. The decimator accumulates
+chunks one by one, hence it can be fed the chunks of
+:meth:`.DataSet.get_parameter_data_chunks` without ever loading the whole
+trace:
+
+>>> decimator = MinMaxDecimator(n_bins=1000, x_range=(0, 1))
+>>> for chunk in dataset.get_parameter_data_chunks('signal'):
+...     if chunk['signal']:
+...         decimator.add(chunk['signal']['time'], chunk['signal']['signal'])
+>>> x, y = decimator.result()
+"""
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 10**6
+
+
+class MinMaxDecimator:
+    """
+    Reduces a 1D trace to at most two points per bin along the x axis: the
+    points with the minimum and the maximum y value in the bin.
+
+    Args:
+        n_bins: The number of bins.
+        x_range: The range of the x values that the bins divide. Points
+            outside of the range are counted in the outermost bins.
+    """
+
+    def __init__(self, n_bins: int, x_range: Tuple[float, float]) -> None:
+        if n_bins < 1:
+            raise ValueError(f'The number of bins must be positive, '
+                             f'got {n_bins}')
+        self.n_bins = n_bins
+        self.x_range = x_range
+        self._y_min = np.full(n_bins, np.inf)
+        self._x_of_min = np.full(n_bins, np.nan)
+        self._y_max = np.full(n_bins, -np.inf)
+        self._x_of_max = np.full(n_bins, np.nan)
+
+    def _bins(self, x: np.ndarray) -> np.ndarray:
+        x_min, x_max = self.x_range
+        width = x_max - x_min
+        if width <= 0:
+            return np.zeros(len(x), dtype=int)
+        bins = np.floor((x - x_min) / width * self.n_bins)
+        return np.clip(bins, 0, self.n_bins - 1).astype(int)
+
+    def add(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Add a chunk of the trace. Points with a non-finite coordinate are
+        left out.
+
+        Args:
+            x: The x values of the chunk.
+            y: The y values of the chunk.
+        """
+        x = np.ravel(x)
+        y = np.ravel(y)
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not finite.all():
+            x = x[finite]
+            y = y[finite]
+        if len(x) == 0:
+            return
+
+        bins = self._bins(x)
+        # sorted by bin, which a sweep usually already is
+        if np.any(np.diff(bins) < 0):
+            order = np.argsort(bins, kind='stable')
+            x, y, bins = x[order], y[order], bins[order]
+        first = np.flatnonzero(np.diff(bins, prepend=-1))
+        counts = np.diff(np.append(first, len(bins)))
+        chunk_bins = bins[first]
+
+        y_min = np.minimum.reduceat(y, first)
+        x_of_min = x[_first_index_of(y, y_min, counts)]
+        lower = y_min < self._y_min[chunk_bins]
+        self._y_min[chunk_bins[lower]] = y_min[lower]
+        self._x_of_min[chunk_bins[lower]] = x_of_min[lower]
+
+        y_max = np.maximum.reduceat(y, first)
+        x_of_max = x[_first_index_of(y, y_max, counts)]
+        higher = y_max > self._y_max[chunk_bins]
+        self._y_max[chunk_bins[higher]] = y_max[higher]
+        self._x_of_max[chunk_bins[higher]] = x_of_max[higher]
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The decimated trace, sorted by x.
+
+        Returns:
+            The x and the y values of the points, at most two per bin.
+        """
+        filled = np.isfinite(self._y_min)
+        x = np.stack((self._x_of_min[filled], self._x_of_max[filled]), axis=1)
+        y = np.stack((self._y_min[filled], self._y_max[filled]), axis=1)
+        # the minimum and the maximum of a bin in the order of their x
+        swap = x[:, 0] > x[:, 1]
+        x[swap] = x[swap][:, ::-1]
+        y[swap] = y[swap][:, ::-1]
+        # a bin with a single point holds it as both minimum and maximum
+        keep = np.ones(x.shape, dtype=bool)
+        keep[:, 1] = (x[:, 0] != x[:, 1]) | (y[:, 0] != y[:, 1])
+        return x[keep], y[keep]
+
+
+def decimate_min_max(x: np.ndarray, y: np.ndarray, n_bins: int,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a 1D trace to the minimum and the maximum in each of ``n_bins``
+    bins along the x axis, see :class:`MinMaxDecimator`.
+
+    Args:
+        x: The x values.
+        y: The y values.
+        n_bins: The number of bins.
+        chunk_size: The number of points that are processed at once.
+
+    Returns:
+        The x and the y values of the decimated trace, sorted by x.
+    """
+    x = np.ravel(x)
+    y = np.ravel(y)
+    finite_x = x[np.isfinite(x)]
+    if len(finite_x) == 0:
+        return x[:0], y[:0]
+    decimator = MinMaxDecimator(n_bins, (finite_x.min(), finite_x.max()))
+    for start in range(0, len(x), chunk_size):
+        decimator.add(x[start:start + chunk_size], y[start:start + chunk_size])
+    return decimator.result()
+
+
+def block_average_2D(xrow: np.ndarray, yrow: np.ndarray, z: np.ndarray,
+                     max_pixels: int,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduce a map on a grid to at most ``max_pixels`` points by averaging
+    square blocks of neighbouring points. Missing (NaN) points are left out
+    of the averages, and a block without any points is NaN. The setpoints of
+    a block are the averages of the setpoints of its rows and columns.
+
+    Args:
+        xrow: The x setpoints of the columns of the map.
+        yrow: The y setpoints of the rows of the map.
+        z: The map, of shape ``(len(yrow), len(xrow))``, as returned by
+            :func:`~qcodes.dataset.data_export.reshape_2D_data`.
+        max_pixels: The maximum number of points of the averaged map.
+        chunk_size: The (approximate) number of points of the map that are
+            averaged at once.
+
+    Returns:
+        The x and y setpoints and the averaged map, unchanged if the map
+        has no more than ``max_pixels`` points.
+    """
+    ny, nx = z.shape
+    if nx * ny <= max_pixels:
+        return xrow, yrow, z
+    block = math.ceil(math.sqrt(nx * ny / max_pixels))
+
+    x_averaged = _average_blocks(xrow, block)
+    y_averaged = _average_blocks(yrow, block)
+
+    # whole rows of blocks are averaged at once
+    rows_per_chunk = block * max(1, chunk_size // (block * nx))
+    chunks = [_average_blocks(z[start:start + rows_per_chunk], block)
+              for start in range(0, ny, rows_per_chunk)]
+    return x_averaged, y_averaged, np.concatenate(chunks)
+
+
+def _first_index_of(values: np.ndarray, group_values: np.ndarray,
+                    counts: np.ndarray) -> np.ndarray:
+    """
+    The index of the first occurrence of the value of each group among the
+    values of the group, for values that are in consecutive groups of the
+    given sizes.
+    """
+    groups = np.repeat(np.arange(len(counts)), counts)
+    matches = np.flatnonzero(values == group_values[groups])
+    return matches[np.diff(groups[matches], prepend=-1) != 0]
+
+
+def _average_blocks(values: np.ndarray, block: int) -> np.ndarray:
+    """
+    Average the values in blocks of ``block`` points along every axis,
+    leaving out NaN values. The last block along an axis may be smaller.
+    """
+    values = np.asarray(values, dtype=float)
+    padding = [(0, -n % block) for n in values.shape]
+    values = np.pad(values, padding, constant_values=np.nan)
+    shape: List[int] = []
+    for n in values.shape:
+        shape += [n // block, block]
+    blocks = values.reshape(shape)
+    block_axes = tuple(range(1, len(shape), 2))
+    total = np.nansum(blocks, axis=block_axes)
+    count = np.sum(~np.isnan(blocks), axis=block_axes)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(count > 0, total / count, np.nan)
@@ -11,8 +11,7 @@ from qcodes.dataset.sqlite.queries import new_experiment as ne, \
     get_last_experiment, get_experiments, \
     get_experiment_name_from_experiment_id, get_runid_from_expid_and_counter, \
     get_sample_name_from_experiment_id
-from qcodes.dataset.sqlite.database import get_DB_location, get_DB_debug, \
-    connect, conn_from_dbpath_or_conn
+from qcodes.dataset.sqlite.database import conn_from_dbpath_or_conn
 from qcodes.dataset.sqlite.query_helpers import select_one_where, VALUES
 
 log = logging.getLogger(__name__)
@@ -208,7 +207,7 @@ def new_experiment(name: str,
     Returns:
         the new experiment
     """
-    conn = conn or connect(get_DB_location())
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
     return Experiment(name=name, sample_name=sample_name,
                       format_string=format_string,
                       conn=conn)
@@ -240,7 +239,8 @@ def load_last_experiment() -> Experiment:
     Returns:
         last experiment
     """
-    last_exp_id = get_last_experiment(connect(get_DB_location()))
+    last_exp_id = get_last_experiment(
+        conn_from_dbpath_or_conn(conn=None, path_to_db=None))
     if last_exp_id is None:
         raise ValueError('There are no experiments in the database file')
     return Experiment(exp_id=last_exp_id)
@@ -267,7 +267,7 @@ def load_experiment_by_name(name: str,
     Raises:
         ValueError if the name is not unique and sample name is None.
     """
-    conn = conn or connect(get_DB_location())
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
 
     if sample:
         sql = """
@@ -278,6 +278,8 @@ def load_experiment_by_name(name: str,
         WHERE
             sample_name = ? AND
             name = ?
+        ORDER BY
+            exp_id
         """
         c = transaction(conn, sql, sample, name)
     else:
@@ -288,6 +290,8 @@ def load_experiment_by_name(name: str,
             experiments
         WHERE
             name = ?
+        ORDER BY
+            exp_id
         """
         c = transaction(conn, sql, name)
     rows = c.fetchall()
@@ -323,7 +327,7 @@ def load_or_create_experiment(experiment_name: str,
     Returns:
         The found or created experiment
     """
-    conn = conn or connect(get_DB_location())
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
     try:
         experiment = load_experiment_by_name(experiment_name, sample_name,
                                              conn=conn)
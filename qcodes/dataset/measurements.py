@@ -29,7 +29,7 @@ from qcodes.dataset.experiment_container import Experiment
 from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
 from qcodes.dataset.descriptions.dependencies import (
     InterDependencies_, DependencyError, InferenceError)
-from qcodes.dataset.data_set import DataSet, VALUE, load_by_guid
+from qcodes.dataset.data_set import DataSet, VALUE, COLUMN, load_by_guid
 from qcodes.dataset.linked_datasets.links import Link
 from qcodes.utils.helpers import NumpyJSONEncoder
 from qcodes.utils.deprecate import deprecate
@@ -89,14 +89,18 @@ class DataSaver:
 
         self._interdeps = interdeps
         self.write_period = float(write_period)
-        # self._results will be filled by add_result
-        self._results: List[Dict[str, VALUE]] = []
+        # self._results will be filled by add_result with blocks of columns
+        self._results: List[Dict[str, COLUMN]] = []
         self._last_save_time = perf_counter()
         self._known_dependencies: Dict[str, List[str]] = {}
         self.parent_datasets: List[DataSet] = []
 
         self._write_in_background = write_in_background
 
+        # all the results of the dataset are written by this data saver,
+        # hence they can be handed to the cache directly
+        self._dataset.cache.start_live()
+
         for link in self._dataset.parent_dataset_links:
             self.parent_datasets.append(load_by_guid(link.tail))
 
@@ -366,9 +370,11 @@ class DataSaver:
         effectively mimicking making one call to add_result per parameter
         tree.
 
-        Deal with 'numeric' type parameters. If a 'numeric' top level parameter
-        has non-scalar shape, it must be unrolled into a list of dicts of
-        single values (database).
+        The results are enqueued as blocks of columns, i.e. as dicts mapping
+        parameter names to sequences of values of equal length. Deal with
+        'numeric' type parameters. If a 'numeric' top level parameter has
+        non-scalar shape, it is flattened into one column per parameter
+        (database) without splitting it up into single values.
         """
 
         interdeps = self._interdeps
@@ -381,18 +387,16 @@ class DataSaver:
             all_params = (inff_params
                           .union(deps_params)
                           .union({toplevel_param}))
-            res_dict: Dict[str, VALUE] = {}  # the dict to append to _results
             if toplevel_param.type == 'array':
-                res_list = self._finalize_res_dict_array(
+                res_block = self._finalize_res_dict_array(
                     result_dict, all_params)
             elif toplevel_param.type in ('numeric', 'text', 'complex'):
-                res_list = self._finalize_res_dict_numeric_text_or_complex(
+                res_block = self._finalize_res_dict_numeric_text_or_complex(
                                result_dict, toplevel_param,
                                inff_params, deps_params)
             else:
-                res_dict = {ps.name: result_dict[ps] for ps in all_params}
-                res_list = [res_dict]
-            self._results += res_list
+                res_block = {ps.name: [result_dict[ps]] for ps in all_params}
+            self._results.append(res_block)
 
         # Finally, handle standalone parameters
 
@@ -406,11 +410,11 @@ class DataSaver:
     @staticmethod
     def _finalize_res_dict_array(
             result_dict: Mapping[ParamSpecBase, values_type],
-            all_params: Set[ParamSpecBase]) -> List[Dict[str, VALUE]]:
+            all_params: Set[ParamSpecBase]) -> Dict[str, COLUMN]:
         """
-        Make a list of res_dicts out of the results for a 'array' type
-        parameter. The results are assumed to already have been validated for
-        type and shape
+        Make a block of results with a single row out of the results for a
+        'array' type parameter. The results are assumed to already have been
+        validated for type and shape
         """
         def reshaper(val: Any, ps: ParamSpecBase) -> VALUE:
             paramtype = ps.type
@@ -429,25 +433,25 @@ class DataSaver:
                 raise ValueError(f'Cannot handle unknown paramtype '
                                  f'{paramtype!r} of {ps!r}.')
 
-        res_dict = {ps.name: reshaper(result_dict[ps], ps)
-                    for ps in all_params}
+        res_block = {ps.name: [reshaper(result_dict[ps], ps)]
+                     for ps in all_params}
 
-        return [res_dict]
+        return res_block
 
     @staticmethod
     def _finalize_res_dict_numeric_text_or_complex(
             result_dict: Mapping[ParamSpecBase, np.ndarray],
             toplevel_param: ParamSpecBase,
             inff_params: Set[ParamSpecBase],
-            deps_params: Set[ParamSpecBase]) -> List[Dict[str, VALUE]]:
+            deps_params: Set[ParamSpecBase]) -> Dict[str, COLUMN]:
         """
-        Make a res_dict in the format expected by DataSet.add_results out
-        of the results for a 'numeric' or text type parameter. This includes
-        replicating and unrolling values as needed and also handling the corner
-        case of np.array(1) kind of values
+        Make a block of results in the format expected by
+        DataSet.add_columnar_results out of the results for a 'numeric' or
+        text type parameter. This includes replicating and flattening values
+        as needed and also handling the corner case of np.array(1) kind of
+        values
         """
 
-        res_list: List[Dict[str, VALUE]] = []
         all_params = inff_params.union(deps_params).union({toplevel_param})
 
         t_map = {'numeric': float, 'text': str, 'complex': complex}
@@ -455,60 +459,45 @@ class DataSaver:
         toplevel_shape = result_dict[toplevel_param].shape
         if toplevel_shape == ():
             # In the case of a single value, life is reasonably simple
-            res_list = [{ps.name: t_map[ps.type](result_dict[ps])
-                         for ps in all_params}]
-        else:
-            # We first massage all values into np.arrays of the same
-            # shape
-            flat_results: Dict[str, np.ndarray] = {}
-
-            toplevel_val = result_dict[toplevel_param]
-            flat_results[toplevel_param.name] = toplevel_val.ravel()
-            N = len(flat_results[toplevel_param.name])
-            for dep in deps_params:
-                if result_dict[dep].shape == ():
-                    flat_results[dep.name] = np.repeat(result_dict[dep], N)
-                else:
-                    flat_results[dep.name] = result_dict[dep].ravel()
-            for inff in inff_params:
-                if np.shape(result_dict[inff]) == ():
-                    flat_results[inff.name] = np.repeat(result_dict[dep], N)
-                else:
-                    flat_results[inff.name] = result_dict[inff].ravel()
+            return {ps.name: [t_map[ps.type](result_dict[ps])]
+                    for ps in all_params}
 
-            # And then put everything into the list
+        # We massage all values into flat np.arrays of the same length.
+        # These are handed over as columns, so no per-point dicts are made
+        res_block: Dict[str, COLUMN] = {}
 
-            res_list = [{p.name: flat_results[p.name][ind] for p in all_params}
-                        for ind in range(N)]
+        toplevel_val = result_dict[toplevel_param]
+        res_block[toplevel_param.name] = toplevel_val.ravel()
+        N = len(res_block[toplevel_param.name])
+        for param in deps_params.union(inff_params):
+            if np.shape(result_dict[param]) == ():
+                res_block[param.name] = np.repeat(result_dict[param], N)
+            else:
+                res_block[param.name] = result_dict[param].ravel()
 
-        return res_list
+        return res_block
 
     @staticmethod
     def _finalize_res_dict_standalones(
             result_dict: Mapping[ParamSpecBase, np.ndarray]
-            ) -> List[Dict[str, VALUE]]:
+            ) -> List[Dict[str, COLUMN]]:
         """
-        Massage all standalone parameters into the correct shape
+        Massage all standalone parameters into blocks of results with one
+        column each
         """
-        res_list: List[Dict[str, VALUE]] = []
+        res_list: List[Dict[str, COLUMN]] = []
+        t_map = {'numeric': float, 'text': str, 'complex': complex}
         for param, value in result_dict.items():
-            if param.type == 'text':
-                if value.shape:
-                    res_list += [{param.name: str(val)} for val in value]
-                else:
-                    res_list += [{param.name: str(value)}]
-            elif param.type == 'numeric':
-                if value.shape:
-                    res_list += [{param.name: number} for number in value]
-                else:
-                    res_list += [{param.name: float(value)}]
-            elif param.type == 'complex':
-                if value.shape:
-                    res_list += [{param.name: number} for number in value]
+            if param.type in t_map:
+                if value.shape and param.type == 'text':
+                    res_list.append({param.name: [str(val)
+                                                  for val in value.ravel()]})
+                elif value.shape:
+                    res_list.append({param.name: value.ravel()})
                 else:
-                    res_list += [{param.name: complex(value)}]
+                    res_list.append({param.name: [t_map[param.type](value)]})
             else:
-                res_list += [{param.name: value}]
+                res_list.append({param.name: [value]})
 
         return res_list
 
@@ -519,7 +508,7 @@ class DataSaver:
         log.debug('Flushing to database')
         if self._results != []:
             try:
-                self._dataset.add_results(self._results)
+                self._dataset.add_columnar_results(self._results)
                 if self._write_in_background:
                     log.debug(f"Succesfully enqueued result for write thread")
                 else:
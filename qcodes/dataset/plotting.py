@@ -22,6 +22,7 @@ from qcodes.utils.plotting import auto_color_scale_from_config
 from .data_export import (get_data_by_id, flatten_1D_data_for_plot,
                           get_1D_plottype, get_2D_plottype, reshape_2D_data,
                           _strings_as_ints)
+from .decimation import block_average_2D, decimate_min_max
 
 log = logging.getLogger(__name__)
 DB = qc.config["core"]["db_location"]
@@ -98,6 +99,7 @@ def plot_dataset(dataset: DataSet,
                                                    Number]] = None,
                  complex_plot_type: str = 'real_and_imag',
                  complex_plot_phase: str = 'radians',
+                 level_of_detail: Optional[bool] = None,
                  **kwargs: Any) -> AxesTupleList:
     """
     Construct all plots for a given dataset
@@ -122,6 +124,13 @@ def plot_dataset(dataset: DataSet,
     for scatter plots and heatmaps if more than 5000 points are supplied.
     This can be overridden by supplying the `rasterized` kwarg.
 
+    Large data is decimated to the level of detail that the plot can show,
+    see ``level_of_detail``: line plots are reduced to the minimum and the
+    maximum in each of a number of bins along the x axis, which keeps their
+    envelope and any spikes, and heatmaps on a grid are reduced to the
+    averages of blocks of neighbouring points. To plot the data at full
+    resolution, supply ``level_of_detail=False``.
+
     Args:
         dataset: The dataset to plot
         axes: Optional Matplotlib axes to plot on. If not provided, new axes
@@ -145,6 +154,12 @@ def plot_dataset(dataset: DataSet,
         complex_plot_phase: Format of phase for plotting complex-valued data,
             either ``"radians"`` or ``"degrees"``. Applicable only for the
             cases where the dataset contains complex numbers
+        level_of_detail: If True, line plots with more than
+            ``config.plotting.level_of_detail.max_line_points`` points and
+            heatmaps with more than
+            ``config.plotting.level_of_detail.max_map_pixels`` points are
+            decimated. Default value is read from
+            ``config.plotting.level_of_detail.enabled``.
 
     Returns:
         A list of axes and a list of colorbars of the same length. The
@@ -169,6 +184,14 @@ def plot_dataset(dataset: DataSet,
             'but can only accept "degrees" or "radians".')
     degrees = complex_plot_phase == "degrees"
 
+    if level_of_detail is None:
+        level_of_detail = qc.config.plotting.level_of_detail.enabled
+    max_line_points: Optional[int] = None
+    max_map_pixels: Optional[int] = None
+    if level_of_detail:
+        max_line_points = qc.config.plotting.level_of_detail.max_line_points
+        max_map_pixels = qc.config.plotting.level_of_detail.max_map_pixels
+
     # Retrieve info about the run for the title
 
     experiment_name = dataset.exp_name
@@ -221,10 +244,18 @@ def plot_dataset(dataset: DataSet,
             log.debug(f'Determined plottype: {plottype}')
 
             if plottype == '1D_line':
-                # sort for plotting
-                order = xpoints.argsort()
-                xpoints = xpoints[order]
-                ypoints = ypoints[order]
+                if (max_line_points is not None
+                        and len(xpoints) > max_line_points):
+                    log.info(f'Decimating {len(xpoints)} points of '
+                             f'{data[1]["name"]} for plotting')
+                    # the decimated points are sorted
+                    xpoints, ypoints = decimate_min_max(
+                        xpoints, ypoints, max(1, max_line_points // 2))
+                else:
+                    # sort for plotting
+                    order = xpoints.argsort()
+                    xpoints = xpoints[order]
+                    ypoints = ypoints[order]
 
                 with _appropriate_kwargs(plottype,
                                          colorbar is not None, **kwargs) as k:
@@ -269,6 +300,9 @@ def plot_dataset(dataset: DataSet,
                            '2D_point': plot_2d_scatterplot,
                            '2D_unknown': plot_2d_scatterplot}
             plot_func = how_to_plot[plottype]
+            if plot_func is plot_on_a_plain_grid:
+                plot_func = partial(plot_on_a_plain_grid,
+                                    max_pixels=max_map_pixels)
 
             with _appropriate_kwargs(plottype,
                                      colorbar is not None, **kwargs) as k:
@@ -313,6 +347,7 @@ def plot_by_id(run_id: int,
                                                  Number]] = None,
                complex_plot_type: str = 'real_and_imag',
                complex_plot_phase: str = 'radians',
+               level_of_detail: Optional[bool] = None,
                **kwargs: Any) -> AxesTupleList:
     """
     Construct all plots for a given `run_id`. Here `run_id` is an
@@ -331,6 +366,7 @@ def plot_by_id(run_id: int,
                         cutoff_percentile,
                         complex_plot_type,
                         complex_plot_phase,
+                        level_of_detail,
                         **kwargs)
 
 
@@ -531,6 +567,7 @@ def plot_on_a_plain_grid(x: np.ndarray,
                          z: np.ndarray,
                          ax: matplotlib.axes.Axes,
                          colorbar: matplotlib.colorbar.Colorbar = None,
+                         max_pixels: Optional[int] = None,
                          **kwargs: Any
                          ) -> AxesTuple:
     """
@@ -551,6 +588,10 @@ def plot_on_a_plain_grid(x: np.ndarray,
         z: The z values
         ax: The axis to plot onto
         colorbar: A colorbar to reuse the axis for
+        max_pixels: If given, a grid with more points is reduced to at most
+            this number of points by averaging blocks of neighbouring
+            points, see :func:`.block_average_2D`. Grids of strings are
+            never reduced.
 
     Returns:
         The matplotlib axes handle for plot and colorbar
@@ -576,6 +617,11 @@ def plot_on_a_plain_grid(x: np.ndarray,
 
     xrow, yrow, z_to_plot = reshape_2D_data(x, y, z)
 
+    if (max_pixels is not None
+            and not (x_is_stringy or y_is_stringy or z_is_stringy)):
+        xrow, yrow, z_to_plot = block_average_2D(xrow, yrow, z_to_plot,
+                                                 max_pixels)
+
     # we use a general edge calculator,
     # in the case of non-equidistantly spaced data
     # TODO: is this appropriate for a log ax?
@@ -0,0 +1,118 @@
+"""
+This module defines the RunSummary dataclass and functions to search the runs
+of a database by their specification, start time and metadata. The searches
+are served by the indices of the database and only read a few columns of the
+runs and experiments tables, i.e. no :class:`.DataSet` is created and no
+snapshot or run description is loaded, which keeps browsing databases with
+many runs fast.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from qcodes.dataset.guids import parse_guid
+from qcodes.dataset.sqlite.connection import ConnectionPlus
+from qcodes.dataset.sqlite.database import conn_from_dbpath_or_conn
+from qcodes.dataset.sqlite.queries import (RUN_SUMMARY_COLUMNS,
+                                           get_run_summary_rows)
+
+
+@dataclass(frozen=True)
+class RunSummary:
+    """
+    Class to represent the summary of a run in a database.
+
+    Attributes:
+        run_id: the run_id of the run in the database
+        captured_run_id: the run_id that was assigned to the run at capture
+            time
+        captured_counter: the counter that was assigned to the run at
+            capture time
+        guid: the GUID of the run
+        name: the name of the run
+        exp_id: the id of the experiment of the run
+        exp_name: the name of the experiment of the run
+        sample_name: the name of the sample of the experiment of the run
+        result_counter: the counter of the run within its experiment
+        run_timestamp: the time the run was started at, in seconds since the
+            epoch, or None if the run has not been started
+        completed_timestamp: the time the run was completed at, in seconds
+            since the epoch, or None if the run has not been completed
+        is_completed: whether the run has been completed
+    """
+    run_id: int
+    captured_run_id: int
+    captured_counter: int
+    guid: str
+    name: str
+    exp_id: int
+    exp_name: str
+    sample_name: str
+    result_counter: int
+    run_timestamp: Optional[float]
+    completed_timestamp: Optional[float]
+    is_completed: bool
+
+    @property
+    def guid_components(self) -> Dict[str, Any]:
+        """
+        The components of the GUID of the run, see
+        :func:`qcodes.dataset.guids.parse_guid`.
+        """
+        return parse_guid(self.guid)
+
+
+def search_runs(*,
+                guids: Optional[Sequence[str]] = None,
+                exp_id: Optional[int] = None,
+                captured_run_id: Optional[int] = None,
+                captured_counter: Optional[int] = None,
+                experiment_name: Optional[str] = None,
+                sample_name: Optional[str] = None,
+                started_after: Optional[float] = None,
+                started_before: Optional[float] = None,
+                metadata: Optional[Mapping[str, Any]] = None,
+                conn: Optional[ConnectionPlus] = None) -> List[RunSummary]:
+    """
+    Find the runs that match all of the supplied conditions. All the
+    conditions are optional; without any condition, all the runs of the
+    database are returned.
+
+    Args:
+        guids: the GUIDs of the runs.
+        exp_id: the id of the experiment of the runs.
+        captured_run_id: the run_id that was assigned to the runs at capture
+            time.
+        captured_counter: the counter that was assigned to the runs at
+            capture time.
+        experiment_name: name of the experiment of the runs.
+        sample_name: name of the sample of the experiment of the runs.
+        started_after: the earliest start time of the runs, in seconds since
+            the epoch (e.g. ``time.time()``).
+        started_before: the latest start time of the runs, in seconds since
+            the epoch.
+        metadata: tags and values of metadata that the runs must have, see
+            :meth:`.DataSet.add_metadata`.
+        conn: An optional connection to the database. If no connection is
+            supplied, the database file specified in the config is searched.
+
+    Returns:
+        The summaries of the matching runs, ordered by run_id
+    """
+    conn = conn_from_dbpath_or_conn(conn=conn, path_to_db=None)
+    rows = get_run_summary_rows(conn,
+                                guids=guids,
+                                exp_id=exp_id,
+                                captured_run_id=captured_run_id,
+                                captured_counter=captured_counter,
+                                experiment_name=experiment_name,
+                                sample_name=sample_name,
+                                started_after=started_after,
+                                started_before=started_before,
+                                metadata=metadata)
+    return [_row_to_run_summary(row) for row in rows]
+
+
+def _row_to_run_summary(row: Sequence[Any]) -> RunSummary:
+    values = dict(zip(RUN_SUMMARY_COLUMNS, row))
+    values['is_completed'] = bool(values['is_completed'])
+    return RunSummary(**values)
@@ -4,13 +4,17 @@ initialising it. Note that connecting/initialisation take into account
 database version and possibly perform database upgrades.
 """
 import io
+import math
 import sqlite3
+import struct
 import sys
+import threading
 from contextlib import contextmanager
-from os.path import expanduser, normpath
-from typing import Union, Iterator, Tuple, Optional
+from os.path import abspath, expanduser, normpath
+from typing import Dict, Union, Iterator, Tuple, Optional, Set
 
 import numpy as np
+import wrapt
 from numpy import ndarray
 
 from qcodes.dataset.sqlite.connection import ConnectionPlus
@@ -21,8 +25,23 @@ import qcodes
 from qcodes.utils.types import complex_types, complex_type_union
 
 
-# utility function to allow sqlite/numpy type
-def _adapt_array(arr: ndarray) -> sqlite3.Binary:
+# Arrays (and complex numbers) are stored in the database in a compact binary
+# format. The header consists of
+#
+#   magic (3 bytes) | format version (1 byte) | length of dtype string (1 byte)
+#   | dtype string (e.g. b'<f8') | number of dimensions (1 byte)
+#   | shape (one little-endian uint64 per dimension)
+#
+# zero-padded to a multiple of _ARRAY_ALIGNMENT bytes, followed by the raw
+# C-ordered data of the array. Data written by older versions of QCoDeS
+# uses the .npy format of `np.save` and is recognised by its own magic string.
+_ARRAY_MAGIC = b'QCA'
+_ARRAY_FORMAT_VERSION = 1
+_ARRAY_ALIGNMENT = 16
+_NPY_MAGIC = b'\x93NUMPY'
+
+
+def _adapt_array_npy(arr: ndarray) -> sqlite3.Binary:
     """
     See this:
     https://stackoverflow.com/questions/3425320/sqlite3-programmingerror-you-must-not-use-8-bit-bytestrings-unless-you-use-a-te
@@ -33,16 +52,68 @@ def _adapt_array(arr: ndarray) -> sqlite3.Binary:
     return sqlite3.Binary(out.read())
 
 
+# utility function to allow sqlite/numpy type
+def _adapt_array(arr: ndarray) -> sqlite3.Binary:
+    """
+    Encode an array in the binary format described above. Arrays that can
+    not be represented by a plain dtype string (object and structured arrays)
+    are stored in the .npy format instead.
+    """
+    if arr.dtype.hasobject or arr.dtype.fields is not None:
+        return _adapt_array_npy(arr)
+    if not arr.flags.c_contiguous:
+        arr = arr.copy(order='C')
+    dtype_str = arr.dtype.str.encode('ascii')
+    header = struct.pack(f'<3sBB{len(dtype_str)}sB{arr.ndim}Q',
+                         _ARRAY_MAGIC, _ARRAY_FORMAT_VERSION, len(dtype_str),
+                         dtype_str, arr.ndim, *arr.shape)
+    padding = -len(header) % _ARRAY_ALIGNMENT
+    # join copies the data of the array exactly once
+    return sqlite3.Binary(b''.join((header, b'\x00' * padding, arr.data)))
+
+
+def _decode_array(text: bytes) -> ndarray:
+    """
+    Decode an array stored in the database. The returned array is a
+    read-only view on the bytes handed over by sqlite, i.e. the data is not
+    copied. Arrays stored in the .npy format are loaded with `np.load`.
+    """
+    if text[:len(_ARRAY_MAGIC)] != _ARRAY_MAGIC:
+        out = io.BytesIO(text)
+        out.seek(0)
+        return np.load(out)
+
+    version, dtype_len = struct.unpack_from('<BB', text, len(_ARRAY_MAGIC))
+    if version != _ARRAY_FORMAT_VERSION:
+        raise RuntimeError(f'Unknown binary array format version {version}. '
+                           f'This version of QCoDeS supports version '
+                           f'{_ARRAY_FORMAT_VERSION}.')
+    offset = len(_ARRAY_MAGIC) + 2
+    dtype_str, ndim = struct.unpack_from(f'<{dtype_len}sB', text, offset)
+    offset += dtype_len + 1
+    shape = struct.unpack_from(f'<{ndim}Q', text, offset)
+    offset += 8 * ndim
+    offset += -offset % _ARRAY_ALIGNMENT
+    arr = np.frombuffer(text, dtype=np.dtype(dtype_str.decode('ascii')),
+                        offset=offset)
+    return arr.reshape(shape)
+
+
 def _convert_array(text: bytes) -> ndarray:
-    out = io.BytesIO(text)
-    out.seek(0)
-    return np.load(out)
+    """
+    Decode an array stored in the database into an array that owns its data,
+    such that users get writeable arrays as they do from `np.load`. The data
+    is copied once, out of the bytes handed over by sqlite.
+    """
+    arr = _decode_array(text)
+    if not arr.flags.writeable:
+        arr = arr.copy()
+    return arr
 
 
 def _convert_complex(text: bytes) -> complex_type_union:
-    out = io.BytesIO(text)
-    out.seek(0)
-    return np.load(out)[0]
+    # the scalar is copied out of the view anyway
+    return _decode_array(text)[0]
 
 
 this_session_default_encoding = sys.getdefaultencoding()
@@ -95,16 +166,72 @@ def _convert_numeric(value: bytes) -> Union[float, int, str]:
 
 
 def _adapt_float(fl: float) -> Union[float, str]:
-    if np.isnan(fl):
+    # this adapter is called for every single float that is inserted, so we
+    # use math.isnan which is much cheaper than np.isnan on python scalars
+    if math.isnan(fl):
         return "nan"
     return float(fl)
 
 
 def _adapt_complex(value: complex_type_union) -> sqlite3.Binary:
-    out = io.BytesIO()
-    np.save(out, np.array([value]))
-    out.seek(0)
-    return sqlite3.Binary(out.read())
+    return _adapt_array(np.array([value]))
+
+
+_adapters_registered = False
+
+
+def _register_adapters() -> None:
+    """
+    Register the numpy/sqlite type adapters and converters with the sqlite3
+    module. The registration is global, hence it is only done once.
+    """
+    global _adapters_registered
+    if _adapters_registered:
+        return
+
+    # register numpy->binary(TEXT) adapter
+    # the typing here is ignored due to what we think is a flaw in typeshed
+    # see https://github.com/python/typeshed/issues/2429
+    sqlite3.register_adapter(np.ndarray, _adapt_array)
+    # register binary(TEXT) -> numpy converter
+    # for some reasons mypy complains about this
+    sqlite3.register_converter("array", _convert_array)
+
+    # Make sure numpy ints and floats types are inserted properly
+    for numpy_int in [
+        np.int, np.int8, np.int16, np.int32, np.int64,
+        np.uint, np.uint8, np.uint16, np.uint32, np.uint64
+    ]:
+        sqlite3.register_adapter(numpy_int, int)
+
+    sqlite3.register_converter("numeric", _convert_numeric)
+
+    for numpy_float in [np.float, np.float16, np.float32, np.float64]:
+        sqlite3.register_adapter(numpy_float, _adapt_float)
+
+    for complex_type in complex_types:
+        sqlite3.register_adapter(complex_type, _adapt_complex)
+    sqlite3.register_converter("complex", _convert_complex)
+
+    _adapters_registered = True
+
+
+def _open_connection(name: str, debug: bool = False) -> ConnectionPlus:
+    """
+    Open a connection to a database without initialising or upgrading it.
+    """
+    _register_adapters()
+
+    sqlite3_conn = sqlite3.connect(name, detect_types=sqlite3.PARSE_DECLTYPES,
+                                   check_same_thread=True)
+    conn = ConnectionPlus(sqlite3_conn)
+
+    # sqlite3 options
+    conn.row_factory = sqlite3.Row
+
+    if debug:
+        conn.set_trace_callback(print)
+    return conn
 
 
 def connect(name: str, debug: bool = False,
@@ -125,53 +252,166 @@ def connect(name: str, debug: bool = False,
             `ConnectionPlus`, not `sqlite3.Connection`
 
     """
-    # register numpy->binary(TEXT) adapter
-    # the typing here is ignored due to what we think is a flaw in typeshed
-    # see https://github.com/python/typeshed/issues/2429
-    sqlite3.register_adapter(np.ndarray, _adapt_array)
-    # register binary(TEXT) -> numpy converter
-    # for some reasons mypy complains about this
-    sqlite3.register_converter("array", _convert_array)
-
-    sqlite3_conn = sqlite3.connect(name, detect_types=sqlite3.PARSE_DECLTYPES,
-                                   check_same_thread=True)
-    conn = ConnectionPlus(sqlite3_conn)
+    conn = _open_connection(name, debug)
 
     latest_supported_version = _latest_available_version()
     db_version = get_user_version(conn)
 
     if db_version > latest_supported_version:
+        conn.close()
         raise RuntimeError(f"Database {name} is version {db_version} but this "
                            f"version of QCoDeS supports up to "
                            f"version {latest_supported_version}")
 
-    # sqlite3 options
-    conn.row_factory = sqlite3.Row
+    init_db(conn)
+    perform_db_upgrade(conn, version=version)
+    return conn
 
-    # Make sure numpy ints and floats types are inserted properly
-    for numpy_int in [
-        np.int, np.int8, np.int16, np.int32, np.int64,
-        np.uint, np.uint8, np.uint16, np.uint32, np.uint64
-    ]:
-        sqlite3.register_adapter(numpy_int, int)
 
-    sqlite3.register_converter("numeric", _convert_numeric)
+# Connections shared by the handles that `get_pooled_connection` hands out,
+# keyed by the absolute path of the database file and the identifier of the
+# thread that opened them, since sqlite connections may only be used in the
+# thread that created them.
+_connection_pool: Dict[Tuple[str, int], ConnectionPlus] = {}
+# Database files that have been initialised and upgraded to the latest
+# version by a pooled connection
+_checked_db_paths: Set[str] = set()
+_connection_pool_lock = threading.Lock()
 
-    for numpy_float in [np.float, np.float16, np.float32, np.float64]:
-        sqlite3.register_adapter(numpy_float, _adapt_float)
 
-    for complex_type in complex_types:
-        sqlite3.register_adapter(complex_type, _adapt_complex)
-    sqlite3.register_converter("complex", _convert_complex)
+class PooledConnectionPlus(ConnectionPlus):
+    """
+    A handle to a connection in the connection pool, see
+    :func:`get_pooled_connection`. It behaves as the connection itself,
+    except that closing the handle only closes the handle: the connection
+    stays open for the other holders of a handle to it.
 
-    if debug:
-        conn.set_trace_callback(print)
+    Args:
+        shared_connection: the pooled connection
+    """
 
-    init_db(conn)
-    perform_db_upgrade(conn, version=version)
+    def __init__(self, shared_connection: ConnectionPlus):
+        # the sqlite connection is wrapped directly, since a ConnectionPlus
+        # may not wrap another one
+        wrapt.ObjectProxy.__init__(self, shared_connection.__wrapped__)
+        self._self_shared_connection = shared_connection
+        self.path_to_dbfile = shared_connection.path_to_dbfile
+
+    # atomic blocks must be nested correctly across all the handles
+    @property  # type: ignore[override]
+    def atomic_in_progress(self) -> bool:  # type: ignore[override]
+        return self._self_shared_connection.atomic_in_progress
+
+    @atomic_in_progress.setter
+    def atomic_in_progress(self, value: bool) -> None:
+        self._self_shared_connection.atomic_in_progress = value
+
+    def close(self) -> None:
+        """
+        Close this handle. Any later use of it raises, as the use of a
+        closed connection does.
+        """
+        self.__wrapped__ = _closed_connection()
+
+
+def _closed_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(':memory:')
+    conn.close()
     return conn
 
 
+def _is_open(conn: ConnectionPlus) -> bool:
+    try:
+        # any access to a closed connection raises
+        conn.total_changes
+    except sqlite3.ProgrammingError:
+        return False
+    return True
+
+
+def get_pooled_connection(path_to_db: str,
+                          debug: bool = False) -> ConnectionPlus:
+    """
+    Get a connection to a database from the process-wide connection pool.
+    All the calls from the same thread for the same database file return a
+    handle to the same connection, such that e.g. many loaded datasets share
+    a single connection. The database is initialised and upgraded (see
+    :func:`connect`) only when the first connection to it is opened; later
+    connections, e.g. from other threads, skip this step.
+
+    Closing the returned :class:`PooledConnectionPlus` closes the handle but
+    not the connection that it shares with the other handles, see
+    :func:`close_connection_pool` to close the pooled connections.
+
+    Args:
+        path_to_db: path to the sqlite file
+        debug: whether or not to turn on tracing
+
+    Returns:
+        A handle to the pooled connection to the database for the calling
+        thread
+    """
+    if path_to_db == ':memory:':
+        # every connection to ':memory:' is a database of its own
+        return connect(path_to_db, debug)
+
+    path = abspath(path_to_db)
+    key = (path, threading.get_ident())
+
+    with _connection_pool_lock:
+        conn = _connection_pool.get(key)
+        checked = path in _checked_db_paths
+
+    if conn is not None and _is_open(conn):
+        conn.set_trace_callback(print if debug else None)
+        return PooledConnectionPlus(conn)
+
+    if checked:
+        conn = _open_connection(path_to_db, debug)
+    else:
+        conn = connect(path_to_db, debug)
+
+    with _connection_pool_lock:
+        # forget the connections of threads that have finished
+        alive_threads = {thread.ident for thread in threading.enumerate()}
+        for pooled_key in list(_connection_pool):
+            if pooled_key[1] not in alive_threads:
+                del _connection_pool[pooled_key]
+        _connection_pool[key] = conn
+        _checked_db_paths.add(path)
+    return PooledConnectionPlus(conn)
+
+
+def close_connection_pool(path_to_db: Optional[str] = None) -> None:
+    """
+    Close the pooled connections, such that the handles to them can no
+    longer be used, and empty the connection pool, such that the next call
+    to :func:`get_pooled_connection` opens a new connection and initialises
+    and upgrades the database again. Pooled connections of other threads
+    can not be closed from this thread; they are removed from the pool and
+    closed when they are garbage collected.
+
+    Args:
+        path_to_db: only close the connections to this database file. If
+            None, all the connections are closed.
+    """
+    path = None if path_to_db is None else abspath(path_to_db)
+    thread_id = threading.get_ident()
+    to_close = []
+    with _connection_pool_lock:
+        for key in list(_connection_pool):
+            if path is None or key[0] == path:
+                conn = _connection_pool.pop(key)
+                if key[1] == thread_id:
+                    to_close.append(conn)
+        if path is None:
+            _checked_db_paths.clear()
+        else:
+            _checked_db_paths.discard(path)
+    for conn in to_close:
+        conn.close()
+
+
 def get_db_version_and_newest_available_version(path_to_db: str) -> Tuple[int,
                                                                           int]:
     """
@@ -212,6 +452,9 @@ def initialise_database(journal_mode: Optional[str] = 'WAL') -> None:
             Options are DELETE, TRUNCATE, PERSIST, MEMORY, WAL and OFF. If set to None
             no changes are made.
     """
+    # the database file may have been replaced, hence pooled connections to
+    # it can no longer be trusted
+    close_connection_pool(get_DB_location())
     # calling connect performs all the needed actions to create and upgrade
     # the db to the latest version.
     conn = connect(get_DB_location(), get_DB_debug())
@@ -284,7 +527,8 @@ def conn_from_dbpath_or_conn(conn: Optional[ConnectionPlus],
     A small helper function to abstract the logic needed for functions
     that take either a `ConnectionPlus` or the path to a db file.
     If neither is given this will fall back to the default db location.
-    It is an error to supply both.
+    It is an error to supply both. Connections to a db file are taken from
+    the connection pool, see :func:`get_pooled_connection`.
 
     Args:
         conn: A ConnectionPlus object pointing to a sqlite database
@@ -301,7 +545,7 @@ def conn_from_dbpath_or_conn(conn: Optional[ConnectionPlus],
         path_to_db = get_DB_location()
 
     if conn is None and path_to_db is not None:
-        conn = connect(path_to_db, get_DB_debug())
+        conn = get_pooled_connection(path_to_db, get_DB_debug())
     elif conn is not None:
         conn = conn
     else:
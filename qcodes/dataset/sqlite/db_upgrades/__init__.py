@@ -347,3 +347,94 @@ def perform_db_upgrade_8_to_9(conn: ConnectionPlus) -> None:
                 transaction(connection, _IX_runs_captured_run_id)
     else:
         raise RuntimeError(f"found {n_run_tables} runs tables expected 1")
+
+
+@upgrader
+def perform_db_upgrade_9_to_10(conn: ConnectionPlus) -> None:
+    """
+    Perform the upgrade from version 9 to version 10.
+
+    The schema is unchanged. From version 10 on, arrays and complex numbers
+    may be stored in the compact binary format of
+    :func:`qcodes.dataset.sqlite.database._adapt_array` instead of the .npy
+    format. Values already stored in the .npy format are still read
+    transparently, hence no data needs to be converted. The version bump
+    makes older versions of QCoDeS, which can not read the new format,
+    refuse to open the database.
+    """
+    pbar = tqdm(range(1), file=sys.stdout)
+    pbar.set_description("Upgrading database; v9 -> v10")
+    # iterate through the pbar for the sake of the side effect; it
+    # prints that the database is being upgraded
+    for _ in pbar:
+        pass
+
+
+@upgrader
+def perform_db_upgrade_10_to_11(conn: ConnectionPlus) -> None:
+    """
+    Perform the upgrade from version 10 to version 11.
+
+    Add indices for searching runs: on the runs table for the counter of a
+    run within its experiment, the captured counter, the timestamps and
+    every metadata column, and on the experiments table for the experiment
+    and sample names.
+    """
+
+    sql = "SELECT name FROM sqlite_master WHERE type='table' AND name='runs'"
+    cur = atomic_transaction(conn, sql)
+    n_run_tables = len(cur.fetchall())
+
+    pbar = tqdm(range(1), file=sys.stdout)
+    pbar.set_description("Upgrading database; v10 -> v11")
+
+    if n_run_tables == 1:
+        indices = [
+            ("IX_runs_exp_id_result_counter", "runs",
+             "exp_id, result_counter"),
+            ("IX_runs_captured_counter", "runs", "captured_counter DESC"),
+            ("IX_runs_run_timestamp", "runs", "run_timestamp"),
+            ("IX_runs_completed_timestamp", "runs", "completed_timestamp"),
+            ("IX_experiments_name_sample_name", "experiments",
+             "name, sample_name"),
+            ("IX_experiments_sample_name", "experiments", "sample_name"),
+        ]
+
+        # metadata is stored in columns that are dynamically added to the
+        # runs table, i.e. all columns but these
+        standard_columns = {"run_id", "exp_id", "name", "result_table_name",
+                            "result_counter", "run_timestamp",
+                            "completed_timestamp", "is_completed",
+                            "parameters", "guid", "run_description",
+                            "snapshot", "parent_datasets", "captured_run_id",
+                            "captured_counter"}
+        cur = atomic_transaction(conn, "PRAGMA table_info(runs)")
+        for row in cur.fetchall():
+            if row['name'] not in standard_columns:
+                indices.append((f"IX_runs_metadata_{row['name']}", "runs",
+                                f'"{row["name"]}"'))
+
+        with atomic(conn) as connection:
+            # iterate through the pbar for the sake of the side effect; it
+            # prints that the database is being upgraded
+            for _ in pbar:
+                for index_name, table, columns in indices:
+                    transaction(connection,
+                                f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+                                f'ON {table} ({columns})')
+    else:
+        raise RuntimeError(f"found {n_run_tables} runs tables expected 1")
+
+
+@upgrader
+def perform_db_upgrade_11_to_12(conn: ConnectionPlus) -> None:
+    """
+    Perform the upgrade from version 11 to version 12.
+
+    Store every distinct snapshot once, in a new snapshots table keyed by the
+    hash of its content. The runs table refers to it through a new
+    snapshot_hash column, and the snapshots of existing runs are moved there.
+    """
+    from qcodes.dataset.sqlite.db_upgrades.upgrade_11_to_12 import \
+        upgrade_11_to_12
+    upgrade_11_to_12(conn)
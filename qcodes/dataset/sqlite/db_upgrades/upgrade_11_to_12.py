@@ -0,0 +1,84 @@
+import hashlib
+import logging
+import sys
+
+from tqdm import tqdm
+
+from qcodes.dataset.sqlite.connection import ConnectionPlus, atomic, \
+    atomic_transaction, transaction
+from qcodes.dataset.sqlite.query_helpers import insert_column, many_many
+
+
+log = logging.getLogger(__name__)
+
+
+_snapshots_table_schema = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    -- the SHA-256 hex digest of the UTF-8 encoded snapshot
+    snapshot_hash TEXT PRIMARY KEY,
+    snapshot TEXT
+);
+"""
+
+
+def upgrade_11_to_12(conn: ConnectionPlus) -> None:
+    """
+    Perform the upgrade from version 11 to version 12.
+
+    Add a snapshots table that stores every distinct snapshot once, keyed by
+    the hash of its content, and a snapshot_hash column to the runs table
+    that refers to it. The snapshots of existing runs are moved from the
+    snapshot column of the runs table to the snapshots table.
+    """
+    sql = "SELECT name FROM sqlite_master WHERE type='table' AND name='runs'"
+    cur = atomic_transaction(conn, sql)
+    n_run_tables = len(cur.fetchall())
+
+    if n_run_tables != 1:
+        raise RuntimeError(f"found {n_run_tables} runs tables expected 1")
+
+    # If one run fails, we want the whole upgrade to roll back, hence the
+    # entire upgrade is one atomic transaction
+
+    with atomic(conn) as conn:
+        transaction(conn, _snapshots_table_schema)
+        insert_column(conn, 'runs', 'snapshot_hash', 'TEXT')
+        transaction(conn, """
+                          CREATE INDEX
+                          IF NOT EXISTS IX_runs_snapshot_hash
+                          ON runs (snapshot_hash)
+                          """)
+
+        cur = transaction(conn, "SELECT run_id FROM runs "
+                                "WHERE snapshot IS NOT NULL")
+        run_ids = [r[0] for r in many_many(cur, 'run_id')]
+
+        pbar = tqdm(run_ids, file=sys.stdout)
+        pbar.set_description("Upgrading database; v11 -> v12")
+
+        total_size = 0
+        for run_id in pbar:
+            # the snapshots are read one by one as each may be large
+            cur = transaction(conn, "SELECT snapshot FROM runs "
+                                    "WHERE run_id = ?", run_id)
+            snapshot = cur.fetchone()[0]
+            encoded = snapshot.encode('utf-8')
+            total_size += len(encoded)
+            snapshot_hash = hashlib.sha256(encoded).hexdigest()
+            transaction(conn, "INSERT OR IGNORE INTO snapshots "
+                              "(snapshot_hash, snapshot) VALUES (?, ?)",
+                        snapshot_hash, snapshot)
+            transaction(conn, "UPDATE runs SET snapshot_hash = ?, "
+                              "snapshot = NULL WHERE run_id = ?",
+                        snapshot_hash, run_id)
+
+        cur = transaction(conn, "SELECT COUNT(*), "
+                                "TOTAL(LENGTH(CAST(snapshot AS BLOB))) "
+                                "FROM snapshots")
+        n_unique, stored_size = cur.fetchone()
+
+    if run_ids:
+        log.info(f'Deduplicated the snapshots of {len(run_ids)} runs into '
+                 f'{n_unique} distinct snapshots, saving '
+                 f'{total_size - int(stored_size)} bytes. Run VACUUM on the '
+                 f'database to release the space to the file system.')
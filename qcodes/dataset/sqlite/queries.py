@@ -2,17 +2,21 @@
 This module contains useful SQL queries and their combinations which are
 specific to the domain of QCoDeS database.
 """
+import hashlib
+import itertools
+import json
 import logging
 import sqlite3
 import time
 import unicodedata
 import warnings
 from typing import Dict, List, Optional, Any, Sequence, Union, Tuple, \
-    Callable, cast, Mapping
+    Callable, cast, Mapping, Iterator
 
 import numpy as np
 
 import qcodes as qc
+from qcodes.dataset.descriptions.dependencies import InterDependencies_
 from qcodes.dataset.descriptions.rundescriber import RunDescriber
 from qcodes.dataset.descriptions.param_spec import ParamSpec
 from qcodes.dataset.descriptions.versioning.converters import old_to_new
@@ -21,10 +25,11 @@ from qcodes.dataset.descriptions.versioning import serialization as serial
 from qcodes.dataset.guids import parse_guid, generate_guid
 from qcodes.dataset.sqlite.connection import transaction, ConnectionPlus, \
     atomic_transaction, atomic
+from qcodes.dataset.sqlite.settings import SQLiteSettings
 from qcodes.dataset.sqlite.query_helpers import (
     sql_placeholder_string, many_many, one, many, select_one_where,
     select_many_where, insert_values, insert_column, is_column_in_table,
-    VALUES, update_where)
+    length, VALUES, update_where)
 from qcodes.utils.deprecate import deprecate
 from qcodes.configuration import Config
 
@@ -41,7 +46,18 @@ RUNS_TABLE_COLUMNS = ["run_id", "exp_id", "name", "result_table_name",
                       "result_counter", "run_timestamp", "completed_timestamp",
                       "is_completed", "parameters", "guid",
                       "run_description", "snapshot", "parent_datasets",
-                      "captured_run_id", "captured_counter"]
+                      "captured_run_id", "captured_counter",
+                      "snapshot_hash"]
+
+# the snapshot of a run is stored once per distinct content in the
+# snapshots table; the snapshot column of the runs table is only read for
+# runs whose snapshot has not been moved there
+_SNAPSHOT_SELECT = """
+    SELECT COALESCE(snapshots.snapshot, runs.snapshot) AS snapshot
+    FROM runs
+    LEFT JOIN snapshots ON runs.snapshot_hash = snapshots.snapshot_hash
+    WHERE runs.run_id = ?
+    """
 
 
 def is_run_id_in_database(conn: ConnectionPlus,
@@ -154,8 +170,8 @@ def get_parameter_data(conn: ConnectionPlus,
     Note that this assumes that all array type parameters have the same length.
     This should always be the case for a parameter and its dependencies.
 
-    Note that all numeric data will at the moment be returned as floating point
-    values.
+    Note that numeric data is returned with an integer dtype if all the
+    values of a column are integers and as floating point values otherwise.
 
     Args:
         conn: database connection
@@ -180,61 +196,301 @@ def get_parameter_data(conn: ConnectionPlus,
 
     # loop over all the requested parameters
     for output_param in columns:
-        output_param_spec = interdeps._id_to_paramspec[output_param]
-        # find all the dependencies of this param
-        paramspecs = [output_param_spec] \
-                   + list(interdeps.dependencies.get(output_param_spec, ()))
-        param_names = [param.name for param in paramspecs]
-        types = [param.type for param in paramspecs]
-
-        res = get_parameter_tree_values(conn,
-                                        table_name,
-                                        output_param,
-                                        *param_names[1:],
-                                        start=start,
-                                        end=end)
-
-        # if we have array type parameters expand all other parameters
-        # to arrays
-        if 'array' in types and ('numeric' in types or 'text' in types
-                                 or 'complex' in types):
-            first_array_element = types.index('array')
-            numeric_elms = [i for i, x in enumerate(types)
-                            if x == "numeric"]
-            complex_elms = [i for i, x in enumerate(types)
-                            if x == 'complex']
-            text_elms = [i for i, x in enumerate(types)
-                         if x == "text"]
-            for row in res:
-                for element in numeric_elms:
-                    row[element] = np.full_like(row[first_array_element],
-                                                row[element],
-                                                dtype=np.float)
-                    # todo should we handle int/float types here
-                    # we would in practice have to perform another
-                    # loop to check that all elements of a given can be cast to
-                    # int without loosing precision before choosing an integer
-                    # representation of the array
-                for element in complex_elms:
-                    row[element] = np.full_like(row[first_array_element],
-                                                row[element],
-                                                dtype=np.complex)
-                for element in text_elms:
-                    strlen = len(row[element])
-                    row[element] = np.full_like(row[first_array_element],
-                                                row[element],
-                                                dtype=f'U{strlen}')
-
-        # Benchmarking shows that transposing the data with python types is
-        # faster than transposing the data using np.array.transpose
-        res_t = map(list, zip(*res))
-        output[output_param] = {name: np.array(column_data)
-                                for name, column_data
-                                in zip(param_names, res_t)}
+        output[output_param] = get_parameter_tree_data(
+            conn, table_name, interdeps, output_param, start=start, end=end)
+
+    return output
+
 
+def get_parameter_data_chunks(conn: ConnectionPlus,
+                              table_name: str,
+                              columns: Sequence[str] = (),
+                              chunk_size: int = 10000) -> \
+        Iterator[Dict[str, Dict[str, np.ndarray]]]:
+    """
+    Get data for one or more parameters and its dependencies in chunks, see
+    :func:`get_parameter_data`. Each chunk holds the data of (at most)
+    ``chunk_size`` consecutive rows of the results table, hence the memory
+    needed does not depend on the size of the table. Parameters without
+    data in the rows of a chunk map to an empty dictionary. Only the rows
+    that are in the table when the iteration starts are returned.
+
+    Note that the dtype of numeric data is determined for each chunk, i.e.
+    chunks of a column may be integer and floating point arrays.
+
+    Args:
+        conn: database connection
+        table_name: name of the table
+        columns: list of columns. If no columns are provided, all parameters
+            are returned.
+        chunk_size: the number of rows of the results table per chunk
+
+    Yields:
+        The data of the rows of the chunk, in the format of
+        :func:`get_parameter_data`
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be positive, not {chunk_size}')
+
+    sql = """
+    SELECT run_id FROM runs WHERE result_table_name = ?
+    """
+    c = atomic_transaction(conn, sql, table_name)
+    run_id = one(c, 'run_id')
+
+    rd = serial.from_json_to_current(get_run_description(conn, run_id))
+    interdeps = rd.interdeps
+
+    if len(columns) == 0:
+        columns = [ps.name for ps in interdeps.non_dependencies]
+
+    max_rowid = length(conn, table_name)
+    for min_rowid in range(1, max_rowid + 1, chunk_size):
+        yield {output_param: get_parameter_tree_data(
+                   conn, table_name, interdeps, output_param,
+                   min_rowid=min_rowid,
+                   max_rowid=min(min_rowid + chunk_size - 1, max_rowid))
+               for output_param in columns}
+
+
+def get_parameter_tree_data(conn: ConnectionPlus,
+                            table_name: str,
+                            interdeps: InterDependencies_,
+                            toplevel_param_name: str,
+                            start: Optional[int] = None,
+                            end: Optional[int] = None,
+                            min_rowid: Optional[int] = None,
+                            max_rowid: Optional[int] = None) -> \
+        Dict[str, np.ndarray]:
+    """
+    Get the data of one parameter and its dependencies as a dict of numpy
+    arrays, see :func:`get_parameter_data`. Besides by result count, the rows
+    can be selected by the (inclusive) range of their row ids in the results
+    table, which is what allows to load only the rows that have been added
+    since a previous call without scanning the table from the top.
+
+    Args:
+        conn: database connection
+        table_name: name of the table
+        interdeps: the interdependencies of the parameters of the run
+        toplevel_param_name: name of the parameter whose data and
+            dependencies to return
+        start: start of range; if None, then starts from the top of the table
+        end: end of range; if None, then ends at the bottom of the table
+        min_rowid: lowest row id to include; if None, there is no lower bound
+        max_rowid: highest row id to include; if None, there is no upper
+            bound
+
+    Returns:
+        Dictionary from the names of the parameter and its dependencies to
+        numpy arrays of their values, or an empty dictionary if there are
+        no rows in the range
+    """
+    output_param_spec = interdeps._id_to_paramspec[toplevel_param_name]
+    # find all the dependencies of this param
+    paramspecs = [output_param_spec] \
+               + list(interdeps.dependencies.get(output_param_spec, ()))
+    param_names = [param.name for param in paramspecs]
+    types = [param.type for param in paramspecs]
+
+    # all columns are read in one transaction such that they are
+    # consistent even if results are being added to the table meanwhile
+    with atomic(conn) as atomic_conn:
+        arrays = [_get_parameter_column_as_array(atomic_conn,
+                                                 table_name,
+                                                 toplevel_param_name,
+                                                 name,
+                                                 paramtype,
+                                                 start=start,
+                                                 end=end,
+                                                 min_rowid=min_rowid,
+                                                 max_rowid=max_rowid)
+                  for name, paramtype in zip(param_names, types)]
+
+    if len(arrays[0]) == 0:
+        return {}
+
+    return dict(zip(param_names, _expand_scalar_columns(arrays, types)))
+
+
+def _expand_scalar_columns(arrays: Sequence[np.ndarray],
+                           types: Sequence[str]) -> List[np.ndarray]:
+    """
+    If some of the columns of a parameter tree are of 'array' type, expand
+    all the other columns to arrays of the same shape.
+    """
+    if 'array' in types and ('numeric' in types or 'text' in types
+                             or 'complex' in types):
+        first_array = arrays[types.index('array')]
+        return [_expand_scalar_column(array, first_array)
+                if paramtype != 'array' else array
+                for array, paramtype in zip(arrays, types)]
+    return list(arrays)
+
+
+def _get_parameter_column_as_array(conn: ConnectionPlus,
+                                   table_name: str,
+                                   toplevel_param_name: str,
+                                   param_name: str,
+                                   paramtype: str,
+                                   start: Optional[int] = None,
+                                   end: Optional[int] = None,
+                                   min_rowid: Optional[int] = None,
+                                   max_rowid: Optional[int] = None
+                                   ) -> np.ndarray:
+    """
+    Get the values of one column of a results table as a numpy array.
+
+    Numeric values are fetched as stored by SQLite, bypassing the converter
+    of the 'numeric' column type, and converted in one go such that integer
+    values get an integer dtype. Only if that does not give a numeric array,
+    e.g. because NaNs are stored as text, the column is fetched again with
+    the converter.
+    """
+    if paramtype == 'numeric':
+        array = np.array(get_parameter_column_values(
+            conn, table_name, toplevel_param_name, param_name,
+            start=start, end=end, convert=False,
+            min_rowid=min_rowid, max_rowid=max_rowid))
+        if array.dtype.kind in 'iuf':
+            return array
+
+    values = get_parameter_column_values(
+        conn, table_name, toplevel_param_name, param_name,
+        start=start, end=end, min_rowid=min_rowid, max_rowid=max_rowid)
+
+    return _column_values_to_array(values, paramtype)
+
+
+def _column_values_to_array(values: Sequence[Any],
+                            paramtype: str) -> np.ndarray:
+    """
+    Convert the values of one column of a results table to a numpy array.
+    Array values of equal shape are stacked into a preallocated array with
+    one more dimension, array values of different shapes are returned as an
+    array of arrays (of object dtype).
+    """
+    if paramtype != 'array' or len(values) == 0:
+        return np.array(values)
+
+    first_shape = np.shape(values[0])
+    if all(np.shape(value) == first_shape for value in values):
+        dtype = np.result_type(*{np.asarray(value).dtype
+                                 for value in values})
+        output = np.empty((len(values),) + first_shape, dtype=dtype)
+        for i, value in enumerate(values):
+            output[i] = value
+    else:
+        output = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            output[i] = value
     return output
 
 
+def _expand_scalar_column(column: np.ndarray,
+                          array_column: np.ndarray) -> np.ndarray:
+    """
+    Expand a column of scalar values to the shape of a column of array
+    values such that each scalar is repeated for all the elements of the
+    array in the same row. For arrays of equal shape this is done in one
+    vectorised step.
+    """
+    if array_column.dtype != np.dtype('O'):
+        expanded = np.empty(array_column.shape, dtype=column.dtype)
+        extra_dims = (1,) * (array_column.ndim - 1)
+        expanded[...] = column.reshape(column.shape + extra_dims)
+        return expanded
+
+    expanded = np.empty(len(column), dtype=object)
+    for i, (value, array) in enumerate(zip(column, array_column)):
+        expanded[i] = np.full(np.shape(array), value, dtype=column.dtype)
+    return expanded
+
+
+def _get_offset_and_limit(start: Optional[int],
+                          end: Optional[int]) -> Tuple[int, int]:
+    """
+    Translate the 1-indexed start and end (both included) of a range of
+    results into the OFFSET and LIMIT of an SQL query
+    """
+    offset = (start - 1) if start is not None else 0
+    limit = (end - offset) if end is not None else -1
+
+    if start is not None and end is not None and start > end:
+        limit = 0
+
+    return offset, limit
+
+
+def get_parameter_column_values(conn: ConnectionPlus,
+                                result_table_name: str,
+                                toplevel_param_name: str,
+                                param_name: str,
+                                start: Optional[int] = None,
+                                end: Optional[int] = None,
+                                convert: bool = True,
+                                min_rowid: Optional[int] = None,
+                                max_rowid: Optional[int] = None
+                                ) -> List[Any]:
+    """
+    Get the values of a single column of a data table. The rows retrieved
+    are the rows where the 'toplevel_param_name' column has non-NULL values,
+    hence calling this function for a toplevel parameter and each of its
+    setpoints yields columns of the same length. This is the column-wise
+    counterpart of :func:`get_parameter_tree_values`.
+
+    Args:
+        conn: Connection to the DB file
+        result_table_name: The result table whence the values are to be
+            retrieved
+        toplevel_param_name: Name of the column that holds the top level
+            parameter
+        param_name: Name of the column to retrieve
+        start: The (1-indexed) result to include as the first results to
+            be returned. None is equivalent to 1. If start > end, nothing
+            is returned.
+        end: The (1-indexed) result to include as the last result to be
+            returned. None is equivalent to "all the rest". If start > end,
+            nothing is returned.
+        convert: If False, the values are returned as stored by SQLite,
+            i.e. the converter registered for the type of the column is not
+            applied.
+        min_rowid: The lowest row id of the table to consider. None means
+            that there is no lower bound. The start and end of the range of
+            results are counted from here.
+        max_rowid: The highest row id of the table to consider. None means
+            that there is no upper bound.
+
+    Returns:
+        A list of the values of the column
+    """
+    offset, limit = _get_offset_and_limit(start, end)
+
+    # the unary + is a no-op on the value, but the resulting column has no
+    # declared type, hence no converter is applied to it
+    column = param_name if convert else f'+{param_name}'
+
+    conditions = [f'{toplevel_param_name} IS NOT NULL']
+    if min_rowid is not None:
+        conditions.append(f'id >= {int(min_rowid)}')
+    if max_rowid is not None:
+        conditions.append(f'id <= {int(max_rowid)}')
+    where = ' AND '.join(conditions)
+
+    sql = f"""
+          SELECT {column}
+          FROM "{result_table_name}"
+          WHERE {where}
+          LIMIT {limit} OFFSET {offset}
+          """
+
+    cursor = conn.cursor()
+    # plain tuples are much cheaper to create than sqlite3.Row objects
+    cursor.row_factory = None
+    cursor.execute(sql)
+    return list(itertools.chain.from_iterable(cursor))
+
+
 @deprecate('This method does not accurately represent the dataset.',
                'Use `get_parameter_data` instead.')
 def get_values(conn: ConnectionPlus,
@@ -292,11 +548,7 @@ def get_parameter_tree_values(conn: ConnectionPlus,
         index is parameter value (first toplevel_param, then other_param_names)
     """
 
-    offset = (start - 1) if start is not None else 0
-    limit = (end - offset) if end is not None else -1
-
-    if start is not None and end is not None and start > end:
-        limit = 0
+    offset, limit = _get_offset_and_limit(start, end)
 
     # Note: if we use placeholders for the SELECT part, then we get rows
     # back that have "?" as all their keys, making further data extraction
@@ -474,54 +726,126 @@ def get_guids_from_run_spec(conn: ConnectionPlus,
     Returns:
         A list of the GUIDs matching the supplied specifications.
     """
-    # first find all experiments that match the given sample
-    # and experiment name
-    exp_query = {}
-    exp_ids: Optional[List[int]]
-    if experiment_name is not None or sample_name is not None:
-        if sample_name is not None:
-            exp_query['sample_name'] = sample_name
-        if experiment_name is not None:
-            exp_query['name'] = experiment_name
-        exp_ids = get_matching_exp_ids(conn,
-                                       **exp_query)
-        if exp_ids == []:
-            return []
-    else:
-        exp_ids = None
+    rows = get_run_summary_rows(conn,
+                                captured_run_id=captured_run_id,
+                                captured_counter=captured_counter,
+                                experiment_name=experiment_name,
+                                sample_name=sample_name)
+    return [row['guid'] for row in rows]
+
+
+# the columns of the rows returned by `get_run_summary_rows`
+RUN_SUMMARY_COLUMNS = ["run_id", "captured_run_id", "captured_counter",
+                       "guid", "name", "exp_id", "exp_name", "sample_name",
+                       "result_counter", "run_timestamp",
+                       "completed_timestamp", "is_completed"]
+
+
+def get_run_summary_rows(conn: ConnectionPlus,
+                         guids: Optional[Sequence[str]] = None,
+                         exp_id: Optional[int] = None,
+                         captured_run_id: Optional[int] = None,
+                         captured_counter: Optional[int] = None,
+                         experiment_name: Optional[str] = None,
+                         sample_name: Optional[str] = None,
+                         started_after: Optional[float] = None,
+                         started_before: Optional[float] = None,
+                         metadata: Optional[Mapping[str, Any]] = None
+                         ) -> List[sqlite3.Row]:
+    """
+    Get a summary of the runs matching all of the supplied conditions in a
+    single query that is served by the indices of the runs and experiments
+    tables. Only the columns in ``RUN_SUMMARY_COLUMNS`` are read, i.e. no
+    snapshots or run descriptions are loaded. Conditions that are None are
+    ignored.
+
+    Args:
+        conn: connection to the database.
+        guids: the GUIDs of the runs.
+        exp_id: the id of the experiment of the runs.
+        captured_run_id: the run_id that was assigned to the run at capture
+            time.
+        captured_counter: the counter that was assigned to the run at
+            capture time.
+        experiment_name: name of the experiment of the runs.
+        sample_name: name of the sample of the experiment of the runs.
+        started_after: the earliest start time of the runs (in seconds since
+            the epoch).
+        started_before: the latest start time of the runs (in seconds since
+            the epoch).
+        metadata: tags and values of metadata that the runs must have.
 
+    Returns:
+        The rows of the matching runs, ordered by run_id
+    """
     conds = []
-    inputs = []
-
-    if exp_ids is not None:
-        exp_placeholder = sql_placeholder_string(len(exp_ids))
-        conds.append(f"exp_id in {exp_placeholder}")
-        inputs.extend(exp_ids)
-    if captured_run_id is not None:
-        conds.append("captured_run_id is ?")
-        inputs.append(captured_run_id)
-    if captured_counter is not None:
-        conds.append("captured_counter is ?")
-        inputs.append(captured_counter)
-
-    if len(conds) >= 1:
-        where_clause = " WHERE " + " AND ".join(conds)
-    else:
-        where_clause = ""
+    inputs: List[Any] = []
+
+    conditions = [("runs.exp_id", exp_id),
+                  ("runs.captured_run_id", captured_run_id),
+                  ("runs.captured_counter", captured_counter),
+                  ("experiments.name", experiment_name),
+                  ("experiments.sample_name", sample_name)]
+    for column, value in conditions:
+        if value is not None:
+            conds.append(f"{column} = ?")
+            inputs.append(value)
+    if started_after is not None:
+        conds.append("runs.run_timestamp >= ?")
+        inputs.append(started_after)
+    if started_before is not None:
+        conds.append("runs.run_timestamp <= ?")
+        inputs.append(started_before)
+    for tag, value in (metadata or {}).items():
+        if not is_column_in_table(conn, "runs", tag):
+            return []
+        conds.append(f'runs."{tag}" = ?')
+        inputs.append(value)
 
-    query = "SELECT guid from runs" + where_clause + " ORDER BY run_id"
+    query = """
+            SELECT runs.run_id, runs.captured_run_id, runs.captured_counter,
+                   runs.guid, runs.name, runs.exp_id,
+                   experiments.name AS exp_name, experiments.sample_name,
+                   runs.result_counter, runs.run_timestamp,
+                   runs.completed_timestamp, runs.is_completed
+            FROM runs
+            JOIN experiments ON runs.exp_id = experiments.exp_id
+            """
 
-    cursor = conn.cursor()
-    if len(inputs) > 0:
-        cursor.execute(query, inputs)
+    where_clauses = []
+    if guids is None:
+        where_clauses.append((conds, inputs))
     else:
-        cursor.execute(query)
+        # the number of guids in a query is limited by the maximal number
+        # of variables of a query
+        max_guids = SQLiteSettings.limits['MAX_VARIABLE_NUMBER'] - len(inputs)
+        for i in range(0, len(guids), max_guids):
+            chunk = guids[i:i + max_guids]
+            guid_cond = f"runs.guid IN {sql_placeholder_string(len(chunk))}"
+            where_clauses.append((conds + [guid_cond], inputs + list(chunk)))
+
+    rows: List[sqlite3.Row] = []
+    with atomic(conn) as conn:
+        for chunk_conds, chunk_inputs in where_clauses:
+            where_clause = ""
+            if chunk_conds:
+                where_clause = " WHERE " + " AND ".join(chunk_conds)
+            cursor = transaction(conn, query + where_clause, *chunk_inputs)
+            rows.extend(cursor.fetchall())
 
-    rows = cursor.fetchall()
-    results = []
-    for r in rows:
-        results.append(r['guid'])
-    return results
+    if guids is not None:
+        rows.sort(key=lambda row: row['run_id'])
+    return rows
+
+
+def _create_metadata_index(conn: ConnectionPlus, tag: str) -> None:
+    """
+    Create an index on the metadata column of the given tag in the runs
+    table, such that runs can be searched by their metadata.
+    """
+    atomic_transaction(conn,
+                       f'CREATE INDEX IF NOT EXISTS "IX_runs_metadata_{tag}" '
+                       f'ON runs ("{tag}")')
 
 
 def _get_layout_id(conn: ConnectionPlus,
@@ -775,6 +1099,7 @@ def get_matching_exp_ids(conn: ConnectionPlus,
         match_conditions.pop("format_string")
     query = query.replace("end_time = ?", f"end_time {time_eq} ?")
     query = query.replace("sample_name = ?", f"sample_name {sample_name_eq} ?")
+    query += "ORDER BY exp_id"
 
     cursor = conn.cursor()
     cursor.execute(query, tuple(match_conditions.values()))
@@ -1441,6 +1766,148 @@ def get_run_description(conn: ConnectionPlus, run_id: int) -> str:
                             "run_id", run_id)
 
 
+def get_snapshot(conn: ConnectionPlus, run_id: int) -> Optional[str]:
+    """
+    Return the (JSON string) snapshot of the specified run, or None if the
+    run has no snapshot
+    """
+    cur = atomic_transaction(conn, _SNAPSHOT_SELECT, run_id)
+    row = cur.fetchone()
+    return None if row is None else row['snapshot']
+
+
+def add_snapshot(conn: ConnectionPlus, run_id: int, snapshot: str) -> None:
+    """
+    Set the snapshot of the specified run. The snapshot is stored in the
+    snapshots table under the hash of its content, unless an identical
+    snapshot is stored there already, such that runs with the same snapshot
+    share it. A snapshot that is no longer referred to by any run, because
+    it has been replaced, is removed.
+
+    Args:
+        conn: connection to the database
+        run_id: the run_id of the run
+        snapshot: the (JSON string) snapshot
+    """
+    snapshot_hash = hashlib.sha256(snapshot.encode('utf-8')).hexdigest()
+    with atomic(conn) as conn:
+        old_hash = select_one_where(conn, "runs", "snapshot_hash",
+                                    "run_id", run_id)
+        transaction(conn, "INSERT OR IGNORE INTO snapshots "
+                          "(snapshot_hash, snapshot) VALUES (?, ?)",
+                    snapshot_hash, snapshot)
+        transaction(conn, "UPDATE runs SET snapshot_hash = ?, "
+                          "snapshot = NULL WHERE run_id = ?",
+                    snapshot_hash, run_id)
+        if old_hash is not None and old_hash != snapshot_hash:
+            transaction(conn, """
+                              DELETE FROM snapshots
+                              WHERE snapshot_hash = ?
+                              AND NOT EXISTS (SELECT 1 FROM runs
+                                              WHERE snapshot_hash = ?)
+                              """,
+                        old_hash, old_hash)
+
+
+def get_snapshot_storage_info(conn: ConnectionPlus) -> Dict[str, int]:
+    """
+    Report how much space the deduplication of snapshots saves
+
+    Args:
+        conn: connection to the database
+
+    Returns:
+        A dictionary with the number of runs that have a snapshot
+        ('runs_with_snapshot'), the number of distinct snapshots stored
+        ('distinct_snapshots'), the size in bytes of the stored snapshots
+        ('stored_bytes'), the size in bytes the snapshots would take if
+        every run stored its own copy ('undeduplicated_bytes') and the
+        difference of the two ('saved_bytes')
+    """
+    sql = """
+          SELECT COUNT(*) AS n_runs,
+                 TOTAL(LENGTH(CAST(snapshots.snapshot AS BLOB))) AS size
+          FROM runs
+          JOIN snapshots ON runs.snapshot_hash = snapshots.snapshot_hash
+          """
+    row = atomic_transaction(conn, sql).fetchone()
+    n_runs, undeduplicated_size = row['n_runs'], int(row['size'])
+
+    sql = """
+          SELECT COUNT(*) AS n_snapshots,
+                 TOTAL(LENGTH(CAST(snapshot AS BLOB))) AS size
+          FROM snapshots
+          """
+    row = atomic_transaction(conn, sql).fetchone()
+    n_snapshots, stored_size = row['n_snapshots'], int(row['size'])
+
+    return {'runs_with_snapshot': n_runs,
+            'distinct_snapshots': n_snapshots,
+            'stored_bytes': stored_size,
+            'undeduplicated_bytes': undeduplicated_size,
+            'saved_bytes': undeduplicated_size - stored_size}
+
+
+def _get_value_at_path(obj: Any, keys: Sequence[Union[str, int]]) -> Any:
+    """
+    Get the value of nested dictionaries and lists at the given path of keys
+    and list indices, raising a KeyError if there is no such value.
+    """
+    value = obj
+    for key in keys:
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            raise KeyError(f"No value at {list(keys)} in the snapshot")
+    return value
+
+
+def get_value_from_snapshot(conn: ConnectionPlus, run_id: int,
+                            keys: Sequence[Union[str, int]]) -> Any:
+    """
+    Get a single value from the snapshot of the specified run. The value is
+    extracted with the JSON functions of SQLite, hence the (potentially
+    large) snapshot is not parsed as a whole. If the JSON functions are not
+    available, the whole snapshot is parsed instead.
+
+    Args:
+        conn: connection to the database
+        run_id: the run_id of the run
+        keys: the keys (of dictionaries) and indices (of lists) of the path
+            to the value within the snapshot
+
+    Returns:
+        The value, with dictionaries and lists parsed from JSON
+
+    Raises:
+        KeyError: if the run has no snapshot or the snapshot has no value at
+            the given path
+    """
+    path = '$' + ''.join(f'[{key}]' if isinstance(key, int) else f'."{key}"'
+                         for key in keys)
+    sql = f"""
+          SELECT json_type(snapshot, ?) AS type,
+                 json_extract(snapshot, ?) AS value
+          FROM ({_SNAPSHOT_SELECT})
+          """
+    try:
+        row = atomic_transaction(conn, sql, path, path, run_id).fetchone()
+    except sqlite3.OperationalError:
+        snapshot_json = get_snapshot(conn, run_id)
+        if snapshot_json is None:
+            raise KeyError(f"Run {run_id} has no snapshot")
+        return _get_value_at_path(json.loads(snapshot_json), keys)
+
+    if row is None or row['type'] is None:
+        raise KeyError(f"No value at {list(keys)} in the snapshot of run "
+                       f"{run_id}")
+    if row['type'] in ('object', 'array'):
+        return json.loads(row['value'])
+    if row['type'] in ('true', 'false'):
+        return bool(row['value'])
+    return row['value']
+
+
 def get_parent_dataset_links(conn: ConnectionPlus, run_id: int) -> str:
     """
     Return the (JSON string) of the parent-child dataset links for the
@@ -1470,6 +1937,10 @@ def get_parent_dataset_links(conn: ConnectionPlus, run_id: int) -> str:
 def get_metadata(conn: ConnectionPlus, tag: str, table_name: str) -> str:
     """ Get metadata under the tag from table
     """
+    if tag == 'snapshot':
+        run_id = select_one_where(conn, "runs", "run_id",
+                                  "result_table_name", table_name)
+        return get_snapshot(conn, run_id)
     return select_one_where(conn, "runs", tag,
                             "result_table_name", table_name)
 
@@ -1524,6 +1995,8 @@ def insert_meta_data(conn: ConnectionPlus, row_id: int, table_name: str,
                              ' That is not a valid metadata value!')
     for key in metadata.keys():
         insert_column(conn, table_name, key)
+        if table_name == "runs" and key not in RUNS_TABLE_COLUMNS:
+            _create_metadata_index(conn, key)
     update_meta_data(conn, row_id, table_name, metadata)
 
 
@@ -1555,6 +2028,15 @@ def add_meta_data(conn: ConnectionPlus,
         - metadata: the metadata to add
         - table_name: the table to add to, defaults to runs
     """
+    if table_name == "runs" and 'snapshot' in metadata:
+        metadata = dict(metadata)
+        snapshot = metadata.pop('snapshot')
+        if snapshot is None:
+            raise ValueError('Tag snapshot has value None. '
+                             ' That is not a valid metadata value!')
+        add_snapshot(conn, row_id, snapshot)
+        if not metadata:
+            return
     try:
         insert_meta_data(conn, row_id, table_name, metadata)
     except sqlite3.OperationalError as e:
@@ -6,7 +6,8 @@ import itertools
 import sqlite3
 from distutils.version import LooseVersion
 
-from typing import List, Any, Union, Dict, Tuple, Optional, Sequence
+from typing import (List, Any, Union, Dict, Tuple, Optional, Sequence,
+                    Iterable)
 
 import numpy as np
 from numpy import ndarray
@@ -222,6 +223,40 @@ def insert_many_values(conn: ConnectionPlus,
     return return_value
 
 
+def insert_many_rows(conn: ConnectionPlus,
+                     formatted_name: str,
+                     columns: Sequence[str],
+                     rows: Iterable[Sequence[VALUE]],
+                     ) -> int:
+    """
+    Inserts many rows for the specified columns using a single prepared
+    statement (``executemany``). Unlike :func:`insert_many_values`, the rows
+    are never flattened into one long list of values, so any iterable of
+    row sequences, e.g. ``zip(*columns)``, can be passed in directly.
+
+    Example input:
+    columns: ['xparam', 'yparam']
+    rows: [(x1, y1), (x2, y2), (x3, y3)]
+
+    Returns:
+        the number of inserted rows
+
+    NOTE this need to be committed before closing the connection.
+    """
+    _columns = ",".join(columns)
+    _values = sql_placeholder_string(len(columns))
+    query = f"""INSERT INTO "{formatted_name}"
+                ({_columns})
+                VALUES
+                {_values}
+             """
+    with atomic(conn) as conn:
+        c = conn.cursor()
+        c.executemany(query, rows)
+        rowcount = c.rowcount
+    return rowcount
+
+
 def modify_values(conn: ConnectionPlus,
                   formatted_name: str,
                   index: int,
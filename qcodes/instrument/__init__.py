@@ -8,6 +8,7 @@ from .parameter import (
     ArrayParameter,
     MultiParameter,
     ParameterWithSetpoints,
+    HardwareSweepSetpoints,
     DelegateParameter,
     ManualParameter,
     ScaledParameter,
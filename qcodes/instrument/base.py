@@ -1,10 +1,13 @@
 """Instrument base class."""
+import asyncio
 import time
+import threading
 import weakref
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import Sequence, Optional, Dict, Union, Callable, Any, List, \
-    TYPE_CHECKING, cast, Type
+    TYPE_CHECKING, cast, Type, Iterator, MutableMapping, TypeVar
 
 import numpy as np
 from qcodes.utils.helpers import DelegateAttributes, strip_attrs, full_class
@@ -13,6 +16,8 @@ from qcodes.utils.validators import Anything
 from qcodes.logger.instrument_logger import get_instrument_logger
 from .parameter import Parameter, _BaseParameter
 from .function import Function
+from . import io_statistics
+from .io_statistics import IOStatistics
 
 if TYPE_CHECKING:
     from qcodes.instrument.channel import ChannelList
@@ -20,6 +25,30 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# holds the dict that the durations of the parameter snapshots are recorded
+# in, if any, see `record_snapshot_durations`
+_snapshot_durations = threading.local()
+
+
+@contextmanager
+def record_snapshot_durations() -> Iterator[Dict[str, float]]:
+    """
+    Context manager that records how long (in seconds) taking the snapshot
+    of each parameter of an instrument takes while it is active. The
+    durations are recorded in the dict that is returned, which maps the
+    full names of the parameters to durations. Only the snapshots taken in
+    the thread that entered the context manager are recorded.
+    """
+    durations: Dict[str, float] = {}
+    previous = getattr(_snapshot_durations, 'durations', None)
+    _snapshot_durations.durations = durations
+    try:
+        yield durations
+    finally:
+        _snapshot_durations.durations = previous
+
 
 class InstrumentBase(Metadatable, DelegateAttributes):
     """
@@ -197,6 +226,8 @@ class InstrumentBase(Metadatable, DelegateAttributes):
             "__class__": full_class(self)
         }
 
+        durations = getattr(_snapshot_durations, 'durations', None)
+
         snap['parameters'] = {}
         for name, param in self.parameters.items():
             if param.snapshot_exclude:
@@ -206,6 +237,7 @@ class InstrumentBase(Metadatable, DelegateAttributes):
             else:
                 update_par = update
 
+            t0 = time.perf_counter()
             try:
                 snap['parameters'][name] = param.snapshot(update=update_par)
             except:
@@ -215,6 +247,8 @@ class InstrumentBase(Metadatable, DelegateAttributes):
                                  f"parameter: {name}")
                 self.log.info(f"Details for Snapshot:", exc_info=True)
                 snap['parameters'][name] = param.snapshot(update=False)
+            if durations is not None:
+                durations[param.full_name] = time.perf_counter() - t0
 
         for attr in set(self._meta_attrs):
             if hasattr(self, attr):
@@ -415,6 +449,10 @@ class Instrument(InstrumentBase, AbstractInstrument):
 
     shared_kwargs = ()
 
+    # the statistics of the communication with the instrument, while they
+    # are recorded, see `start_io_statistics`
+    io_statistics: Optional[IOStatistics] = None
+
     _all_instruments: Dict[str, weakref.ref] = {}
     _type = None
     _instances: List[weakref.ref] = []
@@ -422,6 +460,16 @@ class Instrument(InstrumentBase, AbstractInstrument):
     def __init__(self, name: str,
                  metadata: Optional[Dict] = None) -> None:
         self._t0 = time.time()
+        # the locks that serialise the asynchronous communication with this
+        # instrument, one for each event loop, see `async_lock`
+        self._async_locks: MutableMapping[asyncio.AbstractEventLoop,
+                                          asyncio.Lock] = \
+            weakref.WeakKeyDictionary()
+        # the lock that is held while this instrument is communicated with,
+        # by `write` and `ask`, their asynchronous counterparts and the
+        # concurrent gets of parameters from threads, see
+        # `qcodes.utils.threading.ThreadPoolParamsGetter`
+        self.thread_lock = threading.RLock()
 
         super().__init__(name, metadata)
 
@@ -520,6 +568,7 @@ class Instrument(InstrumentBase, AbstractInstrument):
         if hasattr(self, 'connection') and hasattr(self.connection, 'close'):
             self.connection.close()
 
+        self.stop_io_statistics()
         strip_attrs(self, whitelist=['_name'])
         self.remove_instance(self)
 
@@ -709,7 +758,19 @@ class Instrument(InstrumentBase, AbstractInstrument):
                 including the command and the instrument.
         """
         try:
-            self.write_raw(cmd)
+            with self.thread_lock:
+                statistics = self.io_statistics
+                # a command that is added to a batch is recorded when the
+                # batch is sent
+                batch = getattr(self, '_command_batch', None)
+                if statistics is None or (batch is not None
+                                          and batch.in_opening_thread):
+                    self.write_raw(cmd)
+                else:
+                    t0 = time.perf_counter()
+                    self.write_raw(cmd)
+                    statistics.record('write', time.perf_counter() - t0,
+                                      bytes_sent=len(cmd))
         except Exception as e:
             inst = repr(self)
             e.args = e.args + ('writing ' + repr(cmd) + ' to ' + inst,)
@@ -749,9 +810,17 @@ class Instrument(InstrumentBase, AbstractInstrument):
                 including the command and the instrument.
         """
         try:
-            answer = self.ask_raw(cmd)
-
-            return answer
+            with self.thread_lock:
+                statistics = self.io_statistics
+                if statistics is None:
+                    return self.ask_raw(cmd)
+
+                t0 = time.perf_counter()
+                answer = self.ask_raw(cmd)
+                statistics.record('ask', time.perf_counter() - t0,
+                                  bytes_sent=len(cmd),
+                                  bytes_received=len(answer))
+                return answer
 
         except Exception as e:
             inst = repr(self)
@@ -773,6 +842,192 @@ class Instrument(InstrumentBase, AbstractInstrument):
             'Instrument {} has not defined an ask method'.format(
                 type(self).__name__))
 
+    def start_io_statistics(self, include_in_snapshot: bool = False
+                            ) -> IOStatistics:
+        """
+        Start recording the statistics of the communication with this
+        instrument: the durations and the bytes transferred of its
+        ``write`` and ``ask`` calls and of the gets and sets of its
+        parameters. See :mod:`qcodes.instrument.io_statistics`.
+
+        Args:
+            include_in_snapshot: Should the summary of the statistics be part
+                of the snapshot of the instrument?
+
+        Returns:
+            The statistics, which continue those recorded so far if they
+            are already being recorded
+        """
+        statistics = self.io_statistics
+        if statistics is None:
+            statistics = IOStatistics()
+            self.io_statistics = statistics
+            io_statistics.n_recording += 1
+        statistics.include_in_snapshot = include_in_snapshot
+        return statistics
+
+    def stop_io_statistics(self) -> None:
+        """Stop recording the statistics of the communication"""
+        if self.io_statistics is not None:
+            self.io_statistics = None
+            io_statistics.n_recording -= 1
+
+    def snapshot_base(self, update: bool = False,
+                      params_to_skip_update: Optional[Sequence[str]] = None
+                      ) -> Dict:
+        snap = super().snapshot_base(
+            update=update, params_to_skip_update=params_to_skip_update)
+        statistics = self.io_statistics
+        if statistics is not None and statistics.include_in_snapshot:
+            snap['io_statistics'] = statistics.summary()
+        return snap
+
+    # `write_async` and `ask_async` are the asynchronous counterparts of   #
+    # `write` and `ask`; `write_raw_async` and `ask_raw_async` are the      #
+    # asynchronous interface to hardware                                    #
+
+    def async_lock(self) -> asyncio.Lock:
+        """
+        The lock that serialises the asynchronous communication with this
+        instrument in the running event loop. ``write_async`` and
+        ``ask_async`` hold it, such that only one command is in flight at a
+        time, and so do the asynchronous gets and sets of parameters that
+        can not communicate asynchronously themselves. The communication
+        itself also holds the ``thread_lock``, which excludes the
+        communication from other threads and event loops.
+        """
+        loop = asyncio.get_event_loop()
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._async_locks[loop] = lock
+        return lock
+
+    async def _acquire_thread_lock(self) -> None:
+        """
+        Acquire the ``thread_lock`` in the thread of the running event loop,
+        for the asynchronous communication that is done by the event loop
+        itself rather than in an executor. The lock is polled rather than
+        waited for, such that the event loop is not blocked while another
+        thread communicates with the instrument. The caller must release it.
+        """
+        delay = 0.001
+        while not self.thread_lock.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(2 * delay, 0.02)
+
+    def _run_thread_locked(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Call ``func`` while holding the ``thread_lock``. Blocking calls that
+        asynchronous methods run in an executor are wrapped in this, such
+        that they are serialised with the synchronous communication with the
+        instrument from other threads.
+        """
+        with self.thread_lock:
+            return func(*args)
+
+    async def write_async(self, cmd: str) -> None:
+        """
+        Asynchronous counterpart of :meth:`write`. Commands that are sent
+        concurrently to the same instrument are sent one after the other.
+
+        Subclasses that override ``write`` to transform ``cmd`` should also
+        override this method, and in it call ``super().write_async(new_cmd)``.
+        Otherwise their ``write`` is run in an executor instead.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Raises:
+            Exception: Wraps any underlying exception with extra context,
+                including the command and the instrument.
+        """
+        async with self.async_lock():
+            if type(self).write is not Instrument.write \
+                    and type(self).write_async is Instrument.write_async:
+                await asyncio.get_event_loop().run_in_executor(
+                    None, self.write, cmd)
+                return
+            try:
+                t0 = time.perf_counter()
+                await self.write_raw_async(cmd)
+                statistics = self.io_statistics
+                if statistics is not None:
+                    statistics.record('write', time.perf_counter() - t0,
+                                      bytes_sent=len(cmd))
+            except Exception as e:
+                inst = repr(self)
+                e.args = e.args + ('writing ' + repr(cmd) + ' to ' + inst,)
+                raise e
+
+    async def write_raw_async(self, cmd: str) -> None:
+        """
+        Low level method to write a command string to the hardware without
+        blocking the event loop. By default, ``write_raw`` is run in an
+        executor.
+
+        Subclasses that can communicate with the hardware asynchronously
+        should override this method.
+
+        Args:
+            cmd: The string to send to the instrument.
+        """
+        await asyncio.get_event_loop().run_in_executor(
+            None, self._run_thread_locked, self.write_raw, cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        """
+        Asynchronous counterpart of :meth:`ask`. Commands that are sent
+        concurrently to the same instrument are sent one after the other.
+
+        Subclasses that override ``ask`` to transform ``cmd`` should also
+        override this method, and in it call ``super().ask_async(new_cmd)``.
+        Otherwise their ``ask`` is run in an executor instead.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Returns:
+            response
+
+        Raises:
+            Exception: Wraps any underlying exception with extra context,
+                including the command and the instrument.
+        """
+        async with self.async_lock():
+            if type(self).ask is not Instrument.ask \
+                    and type(self).ask_async is Instrument.ask_async:
+                return await asyncio.get_event_loop().run_in_executor(
+                    None, self.ask, cmd)
+            try:
+                t0 = time.perf_counter()
+                answer = await self.ask_raw_async(cmd)
+                statistics = self.io_statistics
+                if statistics is not None:
+                    statistics.record('ask', time.perf_counter() - t0,
+                                      bytes_sent=len(cmd),
+                                      bytes_received=len(answer))
+                return answer
+            except Exception as e:
+                inst = repr(self)
+                e.args = e.args + ('asking ' + repr(cmd) + ' to ' + inst,)
+                raise e
+
+    async def ask_raw_async(self, cmd: str) -> str:
+        """
+        Low level method to write to the hardware and return a response
+        without blocking the event loop. By default, ``ask_raw`` is run in an
+        executor.
+
+        Subclasses that can communicate with the hardware asynchronously
+        should override this method.
+
+        Args:
+            cmd: The string to send to the instrument.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            None, self._run_thread_locked, self.ask_raw, cmd)
+
 
 def find_or_create_instrument(instrument_class: Type[Instrument],
                               name: str,
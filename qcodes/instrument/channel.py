@@ -1,4 +1,5 @@
 """ Base class for the channel of an instrument """
+import asyncio
 from typing import (
     List, Union, Optional, Dict, Sequence,
     cast, Any, Tuple, Callable,
@@ -69,6 +70,92 @@ class InstrumentChannel(InstrumentBase):
     def ask_raw(self, cmd: str) -> str:
         return self._parent.ask_raw(cmd)
 
+    async def write_async(self, cmd: str) -> None:
+        if type(self).write is not InstrumentChannel.write \
+                and type(self).write_async is InstrumentChannel.write_async:
+            # the command is transformed by write, which must hence be used
+            root_instrument = cast(Instrument, self.root_instrument)
+            async with root_instrument.async_lock():
+                await asyncio.get_event_loop().run_in_executor(
+                    None, self.write, cmd)
+            return
+        await self._parent.write_async(cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        if type(self).ask is not InstrumentChannel.ask \
+                and type(self).ask_async is InstrumentChannel.ask_async:
+            # the command is transformed by ask, which must hence be used
+            root_instrument = cast(Instrument, self.root_instrument)
+            async with root_instrument.async_lock():
+                return await asyncio.get_event_loop().run_in_executor(
+                    None, self.ask, cmd)
+        return await self._parent.ask_async(cmd)
+
+    # The hooks below let a channel class get or set a parameter of several
+    # of its channels, or call a function of them, with fewer commands than
+    # one per channel. They are used by the multi-channel parameters and
+    # functions of a `ChannelList`, which fall back to the channels one by
+    # one for the parameters and functions that a hook does not support.
+
+    @classmethod
+    def bulk_get_raw(cls, channels: Sequence['InstrumentChannel'],
+                     param_name: str
+                     ) -> Optional[Sequence[ParamRawDataType]]:
+        """
+        Get the raw values of a parameter of several channels at once, for
+        instance with a single query whose response contains the values of
+        all the channels. The values are parsed and the caches of the
+        parameters are updated as ``get`` does.
+
+        Args:
+            channels: The channels, all of this class.
+            param_name: The name of the parameter.
+
+        Returns:
+            The raw values, in the order of ``channels``, or None if this
+            parameter is not gotten in bulk, which is the default.
+        """
+        return None
+
+    @classmethod
+    def bulk_set_raw(cls, channels: Sequence['InstrumentChannel'],
+                     param_name: str,
+                     raw_values: Sequence[ParamRawDataType]) -> bool:
+        """
+        Set the raw values of a parameter of several channels at once, for
+        instance with a single command. The values have been validated and
+        converted to raw values, and the caches of the parameters are
+        updated afterwards, as ``set`` does. Parameters that ramp or delay
+        their sets are always set one channel at a time.
+
+        Args:
+            channels: The channels, all of this class.
+            param_name: The name of the parameter.
+            raw_values: The raw values, in the order of ``channels``.
+
+        Returns:
+            Whether the values were set, False if this parameter is not set
+            in bulk, which is the default.
+        """
+        return False
+
+    @classmethod
+    def bulk_call(cls, channels: Sequence['InstrumentChannel'],
+                  func_name: str, *args: Any) -> bool:
+        """
+        Call a function of several channels at once.
+
+        Args:
+            channels: The channels, all of this class.
+            func_name: The name of the function.
+            *args: The arguments of the function.
+
+        Returns:
+            Whether the function was called, False if this function is not
+            called in bulk, which is the default.
+        """
+        return False
+
     @property
     def parent(self) -> InstrumentBase:
         return self._parent
@@ -107,21 +194,53 @@ class MultiChannelInstrumentParameter(MultiParameter):
     def get_raw(self) -> Tuple[ParamRawDataType, ...]:
         """
         Return a tuple containing the data from each of the channels in the
-        list.
+        list. The values are gotten with one bulk query if the channel class
+        supports it, see :meth:`InstrumentChannel.bulk_get_raw`.
         """
-        return tuple(chan.parameters[self._param_name].get() for chan
-                     in self._channels)
+        parameters = [chan.parameters[self._param_name]
+                      for chan in self._channels]
+        raw_values = None
+        if self._channels:
+            raw_values = type(self._channels[0]).bulk_get_raw(
+                self._channels, self._param_name)
+        if raw_values is None:
+            return tuple(parameter.get() for parameter in parameters)
+
+        if len(raw_values) != len(parameters):
+            raise ValueError(f'Expected {len(parameters)} values of '
+                             f'{self._param_name}, got {len(raw_values)}')
+        return tuple(parameter._update_from_raw_value(raw_value)
+                     for parameter, raw_value in zip(parameters, raw_values))
 
     def set_raw(self, value: ParamRawDataType) -> None:
         """
-        Set all parameters to this value.
+        Set all parameters to this value. The values are set with one bulk
+        command if the channel class supports it, see
+        :meth:`InstrumentChannel.bulk_set_raw`.
 
         Args:
             value: The value to set to. The type is given by the
                 underlying parameter.
         """
-        for chan in self._channels:
-            getattr(chan, self._param_name).set(value)
+        parameters = [chan.parameters[self._param_name]
+                      for chan in self._channels]
+        if self._channels and not any(
+                parameter._ramp_on_set or parameter.inter_delay
+                or parameter.post_delay for parameter in parameters):
+            for parameter in parameters:
+                parameter.validate(value)
+            raw_values = [parameter._from_value_to_raw_value(value)
+                          if parameter._convert_on_set else value
+                          for parameter in parameters]
+            if type(self._channels[0]).bulk_set_raw(
+                    self._channels, self._param_name, raw_values):
+                for parameter, raw_value in zip(parameters, raw_values):
+                    parameter.cache._update_with(value=value,
+                                                 raw_value=raw_value)
+                return
+
+        for parameter in parameters:
+            parameter.set(value)
 
     @property
     def full_names(self) -> Tuple[str, ...]:
@@ -488,6 +607,9 @@ class ChannelList(Metadatable):
             # We want to return a reference to a function that would call the
             # function for each of the channels in turn.
             def multi_func(*args: Any) -> None:
+                if type(self._channels[0]).bulk_call(self._channels, name,
+                                                     *args):
+                    return
                 for chan in self._channels:
                     chan.functions[name](*args)
             return multi_func
@@ -772,6 +894,20 @@ class AutoLoadableInstrumentChannel(InstrumentChannel):
         self._assert_existence()
         return super().ask(cmd)
 
+    async def write_async(self, cmd: str) -> None:
+        """
+        Write to the instrument only if the channel is present on the instrument
+        """
+        self._assert_existence()
+        return await super().write_async(cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        """
+        Ask the instrument only if the channel is present on the instrument
+        """
+        self._assert_existence()
+        return await super().ask_async(cmd)
+
     @property
     def exists_on_instrument(self) -> bool:
         return self._exists_on_instrument
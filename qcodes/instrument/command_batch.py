@@ -0,0 +1,281 @@
+"""
+This module implements a :class:`.CommandBatch`, which collects the commands
+and queries to an instrument and sends them in as few messages as possible,
+SCPI style, separated by semicolons. Batches are created with the ``batch``
+method of :class:`.VisaInstrument` and :class:`.IPInstrument`:
+
+>>> with instrument.batch() as batch:
+...     instrument.ch1.voltage(0.1)
+...     instrument.ch2.voltage(0.2)
+...     current = batch.get(instrument.ch1.current)
+>>> current.value
+
+sends ``:CH1:VOLT 0.1;:CH2:VOLT 0.2;:CH1:CURR?`` in one message and reads
+the current from the response.
+"""
+import threading
+import time
+from typing import Any, List, Optional, Sequence, TYPE_CHECKING, Tuple, cast
+from types import TracebackType
+
+if TYPE_CHECKING:
+    from qcodes.instrument.base import Instrument
+    from qcodes.instrument.parameter import _BaseParameter
+
+
+class BatchedQuery:
+    """
+    A query that was added to a :class:`.CommandBatch`. Its response is
+    available once the batch has been sent.
+
+    Args:
+        cmd: the query
+        parameter: the parameter whose value the query gets, if any
+    """
+
+    def __init__(self, cmd: str,
+                 parameter: Optional['_BaseParameter'] = None) -> None:
+        self.cmd = cmd
+        self.parameter = parameter
+        self.done = False
+        self._raw_value: Optional[str] = None
+        self._value: Any = None
+
+    def _set_response(self, raw_value: str) -> None:
+        self._raw_value = raw_value
+        if self.parameter is None:
+            self._value = raw_value
+        else:
+            try:
+                self._value = self.parameter._update_from_raw_value(raw_value)
+            except Exception as e:
+                e.args = e.args + ('getting {}'.format(self.parameter),)
+                raise e
+        self.done = True
+
+    def _check_done(self) -> None:
+        if not self.done:
+            raise RuntimeError(f'The response to {self.cmd!r} is only '
+                               f'available after the batch has been sent')
+
+    @property
+    def raw_value(self) -> str:
+        """The part of the response that answers this query"""
+        self._check_done()
+        return cast(str, self._raw_value)
+
+    @property
+    def value(self) -> Any:
+        """
+        The value of the parameter, parsed from the response as ``get``
+        parses it, or the raw response if the query is not of a parameter
+        """
+        self._check_done()
+        return self._value
+
+
+class CommandBatch:
+    """
+    Collects commands and queries to an instrument and sends them in as
+    few messages as possible, joined by ``separator``, when the batch is
+    sent.
+
+    While a batch is open on an instrument, the commands that are written
+    to the instrument from the thread that opened the batch, for instance by
+    setting its parameters, are added to the batch rather than sent. The
+    values of parameters are queried with :meth:`get`. Any other query to
+    the instrument sends the batch first, such that it sees the effect of
+    the commands before it.
+
+    Parameters that are set in steps or with a delay between sets can not
+    be set while a batch is open, since the steps and delays would pass
+    while the commands are collected rather than while they are sent. If
+    the batch is discarded, because the block that it is open in raises an
+    exception or sending it fails, the caches of the parameters that were
+    set in the batch are invalidated.
+
+    Commands are made absolute by prefixing them with a colon, such that
+    the SCPI header path of one command does not affect the next. The
+    response to a message with several queries is split at ``separator``,
+    hence a response that contains the separator itself can not be batched.
+
+    Args:
+        instrument: the instrument to send the commands to
+        max_length: the maximum length of a message, in characters. A
+            command that is longer on its own is sent in a message of its
+            own.
+        separator: the string that joins the commands of a message and
+            splits the responses to its queries
+    """
+
+    def __init__(self, instrument: 'Instrument', max_length: int,
+                 separator: str = ';') -> None:
+        self.instrument = instrument
+        self.max_length = max_length
+        self.separator = separator
+        self._thread_id = threading.get_ident()
+        self._commands: List[Tuple[str, Optional[BatchedQuery]]] = []
+        self._set_parameters: List['_BaseParameter'] = []
+
+    @property
+    def in_opening_thread(self) -> bool:
+        """
+        Is the current thread the one that opened this batch? Only the
+        commands of that thread are added to the batch.
+        """
+        return threading.get_ident() == self._thread_id
+
+    def write(self, cmd: str) -> None:
+        """
+        Add a command to the batch.
+
+        Args:
+            cmd: the command
+        """
+        self._commands.append((self._absolute(cmd), None))
+
+    def ask(self, cmd: str) -> BatchedQuery:
+        """
+        Add a query to the batch.
+
+        Args:
+            cmd: the query
+
+        Returns:
+            The query, whose response is available once the batch has been
+            sent
+        """
+        query = BatchedQuery(cmd)
+        self._commands.append((self._absolute(cmd), query))
+        return query
+
+    def get(self, parameter: '_BaseParameter') -> BatchedQuery:
+        """
+        Add the query that gets a parameter to the batch. Once the batch has
+        been sent, the cache of the parameter is updated with its value.
+
+        Args:
+            parameter: a parameter of the instrument that gets its value
+                with a command string
+
+        Returns:
+            The query, whose value is available once the batch has been sent
+        """
+        if parameter.root_instrument is not self.instrument:
+            raise ValueError(f'{parameter.full_name} is not a parameter of '
+                             f'{self.instrument.full_name}')
+        cmd = parameter._get_cmd_str
+        if cmd is None:
+            raise ValueError(f'{parameter.full_name} does not get its value '
+                             f'with a command string, hence it can not be '
+                             f'batched')
+        query = BatchedQuery(cmd, parameter)
+        self._commands.append((self._absolute(cmd), query))
+        return query
+
+    def _add_set(self, parameter: '_BaseParameter') -> None:
+        """
+        Called by a parameter of the instrument that is about to be set
+        while the batch is open.
+        """
+        if parameter._ramp_on_set or parameter.inter_delay != 0 \
+                or parameter.post_delay != 0:
+            raise RuntimeError(f'{parameter.full_name} is set in steps or '
+                               f'with a delay, hence it can not be set in '
+                               f'a batch')
+        self._set_parameters.append(parameter)
+
+    def _invalidate_set_parameters(self) -> None:
+        parameters, self._set_parameters = self._set_parameters, []
+        for parameter in parameters:
+            parameter.cache._invalidate()
+
+    def send(self) -> None:
+        """
+        Send the commands and queries that have been added to the batch
+        since it was last sent, and distribute the responses to the
+        queries.
+        """
+        commands, self._commands = self._commands, []
+        if not commands:
+            self._set_parameters = []
+            return
+        # the instrument sends the messages itself, which must not be
+        # added to the batch again
+        self.instrument._command_batch = None
+        try:
+            for message in self._messages(commands):
+                self._send_message(message)
+        except Exception:
+            self._invalidate_set_parameters()
+            raise
+        finally:
+            self.instrument._command_batch = self
+        self._set_parameters = []
+
+    def _messages(self, commands: Sequence[Tuple[str, Optional[BatchedQuery]]]
+                  ) -> List[List[Tuple[str, Optional[BatchedQuery]]]]:
+        messages: List[List[Tuple[str, Optional[BatchedQuery]]]] = []
+        length = 0
+        for command in commands:
+            added_length = len(command[0]) + len(self.separator)
+            if messages and length + added_length <= self.max_length:
+                messages[-1].append(command)
+                length += added_length
+            else:
+                messages.append([command])
+                length = len(command[0])
+        return messages
+
+    def _send_message(self,
+                      message: Sequence[Tuple[str, Optional[BatchedQuery]]]
+                      ) -> None:
+        text = self.separator.join(cmd for cmd, _ in message)
+        queries = [query for _, query in message if query is not None]
+        statistics = self.instrument.io_statistics
+        t0 = time.perf_counter()
+        # the commands were collected by ``write_raw`` of the instrument
+        if not queries:
+            self.instrument.write_raw(text)
+            if statistics is not None:
+                statistics.record('write', time.perf_counter() - t0,
+                                  bytes_sent=len(text))
+            return
+
+        response = self.instrument.ask_raw(text)
+        if statistics is not None:
+            statistics.record('ask', time.perf_counter() - t0,
+                              bytes_sent=len(text),
+                              bytes_received=len(response))
+        parts = response.strip().split(self.separator)
+        if len(parts) != len(queries):
+            raise ValueError(f'Expected {len(queries)} responses to '
+                             f'{text!r}, got {response!r}')
+        for query, part in zip(queries, parts):
+            query._set_response(part.strip())
+
+    @staticmethod
+    def _absolute(cmd: str) -> str:
+        if cmd.startswith((':', '*')):
+            return cmd
+        return ':' + cmd
+
+    def __enter__(self) -> 'CommandBatch':
+        if self.instrument._command_batch is not None:
+            raise RuntimeError(f'A batch is already open on '
+                               f'{self.instrument.full_name}')
+        self.instrument._command_batch = self
+        return self
+
+    def __exit__(self,
+                 exception_type: Optional[type],
+                 exception_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        try:
+            if exception_type is None:
+                self.send()
+            else:
+                self._commands = []
+                self._invalidate_set_parameters()
+        finally:
+            self.instrument._command_batch = None
@@ -0,0 +1,159 @@
+"""
+This module implements the statistics of the communication with an
+instrument: how often, how long and how many bytes its commands, queries
+and the gets and sets of its parameters take. They are recorded by an
+instrument once :meth:`.Instrument.start_io_statistics` has been called:
+
+>>> statistics = instrument.start_io_statistics()
+>>> # measure
+>>> statistics.summary()['ask']['p95']
+
+The durations are kept in histograms with logarithmic bins, hence the
+memory they take does not grow with the number of durations, and their
+percentiles are estimates, which are within 5 % of the exact ones.
+"""
+import math
+import threading
+from typing import Dict
+
+# the number of instruments that record their statistics. As long as it is
+# zero, the gets and sets of parameters do not look for the statistics of
+# their instrument
+n_recording = 0
+
+_BINS_PER_OCTAVE = 8
+# durations are recorded with at least this value, which avoids the
+# logarithm of zero
+_MIN_DURATION = 1e-9
+
+
+class LatencyHistogram:
+    """
+    The number, the durations and the bytes transferred of one kind of
+    operation. The durations are counted in logarithmic bins that are
+    :math:`2^{1/8}`, about 9 %, wide.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._bins: Dict[int, int] = {}
+
+    def add(self, duration: float, bytes_sent: int = 0,
+            bytes_received: int = 0) -> None:
+        """
+        Add an operation.
+
+        Args:
+            duration: the duration of the operation in seconds
+            bytes_sent: the number of bytes sent to the instrument
+            bytes_received: the number of bytes received from it
+        """
+        duration = max(duration, _MIN_DURATION)
+        index = math.floor(math.log2(duration) * _BINS_PER_OCTAVE)
+        self._bins[index] = self._bins.get(index, 0) + 1
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+
+    @property
+    def mean(self) -> float:
+        """The mean duration, NaN if there are no durations"""
+        return self.total / self.count if self.count else math.nan
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile of the durations.
+
+        Args:
+            q: the percentile, between 0 and 100
+
+        Returns:
+            The estimate, the geometric center of the bin that the
+            percentile falls in, or NaN if there are no durations
+        """
+        if not self.count:
+            return math.nan
+        rank = q / 100 * self.count
+        cumulative = 0
+        for index in sorted(self._bins):
+            cumulative += self._bins[index]
+            if cumulative >= rank:
+                break
+        center = 2 ** ((index + 0.5) / _BINS_PER_OCTAVE)
+        return min(max(center, self.min), self.max)
+
+    def summary(self) -> Dict[str, float]:
+        """The statistics of the operations as a JSON-compatible dict"""
+        return {'count': self.count,
+                'total': self.total,
+                'mean': self.mean,
+                'min': self.min if self.count else math.nan,
+                'max': self.max if self.count else math.nan,
+                'p50': self.percentile(50),
+                'p95': self.percentile(95),
+                'p99': self.percentile(99),
+                'bytes_sent': self.bytes_sent,
+                'bytes_received': self.bytes_received}
+
+
+class IOStatistics:
+    """
+    The statistics of the communication with one instrument, with a
+    :class:`LatencyHistogram` for each kind of operation: ``write`` and
+    ``ask`` for the commands and queries sent to the instrument, and
+    ``get <parameter>`` and ``set <parameter>`` for the gets and sets of
+    each of its parameters, including those of its channels.
+
+    Args:
+        include_in_snapshot: Should the summary of the statistics be part
+            of the snapshot of the instrument? As the statistics change with
+            every operation, so does the snapshot.
+    """
+
+    def __init__(self, include_in_snapshot: bool = False) -> None:
+        self.include_in_snapshot = include_in_snapshot
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # operations may be recorded from several threads at once
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, duration: float, bytes_sent: int = 0,
+               bytes_received: int = 0) -> None:
+        """
+        Record an operation.
+
+        Args:
+            operation: the kind of the operation, such as ``ask``
+            duration: the duration of the operation in seconds
+            bytes_sent: the number of bytes sent to the instrument
+            bytes_received: the number of bytes received from it
+        """
+        with self._lock:
+            histogram = self.histograms.get(operation)
+            if histogram is None:
+                histogram = self.histograms[operation] = LatencyHistogram()
+            histogram.add(duration, bytes_sent, bytes_received)
+
+    def reset(self) -> None:
+        """Forget the operations recorded so far"""
+        with self._lock:
+            self.histograms = {}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        The statistics of the operations as a JSON-compatible dict, with
+        the summary of a :class:`LatencyHistogram` for each kind of
+        operation.
+        """
+        with self._lock:
+            return {name: histogram.summary()
+                    for name, histogram in sorted(self.histograms.items())}
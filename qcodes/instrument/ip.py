@@ -1,10 +1,17 @@
 """Ethernet instrument driver class based on sockets."""
+import asyncio
 import socket
 import logging
-from typing import Dict, Sequence, Optional, Any, Type
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Sequence, Optional, Any, Type, Iterator, List, Tuple
 from types import TracebackType
 
+import numpy as np
+
 from .base import Instrument
+from .command_batch import CommandBatch
 
 log = logging.getLogger(__name__)
 
@@ -33,13 +40,34 @@ class IPInstrument(Instrument):
         write_confirmation: Whether the instrument acknowledges writes
             with some response we should read. Default True.
 
+        read_terminator: Character(s) that terminate each response. If
+            given, responses are read until the terminator, however many
+            packets they arrive in, and returned without it; data after
+            the terminator is kept for the next response. If None, the
+            default, a response is whatever one read of the socket returns.
+
+        keep_alive: Seconds to keep the socket of an instrument that is not
+            persistent open after a call, such that the next call to the
+            same address and port, also by another instrument, reuses it
+            instead of opening a new connection. Default 0, which closes
+            the socket after every call.
+
         kwargs: additional static metadata to add to this
             instrument's JSON snapshot.
 
     See help for ``qcodes.Instrument`` for additional information on writing
     instrument subclasses.
+
+    Attributes:
+        max_batch_length: The maximum length of the messages that a
+            :meth:`batch` sends, in characters. Drivers of instruments with
+            a larger input buffer can increase it.
     """
 
+    max_batch_length = 256
+    # the batch that is open on the instrument, see `batch`
+    _command_batch: Optional[CommandBatch] = None
+
     def __init__(self, name: str,
                  address: Optional[str] = None,
                  port: Optional[int] = None,
@@ -47,6 +75,8 @@ class IPInstrument(Instrument):
                  terminator: str = '\n',
                  persistent: bool = True,
                  write_confirmation: bool = True,
+                 read_terminator: Optional[str] = None,
+                 keep_alive: float = 0,
                  **kwargs: Any):
         super().__init__(name, **kwargs)
 
@@ -54,10 +84,14 @@ class IPInstrument(Instrument):
         self._port = port
         self._timeout = timeout
         self._terminator = terminator
+        self._read_terminator = read_terminator
         self._confirmation = write_confirmation
+        self._keep_alive = keep_alive
 
         self._ensure_connection = EnsureConnection(self)
         self._buffer_size = 1400
+        # the data that has been received but not yet returned
+        self._recv_buffer = bytearray()
 
         self._socket: Optional[socket.socket] = None
 
@@ -105,6 +139,14 @@ class IPInstrument(Instrument):
     def _connect(self) -> None:
         if self._socket is not None:
             self._disconnect()
+        self._recv_buffer.clear()
+
+        if not self._persistent and self._keep_alive > 0:
+            self._socket = _idle_connections.take((self._address, self._port))
+            if self._socket is not None:
+                log.debug("Reusing idle socket")
+                self.set_timeout(self._timeout)
+                return
 
         try:
             log.info("Opening socket")
@@ -121,7 +163,9 @@ class IPInstrument(Instrument):
             raise
 
     def _disconnect(self) -> None:
-        if self._socket is None:
+        # the attributes are stripped by ``close``, after which ``__del__``
+        # calls ``close`` again
+        if getattr(self, '_socket', None) is None:
             return
         log.info("Socket shutdown")
         self._socket.shutdown(socket.SHUT_RDWR)
@@ -129,6 +173,24 @@ class IPInstrument(Instrument):
         self._socket.close()
         log.info("Socket closed")
         self._socket = None
+        self._recv_buffer.clear()
+
+    def _release_connection(self, reusable: bool) -> None:
+        """
+        Release the socket after a call of an instrument that is not
+        persistent: keep it open for the next call if the instrument keeps
+        its connections alive, and the socket is ``reusable``, that is, the
+        call left no data behind. Close it otherwise.
+        """
+        sock = self._socket
+        if sock is None:
+            return
+        if self._keep_alive > 0 and reusable and not self._recv_buffer:
+            self._socket = None
+            _idle_connections.put((self._address, self._port), sock,
+                                  self._keep_alive)
+        else:
+            self._disconnect()
 
     def set_timeout(self, timeout: float) -> None:
         """
@@ -152,6 +214,16 @@ class IPInstrument(Instrument):
         """
         self._terminator = terminator
 
+    def set_read_terminator(self, read_terminator: Optional[str]) -> None:
+        r"""
+        Change the terminator of the responses of the instrument.
+
+        Args:
+            read_terminator: Character(s) that terminate each response, or
+                None to return whatever one read of the socket returns.
+        """
+        self._read_terminator = read_terminator
+
     def _send(self, cmd: str) -> None:
         if self._socket is None:
             raise RuntimeError(f'IPInstrument {self.name} is not connected')
@@ -162,7 +234,162 @@ class IPInstrument(Instrument):
     def _recv(self) -> str:
         if self._socket is None:
             raise RuntimeError(f'IPInstrument {self.name} is not connected')
-        result = self._socket.recv(self._buffer_size)
+        if self._read_terminator is not None:
+            terminator = self._read_terminator.encode()
+            result = self._recv_until(terminator)[:-len(terminator)]
+            log.debug(f"Got {result!r} from instrument {self.name}")
+            return result.decode()
+        result = self._take_buffered()
+        if result is None:
+            result = self._socket.recv(self._buffer_size)
+        log.debug(f"Got {result!r} from instrument {self.name}")
+        if result == b'':
+            log.warning("Got empty response from Socket recv() "
+                        "Connection broken.")
+        return result.decode()
+
+    def _take_buffered(self) -> Optional[bytes]:
+        """
+        Take all the data out of the receive buffer, if there is any. Data
+        is left in the buffer by the reads that look for a terminator or
+        a binary block, and comes before anything that is received later.
+        """
+        if not self._recv_buffer:
+            return None
+        result = bytes(self._recv_buffer)
+        self._recv_buffer.clear()
+        return result
+
+    def _take_until(self, terminator: bytes, start: int = 0
+                    ) -> Optional[bytes]:
+        """
+        Take the data up to and including ``terminator`` out of the receive
+        buffer, if the terminator has been received; searching from
+        ``start``
+        """
+        index = self._recv_buffer.find(terminator, start)
+        if index < 0:
+            return None
+        end = index + len(terminator)
+        result = bytes(self._recv_buffer[:end])
+        del self._recv_buffer[:end]
+        return result
+
+    def _recv_into_buffer(self) -> None:
+        assert self._socket is not None
+        data = self._socket.recv(self._buffer_size)
+        if not data:
+            raise ConnectionError(f'The connection to {self.name} was '
+                                  f'closed while waiting for a response')
+        self._recv_buffer += data
+
+    def _recv_until(self, terminator: bytes) -> bytes:
+        """Receive data up to and including ``terminator``"""
+        start = 0
+        while True:
+            result = self._take_until(terminator, start)
+            if result is not None:
+                return result
+            # the terminator may be split over two reads
+            start = max(len(self._recv_buffer) - len(terminator) + 1, 0)
+            self._recv_into_buffer()
+
+    def _recv_exactly(self, n_bytes: int) -> bytes:
+        while len(self._recv_buffer) < n_bytes:
+            self._recv_into_buffer()
+        result = bytes(self._recv_buffer[:n_bytes])
+        del self._recv_buffer[:n_bytes]
+        return result
+
+    def _recv_into_array(self, n_bytes: int) -> np.ndarray:
+        """
+        Receive ``n_bytes`` bytes directly into an array, such that large
+        binary responses are not copied from one buffer to the next
+        """
+        assert self._socket is not None
+        data = np.empty(n_bytes, dtype=np.uint8)
+        view = memoryview(data)
+        n_buffered = min(len(self._recv_buffer), n_bytes)
+        view[:n_buffered] = self._recv_buffer[:n_buffered]
+        del self._recv_buffer[:n_buffered]
+        position = n_buffered
+        while position < n_bytes:
+            n_received = self._socket.recv_into(view[position:])
+            if n_received == 0:
+                raise ConnectionError(f'The connection to {self.name} was '
+                                      f'closed while waiting for a response')
+            position += n_received
+        return data
+
+    def _recv_binary_block(self) -> np.ndarray:
+        """
+        Receive an IEEE 488.2 binary block, ``#<n><length><data>`` with a
+        definite length or ``#0<data><newline>`` with an indefinite one,
+        and return its data as bytes in an array. Anything before the
+        ``#``, such as a header, is skipped.
+        """
+        terminator = (self._read_terminator or self._terminator).encode()
+        self._recv_until(b'#')
+        n_digits = int(self._recv_exactly(1))
+        if n_digits == 0:
+            block = self._recv_until(terminator)[:-len(terminator)]
+            return np.frombuffer(block, dtype=np.uint8)
+
+        length = int(self._recv_exactly(n_digits))
+        data = self._recv_into_array(length)
+        # the terminator of the response follows the block, and may arrive
+        # later than the block itself
+        self._recv_until(terminator)
+        return data
+
+    @contextmanager
+    def _non_blocking_socket(self) -> Iterator[socket.socket]:
+        """
+        Context manager that puts the socket in non-blocking mode, as the
+        socket operations of the event loop require, and restores the
+        timeout of the blocking mode afterwards.
+        """
+        if self._socket is None:
+            raise RuntimeError(f'IPInstrument {self.name} is not connected')
+        sock = self._socket
+        sock.setblocking(False)
+        try:
+            yield sock
+        finally:
+            sock.settimeout(float(self._timeout))
+
+    async def _send_async(self, sock: socket.socket, cmd: str) -> None:
+        data = cmd + self._terminator
+        log.debug(f"Writing {data} to instrument {self.name}")
+        await asyncio.wait_for(
+            asyncio.get_event_loop().sock_sendall(sock, data.encode()),
+            self._timeout)
+
+    async def _recv_async(self, sock: socket.socket) -> str:
+        if self._read_terminator is not None:
+            terminator = self._read_terminator.encode()
+            start = 0
+            response = self._take_until(terminator)
+            while response is None:
+                start = max(len(self._recv_buffer) - len(terminator) + 1, 0)
+                data = await asyncio.wait_for(
+                    asyncio.get_event_loop().sock_recv(
+                        sock, self._buffer_size),
+                    self._timeout)
+                if not data:
+                    raise ConnectionError(
+                        f'The connection to {self.name} was closed while '
+                        f'waiting for a response')
+                self._recv_buffer += data
+                response = self._take_until(terminator, start)
+            log.debug(f"Got {response!r} from instrument {self.name}")
+            return response[:-len(terminator)].decode()
+
+        result = self._take_buffered()
+        if result is None:
+            result = await asyncio.wait_for(
+                asyncio.get_event_loop().sock_recv(sock, self._buffer_size),
+                self._timeout)
         log.debug(f"Got {result!r} from instrument {self.name}")
         if result == b'':
             log.warning("Got empty response from Socket recv() "
@@ -181,6 +408,10 @@ class IPInstrument(Instrument):
         Args:
             cmd: The command to send to the instrument.
         """
+        batch = self._command_batch
+        if batch is not None and batch.in_opening_thread:
+            batch.write(cmd)
+            return
 
         with self._ensure_connection:
             self._send(cmd)
@@ -197,10 +428,94 @@ class IPInstrument(Instrument):
         Returns:
             The instrument's string response.
         """
+        batch = self._command_batch
+        if batch is not None and batch.in_opening_thread:
+            # the query must see the effect of the commands before it
+            batch.send()
         with self._ensure_connection:
             self._send(cmd)
             return self._recv()
 
+    def ask_binary_values(self, cmd: str, datatype: str = 'f',
+                          is_big_endian: bool = False) -> np.ndarray:
+        """
+        Send a query whose response is an IEEE 488.2 binary block, and
+        return the values in the block. The block is received directly into
+        the array, without decoding it to a string first.
+
+        Args:
+            cmd: The query to send to the instrument.
+            datatype: The format of the values, a numpy dtype such as
+                ``'f'`` (float32, the default), ``'d'`` or ``'h'``.
+            is_big_endian: Are the values big endian? Default False.
+
+        Returns:
+            The values in the block.
+        """
+        batch = self._command_batch
+        if batch is not None and batch.in_opening_thread:
+            batch.send()
+        dtype = np.dtype(datatype).newbyteorder('>' if is_big_endian
+                                                else '<')
+        try:
+            t0 = time.perf_counter()
+            with self.thread_lock, self._ensure_connection:
+                self._send(cmd)
+                data = self._recv_binary_block()
+            statistics = self.io_statistics
+            if statistics is not None:
+                statistics.record('ask', time.perf_counter() - t0,
+                                  bytes_sent=len(cmd),
+                                  bytes_received=data.nbytes)
+            return data.view(dtype)
+        except Exception as e:
+            e.args = e.args + ('asking ' + repr(cmd) + ' to ' + repr(self),)
+            raise e
+
+    def batch(self) -> CommandBatch:
+        """
+        Open a batch of commands and queries to this instrument, which are
+        sent in as few messages as possible when the batch is closed. See
+        :class:`.CommandBatch`.
+        """
+        return CommandBatch(self, max_length=self.max_batch_length)
+
+    async def write_raw_async(self, cmd: str) -> None:
+        """
+        Low-level interface to send a command that gets no response, which
+        waits for the socket without blocking the event loop.
+
+        Args:
+            cmd: The command to send to the instrument.
+        """
+        await self._acquire_thread_lock()
+        try:
+            with self._ensure_connection, self._non_blocking_socket() as sock:
+                await self._send_async(sock, cmd)
+                if self._confirmation:
+                    await self._recv_async(sock)
+        finally:
+            self.thread_lock.release()
+
+    async def ask_raw_async(self, cmd: str) -> str:
+        """
+        Low-level interface to send a command an read a response, which
+        waits for the socket without blocking the event loop.
+
+        Args:
+            cmd: The command to send to the instrument.
+
+        Returns:
+            The instrument's string response.
+        """
+        await self._acquire_thread_lock()
+        try:
+            with self._ensure_connection, self._non_blocking_socket() as sock:
+                await self._send_async(sock, cmd)
+                return await self._recv_async(sock)
+        finally:
+            self.thread_lock.release()
+
     def __del__(self) -> None:
         self.close()
 
@@ -234,8 +549,10 @@ class IPInstrument(Instrument):
         snap['confirmation'] = self._confirmation
         snap['address'] = self._address
         snap['terminator'] = self._terminator
+        snap['read_terminator'] = self._read_terminator
         snap['timeout'] = self._timeout
         snap['persistent'] = self._persistent
+        snap['keep_alive'] = self._keep_alive
 
         return snap
 
@@ -266,4 +583,71 @@ class EnsureConnection:
                  traceback: Optional[TracebackType]) -> None:
         """Possibly disconnect on exiting the context."""
         if not self.instrument._persistent:
-            self.instrument._disconnect()
+            # after an error, a response may still be on its way
+            self.instrument._release_connection(reusable=exc_type is None)
+
+
+class _IdleConnections:
+    """
+    The idle sockets of the instruments that keep their connections alive,
+    by address and port, such that a socket is reused by the next call to
+    the same address and port, whichever instrument makes it. A socket is
+    closed once it has been idle for longer than the ``keep_alive`` of the
+    instrument that put it here, or the other end closed it.
+    """
+
+    def __init__(self) -> None:
+        self._sockets: Dict[Tuple[Any, Any],
+                            List[Tuple[socket.socket, float]]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, address: Tuple[Any, Any]) -> Optional[socket.socket]:
+        """Take an open idle socket to ``address`` out, if there is one"""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._sockets.get(address, [])
+            while idle:
+                sock, expiry = idle.pop()
+                if expiry > now and self._is_reusable(sock):
+                    return sock
+                self._close(sock)
+        return None
+
+    def put(self, address: Tuple[Any, Any], sock: socket.socket,
+            keep_alive: float) -> None:
+        """Keep ``sock`` open for ``keep_alive`` seconds"""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._sockets.setdefault(address, [])
+            expired = [s for s, expiry in idle if expiry <= now]
+            idle[:] = [(s, expiry) for s, expiry in idle if expiry > now]
+            idle.append((sock, now + keep_alive))
+        for s in expired:
+            self._close(s)
+
+    @staticmethod
+    def _is_reusable(sock: socket.socket) -> bool:
+        """
+        Is the socket still open, with nothing left to read? Reading from
+        a socket that the other end closed returns no data, and a socket
+        that still has data to read would mix it up with the next response.
+        """
+        try:
+            sock.setblocking(False)
+            sock.recv(1, socket.MSG_PEEK)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        return False
+
+    @staticmethod
+    def _close(sock: socket.socket) -> None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+
+_idle_connections = _IdleConnections()
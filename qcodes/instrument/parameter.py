@@ -39,6 +39,13 @@ more specialized ones:
     the legacy :class:`qcodes.loops.Loop` and :class:`qcodes.measure.Measure`
     measurement types.
 
+- :class:`.HardwareSweepSetpoints` is intended for the setpoints of a
+    :class:`.ParameterWithSetpoints` that the instrument sweeps by itself,
+    acquiring a whole trace into a buffer once it is armed. It lets
+    :func:`qcodes.utils.dataset.doNd.do1d_buffered` and
+    :func:`qcodes.utils.dataset.doNd.do2d_buffered` take a trace in one round
+    trip to the instrument rather than one per point.
+
 - :class:`.DelegateParameter` is intended for proxy-ing other parameters.
     It forwards its ``get`` and ``set`` to the underlying source parameter,
     while allowing to specify label/unit/etc that is different from the
@@ -72,7 +79,8 @@ more specialized ones:
 # create an ABC for Parameter and MultiParameter - or just remove this statement
 # if everyone is happy to use these classes.
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime
 from copy import copy
 from operator import xor
 import time
@@ -82,7 +90,7 @@ import collections
 import warnings
 import enum
 from typing import Optional, Sequence, TYPE_CHECKING, Union, Callable, List, \
-    Dict, Any, Sized, Iterable, cast, Type, Tuple, Iterator
+    Dict, Any, Sized, Iterable, cast, Type, Tuple, Iterator, TypeVar
 from types import TracebackType
 from functools import wraps
 
@@ -98,6 +106,7 @@ from qcodes.utils.command import Command
 from qcodes.utils.validators import Validator, Ints, Strings, Enum, Arrays
 from qcodes.instrument.sweep_values import SweepFixedValues
 from qcodes.data.data_array import DataArray
+import qcodes.instrument.io_statistics as io_statistics
 
 if TYPE_CHECKING:
     from .base import Instrument, InstrumentBase
@@ -106,6 +115,7 @@ if TYPE_CHECKING:
 # for now the type the parameter may contain is not restricted at all
 ParamDataType = Any
 ParamRawDataType = Any
+T = TypeVar('T')
 
 
 log = logging.getLogger(__name__)
@@ -230,6 +240,17 @@ class _BaseParameter(Metadatable):
             JSON snapshot of the parameter
     """
 
+    # the attributes that the get and set pipelines depend on, with their
+    # defaults, such that their setters also work before ``__init__`` has
+    # run, e.g. in the ``__init__`` of a subclass before it calls
+    # ``super().__init__``
+    _scale: Optional[Union[float, Iterable[float]]] = None
+    _offset: Optional[Union[float, Iterable[float]]] = None
+    _val_mapping: Optional[dict] = None
+    _get_parser: Optional[Callable] = None
+    _set_parser: Optional[Callable] = None
+    _step: Optional[float] = None
+
     def __init__(self, name: str,
                  instrument: Optional['InstrumentBase'],
                  snapshot_get: bool = True,
@@ -269,21 +290,25 @@ class _BaseParameter(Metadatable):
             vals = Enum(*val_mapping.keys())
         self.vals = vals
 
-        self.step = step
-        self.scale = scale
-        self.offset = offset
-
-        self.inter_delay = inter_delay
-        self.post_delay = post_delay
-
-        self.val_mapping = val_mapping
+        # the attributes that the get and set pipelines depend on are set
+        # without their setters first, such that the pipelines are only
+        # computed once all of them are known
+        self._scale = scale
+        self._offset = offset
+        self._val_mapping = val_mapping
         if val_mapping is None:
             self.inverse_val_mapping = None
         else:
             self.inverse_val_mapping = invert_val_mapping(val_mapping)
+        self._get_parser = get_parser
+        self._set_parser = set_parser
+        self._step = None
+        self._update_pipelines()
 
-        self.get_parser = get_parser
-        self.set_parser = set_parser
+        self.step = step
+
+        self.inter_delay = inter_delay
+        self.post_delay = post_delay
 
         # ``_Cache`` stores "latest" value (and raw value) and timestamp
         # when it was set or measured
@@ -333,6 +358,11 @@ class _BaseParameter(Metadatable):
         # Specify time of last set operation, used when comparing to delay to
         # check if additional waiting time is needed before next set
         self._t_last_set = time.perf_counter()
+        # the command strings that the parameter gets/sets its value with, if
+        # it does so with a command string to its instrument; they are sent
+        # by ``get_async``/``set_async`` and by command batches directly
+        self._get_cmd_str: Optional[str] = None
+        self._set_cmd_str: Optional[str] = None
         # should we call validate when getting data. default to False
         # intended to be changed in a subclass if you want the subclass
         # to perform a validation on get
@@ -551,17 +581,24 @@ class _BaseParameter(Metadatable):
             Callable[..., ParamDataType]:
         @wraps(get_function)
         def get_wrapper(*args: Any, **kwargs: Any) -> ParamDataType:
+            t0 = time.perf_counter() if io_statistics.n_recording else None
             try:
                 # There might be cases where a .get also has args/kwargs
                 raw_value = get_function(*args, **kwargs)
 
-                value = self._from_raw_value_to_value(raw_value)
+                if self._convert_on_get:
+                    value = self._from_raw_value_to_value(raw_value)
+                else:
+                    value = raw_value
 
                 if self._validate_on_get:
                     self.validate(value)
 
                 self.cache._update_with(value=value, raw_value=raw_value)
 
+                if t0 is not None:
+                    self._record_io('get', t0)
+
                 return value
 
             except Exception as e:
@@ -572,46 +609,70 @@ class _BaseParameter(Metadatable):
 
     def _wrap_set(self, set_function: Callable[..., None]) -> \
             Callable[..., None]:
-        @wraps(set_function)
-        def set_wrapper(value: ParamDataType, **kwargs: Any) -> None:
-            try:
-                self.validate(value)
 
-                # In some cases intermediate sweep values must be used.
-                # Unless `self.step` is defined, get_sweep_values will return
-                # a list containing only `value`.
-                steps = self.get_ramp_values(value, step=self.step)
+        def set_step(val_step: ParamDataType, **kwargs: Any) -> None:
+            if self._convert_on_set:
+                raw_val_step = self._from_value_to_raw_value(val_step)
+            else:
+                raw_val_step = val_step
+
+            if self._inter_delay == 0 and self._post_delay == 0:
+                set_function(raw_val_step, **kwargs)
+                # Update last set time in case a delay is introduced later
+                self._t_last_set = time.perf_counter()
+            else:
+                # Check if delay between set operations is required
+                t_elapsed = time.perf_counter() - self._t_last_set
+                if t_elapsed < self._inter_delay:
+                    # Sleep until time since last set is larger than
+                    # self.inter_delay
+                    time.sleep(self._inter_delay - t_elapsed)
+
+                # Start timer to measure execution time of set_function
+                t0 = time.perf_counter()
 
-                for step_index, val_step in enumerate(steps):
-                    # even if the final value is valid we may be generating
-                    # steps that are not so validate them too
-                    self.validate(val_step)
+                set_function(raw_val_step, **kwargs)
 
-                    raw_val_step = self._from_value_to_raw_value(val_step)
+                # Update last set time (used for calculating delays)
+                self._t_last_set = time.perf_counter()
 
-                    # Check if delay between set operations is required
-                    t_elapsed = time.perf_counter() - self._t_last_set
-                    if t_elapsed < self.inter_delay:
-                        # Sleep until time since last set is larger than
-                        # self.inter_delay
-                        time.sleep(self.inter_delay - t_elapsed)
+                # Check if any delay after setting is required
+                t_elapsed = self._t_last_set - t0
+                if t_elapsed < self._post_delay:
+                    # Sleep until total time is larger than self.post_delay
+                    time.sleep(self._post_delay - t_elapsed)
 
-                    # Start timer to measure execution time of set_function
-                    t0 = time.perf_counter()
+            self.cache._update_with(value=val_step, raw_value=raw_val_step)
 
-                    set_function(raw_val_step, **kwargs)
+        @wraps(set_function)
+        def set_wrapper(value: ParamDataType, **kwargs: Any) -> None:
+            t0 = time.perf_counter() if io_statistics.n_recording else None
+            try:
+                self.validate(value)
+
+                batch = getattr(self.root_instrument, '_command_batch', None)
+                if batch is not None and batch.in_opening_thread:
+                    batch._add_set(self)
+
+                if not self._ramp_on_set:
+                    # there are no intermediate values to set and the value
+                    # has been validated already
+                    set_step(value, **kwargs)
+                else:
+                    # In some cases intermediate sweep values must be used.
+                    # Unless `self.step` is defined, get_sweep_values will
+                    # return a list containing only `value`.
+                    steps = self.get_ramp_values(value, step=self.step)
 
-                    # Update last set time (used for calculating delays)
-                    self._t_last_set = time.perf_counter()
+                    for val_step in steps:
+                        # even if the final value is valid we may be
+                        # generating steps that are not so validate them too
+                        self.validate(val_step)
 
-                    # Check if any delay after setting is required
-                    t_elapsed = self._t_last_set - t0
-                    if t_elapsed < self.post_delay:
-                        # Sleep until total time is larger than self.post_delay
-                        time.sleep(self.post_delay - t_elapsed)
+                        set_step(val_step, **kwargs)
 
-                    self.cache._update_with(value=val_step,
-                                            raw_value=raw_val_step)
+                if t0 is not None:
+                    self._record_io('set', t0)
 
             except Exception as e:
                 e.args = e.args + ('setting {} to {}'.format(self, value),)
@@ -619,6 +680,110 @@ class _BaseParameter(Metadatable):
 
         return set_wrapper
 
+    def _record_io(self, operation: str, t0: float) -> None:
+        """
+        Record a get or set that started at ``t0`` in the I/O statistics of
+        the instrument, if it records them
+        """
+        statistics = getattr(self.root_instrument, 'io_statistics', None)
+        if statistics is not None:
+            statistics.record(f'{operation} {self.full_name}',
+                              time.perf_counter() - t0)
+
+    async def _run_in_executor(self, func: Callable[..., T],
+                               *args: Any) -> T:
+        """
+        Run a blocking function in an executor. If this parameter belongs to
+        an instrument, the ``async_lock`` of the instrument is held
+        meanwhile, and the ``thread_lock`` of the instrument in the
+        executor, such that the communication with the instrument is
+        serialised.
+        """
+        loop = asyncio.get_event_loop()
+        instrument = cast('Instrument', self.root_instrument)
+        async_lock = getattr(instrument, 'async_lock', None)
+        if async_lock is None:
+            return await loop.run_in_executor(None, func, *args)
+        async with async_lock():
+            return await loop.run_in_executor(
+                None, instrument._run_thread_locked, func, *args)
+
+    async def get_async(self) -> ParamDataType:
+        """
+        Asynchronous counterpart of ``get``. If the parameter gets its value
+        by asking its instrument a command string, the command is sent with
+        the ``ask_async`` method of the instrument, which does not block the
+        event loop. Otherwise ``get`` is run in an executor.
+        """
+        if not self.gettable:
+            raise NotImplementedError(f'no get cmd found in Parameter '
+                                      f'{self.name}')
+        if self._get_cmd_str is None:
+            return await self._run_in_executor(self.get)
+
+        instrument = cast('Instrument', self._instrument)
+        try:
+            raw_value = await instrument.ask_async(self._get_cmd_str)
+            return self._update_from_raw_value(raw_value)
+        except Exception as e:
+            e.args = e.args + ('getting {}'.format(self),)
+            raise e
+
+    def _update_from_raw_value(self, raw_value: ParamRawDataType
+                               ) -> ParamDataType:
+        """
+        Convert a raw value that was gotten from the instrument without
+        ``get``, validate it and update the cache with it, as ``get`` does
+        """
+        if self._convert_on_get:
+            value = self._from_raw_value_to_value(raw_value)
+        else:
+            value = raw_value
+
+        if self._validate_on_get:
+            self.validate(value)
+
+        self.cache._update_with(value=value, raw_value=raw_value)
+
+        return value
+
+    async def set_async(self, value: ParamDataType) -> None:
+        """
+        Asynchronous counterpart of ``set``. If the parameter sets its value
+        by writing a command string to its instrument, and it neither steps
+        nor waits between sets, the command is sent with the
+        ``write_async`` method of the instrument, which does not block the
+        event loop. Otherwise ``set`` is run in an executor.
+
+        Args:
+            value: the value to set the parameter to
+        """
+        if not self.settable:
+            raise NotImplementedError(f'no set cmd found in Parameter '
+                                      f'{self.name}')
+        if self._set_cmd_str is None or self._ramp_on_set \
+                or self._inter_delay != 0 or self._post_delay != 0:
+            await self._run_in_executor(self.set, value)
+            return
+
+        instrument = cast('Instrument', self._instrument)
+        try:
+            self.validate(value)
+
+            if self._convert_on_set:
+                raw_value = self._from_value_to_raw_value(value)
+            else:
+                raw_value = value
+
+            await instrument.write_async(self._set_cmd_str.format(raw_value))
+            self._t_last_set = time.perf_counter()
+
+            self.cache._update_with(value=value, raw_value=raw_value)
+
+        except Exception as e:
+            e.args = e.args + ('setting {} to {}'.format(self, value),)
+            raise e
+
     def get_ramp_values(self, value: Union[float, Sized],
                         step: float = None) -> Sequence[Union[float, Sized]]:
         """
@@ -668,13 +833,104 @@ class _BaseParameter(Metadatable):
             ValueError: If the value is outside the bounds specified by the
                validator.
         """
+        if self.vals is None:
+            return
         if self._instrument:
             context = (getattr(self._instrument, 'name', '') or
                        str(self._instrument.__class__)) + '.' + self.name
         else:
             context = self.name
-        if self.vals is not None:
-            self.vals.validate(value, 'Parameter: ' + context)
+        self.vals.validate(value, 'Parameter: ' + context)
+
+    def _update_pipelines(self) -> None:
+        """
+        Work out which stages of the get and set pipelines are needed by this
+        parameter, such that ``get`` and ``set`` can skip the conversion
+        between value and raw value, and the ramping, if they would do
+        nothing. This is called whenever one of the attributes that these
+        stages depend on changes.
+        """
+        cls = type(self)
+        self._convert_on_get = (
+            self._get_parser is not None
+            or self._scale is not None
+            or self._offset is not None
+            or self._val_mapping is not None
+            or cls._from_raw_value_to_value
+            is not _BaseParameter._from_raw_value_to_value)
+        self._convert_on_set = (
+            self._set_parser is not None
+            or self._scale is not None
+            or self._offset is not None
+            or self._val_mapping is not None
+            or cls._from_value_to_raw_value
+            is not _BaseParameter._from_value_to_raw_value)
+        self._ramp_on_set = (
+            self._step is not None
+            or cls.get_ramp_values is not _BaseParameter.get_ramp_values)
+
+    @property
+    def scale(self) -> Optional[Union[float, Iterable[float]]]:
+        """
+        Scale to multiply the value with before setting it (and to divide
+        the raw value by after getting it), or None.
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: Optional[Union[float, Iterable[float]]]) -> None:
+        self._scale = scale
+        self._update_pipelines()
+
+    @property
+    def offset(self) -> Optional[Union[float, Iterable[float]]]:
+        """
+        Offset to add to the value before setting it (and to subtract from
+        the raw value after getting it), or None.
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset: Optional[Union[float, Iterable[float]]]) -> None:
+        self._offset = offset
+        self._update_pipelines()
+
+    @property
+    def val_mapping(self) -> Optional[dict]:
+        """
+        Map of values to instrument codes, or None. Setting it also sets
+        ``inverse_val_mapping``.
+        """
+        return self._val_mapping
+
+    @val_mapping.setter
+    def val_mapping(self, val_mapping: Optional[dict]) -> None:
+        self._val_mapping = val_mapping
+        if val_mapping is None:
+            self.inverse_val_mapping = None
+        else:
+            self.inverse_val_mapping = invert_val_mapping(val_mapping)
+        self._update_pipelines()
+
+    @property
+    def get_parser(self) -> Optional[Callable]:
+        """Function to transform the response of get, or None."""
+        return self._get_parser
+
+    @get_parser.setter
+    def get_parser(self, get_parser: Optional[Callable]) -> None:
+        self._get_parser = get_parser
+        self._update_pipelines()
+
+    @property
+    def set_parser(self) -> Optional[Callable]:
+        """Function to transform the value before it is set, or None."""
+        return self._set_parser
+
+    @set_parser.setter
+    def set_parser(self, set_parser: Optional[Callable]) -> None:
+        self._set_parser = set_parser
+        self._update_pipelines()
 
     @property
     def step(self) -> Optional[float]:
@@ -702,7 +958,7 @@ class _BaseParameter(Metadatable):
     @step.setter
     def step(self, step: Optional[float]) -> None:
         if step is None:
-            self._step: Optional[float] = step
+            self._step = step
         elif not getattr(self.vals, 'is_numeric', True):
             raise TypeError('you can only step numeric parameters')
         elif not isinstance(step, (int, float)):
@@ -715,6 +971,7 @@ class _BaseParameter(Metadatable):
             raise TypeError('step must be a positive int for an Ints parameter')
         else:
             self._step = step
+        self._update_pipelines()
 
     @property
     def post_delay(self) -> float:
@@ -1017,6 +1274,9 @@ class Parameter(_BaseParameter):
                 self.get_raw = Command(arg_count=0,  # type: ignore[assignment]
                                        cmd=get_cmd,
                                        exec_str=exec_str_ask)
+                if isinstance(get_cmd, str) and exec_str_ask is not None \
+                        and hasattr(instrument, 'ask_async'):
+                    self._get_cmd_str = get_cmd
             self.gettable = True
             self.get = self._wrap_get(self.get_raw)
 
@@ -1029,6 +1289,9 @@ class Parameter(_BaseParameter):
                     if instrument else None
                 self.set_raw = Command(arg_count=1, cmd=set_cmd,
                                        exec_str=exec_str_write)
+                if isinstance(set_cmd, str) and exec_str_write is not None \
+                        and hasattr(instrument, 'write_async'):
+                    self._set_cmd_str = set_cmd
             self.settable = True
             self.set = self._wrap_set(self.set_raw)
 
@@ -1213,6 +1476,78 @@ class ParameterWithSetpoints(Parameter):
         super().validate(value)
 
 
+class HardwareSweepSetpoints(Parameter):
+    """
+    The setpoints of a :class:`ParameterWithSetpoints` that an instrument
+    sweeps by itself: once the sweep is armed, the instrument steps through
+    the setpoints on its own, e.g. on triggers, and acquires a value at each
+    of them into a buffer, which a get of the :class:`ParameterWithSetpoints`
+    fetches as a whole.
+
+    The setpoints are ``num_points`` values evenly spaced from ``start`` to
+    ``stop``, which are parameters of the instrument. A get returns the
+    setpoints.
+
+    Args:
+        name: The local name of the parameter.
+        start: The parameter of the first setpoint of the sweep.
+        stop: The parameter of the last setpoint of the sweep.
+        num_points: The parameter of the number of setpoints of the sweep.
+        arm_cmd: The command that arms the sweep, i.e. that prepares the
+            instrument to acquire a trace. A string is written to the
+            instrument, a function is called without arguments.
+        vals: The validator of the setpoints, by default an
+            :class:`.Arrays` validator of shape ``(num_points,)``.
+        **kwargs: Passed on to :class:`Parameter`.
+    """
+
+    def __init__(self, name: str, *,
+                 start: Parameter,
+                 stop: Parameter,
+                 num_points: Parameter,
+                 arm_cmd: Union[str, Callable[[], Any]],
+                 vals: Optional[Validator] = None,
+                 **kwargs: Any) -> None:
+        if vals is None:
+            vals = Arrays(shape=(num_points,))
+        super().__init__(name, vals=vals, **kwargs)
+        self.start = start
+        self.stop = stop
+        self.num_points = num_points
+        self._arm_cmd = arm_cmd
+
+    def get_raw(self) -> ParamRawDataType:
+        return numpy.linspace(self.start(), self.stop(), self.num_points())
+
+    def configure_sweep(self, start: float, stop: float,
+                        num_points: int) -> None:
+        """
+        Set the setpoints of the sweep.
+
+        Args:
+            start: The first setpoint.
+            stop: The last setpoint.
+            num_points: The number of setpoints.
+        """
+        self.start(start)
+        self.stop(stop)
+        self.num_points(num_points)
+
+    def arm_sweep(self) -> None:
+        """
+        Arm the sweep, after which the next get of a
+        :class:`ParameterWithSetpoints` of these setpoints returns a newly
+        acquired trace.
+        """
+        if isinstance(self._arm_cmd, str):
+            if self.instrument is None:
+                raise RuntimeError(f'Can not write the arm command of '
+                                   f'{self.full_name}, it has no instrument')
+            self.instrument.write(self._arm_cmd)
+        else:
+            self._arm_cmd()
+
+
 class DelegateParameter(Parameter):
     """
     The :class:`.DelegateParameter` wraps a given `source`-parameter.
@@ -1780,7 +2115,11 @@ class _Cache:
         self._parameter = parameter
         self._value: ParamDataType = None
         self._raw_value: ParamRawDataType = None
-        self._timestamp: Optional[datetime] = None
+        # the time of the last update is stored as seconds since the epoch,
+        # which is much cheaper to obtain than a ``datetime``; the
+        # ``datetime`` is only created when the timestamp is requested
+        self._timestamp: Optional[float] = None
+        self._timestamp_datetime: Optional[datetime] = None
         self._max_val_age = max_val_age
 
     @property
@@ -1796,7 +2135,9 @@ class _Cache:
         If ``None``, the cache hasn't been updated yet and shall be seen as
         "invalid".
         """
-        return self._timestamp
+        if self._timestamp_datetime is None and self._timestamp is not None:
+            self._timestamp_datetime = datetime.fromtimestamp(self._timestamp)
+        return self._timestamp_datetime
 
     @property
     def max_val_age(self) -> Optional[float]:
@@ -1848,9 +2189,21 @@ class _Cache:
         self._value = value
         self._raw_value = raw_value
         if timestamp is None:
-            self._timestamp = datetime.now()
+            self._timestamp = time.time()
         else:
-            self._timestamp = timestamp
+            self._timestamp = timestamp.timestamp()
+        self._timestamp_datetime = timestamp
+
+    def _invalidate(self) -> None:
+        """
+        Forget the value in this cache, such that the next ``get`` of the
+        cache gets the parameter, for instance because the value in the
+        cache has not been sent to the instrument.
+        """
+        self._value = None
+        self._raw_value = None
+        self._timestamp = None
+        self._timestamp_datetime = None
 
     def get(self, get_if_invalid: bool = True) -> ParamDataType:
         """
@@ -1893,9 +2246,7 @@ class _Cache:
                 raise RuntimeError("`max_val_age` is not supported for a "
                                    "parameter without get command.")
 
-            oldest_accepted_timestamp = (
-                    datetime.now() - timedelta(seconds=self._max_val_age))
-            if self._timestamp < oldest_accepted_timestamp:
+            if time.time() - self._timestamp > self._max_val_age:
                 # Time of last get exceeds max_val_age seconds, need to
                 # perform new .get()
                 return self._parameter.get()
@@ -1,5 +1,7 @@
 """Visa instrument driver based on pyvisa."""
-from typing import Sequence, Optional, Dict, Union, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence, Optional, Dict, Union, Any, Callable, TypeVar
 import warnings
 import logging
 
@@ -8,6 +10,7 @@ import pyvisa.constants as vi_const
 import pyvisa.resources
 
 from .base import Instrument, InstrumentBase
+from .command_batch import CommandBatch
 
 import qcodes.utils.validators as vals
 from qcodes.logger.instrument_logger import get_instrument_logger
@@ -17,6 +20,8 @@ VISA_LOGGER = '.'.join((InstrumentBase.__module__, 'com', 'visa'))
 
 log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class VisaInstrument(Instrument):
 
@@ -43,8 +48,15 @@ class VisaInstrument(Instrument):
 
     Attributes:
         visa_handle (pyvisa.resources.Resource): The communication channel.
+        max_batch_length: The maximum length of the messages that a
+            :meth:`batch` sends, in characters. Drivers of instruments with
+            a larger input buffer can increase it.
     """
 
+    max_batch_length = 256
+    # the batch that is open on the instrument, see `batch`
+    _command_batch: Optional[CommandBatch] = None
+
     def __init__(self, name: str, address: str, timeout: Union[int, float] = 5,
                  terminator: str = '', device_clear: bool = True,
                  visalib: Optional[str] = None, **kwargs: Any):
@@ -177,6 +189,9 @@ class VisaInstrument(Instrument):
 
     def close(self) -> None:
         """Disconnect and irreversibly tear down the instrument."""
+        executor = getattr(self, '_visa_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=True)
         if getattr(self, 'visa_handle', None):
             self.visa_handle.close()
         super().close()
@@ -207,6 +222,10 @@ class VisaInstrument(Instrument):
         Args:
             cmd: The command to send to the instrument.
         """
+        batch = self._command_batch
+        if batch is not None and batch.in_opening_thread:
+            batch.write(cmd)
+            return
         with DelayedKeyboardInterrupt():
             self.visa_log.debug(f"Writing: {cmd}")
             nr_bytes_written, ret_code = self.visa_handle.write(cmd)
@@ -222,12 +241,69 @@ class VisaInstrument(Instrument):
         Returns:
             str: The instrument's response.
         """
+        batch = self._command_batch
+        if batch is not None and batch.in_opening_thread:
+            # the query must see the effect of the commands before it
+            batch.send()
         with DelayedKeyboardInterrupt():
             self.visa_log.debug(f"Querying: {cmd}")
             response = self.visa_handle.query(cmd)
             self.visa_log.debug(f"Response: {response}")
         return response
 
+    def batch(self) -> CommandBatch:
+        """
+        Open a batch of commands and queries to this instrument, which are
+        sent in as few messages as possible when the batch is closed. See
+        :class:`.CommandBatch`.
+
+        >>> with instrument.batch() as batch:
+        ...     instrument.voltage(0.1)
+        ...     instrument.current_limit(1e-6)
+        ...     current = batch.get(instrument.current)
+        >>> current.value
+        """
+        return CommandBatch(self, max_length=self.max_batch_length)
+
+    async def _run_in_visa_executor(self, func: Callable[[str], T],
+                                    cmd: str) -> T:
+        """
+        Run a blocking call of the visa handle in the thread that this
+        instrument uses for its asynchronous communication, such that the
+        event loop is not blocked. The thread is started on first use and
+        stopped when the instrument is closed.
+        """
+        executor = getattr(self, '_visa_executor', None)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f'visa_{self.name}')
+            self._visa_executor = executor
+        return await asyncio.get_event_loop().run_in_executor(
+            executor, self._run_thread_locked, func, cmd)
+
+    async def write_raw_async(self, cmd: str) -> None:
+        """
+        Asynchronous counterpart of :meth:`write_raw`. As pyvisa is
+        blocking, the command is written from a thread of this instrument.
+
+        Args:
+            cmd: The command to send to the instrument.
+        """
+        await self._run_in_visa_executor(self.write_raw, cmd)
+
+    async def ask_raw_async(self, cmd: str) -> str:
+        """
+        Asynchronous counterpart of :meth:`ask_raw`. As pyvisa is blocking,
+        the instrument is queried from a thread of this instrument.
+
+        Args:
+            cmd: The command to send to the instrument.
+
+        Returns:
+            str: The instrument's response.
+        """
+        return await self._run_in_visa_executor(self.ask_raw, cmd)
+
     def snapshot_base(self, update: bool = True,
                       params_to_skip_update: Optional[Sequence[str]] = None
                       ) -> Dict:
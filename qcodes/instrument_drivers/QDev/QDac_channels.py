@@ -40,6 +40,7 @@ class QDacChannel(InstrumentChannel):
 
         # Validate the channel
         self._CHANNEL_VALIDATION.validate(channum)
+        self._channum = channum
 
         # Add the parameters
 
@@ -117,33 +118,42 @@ class QDacChannel(InstrumentChannel):
                                      params_to_skip_update=params_to_skip_update)
         return snap
 
+    @classmethod
+    def bulk_get_raw(cls, channels, param_name):
+        """
+        The voltages and the voltage and current ranges of all channels are
+        read with a single ``status`` query
+        """
+        if param_name not in ('v', 'vrange', 'irange'):
+            return None
+        channels[0]._parent._update_cache(readcurrents=False)
+        return [chan.parameters[param_name].cache.raw_value
+                for chan in channels]
 
-class QDacMultiChannelParameter(MultiChannelInstrumentParameter):
-    """
-    The class to be returned by __getattr__ of the ChannelList. Here customised
-    for fast multi-readout of voltages.
-    """
-    def __init__(self, channels, param_name, *args, **kwargs):
-        super().__init__(channels, param_name, *args, **kwargs)
-
-    def get_raw(self):
+    @classmethod
+    def bulk_set_raw(cls, channels, param_name, raw_values):
         """
-        Return a tuple containing the data from each of the channels in the
-        list.
+        The voltages of channels without a slope are set with a single
+        command
         """
-        # For voltages, we can do something slightly faster than the naive
-        # approach
+        if param_name != 'v':
+            return False
+        qdac = channels[0]._parent
+        slopechans = [sl[0] for sl in qdac._slopes]
+        if any(chan._channum in slopechans for chan in channels):
+            return False
+        qdac.write(';'.join(
+            qdac._set_voltage_cmd(chan._channum, v_set)
+            for chan, v_set in zip(channels, raw_values)))
+        return True
 
-        if self._param_name == 'v':
-            qdac = self._channels[0]._parent
-            qdac._update_cache(readcurrents=False)
-            output = tuple(chan.parameters[self._param_name].get_latest()
-                           for chan in self._channels)
-        else:
-            output = tuple(chan.parameters[self._param_name].get()
-                           for chan in self._channels)
 
-        return output
+class QDacMultiChannelParameter(MultiChannelInstrumentParameter):
+    """
+    The class to be returned by __getattr__ of the ChannelList. The voltages
+    are read and set in bulk by :meth:`QDacChannel.bulk_get_raw` and
+    :meth:`QDacChannel.bulk_set_raw`, which the base class uses.
+    """
 
 
 class QDac(VisaInstrument):
@@ -308,10 +318,21 @@ class QDac(VisaInstrument):
             # happen inside _rampvoltage
             self._rampvoltage(chan, fg, v_start, v_set, time)
         else:
-            v_dac = QDac._get_v_dac_from_v_exp(channel, v_set)
-            # set the mode back to DC in case it had been changed
-            # and then set the voltage
-            self.write(f'wav {chan} 0 0 0;set {chan} {v_dac:.6f}')
+            self.write(self._set_voltage_cmd(chan, v_set))
+
+    def _set_voltage_cmd(self, chan, v_set):
+        """
+        The command that sets the voltage of a channel without a slope
+
+        Args:
+            chan (int): The 1-indexed channel number
+            v_set (float): The target voltage
+        """
+        channel = self.channels[chan-1]
+        v_dac = QDac._get_v_dac_from_v_exp(channel, v_set)
+        # set the mode back to DC in case it had been changed
+        # and then set the voltage
+        return f'wav {chan} 0 0 0;set {chan} {v_dac:.6f}'
 
     def _get_voltage(self, chan):
         """
@@ -1,7 +1,8 @@
 """
 This module defines a number of functions to make it easier to
 work with log messages from QCoDeS. Specifically it enables
-exports of logs and log files to a :class:`pandas.DataFrame`
+exports of logs and log files to a :class:`pandas.DataFrame`, as well as
+of the I/O statistics of instruments.
 
 """
 
@@ -11,7 +12,8 @@ from contextlib import contextmanager
 import logging
 import io
 
-from typing import Optional, Sequence, Iterator, Tuple, Callable
+from typing import (Optional, Sequence, Iterable, Iterator, Tuple, Callable,
+                    TYPE_CHECKING)
 
 from .logger import (LOGGING_SEPARATOR,
                      FORMAT_STRING_DICT,
@@ -19,6 +21,9 @@ from .logger import (LOGGING_SEPARATOR,
                      LevelType,
                      get_log_file_name)
 
+if TYPE_CHECKING:
+    from qcodes.instrument.base import Instrument
+
 
 def log_to_dataframe(log: Sequence[str],
                      columns: Optional[Sequence[str]] = None,
@@ -167,3 +172,39 @@ def capture_dataframe(level: LevelType = logging.DEBUG,
                 log_capture.getvalue().splitlines())
         finally:
             logger.removeHandler(string_handler)
+
+
+def io_statistics_to_dataframe(instruments: Iterable['Instrument']
+                               ) -> pandas.DataFrame:
+    """
+    Return the I/O statistics of instruments as a :class:`pandas.DataFrame`,
+    with one row for each kind of operation of each instrument, see
+    :meth:`qcodes.instrument.base.Instrument.start_io_statistics`.
+    Instruments that do not record their statistics are left out.
+
+    Example:
+        >>> dmm.start_io_statistics()
+        >>> # measure
+        >>> df = io_statistics_to_dataframe([dmm, dac])
+        >>> df.loc['dmm'].sort_values('total')
+
+    Args:
+        instruments: The instruments.
+
+    Returns:
+        A :class:`pandas.DataFrame` indexed by the instrument and the
+        operation, with the count, total, mean, min, max, p50, p95 and p99
+        durations (s), and the bytes sent and received as columns.
+    """
+    rows = []
+    for instrument in instruments:
+        statistics = instrument.io_statistics
+        if statistics is None:
+            continue
+        for operation, summary in statistics.summary().items():
+            rows.append({'instrument': instrument.full_name,
+                         'operation': operation, **summary})
+    columns = ['instrument', 'operation', 'count', 'total', 'mean', 'min',
+               'max', 'p50', 'p95', 'p99', 'bytes_sent', 'bytes_received']
+    return pandas.DataFrame(rows, columns=columns).set_index(
+        ['instrument', 'operation'])
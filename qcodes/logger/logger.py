@@ -19,8 +19,10 @@ from copy import copy
 
 from typing import Optional, Union, Sequence, TYPE_CHECKING, Iterator, Type
 from types import TracebackType
-from opencensus.ext.azure.log_exporter import AzureLogHandler
-from opencensus.ext.azure.common.protocol import Envelope
+
+if TYPE_CHECKING:
+    from opencensus.ext.azure.log_exporter import AzureLogHandler
+    from opencensus.ext.azure.common.protocol import Envelope
 
 import qcodes as qc
 import qcodes.utils.installation_info as ii
@@ -56,7 +58,7 @@ FORMAT_STRING_DICT = OrderedDict([
 # console hander.
 console_handler: Optional[logging.Handler] = None
 file_handler: Optional[logging.Handler] = None
-telemetry_handler: Optional[AzureLogHandler] = None
+telemetry_handler: Optional["AzureLogHandler"] = None
 
 
 def get_formatter() -> logging.Formatter:
@@ -210,6 +212,10 @@ def start_logger() -> None:
     logging.captureWarnings(capture=True)
 
     if qc.config.telemetry.enabled:
+        # opencensus is slow to import, hence it is only imported when
+        # telemetry is enabled
+        from opencensus.ext.azure.log_exporter import AzureLogHandler
+
         # Transport module of opencensus-ext-azure logs info 'transmission
         # succeeded' which is also exported to azure if AzureLogHandler is
         # in root_logger. The following lines stops that.
@@ -219,7 +225,7 @@ def start_logger() -> None:
         loc = qc.config.GUID_components.location
         stat = qc.config.GUID_components.work_station
 
-        def callback_function(envelope: Envelope) -> bool:
+        def callback_function(envelope: "Envelope") -> bool:
             envelope.tags['ai.user.accountId'] = platform.node()
             envelope.tags['ai.user.id'] = f'{loc:02x}-{stat:06x}'
             return True
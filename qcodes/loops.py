@@ -684,8 +684,10 @@ class ActiveLoop(Metadatable):
 
         Args:
             use_threads: (default False): whenever there are multiple `get` calls
-                back-to-back, execute them in separate threads so they run in
-                parallel (as long as they don't block each other)
+                back-to-back, execute them in the threads of a shared pool so
+                they run in parallel (as long as they don't block each other).
+                The parameters of one instrument are still gotten one after
+                the other.
             quiet: (default False): set True to not print anything except errors
             station: a Station instance for snapshots (omit to use a previously
                 provided Station, or the default Station)
@@ -3,7 +3,9 @@ Station objects - collect all the equipment you use to do an experiment.
 """
 
 
+import concurrent.futures
 from contextlib import suppress
+from dataclasses import dataclass, field
 from typing import (
     Dict, List, Optional, Sequence, Any, cast, AnyStr, IO, Tuple)
 from types import ModuleType
@@ -15,6 +17,7 @@ import itertools
 import json
 import pkgutil
 import inspect
+import time
 from copy import deepcopy, copy
 from collections import UserDict
 from typing import Union
@@ -28,13 +31,13 @@ from qcodes.utils.helpers import (
     get_qcodes_user_path)
 from qcodes.utils.deprecate import issue_deprecation_warning
 
-from qcodes.instrument.base import Instrument, InstrumentBase
+from qcodes.instrument.base import (Instrument, InstrumentBase,
+                                    record_snapshot_durations)
 from qcodes.instrument.channel import ChannelList
 from qcodes.instrument.parameter import (
     Parameter, ManualParameter,
     DelegateParameter, _BaseParameter)
 import qcodes.utils.validators as validators
-from qcodes.monitor.monitor import Monitor
 from qcodes.utils.deprecate import deprecate
 from qcodes.actions import _actions_snapshot
 
@@ -68,6 +71,14 @@ def get_config_use_monitor() -> Optional[str]:
     return qcodes.config["station"]["use_monitor"]
 
 
+def get_config_parallel_snapshot() -> bool:
+    return qcodes.config["station"]["parallel_snapshot"]
+
+
+def get_config_snapshot_timeout() -> Optional[float]:
+    return qcodes.config["station"]["snapshot_timeout"]
+
+
 ChannelOrInstrumentBase = Union[InstrumentBase, ChannelList]
 
 
@@ -77,6 +88,58 @@ class ValidationWarning(Warning):
     pass
 
 
+@dataclass
+class SnapshotTimings:
+    """
+    Class to represent how long taking the snapshot of the instruments of a
+    station took.
+
+    Attributes:
+        total: the duration of the whole snapshot of the instruments
+        instruments: the names of the instruments mapped to the durations
+            of their snapshots
+        parameters: the full names of the parameters mapped to the durations
+            of their snapshots
+        timed_out: the names of the instruments whose snapshots timed out, for
+            which the latest values in memory were used instead
+    """
+    total: float
+    instruments: Dict[str, float] = field(default_factory=dict)
+    parameters: Dict[str, float] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+
+    def slowest_instruments(self, n: int = 5) -> List[Tuple[str, float]]:
+        """
+        The names and durations of the ``n`` instruments whose snapshots took
+        longest, slowest first
+        """
+        return sorted(self.instruments.items(),
+                      key=lambda item: item[1], reverse=True)[:n]
+
+    def slowest_parameters(self, n: int = 5) -> List[Tuple[str, float]]:
+        """
+        The full names and durations of the ``n`` parameters whose snapshots
+        took longest, slowest first
+        """
+        return sorted(self.parameters.items(),
+                      key=lambda item: item[1], reverse=True)[:n]
+
+
+def _timed_snapshot(instrument: Instrument, update: bool
+                    ) -> Tuple[Dict, float, Dict[str, float]]:
+    """
+    Take the snapshot of an instrument and return it along with its duration
+    and the durations of the snapshots of its parameters. The
+    ``thread_lock`` of the instrument is held meanwhile, such that the
+    communication with the instrument waits for a snapshot that is still
+    being taken after it has timed out.
+    """
+    t0 = time.perf_counter()
+    with instrument.thread_lock, record_snapshot_durations() as durations:
+        snap = instrument.snapshot(update=update)
+    return snap, time.perf_counter() - t0, durations
+
+
 class StationConfig(UserDict):
     def snapshot(self, update: bool = True) -> 'StationConfig':
         return self
@@ -95,6 +158,12 @@ class Station(Metadatable, DelegateAttributes):
             Station. Can be added later via ``self.add_component``.
         config_file: Path to YAML file to load the station config from.
         use_monitor: Should the QCoDeS monitor be activated for this station.
+        parallel_snapshot: Should the snapshots of the instruments be taken
+            concurrently? Defaults to the ``station.parallel_snapshot``
+            setting of the config.
+        snapshot_timeout: Time in seconds after which a snapshot of an
+            instrument that is taken concurrently is given up. Defaults to
+            the ``station.snapshot_timeout`` setting of the config.
         default: Is this station the default?
         update_snapshot: Immediately update the snapshot of each
             component as it is added to the Station.
@@ -118,7 +187,10 @@ class Station(Metadatable, DelegateAttributes):
     def __init__(self, *components: Metadatable,
                  config_file: Optional[str] = None,
                  use_monitor: Optional[bool] = None, default: bool = True,
-                 update_snapshot: bool = True, **kwargs: Any) -> None:
+                 update_snapshot: bool = True,
+                 parallel_snapshot: Optional[bool] = None,
+                 snapshot_timeout: Optional[float] = None,
+                 **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
         # when a new station is defined, store it in a class variable
@@ -135,6 +207,12 @@ class Station(Metadatable, DelegateAttributes):
             self.add_component(item, update_snapshot=update_snapshot)
 
         self.use_monitor = use_monitor
+        self.parallel_snapshot = parallel_snapshot
+        self.snapshot_timeout = snapshot_timeout
+        self.last_snapshot_timings: Optional[SnapshotTimings] = None
+        """
+        How long the last snapshot of the instruments of the station took,
+        per instrument and parameter"""
         self.config_file = config_file
 
         self.default_measurement: Tuple[ActionType, ...] = ()
@@ -155,6 +233,14 @@ class Station(Metadatable, DelegateAttributes):
         closed, not only will it not be snapshotted, it will also be removed
         from the station during the execution of this function.
 
+        If ``parallel_snapshot`` is enabled, the snapshots of the instruments
+        are taken concurrently, each instrument in its own thread (so the
+        parameters of one instrument are still queried one after the
+        other). If an instrument does not respond within
+        ``snapshot_timeout``, the latest values of its parameters in memory
+        are used instead. Either way, the durations of the snapshots are
+        available in :attr:`last_snapshot_timings` afterwards.
+
         Args:
             update: If ``True``, update the state by querying the
                 all the children: f.ex. instruments, parameters,
@@ -175,6 +261,7 @@ class Station(Metadatable, DelegateAttributes):
         }
 
         components_to_remove = []
+        instruments: Dict[str, Instrument] = {}
 
         for name, itm in self.components.items():
             if isinstance(itm, Instrument):
@@ -182,9 +269,15 @@ class Station(Metadatable, DelegateAttributes):
                 # station object, hence this 'if' allows to avoid
                 # snapshotting instruments that are already closed
                 if Instrument.is_valid(itm):
-                    snap['instruments'][name] = itm.snapshot(update=update)
+                    instruments[name] = itm
                 else:
                     components_to_remove.append(name)
+
+        snap['instruments'] = self._snapshot_instruments(instruments, update)
+
+        for name, itm in self.components.items():
+            if isinstance(itm, Instrument):
+                continue
             elif isinstance(itm, (Parameter,
                                   ManualParameter
                                   )):
@@ -197,6 +290,68 @@ class Station(Metadatable, DelegateAttributes):
 
         return snap
 
+    def _snapshot_instruments(self, instruments: Dict[str, Instrument],
+                              update: bool) -> Dict[str, Dict]:
+        """
+        Take the snapshots of the given instruments, concurrently if
+        ``parallel_snapshot`` is enabled, and record their durations in
+        :attr:`last_snapshot_timings`
+        """
+        parallel = self.parallel_snapshot
+        if parallel is None:
+            parallel = get_config_parallel_snapshot()
+        timeout = self.snapshot_timeout
+        if timeout is None:
+            timeout = get_config_snapshot_timeout()
+
+        t_start = time.perf_counter()
+        timings = SnapshotTimings(total=0)
+        snaps: Dict[str, Dict] = {}
+
+        if not parallel or len(instruments) < 2:
+            for name, itm in instruments.items():
+                snaps[name], timings.instruments[name], durations = \
+                    _timed_snapshot(itm, update)
+                timings.parameters.update(durations)
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(instruments),
+                thread_name_prefix='station_snapshot')
+            futures = {name: executor.submit(_timed_snapshot, itm, update)
+                       for name, itm in instruments.items()}
+            # all the snapshots are taken at the same time, hence their
+            # timeouts all end at the same time too
+            deadline = None if timeout is None else t_start + timeout
+            try:
+                for name, future in futures.items():
+                    remaining = None if deadline is None \
+                        else max(deadline - time.perf_counter(), 0)
+                    try:
+                        snaps[name], timings.instruments[name], durations = \
+                            future.result(timeout=remaining)
+                    except concurrent.futures.TimeoutError:
+                        log.warning(f"Snapshot: instrument {name} did not "
+                                    f"respond within {timeout} s, using the "
+                                    f"latest values in memory instead")
+                        snaps[name] = instruments[name].snapshot(update=False)
+                        timings.instruments[name] = \
+                            time.perf_counter() - t_start
+                        timings.timed_out.append(name)
+                    else:
+                        timings.parameters.update(durations)
+            finally:
+                # do not wait for the snapshots that timed out; they hold
+                # the thread_lock of their instrument until they are done
+                executor.shutdown(wait=False)
+
+        timings.total = time.perf_counter() - t_start
+        self.last_snapshot_timings = timings
+        slowest = ', '.join(f'{name}: {duration:.3f} s' for name, duration
+                            in timings.slowest_instruments(3))
+        log.debug(f"Snapshot of instruments took {timings.total:.3f} s, "
+                  f"slowest: {slowest}")
+        return snaps
+
     def add_component(self, component: Metadatable, name: str = None,
                       update_snapshot: bool = True) -> str:
         """
@@ -611,6 +766,10 @@ class Station(Metadatable, DelegateAttributes):
         def update_monitor() -> None:
             if ((self.use_monitor is None and get_config_use_monitor())
                     or self.use_monitor):
+                # the monitor requires websockets and is hence only
+                # imported when it is used
+                from qcodes.monitor.monitor import Monitor
+
                 # restart Monitor
                 Monitor(*self._monitor_parameters)
 
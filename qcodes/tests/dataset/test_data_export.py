@@ -0,0 +1,188 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from qcodes.dataset.data_export import (_all_in_group_or_subgroup,
+                                        _rows_from_datapoints,
+                                        _strings_as_ints,
+                                        datatype_from_setpoints_2d,
+                                        reshape_2D_data)
+
+
+# The implementations of the grid detection before it was vectorised, which
+# the current ones must agree with
+
+def _reference_rows_from_datapoints(inputsetpoints):
+    rows = []
+    setpoints = inputsetpoints.copy()
+
+    temp, inds, count = np.unique(setpoints, return_index=True,
+                                  return_counts=True)
+    num_repeats_array = np.unique(count)
+    if len(num_repeats_array) == 1 and count.sum() == len(inputsetpoints):
+        return np.tile(temp, (num_repeats_array[0], 1))
+    else:
+        rows.append(temp)
+        setpoints = np.delete(setpoints, inds)
+
+    while len(setpoints) > 0:
+        temp, inds = np.unique(setpoints, return_index=True)
+        rows.append(temp)
+        setpoints = np.delete(setpoints, inds)
+
+    with warnings.catch_warnings():
+        # rows of different lengths make an object array
+        warnings.simplefilter('ignore')
+        return np.array(rows)
+
+
+def _reference_all_in_group_or_subgroup(rows):
+    groups = 1
+    comp_to = rows[0]
+
+    aigos = True
+    switchindex = 0
+
+    for rowind, row in enumerate(rows[1:]):
+        if np.array_equal(row, comp_to):
+            continue
+        else:
+            groups += 1
+            comp_to = row
+            switchindex = rowind
+            if groups > 2:
+                aigos = False
+                break
+
+    if aigos and switchindex > 0:
+        for row in rows[1+switchindex:]:
+            if sum([r in rows[0] for r in row]) != len(row):
+                aigos = False
+                break
+
+    return aigos
+
+
+def _reference_strings_as_ints(inputarray):
+    newdata = np.zeros(len(inputarray))
+    for n, word in enumerate(np.unique(inputarray)):
+        newdata += ((inputarray == word).astype(int)*n)
+    return newdata
+
+
+def _reference_reshape_2D_data(x, y, z):
+    xrow = np.array(_reference_rows_from_datapoints(x)[0])
+    yrow = np.array(_reference_rows_from_datapoints(y)[0])
+    nx = len(xrow)
+    ny = len(yrow)
+
+    if isinstance(z[0], str):
+        z_to_plot = np.full((ny, nx), '', dtype=z.dtype)
+    else:
+        z_to_plot = np.full((ny, nx), np.nan)
+    x_index = np.zeros_like(x, dtype=int)
+    y_index = np.zeros_like(y, dtype=int)
+    for i, xval in enumerate(xrow):
+        x_index[np.where(x == xval)[0]] = i
+    for i, yval in enumerate(yrow):
+        y_index[np.where(y == yval)[0]] = i
+
+    z_to_plot[y_index, x_index] = z
+
+    return xrow, yrow, z_to_plot
+
+
+def _sweep(nx, ny, n_points=None, shuffle=False, seed=0):
+    """
+    The setpoints and values of a 2D sweep, of which only the first
+    ``n_points`` were measured if it was interrupted
+    """
+    rng = np.random.RandomState(seed)
+    xs = np.sort(rng.choice(np.arange(100), nx, replace=False)) * 0.1
+    ys = np.linspace(-1, 1, ny)
+    x, y = (a.ravel() for a in np.meshgrid(xs, ys, indexing='ij'))
+    z = rng.rand(len(x))
+    if n_points is not None:
+        x, y, z = x[:n_points], y[:n_points], z[:n_points]
+    if shuffle:
+        order = rng.permutation(len(x))
+        x, y, z = x[order], y[order], z[order]
+    return x, y, z
+
+
+SWEEPS = [
+    dict(nx=5, ny=7),
+    dict(nx=5, ny=7, shuffle=True),
+    # interrupted in the middle of a row
+    dict(nx=5, ny=7, n_points=17),
+    dict(nx=5, ny=7, n_points=17, shuffle=True),
+    # interrupted at the end of a row
+    dict(nx=5, ny=7, n_points=21),
+    dict(nx=30, ny=20, n_points=599, shuffle=True),
+    dict(nx=1, ny=10),
+]
+
+
+def _assert_rows_equal(rows, reference):
+    assert len(rows) == len(reference)
+    for row, reference_row in zip(rows, reference):
+        np.testing.assert_array_equal(row, reference_row)
+
+
+@pytest.mark.parametrize('sweep', SWEEPS)
+def test_grid_detection_agrees_with_reference(sweep):
+    x, y, z = _sweep(**sweep)
+
+    for setpoints in (x, y):
+        rows = _rows_from_datapoints(setpoints)
+        reference_rows = _reference_rows_from_datapoints(setpoints)
+        _assert_rows_equal(rows, reference_rows)
+        assert (_all_in_group_or_subgroup(rows)
+                == _reference_all_in_group_or_subgroup(reference_rows))
+
+    if len(np.unique(x)) > 1:
+        assert datatype_from_setpoints_2d(x, y) == '2D_grid'
+
+    for result, reference in zip(reshape_2D_data(x, y, z),
+                                 _reference_reshape_2D_data(x, y, z)):
+        np.testing.assert_array_equal(result, reference)
+
+
+@pytest.mark.parametrize('setpoints', [
+    np.array([3, 1, 2, 1, 3, 3, 5]),
+    np.array([1., 1., 1., 2.]),
+    np.array([0.5]),
+    np.array([]),
+])
+def test_rows_agree_with_reference(setpoints):
+    _assert_rows_equal(_rows_from_datapoints(setpoints),
+                       _reference_rows_from_datapoints(setpoints))
+
+
+@pytest.mark.parametrize('rows', [
+    [[1, 2, 3], [1, 2, 3], [1, 2], [1, 2]],
+    [[1, 2, 3], [1, 2, 3], [1, 4], [1, 4]],
+    [[1, 2, 3], [1, 2], [1]],
+    [[1, 2, 3], [1, 2, 4]],
+])
+def test_groups_agree_with_reference(rows):
+    rows = [np.array(row) for row in rows]
+    assert (_all_in_group_or_subgroup(rows)
+            == _reference_all_in_group_or_subgroup(rows))
+
+
+def test_strings_as_ints_agree_with_reference():
+    words = np.array(['b', 'a', 'c', 'a', 'c', 'dd'])
+    result = _strings_as_ints(words)
+    np.testing.assert_array_equal(result, _reference_strings_as_ints(words))
+    np.testing.assert_array_equal(result, [1, 0, 2, 0, 2, 3])
+
+
+def test_reshape_string_data():
+    x = np.array(['a', 'b', 'a', 'b'])
+    y = np.array([1, 1, 2, 2])
+    z = np.array(['p', 'q', 'r', 's'])
+    for result, reference in zip(reshape_2D_data(x, y, z),
+                                 _reference_reshape_2D_data(x, y, z)):
+        np.testing.assert_array_equal(result, reference)
@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from qcodes import ManualParameter
+from qcodes.dataset.data_set import load_by_id
+from qcodes.dataset.data_set_cache import _GrowableArray
+from qcodes.dataset.measurements import Measurement
+# pylint: disable=unused-import
+from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
+                                                      experiment)
+# pylint: enable=unused-import
+
+
+def assert_parameter_data_equal(data, expected, check_dtype=True):
+    assert data.keys() == expected.keys()
+    for name, tree in expected.items():
+        assert data[name].keys() == tree.keys()
+        for param, values in tree.items():
+            if check_dtype:
+                assert data[name][param].dtype == values.dtype
+            np.testing.assert_array_equal(data[name][param], values)
+
+
+@pytest.fixture
+def parameters():
+    x = ManualParameter('x')
+    y = ManualParameter('y')
+    z = ManualParameter('z')
+    signal = ManualParameter('signal')
+    standalone = ManualParameter('standalone')
+    return x, y, z, signal, standalone
+
+
+@pytest.mark.parametrize("write_in_background", [True, False])
+@pytest.mark.usefixtures("experiment")
+def test_cache_follows_measurement(parameters, write_in_background):
+    x, y, z, signal, standalone = parameters
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y)
+    meas.register_parameter(z, setpoints=(x, y))
+    meas.register_parameter(signal, setpoints=(x,), paramtype='array')
+    meas.register_parameter(standalone, paramtype='text')
+
+    with meas.run(write_in_background=write_in_background) as datasaver:
+        dataset = datasaver.dataset
+        assert dataset.cache.live
+        assert dataset.cache.data() == {'signal': {}, 'standalone': {},
+                                        'z': {}}
+
+        for i, xv in enumerate(np.linspace(0, 1, 5)):
+            ys = np.linspace(0, 1, 7)
+            datasaver.add_result((x, xv), (y, ys), (z, i * ys))
+            datasaver.add_result((x, xv), (signal, np.random.rand(3)))
+            datasaver.add_result((standalone, f'point {i}'))
+            datasaver.flush_data_to_database()
+            if write_in_background:
+                dataset._data_write_queue.join()
+
+            # the database stores whole floats as integers, so the loaded
+            # data may have an integer dtype where the cache has float
+            assert_parameter_data_equal(dataset.cache.data(),
+                                        dataset.get_parameter_data(),
+                                        check_dtype=False)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_cache_loads_new_rows_from_db(parameters):
+    x, y, z, _, _ = parameters
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y)
+    meas.register_parameter(z, setpoints=(x, y))
+
+    with meas.run() as datasaver:
+        loaded_ds = load_by_id(datasaver.run_id)
+        assert not loaded_ds.cache.live
+
+        for xv in range(4):
+            datasaver.add_result((x, xv), (y, np.arange(10)),
+                                 (z, xv * np.arange(10)))
+            datasaver.flush_data_to_database()
+
+            data = loaded_ds.cache.data()
+            assert_parameter_data_equal(data,
+                                        loaded_ds.get_parameter_data())
+            assert loaded_ds.cache._max_rowid == (xv + 1) * 10
+
+    # views returned before are not affected by later appends
+    assert len(data['z']['z']) == 40
+    assert data['z']['z'].dtype.kind == 'i'
+
+
+@pytest.mark.parametrize("write_in_background", [True, False])
+@pytest.mark.usefixtures("experiment")
+def test_cache_follows_all_ways_of_adding_results(parameters,
+                                                  write_in_background):
+    x, _, z, _, _ = parameters
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(z, setpoints=(x,))
+
+    with meas.run(write_in_background=write_in_background) as datasaver:
+        dataset = datasaver.dataset
+        datasaver.add_result((x, 0), (z, 0))
+        datasaver.flush_data_to_database()
+        dataset.add_results([{'x': 1, 'z': 10}, {'x': 2, 'z': 20}])
+        if write_in_background:
+            dataset.add_result_to_queue([{'x': 3, 'z': 30}])
+            dataset._data_write_queue.join()
+        assert dataset.cache.live
+        assert_parameter_data_equal(dataset.cache.data(),
+                                    dataset.get_parameter_data(),
+                                    check_dtype=False)
+
+    # a completed dataset is no longer written to, and its cache is not
+    # loaded again
+    assert not dataset.cache.live
+    n_points = 4 if write_in_background else 3
+    np.testing.assert_array_equal(dataset.cache.data()['z']['x'],
+                                  np.arange(n_points))
+
+
+@pytest.mark.parametrize("write_in_background", [True, False])
+@pytest.mark.usefixtures("experiment")
+def test_cache_of_results_of_several_trees(parameters, write_in_background):
+    x, y, z, _, _ = parameters
+
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(y, setpoints=(x,))
+    meas.register_parameter(z)
+
+    with meas.run(write_in_background=write_in_background) as datasaver:
+        dataset = datasaver.dataset
+        dataset.add_results([{'x': 1, 'y': 2}, {'z': 3}])
+        if write_in_background:
+            dataset._data_write_queue.join()
+        dataset.add_result({'x': 4, 'y': 5})
+        if write_in_background:
+            dataset.add_result_to_queue([{'z': 6}, {'x': 7, 'y': 8}])
+            dataset._data_write_queue.join()
+        assert dataset.cache.live
+        assert_parameter_data_equal(dataset.cache.data(),
+                                    dataset.get_parameter_data(),
+                                    check_dtype=False)
+
+
+def test_growable_array_promotes_dtype():
+    array = _GrowableArray(np.array([1, 2]))
+    first_values = array.values
+    array.append(np.array([3, 4, 5]))
+    array.append(np.array([6.5]))
+
+    np.testing.assert_array_equal(array.values, [1, 2, 3, 4, 5, 6.5])
+    assert array.values.dtype == np.float64
+    np.testing.assert_array_equal(first_values, [1, 2])
+
+
+def test_growable_array_rows_of_different_shapes():
+    array = _GrowableArray(np.ones((2, 3)))
+    array.append(np.ones((1, 4)))
+
+    values = array.values
+    assert values.shape == (3,)
+    assert values.dtype == np.dtype('O')
+    assert [np.shape(row) for row in values] == [(3,), (3,), (4,)]
@@ -32,9 +32,15 @@ from qcodes.dataset.sqlite.db_upgrades import (_latest_available_version,
                                                perform_db_upgrade_7_to_8,
                                                perform_db_upgrade,
                                                set_user_version,
-                                               perform_db_upgrade_8_to_9)
-from qcodes.dataset.sqlite.queries import get_run_description, update_GUIDs
-from qcodes.dataset.sqlite.query_helpers import is_column_in_table, one
+                                               perform_db_upgrade_8_to_9,
+                                               perform_db_upgrade_10_to_11,
+                                               perform_db_upgrade_11_to_12)
+from qcodes.dataset.sqlite.queries import (get_run_description,
+                                           get_snapshot,
+                                           get_snapshot_storage_info,
+                                           update_GUIDs)
+from qcodes.dataset.sqlite.query_helpers import (insert_column,
+                                                 is_column_in_table, one)
 from qcodes.tests.common import error_caused_by
 from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
                                                       experiment,
@@ -81,7 +87,8 @@ def test_tables_exist(empty_temp_db, version):
                    version=version)
     cursor = conn.execute("select sql from sqlite_master"
                           " where type = 'table'")
-    expected_tables = ['experiments', 'runs', 'layouts', 'dependencies']
+    expected_tables = ['experiments', 'runs', 'layouts', 'dependencies',
+                       'snapshots']
     rows = [row for row in cursor]
     assert len(rows) == len(expected_tables)
     for row, expected_table in zip(rows, expected_tables):
@@ -901,8 +908,64 @@ def test_cannot_connect_to_newer_db():
                        qc.config["core"]["db_debug"])
 
 
+def test_perform_upgrade_10_to_11(tmp_path):
+    conn = connect(str(tmp_path / 'v10.db'), version=10)
+    insert_column(conn, 'runs', 'cooldown')
+
+    def index_names(table):
+        c = atomic_transaction(conn, f"PRAGMA index_list({table})")
+        return {row['name'] for row in c.fetchall()}
+
+    assert index_names('runs') == {'IX_runs_exp_id', 'IX_runs_guid',
+                                   'IX_runs_captured_run_id'}
+    assert index_names('experiments') == set()
+
+    perform_db_upgrade_10_to_11(conn)
+
+    assert index_names('runs') == {'IX_runs_exp_id', 'IX_runs_guid',
+                                   'IX_runs_captured_run_id',
+                                   'IX_runs_exp_id_result_counter',
+                                   'IX_runs_captured_counter',
+                                   'IX_runs_run_timestamp',
+                                   'IX_runs_completed_timestamp',
+                                   'IX_runs_metadata_cooldown'}
+    assert index_names('experiments') == {'IX_experiments_name_sample_name',
+                                          'IX_experiments_sample_name'}
+    conn.close()
+
+
+def test_perform_upgrade_11_to_12(tmp_path):
+    conn = connect(str(tmp_path / 'v11.db'), version=11)
+    snapshot_a = json.dumps({'station': {'a': 1}})
+    snapshot_b = json.dumps({'station': {'b': 2}})
+    for name, snapshot in (('a1', snapshot_a), ('a2', snapshot_a),
+                           ('b', snapshot_b), ('none', None)):
+        atomic_transaction(conn, "INSERT INTO runs (name, snapshot) "
+                                 "VALUES (?, ?)", name, snapshot)
+
+    perform_db_upgrade_11_to_12(conn)
+
+    assert is_column_in_table(conn, 'runs', 'snapshot_hash')
+    c = atomic_transaction(conn, "SELECT COUNT(*) FROM runs "
+                                 "WHERE snapshot IS NOT NULL")
+    assert c.fetchone()[0] == 0
+    c = atomic_transaction(conn, "SELECT COUNT(*) FROM snapshots")
+    assert c.fetchone()[0] == 2
+
+    assert get_snapshot(conn, 1) == snapshot_a
+    assert get_snapshot(conn, 2) == snapshot_a
+    assert get_snapshot(conn, 3) == snapshot_b
+    assert get_snapshot(conn, 4) is None
+
+    info = get_snapshot_storage_info(conn)
+    assert info['runs_with_snapshot'] == 3
+    assert info['distinct_snapshots'] == 2
+    assert info['saved_bytes'] == len(snapshot_a)
+    conn.close()
+
+
 def test_latest_available_version():
-    assert _latest_available_version() == 9
+    assert _latest_available_version() == 12
 
 
 @pytest.mark.parametrize('version', VERSIONS)
@@ -829,3 +829,77 @@ def test_column_mismatch(two_empty_temp_db_connections, some_interdeps, inst):
     target_copied_ds = DataSet(conn=target_conn, run_id=2)
 
     assert target_copied_ds.the_same_dataset_as(source_ds)
+
+
+def _make_completed_runs(conn, interdeps, n_runs):
+    exp = Experiment(conn=conn)
+    datasets = [DataSet(conn=conn, exp_id=exp.exp_id) for _ in range(n_runs)]
+    for i, ds in enumerate(datasets):
+        ds.set_interdependencies(interdeps)
+        ds.mark_started()
+        ds.add_results([{name: float(i + j) for name in interdeps.names}
+                        for j in range(10)])
+        ds.add_snapshot('{"run": %d}' % (i % 2))
+        ds.mark_completed()
+    return datasets
+
+
+def test_interrupted_extraction_is_resumed(two_empty_temp_db_connections,
+                                           some_interdeps, monkeypatch):
+    source_conn, target_conn = two_empty_temp_db_connections
+    source_path = path_to_dbfile(source_conn)
+    target_path = path_to_dbfile(target_conn)
+    source_datasets = _make_completed_runs(source_conn, some_interdeps[1], 3)
+
+    import qcodes.dataset.database_extract_runs as extract_runs
+    rewrite_timestamps = extract_runs._rewrite_timestamps
+    calls = []
+
+    def interrupted_rewrite_timestamps(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise OSError('the disk is full')
+        rewrite_timestamps(*args)
+
+    monkeypatch.setattr(extract_runs, '_rewrite_timestamps',
+                        interrupted_rewrite_timestamps)
+    with pytest.raises(RuntimeError):
+        extract_runs_into_db(source_path, target_path, 1, 2, 3)
+    # the first run was copied completely, the second one not at all
+    assert len(DataSet(conn=target_conn, run_id=1).get_parameter_data()) > 0
+    assert len(get_experiments(target_conn)) == 1
+    with pytest.raises(ValueError):
+        DataSet(conn=target_conn, run_id=2)
+
+    monkeypatch.undo()
+    extract_runs_into_db(source_path, target_path, 1, 2, 3)
+
+    for run_id, source_ds in enumerate(source_datasets, start=1):
+        target_ds = DataSet(conn=target_conn, run_id=run_id)
+        assert source_ds.the_same_dataset_as(target_ds)
+        assert target_ds.snapshot_raw == source_ds.snapshot_raw
+        np.testing.assert_equal(target_ds.get_parameter_data(),
+                                source_ds.get_parameter_data())
+    with pytest.raises(ValueError):
+        DataSet(conn=target_conn, run_id=4)
+
+
+def test_extraction_without_attaching_the_source(
+        two_empty_temp_db_connections, some_interdeps, monkeypatch, capsys):
+    source_conn, target_conn = two_empty_temp_db_connections
+    source_path = path_to_dbfile(source_conn)
+    target_path = path_to_dbfile(target_conn)
+    source_datasets = _make_completed_runs(source_conn, some_interdeps[1], 2)
+
+    import qcodes.dataset.database_extract_runs as extract_runs
+    monkeypatch.setattr(extract_runs, '_attach_source_db',
+                        lambda *args: False)
+    extract_runs_into_db(source_path, target_path, 1, 2, show_progress=True)
+
+    for run_id, source_ds in enumerate(source_datasets, start=1):
+        target_ds = DataSet(conn=target_conn, run_id=run_id)
+        assert source_ds.the_same_dataset_as(target_ds)
+        assert target_ds.snapshot_raw == source_ds.snapshot_raw
+        np.testing.assert_equal(target_ds.get_parameter_data(),
+                                source_ds.get_parameter_data())
+    assert '2/2' in capsys.readouterr().out
@@ -8,6 +8,7 @@ import os
 
 import pytest
 import numpy as np
+import pandas as pd
 from hypothesis import given, settings
 import hypothesis.strategies as hst
 
@@ -546,6 +547,171 @@ def test_numpy_inf(dataset):
     assert np.isinf(retrieved).all()
 
 
+@pytest.mark.parametrize("values, expected_kind",
+                         [([1, 2, 3], 'i'),
+                          ([1, 2.5, 3], 'f'),
+                          ([1.0, np.nan, np.inf], 'f')])
+def test_get_parameter_data_numeric_dtype(dataset, values, expected_kind):
+    """
+    Test that numeric columns are loaded with an integer dtype if all values
+    are integers, and with a float dtype otherwise, also when NaNs are stored
+    """
+    parameter_m = ParamSpecBase("m", "numeric")
+    idps = InterDependencies_(standalones=(parameter_m,))
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    dataset.add_results([{"m": value} for value in values])
+    retrieved = dataset.get_parameter_data()['m']['m']
+    assert retrieved.dtype.kind == expected_kind
+    np.testing.assert_array_equal(retrieved, values)
+
+
+def test_add_columnar_results(dataset):
+    """
+    Test that blocks of columns are inserted in order and that consecutive
+    blocks with the same keys may mix numpy arrays and lists
+    """
+    x = ParamSpecBase("x", paramtype='numeric')
+    y = ParamSpecBase("y", paramtype='numeric')
+    z = ParamSpecBase("z", paramtype='numeric')
+    idps = InterDependencies_(dependencies={y: (x,)}, standalones=(z,))
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    xvals = np.linspace(0, 1, 11)
+    dataset.add_columnar_results([{'x': xvals[:10], 'y': 2 * xvals[:10]},
+                                  {'x': [xvals[10]], 'y': [2 * xvals[10]]},
+                                  {'z': np.array([1, np.nan, 3])},
+                                  {'x': [2.0], 'y': [4]}])
+
+    assert len(dataset) == 15
+    data = dataset.get_parameter_data()
+    np.testing.assert_allclose(data['y']['x'], np.append(xvals, 2.0))
+    np.testing.assert_allclose(data['y']['y'], np.append(2 * xvals, 4))
+    np.testing.assert_allclose(data['z']['z'], [1, np.nan, 3])
+
+
+def test_add_columnar_results_raises(dataset):
+    x = ParamSpecBase("x", paramtype='numeric')
+    y = ParamSpecBase("y", paramtype='numeric')
+    idps = InterDependencies_(dependencies={y: (x,)})
+    dataset.set_interdependencies(idps)
+
+    with pytest.raises(RuntimeError, match='has not been marked as started'):
+        dataset.add_columnar_results([{'x': [1], 'y': [2]}])
+
+    dataset.mark_started()
+
+    with pytest.raises(ValueError, match='same length'):
+        dataset.add_columnar_results([{'x': [1, 2], 'y': [2]}])
+    with pytest.raises(ValueError, match='one-dimensional'):
+        dataset.add_columnar_results([{'x': np.ones((2, 2)),
+                                       'y': np.ones((2, 2))}])
+    assert len(dataset) == 0
+
+
+def test_background_writer_coalesces_pending_results(dataset):
+    """
+    Test that all the results pending in the write queue are written in a
+    single transaction
+    """
+    x = ParamSpecBase("x", paramtype='numeric')
+    y = ParamSpecBase("y", paramtype='numeric')
+    z = ParamSpecBase("z", paramtype='numeric')
+    idps = InterDependencies_(dependencies={y: (x,)}, standalones=(z,))
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    for i in range(10):
+        dataset._enqueue_results(['x', 'y'], [(i, 2 * i)])
+    dataset._enqueue_results(['z'], [(-1,), (-2,)])
+    dataset._enqueue_results(['x', 'y'], [(10, 20)])
+    assert dataset.get_write_metrics()['queue_depth'] == 12
+
+    dataset._data_write_queue.put({'keys': 'stop', 'values': []})
+    # run the writer in this thread, it stops once the queue is exhausted
+    dataset._bg_writer.run()
+
+    metrics = dataset.get_write_metrics()
+    assert metrics['commits'] == 1
+    assert metrics['rows_written'] == 13
+    assert metrics['queue_depth'] == 0
+    assert metrics['max_queue_depth'] == 12
+    assert sum(metrics['commit_latency_histogram'].values()) == 1
+
+    data = dataset.get_parameter_data()
+    np.testing.assert_array_equal(data['y']['x'], np.arange(11))
+    np.testing.assert_array_equal(data['y']['y'], 2 * np.arange(11))
+    np.testing.assert_array_equal(data['z']['z'], [-1, -2])
+
+
+def test_write_queue_drop_policy(experiment):
+    size = qc.config.dataset.write_queue_size
+    policy = qc.config.dataset.write_queue_policy
+    try:
+        qc.config.dataset.write_queue_size = 1
+        qc.config.dataset.write_queue_policy = 'drop'
+        ds = new_data_set("test-dataset")
+    finally:
+        qc.config.dataset.write_queue_size = size
+        qc.config.dataset.write_queue_policy = policy
+
+    x = ParamSpecBase("x", paramtype='numeric')
+    ds.set_interdependencies(InterDependencies_(standalones=(x,)))
+    ds.mark_started()
+
+    assert ds._enqueue_results(['x'], [(1,), (2,)])
+    assert not ds._enqueue_results(['x'], [(3,)])
+
+    metrics = ds.get_write_metrics()
+    assert metrics['rows_dropped'] == 1
+    assert metrics['queue_depth'] == 1
+
+
+def test_write_queue_block_policy_with_stopped_writer(experiment):
+    size = qc.config.dataset.write_queue_size
+    policy = qc.config.dataset.write_queue_policy
+    try:
+        qc.config.dataset.write_queue_size = 1
+        qc.config.dataset.write_queue_policy = 'block'
+        ds = new_data_set("test-dataset")
+    finally:
+        qc.config.dataset.write_queue_size = size
+        qc.config.dataset.write_queue_policy = policy
+
+    x = ParamSpecBase("x", paramtype='numeric')
+    ds.set_interdependencies(InterDependencies_(standalones=(x,)))
+    ds.mark_started(start_bg_writer=True)
+    ds.add_result_to_queue([{'x': 1}])
+
+    ds._data_write_queue.put({'keys': 'stop', 'values': []})
+    ds._bg_writer.join()
+    ds._data_write_queue.put({'keys': ['x'], 'values': [(2,)]})
+
+    # the queue is full and nothing will ever make room in it
+    with pytest.raises(RuntimeError, match='background writer .* stopped'):
+        ds.add_result_to_queue([{'x': 3}])
+    ds.mark_completed()
+    np.testing.assert_array_equal(ds.get_parameter_data()['x']['x'], [1])
+
+
+def test_write_metrics(dataset):
+    x = ParamSpecBase("x", paramtype='numeric')
+    dataset.set_interdependencies(InterDependencies_(standalones=(x,)))
+    dataset.mark_started()
+
+    dataset.add_results([{'x': 1}, {'x': 2}])
+    dataset.add_columnar_results([{'x': np.arange(3)}])
+
+    metrics = dataset.get_write_metrics()
+    assert metrics['commits'] == 2
+    assert metrics['rows_written'] == 5
+    assert metrics['rows_dropped'] == 0
+    assert metrics['rows_per_second'] > 0
+    assert 0 < metrics['mean_commit_latency'] <= metrics['max_commit_latency']
+
+
 def test_missing_keys(dataset):
     """
     Test that we can now have partial results with keys missing. This is for
@@ -1121,6 +1287,35 @@ def test_get_parameter_data_independent_parameters(standalone_parameters_dataset
                           expected_values)
 
 
+@pytest.mark.parametrize("chunk_size", [1, 7, 300, 1000, 5000])
+def test_get_parameter_data_chunks(standalone_parameters_dataset, chunk_size):
+    ds = standalone_parameters_dataset
+    expected = ds.get_parameter_data()
+
+    chunks = list(ds.get_parameter_data_chunks(chunk_size=chunk_size))
+    assert len(chunks) == -(-len(ds) // chunk_size)
+
+    for name, tree in expected.items():
+        for param, values in tree.items():
+            chunk_values = [chunk[name][param] for chunk in chunks
+                            if chunk[name]]
+            np.testing.assert_array_equal(np.concatenate(chunk_values),
+                                          values)
+
+    df_chunks = list(ds.get_data_as_pandas_dataframe_chunks(
+        'param_3', chunk_size=chunk_size))
+    df = ds.get_data_as_pandas_dataframe('param_3')['param_3']
+    pd.testing.assert_frame_equal(
+        pd.concat([dfs['param_3'] for dfs in df_chunks]), df)
+
+
+def test_get_parameter_data_chunks_invalid_chunk_size(
+        standalone_parameters_dataset):
+    with pytest.raises(ValueError, match='chunk_size'):
+        next(standalone_parameters_dataset.get_parameter_data_chunks(
+            chunk_size=0))
+
+
 def parameter_test_helper(ds: DataSet,
                           toplevel_names: Sequence[str],
                           expected_names: Dict[str, Sequence[str]],
@@ -1317,3 +1512,30 @@ def test_write_data_to_text_file_name_exception(tmp_path):
     with pytest.raises(Exception, match='desired file name'):
         dataset.write_data_to_text_file(path=temp_dir, single_file=True,
                                         single_file_name=None)
+
+
+@pytest.mark.usefixtures('experiment')
+def test_write_data_to_text_file_single_file_many_chunks(tmp_path):
+    dataset = new_data_set("dataset")
+    xparam = ParamSpecBase("x", 'numeric')
+    yparam = ParamSpecBase("y", 'numeric')
+    zparam = ParamSpecBase("z", 'numeric')
+    idps = InterDependencies_(dependencies={yparam: (xparam,), zparam: (xparam,)})
+    dataset.set_interdependencies(idps)
+
+    # the results of y and z are in separate rows, hence the chunks in which
+    # the data is written contain different numbers of y and z values
+    n_points = 10001
+    dataset.mark_started()
+    results = []
+    for i in range(n_points):
+        results.append({'x': i, 'y': 2 * i})
+        results.append({'x': i, 'z': 3 * i})
+    dataset.add_results(results)
+    dataset.mark_completed()
+
+    dataset.write_data_to_text_file(path=str(tmp_path), single_file=True,
+                                    single_file_name='yz')
+    with open(os.path.join(str(tmp_path), "yz.dat")) as f:
+        lines = f.readlines()
+    assert lines == [f'{i}\t{2 * i}\t{3 * i}\n' for i in range(n_points)]
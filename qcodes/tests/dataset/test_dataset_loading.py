@@ -14,7 +14,7 @@ from qcodes.dataset.descriptions.param_spec import ParamSpecBase
 from qcodes.dataset.descriptions.dependencies import InterDependencies_
 from qcodes.dataset.data_export import get_data_by_id
 from qcodes.dataset.sqlite.queries import get_guids_from_run_spec
-from qcodes.dataset.experiment_container import new_experiment
+from qcodes.dataset.experiment_container import experiments, new_experiment
 # pylint: disable=unused-import
 from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
                                                       experiment, dataset)
@@ -227,6 +227,37 @@ def test_load_by_guid(some_interdeps):
     assert loaded_ds.the_same_dataset_as(ds)
 
 
+@pytest.mark.usefixtures('experiment')
+def test_closing_a_loaded_dataset_leaves_the_others_usable(some_interdeps):
+    ds = DataSet()
+    ds.set_interdependencies(some_interdeps[1])
+    ds.mark_started()
+    ds.add_results([{'ps1': 1, 'ps2': 2}])
+    ds.mark_completed()
+
+    loaded_ds1 = load_by_id(ds.run_id)
+    loaded_ds2 = load_by_id(ds.run_id)
+    loaded_ds1.conn.close()
+
+    assert loaded_ds2.get_parameter_data()['ps2']['ps2'] == [2]
+    assert len(experiments()[0].data_sets()) == 1
+
+
+@pytest.mark.usefixtures('experiment')
+def test_run_description_is_loaded_lazily(some_interdeps):
+    ds = DataSet()
+    ds.set_interdependencies(some_interdeps[1])
+    ds.mark_started()
+
+    loaded_ds = load_by_id(ds.run_id)
+    assert loaded_ds._parsed_interdeps is None
+
+    assert loaded_ds.description == ds.description
+    interdeps = loaded_ds._parsed_interdeps
+    assert interdeps == some_interdeps[1]
+    assert loaded_ds.description.interdeps is interdeps
+
+
 def test_load_by_run_spec(empty_temp_db, some_interdeps):
 
     def create_ds_with_exp_id(exp_id):
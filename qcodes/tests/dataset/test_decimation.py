@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from qcodes.dataset.decimation import (MinMaxDecimator, block_average_2D,
+                                       decimate_min_max)
+
+
+def _trace(n_points, seed=0):
+    rng = np.random.RandomState(seed)
+    x = np.linspace(0, 1, n_points)
+    y = np.sin(20 * x) + 0.1 * rng.randn(n_points)
+    return x, y
+
+
+def test_min_max_keeps_envelope_and_spikes():
+    x, y = _trace(10**5)
+    y[12345] = 10
+    y[54321] = -10
+
+    x_dec, y_dec = decimate_min_max(x, y, n_bins=100)
+
+    assert len(x_dec) <= 200
+    assert np.all(np.diff(x_dec) >= 0)
+    assert y_dec.max() == 10
+    assert y_dec.min() == -10
+    assert x_dec[np.argmax(y_dec)] == x[12345]
+
+    # the minimum and the maximum of each bin are kept
+    bins = np.minimum((x * 100).astype(int), 99)
+    for b in (0, 37, 99):
+        in_bin = bins == b
+        in_bin_dec = np.minimum((x_dec * 100).astype(int), 99) == b
+        assert y_dec[in_bin_dec].max() == y[in_bin].max()
+        assert y_dec[in_bin_dec].min() == y[in_bin].min()
+
+
+def test_min_max_chunks_agree_with_single_chunk():
+    x, y = _trace(10**4)
+    order = np.random.RandomState(1).permutation(len(x))
+    x, y = x[order], y[order]
+
+    single = decimate_min_max(x, y, n_bins=50, chunk_size=len(x))
+    chunked = decimate_min_max(x, y, n_bins=50, chunk_size=333)
+    for result, reference in zip(chunked, single):
+        np.testing.assert_array_equal(result, reference)
+
+    decimator = MinMaxDecimator(n_bins=50, x_range=(x.min(), x.max()))
+    for start in range(0, len(x), 1000):
+        decimator.add(x[start:start + 1000], y[start:start + 1000])
+    for result, reference in zip(decimator.result(), single):
+        np.testing.assert_array_equal(result, reference)
+
+
+def test_min_max_leaves_out_nan_and_single_points():
+    x = np.array([0., 1., 2., np.nan, 4.])
+    y = np.array([1., np.nan, 3., 4., 5.])
+
+    x_dec, y_dec = decimate_min_max(x, y, n_bins=5)
+
+    np.testing.assert_array_equal(x_dec, [0, 2, 4])
+    np.testing.assert_array_equal(y_dec, [1, 3, 5])
+
+    x_empty, y_empty = decimate_min_max(np.array([np.nan]),
+                                        np.array([1.]), n_bins=5)
+    assert len(x_empty) == len(y_empty) == 0
+
+    with pytest.raises(ValueError):
+        MinMaxDecimator(n_bins=0, x_range=(0, 1))
+
+
+def test_block_average_leaves_out_nan():
+    xrow = np.array([0., 1., 2., 3.])
+    yrow = np.array([0., 1., 2.])
+    z = np.arange(12, dtype=float).reshape(3, 4)
+    z[0, 0] = np.nan
+    z[2, 2:] = np.nan
+
+    x_avg, y_avg, z_avg = block_average_2D(xrow, yrow, z, max_pixels=4)
+
+    np.testing.assert_array_equal(x_avg, [0.5, 2.5])
+    np.testing.assert_array_equal(y_avg, [0.5, 2])
+    np.testing.assert_allclose(z_avg, [[(1 + 4 + 5) / 3, (2 + 3 + 6 + 7) / 4],
+                                       [(8 + 9) / 2, np.nan]])
+
+
+def test_block_average_chunks_and_small_maps():
+    rng = np.random.RandomState(0)
+    xrow = np.linspace(0, 1, 301)
+    yrow = np.linspace(-1, 1, 199)
+    z = rng.rand(len(yrow), len(xrow))
+    z[rng.rand(*z.shape) < 0.1] = np.nan
+
+    single = block_average_2D(xrow, yrow, z, max_pixels=1000,
+                              chunk_size=z.size)
+    chunked = block_average_2D(xrow, yrow, z, max_pixels=1000,
+                               chunk_size=1000)
+    assert single[2].size <= 1000
+    for result, reference in zip(chunked, single):
+        np.testing.assert_array_equal(result, reference)
+
+    unchanged = block_average_2D(xrow, yrow, z, max_pixels=z.size)
+    assert unchanged[2] is z
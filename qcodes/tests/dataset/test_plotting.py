@@ -1,3 +1,4 @@
+import matplotlib.pyplot as plt
 import numpy as np
 from hypothesis import given, example, assume, settings, HealthCheck
 from hypothesis.strategies import text, sampled_from, floats, lists, data, \
@@ -243,3 +244,42 @@ def test__complex_to_real_preparser_complex_setpoint():
     assert measured_param['label'] == 'measured voltage'
     assert measured_param['unit'] == 'V'
     assert all(measured_param['data'] == np.array([0, 1, 2]))
+
+
+def test_plot_by_id_level_of_detail(experiment):
+    """
+    Test that large line plots and heatmaps are decimated, unless the full
+    resolution is asked for
+    """
+    meas = Measurement()
+    meas.register_custom_parameter('x')
+    meas.register_custom_parameter('y')
+    meas.register_custom_parameter('line', setpoints=('x',))
+    meas.register_custom_parameter('map', setpoints=('x', 'y'))
+
+    n_points = 1000
+    x = np.linspace(0, 1, n_points)
+    xx, yy = (a.ravel() for a in np.meshgrid(x[::10], x[::10]))
+    with meas.run() as datasaver:
+        datasaver.add_result(('x', x), ('line', np.sin(10 * x)))
+        datasaver.add_result(('x', xx), ('y', yy), ('map', xx * yy))
+
+    max_line_points = qc.config.plotting.level_of_detail.max_line_points
+    max_map_pixels = qc.config.plotting.level_of_detail.max_map_pixels
+    try:
+        qc.config.plotting.level_of_detail.max_line_points = 100
+        qc.config.plotting.level_of_detail.max_map_pixels = 2500
+
+        axes, _ = plot_by_id(datasaver.run_id)
+        line_x = axes[0].lines[0].get_xdata()
+        assert len(line_x) <= 100
+        assert np.all(np.diff(line_x) >= 0)
+        assert axes[1].collections[0].get_array().size == 50 * 50
+
+        axes, _ = plot_by_id(datasaver.run_id, level_of_detail=False)
+        assert len(axes[0].lines[0].get_xdata()) == n_points
+        assert axes[1].collections[0].get_array().size == 100 * 100
+    finally:
+        qc.config.plotting.level_of_detail.max_line_points = max_line_points
+        qc.config.plotting.level_of_detail.max_map_pixels = max_map_pixels
+        plt.close('all')
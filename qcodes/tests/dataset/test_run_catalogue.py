@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from qcodes import new_data_set, new_experiment
+from qcodes.dataset.guids import parse_guid
+from qcodes.dataset.run_catalogue import RunSummary, search_runs
+from qcodes.dataset.sqlite.connection import atomic_transaction
+from qcodes.dataset.sqlite.settings import SQLiteSettings
+# pylint: disable=unused-import
+from qcodes.tests.dataset.temporary_databases import (empty_temp_db,
+                                                      experiment)
+# pylint: enable=unused-import
+
+
+@pytest.fixture
+def runs(empty_temp_db):
+    exp1 = new_experiment('exp1', sample_name='sample1')
+    datasets = [new_data_set(f'run{i}', exp_id=exp1.exp_id)
+                for i in range(3)]
+    exp2 = new_experiment('exp2', sample_name='sample2')
+    datasets += [new_data_set(f'run{i}', exp_id=exp2.exp_id)
+                 for i in range(2)]
+    try:
+        yield datasets
+    finally:
+        exp1.conn.close()
+        exp2.conn.close()
+
+
+def test_search_all_runs(runs):
+    summaries = search_runs()
+    assert [summary.guid for summary in summaries] \
+        == [ds.guid for ds in runs]
+
+    summary = summaries[3]
+    assert isinstance(summary, RunSummary)
+    assert summary.run_id == runs[3].run_id
+    assert summary.captured_run_id == runs[3].captured_run_id
+    assert summary.captured_counter == 1
+    assert summary.name == 'run0'
+    assert summary.exp_name == 'exp2'
+    assert summary.sample_name == 'sample2'
+    assert summary.run_timestamp is None
+    assert summary.is_completed is False
+    assert summary.guid_components == parse_guid(runs[3].guid)
+
+
+def test_search_runs_by_specification(runs):
+    assert [s.run_id for s in search_runs(experiment_name='exp1')] \
+        == [1, 2, 3]
+    assert [s.run_id for s in search_runs(sample_name='sample2')] == [4, 5]
+    assert [s.run_id for s in search_runs(captured_counter=2)] == [2, 5]
+    assert [s.run_id for s in search_runs(captured_counter=2,
+                                          exp_id=2)] == [5]
+    assert [s.run_id for s in search_runs(captured_run_id=3)] == [3]
+    assert search_runs(experiment_name='exp1', sample_name='sample2') == []
+
+    guids = [runs[4].guid, runs[0].guid, 'not-a-guid']
+    assert [s.run_id for s in search_runs(guids=guids)] == [1, 5]
+    assert search_runs(guids=[]) == []
+
+
+def test_search_runs_by_start_time(runs):
+    runs[0].mark_started()
+    t_start = runs[0].run_timestamp_raw
+    time.sleep(0.01)
+    runs[1].mark_started()
+
+    assert [s.run_id for s in search_runs(started_after=t_start)] == [1, 2]
+    assert [s.run_id for s in search_runs(started_after=t_start + 0.005)] \
+        == [2]
+    assert [s.run_id for s in search_runs(started_before=t_start)] == [1]
+
+
+def test_search_runs_by_metadata(runs):
+    runs[1].add_metadata('cooldown', 'cd1')
+    runs[2].add_metadata('cooldown', 'cd2')
+    runs[3].add_metadata('cooldown', 'cd1')
+
+    assert [s.run_id for s in search_runs(metadata={'cooldown': 'cd1'})] \
+        == [2, 4]
+    assert [s.run_id for s in search_runs(metadata={'cooldown': 'cd1'},
+                                          sample_name='sample1')] == [2]
+    assert search_runs(metadata={'no_such_tag': 1}) == []
+
+    # metadata columns are indexed
+    conn = runs[0].conn
+    index_names = [row['name'] for row in
+                   atomic_transaction(conn, "PRAGMA index_list(runs)")]
+    assert 'IX_runs_metadata_cooldown' in index_names
+
+
+def test_search_more_guids_than_variables(experiment, monkeypatch):
+    monkeypatch.setitem(SQLiteSettings.limits, 'MAX_VARIABLE_NUMBER', 3)
+    datasets = [new_data_set(f'run{i}') for i in range(5)]
+    guids = [ds.guid for ds in reversed(datasets)]
+    summaries = search_runs(guids=guids, exp_id=experiment.exp_id)
+    assert [s.run_id for s in summaries] == [1, 2, 3, 4, 5]
@@ -3,6 +3,10 @@ import json
 import numpy
 import pytest
 
+from qcodes import new_data_set
+from qcodes.dataset.data_set import load_by_id
+from qcodes.dataset.sqlite.connection import atomic_transaction
+from qcodes.dataset.sqlite.queries import get_snapshot_storage_info
 from qcodes.instrument.parameter import ManualParameter
 from qcodes.tests.instrument_mocks import DummyInstrument
 from qcodes.dataset.measurements import Measurement
@@ -108,3 +112,77 @@ def test_snapshot_creation_for_types_not_supported_by_builtin_json(experiment):
 
     assert False is snapshot['station']['parameters']['p_np_bool']['value']
     assert False is snapshot['station']['parameters']['p_np_bool']['raw_value']
+
+
+@pytest.mark.usefixtures('set_default_station_to_none')
+def test_get_snapshot_value(experiment, dac):
+    p_bool = ManualParameter('p_bool', initial_value=True)
+    station = Station(dac, p_bool)
+
+    measurement = Measurement(experiment, station)
+    measurement.register_parameter(dac.ch1)
+
+    with measurement.run() as data_saver:
+        dac.ch1(3.5)
+        data_saver.add_result((dac.ch1, dac.ch1()))
+
+    dataset = load_by_id(data_saver.run_id)
+    expected = json.loads(dataset.snapshot_raw)
+    dac_path = ('station', 'instruments', 'dummy_dac')
+
+    # the snapshot is not parsed to get a single value
+    assert dataset.get_snapshot_value(*dac_path, 'parameters', 'ch1',
+                                      'unit') == 'V'
+    assert dataset.get_snapshot_value('station', 'parameters', 'p_bool',
+                                      'value') is True
+    assert dataset.get_snapshot_value(*dac_path, 'parameters') \
+        == expected['station']['instruments']['dummy_dac']['parameters']
+    assert dataset._snapshot is None
+    with pytest.raises(KeyError):
+        dataset.get_snapshot_value(*dac_path, 'parameters', 'ch3')
+
+    # once parsed, the snapshot is reused
+    snapshot = dataset.snapshot
+    assert snapshot == expected
+    assert dataset.snapshot is snapshot
+    assert dataset.get_snapshot_value(*dac_path, 'parameters', 'ch1',
+                                      'unit') == 'V'
+    with pytest.raises(KeyError):
+        dataset.get_snapshot_value(*dac_path, 'parameters', 'ch3')
+
+    dataset.add_snapshot(json.dumps({'station': {}}), overwrite=True)
+    assert dataset.snapshot == {'station': {}}
+
+
+def test_get_snapshot_value_without_snapshot(experiment):
+    dataset = new_data_set('no_snapshot')
+    assert dataset.snapshot is None
+    with pytest.raises(KeyError):
+        dataset.get_snapshot_value('station')
+
+
+def test_identical_snapshots_are_stored_once(experiment):
+    snapshot = json.dumps({'station': {'parameters': {'p': 1}}})
+    other_snapshot = json.dumps({'station': {}})
+    datasets = [new_data_set(f'run_{i}') for i in range(3)]
+    for dataset in datasets:
+        dataset.add_snapshot(snapshot)
+
+    conn = datasets[0].conn
+    info = get_snapshot_storage_info(conn)
+    assert info['runs_with_snapshot'] == 3
+    assert info['distinct_snapshots'] == 1
+    assert info['stored_bytes'] == len(snapshot)
+    assert info['saved_bytes'] == 2 * len(snapshot)
+
+    for dataset in datasets:
+        loaded = load_by_id(dataset.run_id)
+        assert loaded.snapshot_raw == snapshot
+        assert loaded.get_metadata('snapshot') == snapshot
+        assert loaded.get_snapshot_value('station', 'parameters', 'p') == 1
+
+    # a snapshot that is no longer used by any run is removed
+    for dataset in datasets:
+        dataset.add_snapshot(other_snapshot, overwrite=True)
+    c = atomic_transaction(conn, "SELECT snapshot FROM snapshots")
+    assert [row['snapshot'] for row in c.fetchall()] == [other_snapshot]
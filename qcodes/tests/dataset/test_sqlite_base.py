@@ -373,3 +373,63 @@ def test_set_run_timestamp(experiment):
                                 "been set"))
 
     ds.conn.close()
+
+
+@pytest.mark.parametrize('array', (np.linspace(0, 1, 11),
+                                   np.arange(12).reshape(3, 4).T,
+                                   np.array(2.5),
+                                   np.zeros((0, 3)),
+                                   np.array(['a', 'bcd']),
+                                   np.array([1 + 2j], dtype=np.complex64),
+                                   np.array([1, 2], dtype='>i4')))
+def test_array_adapter_roundtrip(array):
+    blob = bytes(mut_db._adapt_array(array))
+    assert blob.startswith(mut_db._ARRAY_MAGIC)
+
+    converted = mut_db._convert_array(blob)
+    assert converted.dtype == array.dtype
+    assert converted.shape == array.shape
+    np.testing.assert_array_equal(converted, array)
+    # the array owns its data, as arrays loaded with np.load do
+    assert converted.flags.writeable
+    assert converted.flags.owndata
+
+
+def test_array_converter_reads_npy_format():
+    array = np.linspace(0, 1, 11).reshape(11, 1)
+    blob = bytes(mut_db._adapt_array_npy(array))
+    assert blob.startswith(mut_db._NPY_MAGIC)
+    np.testing.assert_array_equal(mut_db._convert_array(blob), array)
+
+    complex_blob = bytes(mut_db._adapt_array_npy(np.array([1 - 1j])))
+    assert mut_db._convert_complex(complex_blob) == 1 - 1j
+
+
+def test_array_converter_unknown_version():
+    blob = bytearray(mut_db._adapt_array(np.arange(3)))
+    blob[len(mut_db._ARRAY_MAGIC)] = mut_db._ARRAY_FORMAT_VERSION + 1
+    with pytest.raises(RuntimeError, match='Unknown binary array format'):
+        mut_db._convert_array(bytes(blob))
+
+
+def test_legacy_npy_blobs_are_loaded(experiment):
+    """
+    Test that arrays and complex numbers written in the .npy format by older
+    versions of QCoDeS can be loaded
+    """
+    x = ParamSpec('x', 'array')
+    z = ParamSpec('z', 'complex')
+    ds = DataSet(specs=[x, z])
+    ds.mark_started()
+
+    array = np.linspace(0, 1, 5)
+    mut_conn.atomic_transaction(
+        ds.conn,
+        f'INSERT INTO "{ds.table_name}" (x, z) VALUES (?, ?)',
+        mut_db._adapt_array_npy(array),
+        mut_db._adapt_array_npy(np.array([1 + 1j])))
+    ds.add_results([{'x': array, 'z': 2 + 2j}])
+
+    data = ds.get_parameter_data()
+    np.testing.assert_array_equal(data['x']['x'], np.array([array, array]))
+    np.testing.assert_array_equal(data['z']['z'], [1 + 1j, 2 + 2j])
@@ -1,11 +1,15 @@
 import re
 import sqlite3
+import threading
+from unittest.mock import patch
 
 import pytest
 
 from qcodes.dataset.sqlite.connection import ConnectionPlus, \
     make_connection_plus_from, atomic, atomic_transaction
-from qcodes.dataset.sqlite.database import connect
+from qcodes.dataset.sqlite import database
+from qcodes.dataset.sqlite.database import (connect, get_pooled_connection,
+                                            close_connection_pool)
 from qcodes.tests.common import error_caused_by
 
 
@@ -330,3 +334,80 @@ def test_connect():
     assert False is conn.atomic_in_progress
 
     assert sqlite3.Row is conn.row_factory
+
+
+def test_pooled_connection_is_reused_per_thread(tmp_path):
+    path = str(tmp_path / 'pooled.db')
+    try:
+        conn = get_pooled_connection(path)
+        assert isinstance(conn, ConnectionPlus)
+        other_handle = get_pooled_connection(path)
+        assert other_handle.__wrapped__ is conn.__wrapped__
+
+        other_conns = []
+        thread = threading.Thread(
+            target=lambda: other_conns.append(get_pooled_connection(path)))
+        thread.start()
+        thread.join()
+        assert other_conns[0].__wrapped__ is not conn.__wrapped__
+
+        # closing a handle does not close the connection of the others
+        conn.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+        other_handle.execute('SELECT 1')
+        assert get_pooled_connection(path).__wrapped__ \
+            is other_handle.__wrapped__
+    finally:
+        close_connection_pool()
+
+
+def test_pooled_connection_handles_share_atomic_blocks(tmp_path):
+    path = str(tmp_path / 'pooled.db')
+    try:
+        conn = get_pooled_connection(path)
+        other_handle = get_pooled_connection(path)
+        with atomic(conn):
+            assert other_handle.atomic_in_progress
+            with atomic(other_handle):
+                other_handle.execute('CREATE TABLE t (x INTEGER)')
+        assert not conn.atomic_in_progress
+    finally:
+        close_connection_pool()
+
+
+def test_pooled_connection_skips_upgrade_after_first_open(tmp_path):
+    path = str(tmp_path / 'pooled.db')
+    try:
+        get_pooled_connection(path)
+        close_connection_pool(path)
+        get_pooled_connection(path)
+
+        # the pool remembers that the database has been upgraded
+        with patch.object(database, 'perform_db_upgrade') as upgrade:
+            thread = threading.Thread(target=get_pooled_connection,
+                                      args=(path,))
+            thread.start()
+            thread.join()
+        upgrade.assert_not_called()
+    finally:
+        close_connection_pool()
+
+
+def test_close_connection_pool(tmp_path):
+    path = str(tmp_path / 'pooled.db')
+    conn = get_pooled_connection(path)
+    other_conn = get_pooled_connection(str(tmp_path / 'other.db'))
+
+    close_connection_pool(path)
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute('SELECT 1')
+    other_conn.execute('SELECT 1')
+
+    close_connection_pool()
+    with pytest.raises(sqlite3.ProgrammingError):
+        other_conn.execute('SELECT 1')
+    new_conn = get_pooled_connection(str(tmp_path / 'other.db'))
+    new_conn.execute('SELECT 1')
+
+    close_connection_pool()
@@ -3,8 +3,10 @@ from typing import List, Tuple, Dict, Union
 from numbers import Number
 
 import pytest
+import numpy as np
 from numpy import ndarray
 import logging
+import time
 
 import qcodes
 from qcodes.dataset.descriptions.param_spec import ParamSpecBase
@@ -214,3 +216,61 @@ def test_subscription_from_config_wrong_name(dataset):
         assert 'test_subscriber' not in qcodes.config.subscription.subscribers
         with pytest.raises(RuntimeError):
             sub_id_c = dataset.subscribe_from_config('test_subscriber')
+
+
+def test_columnar_subscription(dataset):
+    xparam = ParamSpecBase(name='x', paramtype='numeric')
+    yparam = ParamSpecBase(name='y', paramtype='numeric')
+    zparam = ParamSpecBase(name='z', paramtype='text')
+    idps = InterDependencies_(dependencies={yparam: (xparam,)},
+                              standalones=(zparam,))
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    def subscriber(results, length, state):
+        state.append((results, length))
+
+    state = []
+    dataset.subscribe(subscriber, min_count=4, state=state, columnar=True)
+
+    dataset.add_columnar_results([{'x': np.arange(3), 'y': -np.arange(3)},
+                                  {'z': ['a']}])
+    dataset.mark_completed()
+
+    assert len(state) == 1
+    results, length = state[0]
+    assert length == 4
+    assert list(results) == ['x', 'y', 'z']
+    np.testing.assert_array_equal(results['x'][:3], np.arange(3))
+    np.testing.assert_array_equal(results['y'][:3], -np.arange(3))
+    assert list(results['z']) == [None, None, None, 'a']
+
+    # no triggers are used to feed the subscribers
+    get_triggers_sql = "SELECT * FROM sqlite_master WHERE TYPE = 'trigger';"
+    assert atomic_transaction(dataset.conn, get_triggers_sql).fetchall() == []
+
+
+def test_subscription_back_pressure(dataset):
+    """
+    Test that a slow subscriber with max_count set never has more than
+    max_count results pending
+    """
+    xparam = ParamSpecBase(name='x', paramtype='numeric')
+    idps = InterDependencies_(standalones=(xparam,))
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    def slow_subscriber(results, length, state):
+        time.sleep(0.01)
+        state.append(results)
+
+    state = []
+    dataset.subscribe(slow_subscriber, min_count=1, max_count=2,
+                      state=state)
+
+    for x in range(20):
+        dataset.add_results([{'x': x}])
+    dataset.mark_completed()
+
+    assert max(len(results) for results in state) <= 2
+    assert [row[0] for results in state for row in results] == list(range(20))
@@ -6,9 +6,10 @@ from typing import Sequence, Dict, Optional
 import numpy as np
 
 from qcodes.instrument.base import Instrument, InstrumentBase
-from qcodes.utils.validators import Numbers, Arrays, Strings, ComplexNumbers
+from qcodes.utils.validators import Numbers, Ints, Arrays, Strings, \
+    ComplexNumbers
 from qcodes.instrument.parameter import MultiParameter, Parameter, \
-    ArrayParameter, ParameterWithSetpoints
+    ArrayParameter, ParameterWithSetpoints, HardwareSweepSetpoints
 from qcodes.instrument.channel import InstrumentChannel, ChannelList
 import random
 
@@ -224,6 +225,20 @@ class DummyChannel(InstrumentChannel):
         self.add_function(name='log_my_name',
                           call_cmd=partial(log.debug, f'{name}'))
 
+    # The temperatures of all channels are gotten and set in bulk. As the
+    # dummy channels keep their values in the caches of their parameters,
+    # this takes no communication at all.
+
+    @classmethod
+    def bulk_get_raw(cls, channels, param_name):
+        if param_name != 'temperature':
+            return None
+        return [chan.temperature.cache.raw_value for chan in channels]
+
+    @classmethod
+    def bulk_set_raw(cls, channels, param_name, raw_values):
+        return param_name == 'temperature'
+
 
 class DummyChannelInstrument(Instrument):
     """
@@ -241,6 +256,81 @@ class DummyChannelInstrument(Instrument):
         self.add_submodule("channels", channels)
 
 
+class DummyBufferedInstrument(Instrument):
+    """
+    Dummy instrument that sweeps a voltage by itself and acquires a trace of
+    a current into a buffer, as a DMM with a trigger count or a lock-in
+    amplifier with a buffer does. The current is ``offset + voltage**2``.
+
+    Arming the sweep acquires a trace, and getting the ``trace`` fetches it,
+    after which the buffer is empty. The arms and fetches are counted in
+    ``n_arms`` and ``n_fetches``.
+    """
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+
+        self.n_arms = 0
+        self.n_fetches = 0
+        self._buffer = None
+
+        self.add_parameter('offset',
+                           initial_value=0,
+                           unit='A',
+                           vals=Numbers(),
+                           get_cmd=None,
+                           set_cmd=None)
+
+        self.add_parameter('sweep_start',
+                           initial_value=0,
+                           unit='V',
+                           vals=Numbers(),
+                           get_cmd=None,
+                           set_cmd=None)
+
+        self.add_parameter('sweep_stop',
+                           initial_value=1,
+                           unit='V',
+                           vals=Numbers(),
+                           get_cmd=None,
+                           set_cmd=None)
+
+        self.add_parameter('sweep_n_points',
+                           initial_value=10,
+                           vals=Ints(1, 10**6),
+                           get_cmd=None,
+                           set_cmd=None)
+
+        self.add_parameter('sweep_axis',
+                           label='Voltage',
+                           unit='V',
+                           parameter_class=HardwareSweepSetpoints,
+                           start=self.sweep_start,
+                           stop=self.sweep_stop,
+                           num_points=self.sweep_n_points,
+                           arm_cmd=self._arm)
+
+        self.add_parameter('trace',
+                           label='Current',
+                           unit='A',
+                           setpoints=(self.sweep_axis,),
+                           vals=Arrays(shape=(self.sweep_n_points,)),
+                           get_cmd=self._fetch,
+                           parameter_class=ParameterWithSetpoints)
+
+    def _arm(self):
+        self.n_arms += 1
+        self._buffer = self.offset() + self.sweep_axis() ** 2
+
+    def _fetch(self):
+        if self._buffer is None:
+            raise RuntimeError('The buffer is empty, the sweep has to be '
+                               'armed before every trace')
+        self.n_fetches += 1
+        trace, self._buffer = self._buffer, None
+        return trace
+
+
 class MultiGetter(MultiParameter):
     """
     Test parameters with complicated return values
@@ -0,0 +1,212 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from qcodes.instrument.base import Instrument
+from qcodes.instrument.ip import IPInstrument
+from qcodes.instrument.parameter import Parameter
+from qcodes.utils.asyncio_helpers import (gather_get, get_concurrently,
+                                          run_coroutine)
+from qcodes.utils.validators import Numbers
+from .test_visa import MockVisa
+
+
+RESPONSE_DELAY = 0.2
+
+
+class _Responder:
+    """
+    A local TCP server that stands in for an instrument. It answers
+    ``VOLT?`` with the voltage after ``RESPONSE_DELAY`` seconds and sets the
+    voltage on ``VOLT <value>``, which it confirms with ``OK``. Every
+    connection has a voltage of its own.
+    """
+
+    def __init__(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(5)
+        self.port = self.server.getsockname()[1]
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,),
+                             daemon=True).start()
+
+    def _serve(self, conn):
+        volt = 0.0
+        buffer = b''
+        with conn:
+            while True:
+                data = conn.recv(1024)
+                if not data:
+                    return
+                buffer += data
+                while b'\n' in buffer:
+                    line, buffer = buffer.split(b'\n', 1)
+                    command = line.decode()
+                    if command == 'VOLT?':
+                        with self._lock:
+                            self._in_flight += 1
+                            self.max_in_flight = max(self.max_in_flight,
+                                                     self._in_flight)
+                        time.sleep(RESPONSE_DELAY)
+                        with self._lock:
+                            self._in_flight -= 1
+                        conn.sendall(f'{volt}\n'.encode())
+                    elif command.startswith('VOLT '):
+                        volt = float(command.split(' ')[1])
+                        conn.sendall(b'OK\n')
+
+    def close(self):
+        self.server.close()
+
+
+class _SocketInstrument(IPInstrument):
+
+    def __init__(self, name, port, **kwargs):
+        super().__init__(name, address='127.0.0.1', port=port,
+                         terminator='\n', **kwargs)
+        self.add_parameter('volt', get_cmd='VOLT?', set_cmd='VOLT {}',
+                           get_parser=float, vals=Numbers(-10, 10))
+
+
+class _ShoutingInstrument(_SocketInstrument):
+    """An instrument whose ``ask`` transforms the command"""
+
+    def ask(self, cmd):
+        return super().ask(cmd.upper())
+
+
+@pytest.fixture
+def responder():
+    server = _Responder()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def socket_instruments(responder):
+    instruments = [_SocketInstrument(f'socket_instrument_{i}', responder.port)
+                   for i in range(2)]
+    yield instruments
+    for instrument in instruments:
+        instrument.close()
+
+
+def test_ask_and_write_async(socket_instruments):
+    instrument = socket_instruments[0]
+
+    async def talk():
+        await instrument.write_async('VOLT 1.5')
+        return await instrument.ask_async('VOLT?')
+
+    assert run_coroutine(talk()) == '1.5\n'
+    # the socket is blocking again afterwards
+    assert instrument.ask('VOLT?') == '1.5\n'
+
+
+def test_get_and_set_async(socket_instruments):
+    volt = socket_instruments[0].volt
+
+    run_coroutine(volt.set_async(2.5))
+    assert volt.cache.get(get_if_invalid=False) == 2.5
+    assert run_coroutine(volt.get_async()) == 2.5
+    assert volt.get() == 2.5
+
+    with pytest.raises(ValueError):
+        run_coroutine(volt.set_async(20))
+
+
+def test_get_concurrently_overlaps_instruments(responder,
+                                               socket_instruments):
+    volts = [instrument.volt for instrument in socket_instruments]
+    for i, volt in enumerate(volts):
+        volt.set(i)
+
+    t0 = time.perf_counter()
+    assert get_concurrently(volts) == [0, 1]
+    duration = time.perf_counter() - t0
+
+    assert responder.max_in_flight == 2
+    assert duration < 2 * RESPONSE_DELAY
+
+
+def test_get_async_serialises_one_instrument(responder, socket_instruments):
+    volt = socket_instruments[0].volt
+    volt.set(3)
+
+    async def read_twice():
+        return await gather_get(volt, volt)
+
+    assert run_coroutine(read_twice()) == [3, 3]
+    assert responder.max_in_flight == 1
+
+
+def test_overridden_ask_is_used(responder):
+    instrument = _ShoutingInstrument('shouting_instrument', responder.port)
+    try:
+        instrument.volt.set(4)
+        assert run_coroutine(instrument.ask_async('volt?')) == '4.0\n'
+        assert run_coroutine(instrument.volt.get_async()) == 4
+    finally:
+        instrument.close()
+
+
+def test_run_coroutine_in_running_loop(socket_instruments):
+    volt = socket_instruments[0].volt
+    volt.set(5)
+
+    async def outer():
+        # as in a jupyter notebook, a loop is already running
+        return get_concurrently([volt])
+
+    assert run_coroutine(outer()) == [5]
+
+
+def test_visa_get_and_set_async():
+    instrument = MockVisa('mock_visa_async', address='Joe')
+    try:
+        run_coroutine(instrument.state.set_async(6))
+        assert instrument.visa_handle.state == 6
+        assert run_coroutine(instrument.state.get_async()) == 6
+
+        with pytest.raises(ValueError) as excinfo:
+            run_coroutine(instrument.state.set_async(-1))
+        assert "writing 'STAT:-1.000' to <MockVisa: mock_visa_async>" \
+            in excinfo.value.args
+    finally:
+        instrument.close()
+
+
+def test_get_async_of_parameter_without_command_string():
+    values = iter(range(3))
+    parameter = Parameter('counter', get_cmd=lambda: next(values),
+                          set_cmd=None)
+
+    assert run_coroutine(gather_get(parameter)) == [0]
+    run_coroutine(parameter.set_async(7))
+    assert parameter.cache.get(get_if_invalid=False) == 7
+
+    not_gettable = Parameter('not_gettable', set_cmd=None, get_cmd=False)
+    with pytest.raises(NotImplementedError):
+        run_coroutine(not_gettable.get_async())
+
+
+def test_get_async_of_instrument_without_async_io():
+    instrument = Instrument('plain_instrument')
+    try:
+        instrument.add_parameter('value', get_cmd=lambda: 8, set_cmd=None)
+        assert get_concurrently([instrument.value]) == [8]
+    finally:
+        instrument.close()
@@ -11,7 +11,8 @@ import pytest
 from qcodes.tests.instrument_mocks import DummyChannelInstrument, DummyChannel
 from qcodes.utils.validators import Numbers
 from qcodes.instrument.parameter import Parameter
-from qcodes.instrument.channel import ChannelList
+from qcodes.instrument.base import Instrument
+from qcodes.instrument.channel import ChannelList, InstrumentChannel
 from qcodes.loops import Loop
 
 
@@ -37,6 +38,97 @@ def test_channels_call_function(dci, caplog):
         assert mssgs == names
 
 
+class _BulkChannel(InstrumentChannel):
+
+    def __init__(self, parent, name, index):
+        super().__init__(parent, name)
+        self.index = index
+        self.add_parameter('v', get_cmd=f'V{index}?', set_cmd=f'V{index} {{}}',
+                           get_parser=float, scale=2, vals=Numbers(-1, 1))
+        self.add_parameter('i', get_cmd=f'I{index}?', get_parser=float)
+
+    @classmethod
+    def bulk_get_raw(cls, channels, param_name):
+        if param_name != 'v':
+            return None
+        values = channels[0].ask('V?').split(',')
+        return [values[chan.index] for chan in channels]
+
+    @classmethod
+    def bulk_set_raw(cls, channels, param_name, raw_values):
+        channels[0].write(';'.join(f'V{chan.index} {value}'
+                                   for chan, value in zip(channels, raw_values)))
+        return True
+
+
+class _BulkInstrument(Instrument):
+    """An instrument whose channel voltages are gotten with one query"""
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self.commands = []
+        channels = ChannelList(self, 'channels', _BulkChannel)
+        for index in range(4):
+            channels.append(_BulkChannel(self, f'ch{index}', index))
+        channels.lock()
+        self.add_submodule('channels', channels)
+
+    def write_raw(self, cmd):
+        self.commands.append(cmd)
+
+    def ask_raw(self, cmd):
+        self.commands.append(cmd)
+        if cmd == 'V?':
+            return '0.2,0.4,0.6,0.8'
+        return '1'
+
+
+@pytest.fixture
+def bulk_instrument():
+    inst = _BulkInstrument('bulk')
+    yield inst
+    inst.close()
+
+
+def test_channels_bulk_get(bulk_instrument):
+    channels = bulk_instrument.channels
+
+    assert channels.v.get() == (0.1, 0.2, 0.3, 0.4)
+    assert bulk_instrument.commands == ['V?']
+    assert channels[2].v.cache.get(get_if_invalid=False) == 0.3
+    assert channels[2].v.cache.raw_value == '0.6'
+
+    assert channels[1:3].v.get() == (0.2, 0.3)
+    assert channels.i.get() == (1, 1, 1, 1)
+    assert bulk_instrument.commands == ['V?', 'V?', 'I0?', 'I1?', 'I2?',
+                                        'I3?']
+
+
+def test_channels_bulk_set(bulk_instrument):
+    channels = bulk_instrument.channels
+
+    channels.v.set(0.5)
+    assert bulk_instrument.commands == ['V0 1.0;V1 1.0;V2 1.0;V3 1.0']
+    assert channels[3].v.cache.get(get_if_invalid=False) == 0.5
+
+    # the values are validated before anything is sent
+    with pytest.raises(ValueError):
+        channels.v.set(2)
+    assert len(bulk_instrument.commands) == 1
+
+    # channels that ramp are set one by one
+    channels[0].v.step = 1
+    channels.v.set(0.25)
+    assert bulk_instrument.commands[1:] == ['V0 0.5', 'V1 0.5', 'V2 0.5',
+                                            'V3 0.5']
+
+
+def test_dummy_channels_bulk_get_and_set(dci):
+    dci.channels.temperature.set(12)
+    assert dci.channels.temperature.get() == (12,) * 6
+    assert dci.C.temperature.get() == 12
+
+
 class TestChannels(TestCase):
 
     def setUp(self):
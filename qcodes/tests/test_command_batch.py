@@ -0,0 +1,217 @@
+import threading
+
+import pytest
+
+from qcodes.instrument.channel import InstrumentChannel
+from qcodes.instrument.visa import VisaInstrument
+from qcodes.utils.validators import Numbers
+
+
+class SCPIVisaHandle:
+    """
+    A visa handle that records the messages it receives, and understands
+    messages of several SCPI commands and queries joined by semicolons,
+    such as ``:CH1:VOLT 0.1;:CH1:VOLT?``
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.values = {}
+
+    def _execute(self, message):
+        responses = []
+        for command in message.split(';'):
+            header, _, argument = command.lstrip(':').partition(' ')
+            if header.endswith('?'):
+                responses.append(self.values.get(header[:-1], '0'))
+            else:
+                self.values[header] = argument
+        return responses
+
+    def write(self, message):
+        self.messages.append(message)
+        self._execute(message)
+        return len(message), 0
+
+    def query(self, message):
+        self.messages.append(message)
+        return ';'.join(self._execute(message))
+
+    def clear(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SCPIChannel(InstrumentChannel):
+
+    def __init__(self, parent, name):
+        super().__init__(parent, name)
+        self.add_parameter('voltage', get_cmd=f'{name}:VOLT?',
+                           set_cmd=f'{name}:VOLT {{}}', get_parser=float,
+                           scale=10, vals=Numbers(-1, 1))
+
+
+class SCPIVisa(VisaInstrument):
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, address='SCPI::INSTR', **kwargs)
+        for i in range(1, 4):
+            self.add_submodule(f'ch{i}', SCPIChannel(self, f'CH{i}'))
+        self.add_parameter('mode', get_cmd='MODE?', set_cmd='MODE {}',
+                           val_mapping={'fast': 'FAST', 'slow': 'SLOW'})
+        self.add_parameter('counter', get_cmd=lambda: 0)
+
+    def set_address(self, address):
+        self.visa_handle = SCPIVisaHandle()
+        self.visabackend = 'sim'
+
+
+@pytest.fixture
+def instrument():
+    inst = SCPIVisa('scpi_visa')
+    yield inst
+    inst.close()
+
+
+def test_writes_are_sent_in_one_message(instrument):
+    handle = instrument.visa_handle
+
+    with instrument.batch():
+        instrument.ch1.voltage(0.1)
+        instrument.ch2.voltage(0.2)
+        instrument.mode('fast')
+        assert handle.messages == []
+
+    assert handle.messages == [':CH1:VOLT 1.0;:CH2:VOLT 2.0;:MODE FAST']
+    assert instrument.ch1.voltage.cache.get(get_if_invalid=False) == 0.1
+
+
+def test_io_statistics_record_the_messages_sent(instrument):
+    statistics = instrument.start_io_statistics()
+
+    with instrument.batch():
+        for ch in (instrument.ch1, instrument.ch2, instrument.ch3):
+            ch.voltage(0.1)
+        assert 'write' not in statistics.summary()
+
+    summary = statistics.summary()
+    assert summary['write']['count'] == 1
+    assert summary['write']['bytes_sent'] == \
+        len(':CH1:VOLT 1.0;:CH2:VOLT 1.0;:CH3:VOLT 1.0')
+    assert 'ask' not in summary
+
+    with instrument.batch():
+        instrument.ch1.voltage(0.2)
+        assert instrument.ch1.voltage() == 0.2
+
+    summary = statistics.summary()
+    assert summary['write']['count'] == 2
+    assert summary['write']['bytes_sent'] == \
+        len(':CH1:VOLT 1.0;:CH2:VOLT 1.0;:CH3:VOLT 1.0') + len(':CH1:VOLT 2.0')
+    assert summary['ask']['count'] == 1
+    assert summary['ask']['bytes_sent'] == len('CH1:VOLT?')
+
+
+def test_queries_update_the_parameters(instrument):
+    handle = instrument.visa_handle
+    handle.values.update({'CH1:VOLT': '5', 'CH3:VOLT': '-5', 'MODE': 'SLOW'})
+
+    with instrument.batch() as batch:
+        instrument.ch2.voltage(0.2)
+        voltages = [batch.get(ch.voltage) for ch in
+                    (instrument.ch1, instrument.ch2, instrument.ch3)]
+        mode = batch.get(instrument.mode)
+        idn = batch.ask('*IDN?')
+        with pytest.raises(RuntimeError):
+            mode.value
+
+    assert handle.messages == [':CH2:VOLT 2.0;:CH1:VOLT?;:CH2:VOLT?;'
+                               ':CH3:VOLT?;:MODE?;*IDN?']
+    assert [v.value for v in voltages] == [0.5, 0.2, -0.5]
+    assert voltages[0].raw_value == '5'
+    assert mode.value == 'slow'
+    assert instrument.mode.cache.get(get_if_invalid=False) == 'slow'
+    assert instrument.ch3.voltage.cache.get(get_if_invalid=False) == -0.5
+    assert idn.value == '0'
+
+
+def test_messages_respect_the_maximum_length(instrument):
+    handle = instrument.visa_handle
+    instrument.max_batch_length = 30
+
+    with instrument.batch():
+        for ch in (instrument.ch1, instrument.ch2, instrument.ch3):
+            ch.voltage(0.1)
+
+    assert handle.messages == [':CH1:VOLT 1.0;:CH2:VOLT 1.0',
+                               ':CH3:VOLT 1.0']
+    assert all(len(m) <= 30 for m in handle.messages)
+
+
+def test_other_queries_send_the_batch_first(instrument):
+    handle = instrument.visa_handle
+
+    with instrument.batch():
+        instrument.ch1.voltage(0.3)
+        assert instrument.ch1.voltage() == 0.3
+        instrument.ch2.voltage(0.4)
+
+    assert handle.messages == [':CH1:VOLT 3.0', 'CH1:VOLT?', ':CH2:VOLT 4.0']
+
+
+def test_other_threads_are_not_batched(instrument):
+    handle = instrument.visa_handle
+
+    with instrument.batch():
+        thread = threading.Thread(target=instrument.ch1.voltage, args=(0.1,))
+        thread.start()
+        thread.join()
+        assert handle.messages == ['CH1:VOLT 1.0']
+
+
+def test_batch_is_discarded_on_error(instrument):
+    handle = instrument.visa_handle
+
+    with pytest.raises(ZeroDivisionError):
+        with instrument.batch():
+            instrument.ch1.voltage(0.1)
+            1 / 0
+
+    assert handle.messages == []
+    assert instrument.ch1.voltage.cache.get(get_if_invalid=False) is None
+    assert instrument.ch1.voltage.cache.timestamp is None
+    instrument.ch1.voltage(0.2)
+    assert handle.messages == ['CH1:VOLT 2.0']
+    assert instrument.ch1.voltage.cache.get(get_if_invalid=False) == 0.2
+
+
+def test_stepped_and_delayed_sets_are_not_batched(instrument):
+    handle = instrument.visa_handle
+    instrument.ch1.voltage.step = 0.1
+    instrument.ch2.voltage.post_delay = 0.01
+
+    with instrument.batch():
+        for voltage in (instrument.ch1.voltage, instrument.ch2.voltage):
+            with pytest.raises(RuntimeError, match='can not be set in a batch'):
+                voltage(0.5)
+        instrument.ch3.voltage(0.5)
+
+    assert handle.messages == [':CH3:VOLT 5.0']
+    assert instrument.ch1.voltage.cache.timestamp is None
+    assert instrument.ch2.voltage.cache.timestamp is None
+
+
+def test_invalid_batches(instrument):
+    with instrument.batch() as batch:
+        with pytest.raises(ValueError, match='command string'):
+            batch.get(instrument.counter)
+        with pytest.raises(RuntimeError, match='already open'):
+            with instrument.batch():
+                pass
+
+    with pytest.raises(ValueError, match='Expected 2 responses'):
+        with instrument.batch() as batch:
+            batch.get(instrument.mode)
+            batch.ask('CH1:VOLT 1.0;*IDN')
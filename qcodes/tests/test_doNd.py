@@ -1,12 +1,20 @@
 """
 These are the basic black box tests for the doNd functions.
 """
+import json
+from unittest.mock import patch
+
 from qcodes.dataset.data_set import DataSet
-from qcodes.utils.dataset.doNd import do0d, do1d, do2d
+from qcodes.utils.dataset.doNd import (do0d, do1d, do2d, do1d_buffered,
+                                       do2d_buffered)
+from qcodes.tests.instrument_mocks import (DummyBufferedInstrument,
+                                           DummyChannelInstrument)
 from qcodes.instrument.parameter import Parameter
 from qcodes import config, new_experiment
 from qcodes.utils import validators
+from qcodes.utils.threading import ThreadPoolParamsGetter
 
+import numpy as np
 import pytest
 import matplotlib.pyplot as plt
 
@@ -20,6 +28,13 @@ def plot_close():
     plt.close('all')
 
 
+@pytest.fixture()
+def _buffered_instrument():
+    instrument = DummyBufferedInstrument('buffered_instrument')
+    yield instrument
+    instrument.close()
+
+
 @pytest.fixture()
 def _param():
     p = Parameter('simple_parameter',
@@ -254,6 +269,38 @@ def test_do2d_output_data(_param, _param_complex, _param_set):
                                                 [0.875], [1], [1]] * 5
 
 
+@pytest.mark.usefixtures("plot_close")
+def test_do1d_with_threads(_param, _param_complex, _param_set):
+    calls = []
+
+    def action():
+        calls.append(_param_set.get())
+
+    start = 0
+    stop = 1
+    num_points = 5
+    delay = 0
+
+    data = do1d(_param_set, start, stop, num_points, delay,
+                _param, action, _param_complex, use_threads=True)[0]
+
+    assert data.get_values(_param.name) == [[1]] * 5
+    assert data.get_values(_param_complex.name) == [[1 + 1j]] * 5
+    assert calls == [0, 0.25, 0.5, 0.75, 1]
+
+
+@pytest.mark.usefixtures("plot_close")
+def test_do1d_with_threads_builds_getters_once(_param, _param_complex,
+                                               _param_set):
+    with patch.object(ThreadPoolParamsGetter, '__init__', autospec=True,
+                      side_effect=ThreadPoolParamsGetter.__init__) as init:
+        do1d(_param_set, 0, 1, 10, 0, _param, lambda: None, _param_complex,
+             use_threads=True)
+
+    # one getter for the parameters on each side of the function
+    assert init.call_count == 2
+
+
 def test_do1d_additional_setpoints(_param, _param_complex, _param_set):
     additional_setpoints = [Parameter(
         'simple_setter_parameter',
@@ -300,3 +347,125 @@ def test_do2d_additional_setpoints(_param, _param_complex, _param_set):
                  _param, _param_complex,
                  additional_setpoints=additional_setpoints)
             plt.close('all')
+
+
+@pytest.mark.usefixtures("plot_close")
+def test_do1d_pipelined(_param, _param_complex, _param_set):
+    calls = []
+
+    def action():
+        calls.append(_param_set.get())
+
+    data = do1d(_param_set, 0, 1, 5, 0.01,
+                _param, action, _param_complex, pipeline=True)[0]
+
+    assert data.get_values(_param.name) == [[1]] * 5
+    assert data.get_values(_param_complex.name) == [[1 + 1j]] * 5
+    assert data.get_values(_param_set.name) == [[0], [0], [0.25], [0.25],
+                                                [0.5], [0.5], [0.75], [0.75],
+                                                [1], [1]]
+    assert calls == [0, 0.25, 0.5, 0.75, 1]
+    assert _param_set.post_delay == 0.01
+
+    timings = json.loads(data.metadata['doNd_stage_timings'])
+    assert set(timings) == {'set', 'settle', 'measure', 'add_result'}
+    assert timings['add_result']['count'] == 5
+    assert timings['settle']['total'] >= 4 * 0.01
+
+
+@pytest.mark.usefixtures("plot_close")
+@pytest.mark.parametrize('sweep, columns', [(False, False), (True, True)])
+def test_do2d_pipelined(_param, _param_complex, _param_set, sweep, columns):
+    _param_set2 = Parameter('simple_setter_parameter_2',
+                            set_cmd=None, get_cmd=None)
+    args = (_param_set, 0, 0.5, 3, 0, _param_set2, 0.5, 1, 4, 0.001,
+            _param, _param_complex)
+
+    serial = do2d(*args, set_before_sweep=sweep, flush_columns=columns,
+                  do_plot=False)[0]
+    pipelined = do2d(*args, set_before_sweep=sweep, flush_columns=columns,
+                     do_plot=False, pipeline=True)[0]
+
+    for name in (_param_set.name, _param_set2.name, _param.name,
+                 _param_complex.name):
+        assert pipelined.get_values(name) == serial.get_values(name)
+    assert _param_set2.post_delay == 0.001
+
+
+def test_do1d_pipelined_raises_errors_of_adding_results(_param_set):
+    not_a_number = Parameter('not_a_number', set_cmd=None,
+                             get_cmd=lambda: 'abc')
+
+    with pytest.raises(ValueError):
+        do1d(_param_set, 0, 1, 5, 0, not_a_number, pipeline=True,
+             do_plot=False)
+    assert _param_set.post_delay == 0
+
+
+@pytest.mark.usefixtures("plot_close")
+def test_do1d_buffered(_buffered_instrument):
+    inst = _buffered_instrument
+    inst.offset(1)
+
+    data = do1d_buffered(inst.sweep_axis, 0, 2, 5, inst.trace)[0]
+
+    assert inst.n_arms == inst.n_fetches == 1
+    assert data.number_of_results == 1
+    traces = data.get_parameter_data()[inst.trace.full_name]
+    np.testing.assert_array_equal(traces[inst.sweep_axis.full_name],
+                                  [[0, 0.5, 1, 1.5, 2]])
+    np.testing.assert_array_equal(traces[inst.trace.full_name],
+                                  [[1, 1.25, 2, 3.25, 5]])
+
+
+@pytest.mark.usefixtures("plot_close")
+def test_do2d_buffered(_buffered_instrument, _param, _param_set):
+    inst = _buffered_instrument
+    _param_set(7)
+    calls = []
+
+    def action():
+        calls.append(inst.n_arms)
+
+    data = do2d_buffered(inst.offset, 0, 1, 3, 0,
+                         inst.sweep_axis, 0, 2, 5,
+                         inst.trace, action, _param,
+                         after_inner_actions=(action,),
+                         additional_setpoints=(_param_set,))[0]
+
+    # one trace per point of the outer loop
+    assert inst.n_arms == inst.n_fetches == 3
+    assert calls == [1, 1, 2, 2, 3, 3]
+    assert data.number_of_results == 6
+
+    all_data = data.get_parameter_data()
+    traces = all_data[inst.trace.full_name]
+    offsets = np.array([0, 0.5, 1])
+    axis = np.array([0, 0.5, 1, 1.5, 2])
+    np.testing.assert_array_equal(traces[inst.offset.full_name],
+                                  np.repeat(offsets[:, None], 5, axis=1))
+    np.testing.assert_array_equal(traces[inst.sweep_axis.full_name],
+                                  np.tile(axis, (3, 1)))
+    np.testing.assert_array_equal(traces[inst.trace.full_name],
+                                  offsets[:, None] + axis ** 2)
+    # the other parameters are measured once per point of the outer loop
+    np.testing.assert_array_equal(all_data[_param.full_name][_param.full_name],
+                                  [1, 1, 1])
+    np.testing.assert_array_equal(
+        all_data[_param.full_name][_param_set.full_name], [7, 7, 7])
+
+
+def test_buffered_sweep_needs_traces_along_the_sweep(_buffered_instrument,
+                                                     _param):
+    inst = _buffered_instrument
+    channels = DummyChannelInstrument('channels_not_along_sweep')
+    try:
+        with pytest.raises(ValueError, match='not a trace along'):
+            do1d_buffered(inst.sweep_axis, 0, 1, 5, inst.trace,
+                          channels.A.dummy_parameter_with_setpoints,
+                          do_plot=False)
+        with pytest.raises(ValueError, match='None of the parameters'):
+            do1d_buffered(inst.sweep_axis, 0, 1, 5, _param, do_plot=False)
+    finally:
+        channels.close()
+    assert inst.n_arms == 0
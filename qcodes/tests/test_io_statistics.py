@@ -0,0 +1,133 @@
+import math
+
+import numpy as np
+import pytest
+
+import qcodes.instrument.io_statistics as io_statistics
+from qcodes.instrument.base import Instrument
+from qcodes.instrument.channel import InstrumentChannel
+from qcodes.instrument.io_statistics import LatencyHistogram
+from qcodes.logger.log_analysis import io_statistics_to_dataframe
+from qcodes.utils.asyncio_helpers import run_coroutine
+
+
+class _EchoChannel(InstrumentChannel):
+
+    def __init__(self, parent, name):
+        super().__init__(parent, name)
+        self.add_parameter('level', get_cmd='LEVEL?', set_cmd='LEVEL {}',
+                           get_parser=float)
+
+
+class _EchoInstrument(Instrument):
+    """An instrument that answers every query with ``'1.5'``"""
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self.add_parameter('voltage', get_cmd='VOLT?', set_cmd='VOLT {}',
+                           get_parser=float)
+        self.add_submodule('ch1', _EchoChannel(self, 'ch1'))
+
+    def write_raw(self, cmd):
+        pass
+
+    def ask_raw(self, cmd):
+        return '1.5'
+
+
+@pytest.fixture
+def instrument():
+    inst = _EchoInstrument('echo')
+    yield inst
+    inst.close()
+
+
+def test_percentiles_are_estimated_closely():
+    durations = np.random.RandomState(0).lognormal(-7, 1, size=10000)
+    histogram = LatencyHistogram()
+    for duration in durations:
+        histogram.add(duration, bytes_sent=2)
+
+    for q in (50, 95, 99):
+        exact = np.percentile(durations, q)
+        assert histogram.percentile(q) == pytest.approx(exact, rel=0.05)
+    assert histogram.count == 10000
+    assert histogram.mean == pytest.approx(durations.mean())
+    assert histogram.bytes_sent == 20000
+
+    assert math.isnan(LatencyHistogram().percentile(50))
+
+
+def test_statistics_are_not_recorded_by_default(instrument):
+    assert instrument.io_statistics is None
+    instrument.voltage()
+    assert io_statistics.n_recording == 0
+    assert 'io_statistics' not in instrument.snapshot()
+
+
+def test_io_and_parameters_are_recorded(instrument):
+    statistics = instrument.start_io_statistics()
+    assert io_statistics.n_recording == 1
+
+    instrument.voltage()
+    instrument.voltage(2)
+    instrument.ch1.level()
+    instrument.ch1.level()
+
+    summary = statistics.summary()
+    assert set(summary) == {'ask', 'write', 'get echo_voltage',
+                            'set echo_voltage', 'get echo_ch1_level'}
+    assert summary['ask']['count'] == 3
+    assert summary['ask']['bytes_sent'] == len('VOLT?') + 2 * len('LEVEL?')
+    assert summary['ask']['bytes_received'] == 3 * len('1.5')
+    assert summary['write']['bytes_sent'] == len('VOLT 2')
+    assert summary['get echo_ch1_level']['count'] == 2
+    assert (summary['get echo_voltage']['total']
+            >= summary['get echo_voltage']['p50'] > 0)
+
+    # starting again continues the statistics
+    assert instrument.start_io_statistics() is statistics
+    statistics.reset()
+    assert statistics.summary() == {}
+
+    instrument.stop_io_statistics()
+    assert io_statistics.n_recording == 0
+    instrument.voltage()
+    assert statistics.summary() == {}
+
+
+def test_async_io_is_recorded(instrument):
+    statistics = instrument.start_io_statistics()
+    assert run_coroutine(instrument.voltage.get_async()) == 1.5
+    assert statistics.summary()['ask']['count'] == 1
+
+
+def test_statistics_in_snapshot(instrument):
+    instrument.start_io_statistics(include_in_snapshot=True)
+    instrument.voltage()
+    snapshot = instrument.snapshot()
+    assert snapshot['io_statistics']['ask']['count'] == 1
+
+
+def test_closing_stops_recording():
+    inst = _EchoInstrument('echo_closed')
+    inst.start_io_statistics()
+    inst.close()
+    assert io_statistics.n_recording == 0
+
+
+def test_export_to_dataframe(instrument):
+    other = _EchoInstrument('other_echo')
+    try:
+        instrument.start_io_statistics()
+        instrument.voltage()
+        instrument.voltage()
+        other.voltage()
+
+        df = io_statistics_to_dataframe([instrument, other])
+        assert list(df.index) == [('echo', 'ask'),
+                                  ('echo', 'get echo_voltage')]
+        assert df.loc[('echo', 'ask'), 'count'] == 2
+        assert 'p95' in df.columns
+    finally:
+        other.close()
@@ -0,0 +1,221 @@
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from qcodes.instrument.ip import IPInstrument
+from qcodes.utils.asyncio_helpers import run_coroutine
+
+
+LATENCY = 0.02
+CURVE = np.linspace(-1, 1, 5000, dtype='<f4')
+
+
+class _StandIn:
+    """
+    A local TCP server that stands in for an instrument. Its responses are
+    split into several packets, sent ``LATENCY`` seconds apart, and it
+    counts the connections that are opened to it.
+    """
+
+    def __init__(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(5)
+        self.port = self.server.getsockname()[1]
+        self.n_connections = 0
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.n_connections += 1
+            threading.Thread(target=self._serve,
+                             args=(conn, self.n_connections),
+                             daemon=True).start()
+
+    def _send_in_packets(self, conn, data, n_packets=3):
+        size = -(-len(data) // n_packets)
+        for start in range(0, len(data), size):
+            conn.sendall(data[start:start + size])
+            time.sleep(LATENCY)
+
+    def _serve(self, conn, index):
+        buffer = b''
+        with conn:
+            while True:
+                try:
+                    data = conn.recv(1024)
+                except OSError:
+                    return
+                if not data:
+                    return
+                buffer += data
+                while b'\n' in buffer:
+                    line, buffer = buffer.split(b'\n', 1)
+                    if line == b'QUIT?':
+                        conn.sendall(b'bye\r\n')
+                        return
+                    self._respond(conn, line.decode(), index)
+
+    def _respond(self, conn, command, index):
+        if command == 'LONG?':
+            self._send_in_packets(conn, b'x' * 3000 + b'\r\n')
+        elif command == 'TWO?':
+            conn.sendall(b'first\r\nsecond\r\n')
+        elif command == 'CONN?':
+            conn.sendall(f'{index}\r\n'.encode())
+        elif command == 'CURV?':
+            data = CURVE.tobytes()
+            header = f'#{len(str(len(data)))}{len(data)}'.encode()
+            self._send_in_packets(conn, b':CURV ' + header + data + b'\r\n')
+        elif command == 'CURV3?;CONN?':
+            # the response to the query after the block arrives along with it
+            conn.sendall(b'#13\x01\x02\x03\r\n' + f'{index}\r\n'.encode())
+        elif command == 'CURV0?':
+            self._send_in_packets(conn, b'#0' + b'\x01\x02\x03' + b'\r\n')
+
+    def close(self):
+        self.server.close()
+
+
+@pytest.fixture
+def stand_in():
+    server = _StandIn()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def instrument(stand_in):
+    inst = IPInstrument('ip_instrument', address='127.0.0.1',
+                        port=stand_in.port, read_terminator='\r\n')
+    yield inst
+    inst.close()
+
+
+def test_fragmented_response_is_read_until_terminator(instrument):
+    assert instrument.ask('LONG?') == 'x' * 3000
+
+
+def test_responses_received_together_are_kept_apart(instrument):
+    assert instrument.ask('TWO?') == 'first'
+    # the second response has already been received
+    assert instrument._recv() == 'second'
+
+
+def test_async_response_is_read_until_terminator(instrument):
+    assert run_coroutine(instrument.ask_async('LONG?')) == 'x' * 3000
+    assert run_coroutine(instrument.ask_async('TWO?')) == 'first'
+    assert instrument._recv() == 'second'
+
+
+def test_async_ask_waits_for_ask_from_another_thread(instrument):
+    answers = []
+    thread = threading.Thread(
+        target=lambda: answers.append(instrument.ask('LONG?')))
+    thread.start()
+    # the response to LONG? is still being received
+    time.sleep(LATENCY / 2)
+    assert run_coroutine(instrument.ask_async('CONN?')) == '1'
+    thread.join()
+    assert answers == ['x' * 3000]
+
+
+def test_binary_block(instrument):
+    values = instrument.ask_binary_values('CURV?', datatype='f')
+    np.testing.assert_array_equal(values, CURVE)
+    # the terminator after the block has been read too
+    assert instrument.ask('CONN?') == '1'
+
+    raw = instrument.ask_binary_values('CURV0?', datatype='B')
+    np.testing.assert_array_equal(raw, [1, 2, 3])
+
+
+def test_binary_block_big_endian(instrument):
+    values = instrument.ask_binary_values('CURV?', datatype='f',
+                                          is_big_endian=True)
+    np.testing.assert_array_equal(values, CURVE.byteswap().view('<f4'))
+
+
+def test_binary_block_without_read_terminator(stand_in):
+    inst = IPInstrument('legacy_ip_instrument', address='127.0.0.1',
+                        port=stand_in.port)
+    try:
+        for _ in range(2):
+            values = inst.ask_binary_values('CURV?', datatype='f')
+            np.testing.assert_array_equal(values, CURVE)
+        # the terminator after the blocks has been read too
+        assert inst.ask('CONN?') == '1\r\n'
+    finally:
+        inst.close()
+
+
+def test_ask_after_binary_block_gets_the_buffered_response(stand_in):
+    inst = IPInstrument('legacy_ip_instrument', address='127.0.0.1',
+                        port=stand_in.port)
+    try:
+        values = inst.ask_binary_values('CURV3?;CONN?', datatype='B')
+        np.testing.assert_array_equal(values, [1, 2, 3])
+        # the response to CONN? was received along with the block, and
+        # comes before the response to TWO?
+        assert inst.ask('TWO?') == '1\r\n'
+        assert inst._recv() == 'first\r\nsecond\r\n'
+    finally:
+        inst.close()
+
+
+def test_legacy_receive_returns_one_read(stand_in):
+    inst = IPInstrument('legacy_ip_instrument', address='127.0.0.1',
+                        port=stand_in.port)
+    try:
+        assert inst.ask('CONN?') == '1\r\n'
+    finally:
+        inst.close()
+
+
+@pytest.mark.parametrize('keep_alive, expected', [(0, ['1', '2', '3']),
+                                                  (10, ['1', '1', '1'])])
+def test_keep_alive_reuses_connections(stand_in, keep_alive, expected):
+    instruments = [IPInstrument(f'ip_instrument_{i}', address='127.0.0.1',
+                                port=stand_in.port, persistent=False,
+                                read_terminator='\r\n', keep_alive=keep_alive)
+                   for i in range(2)]
+    try:
+        # the connection is shared by instruments with the same address
+        responses = [instruments[0].ask('CONN?'),
+                     instruments[1].ask('CONN?'),
+                     instruments[0].ask('CONN?')]
+        assert responses == expected
+    finally:
+        for inst in instruments:
+            inst.close()
+
+
+def test_expired_idle_connections_are_not_reused(stand_in):
+    inst = IPInstrument('ip_instrument', address='127.0.0.1',
+                        port=stand_in.port, persistent=False,
+                        read_terminator='\r\n', keep_alive=0.1)
+    try:
+        assert inst.ask('CONN?') == '1'
+        time.sleep(0.2)
+        assert inst.ask('CONN?') == '2'
+    finally:
+        inst.close()
+
+
+def test_idle_connections_closed_by_the_instrument_are_not_reused(stand_in):
+    inst = IPInstrument('ip_instrument', address='127.0.0.1',
+                        port=stand_in.port, persistent=False,
+                        read_terminator='\r\n', keep_alive=10)
+    try:
+        assert inst.ask('QUIT?') == 'bye'
+        time.sleep(LATENCY)
+        assert inst.ask('CONN?') == '2'
+    finally:
+        inst.close()
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+import qcodes
+
+
+def _modules_imported_by(statement):
+    code = (f"import sys\n{statement}\n"
+            "print('\\n'.join(sorted(sys.modules)))")
+    output = subprocess.run([sys.executable, '-c', code],
+                            stdout=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True).stdout
+    return set(output.splitlines())
+
+
+def test_import_qcodes_does_not_import_submodules():
+    modules = _modules_imported_by('import qcodes')
+    for module in ('qcodes.dataset', 'qcodes.instrument.base',
+                   'qcodes.station', 'qcodes.plots', 'qcodes.monitor',
+                   'opencensus'):
+        assert module not in modules
+
+
+def test_public_names_are_imported_on_access():
+    modules = _modules_imported_by('from qcodes import Measurement')
+    assert 'qcodes.dataset.measurements' in modules
+    assert 'qcodes.monitor.monitor' not in modules
+
+
+def test_star_import_imports_the_public_names():
+    code = ("from qcodes import *\n"
+            "print('\\n'.join(sorted(globals())))")
+    output = subprocess.run([sys.executable, '-c', code],
+                            stdout=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True).stdout
+    names = set(output.splitlines())
+    for name in ('config', 'Station', 'Instrument', 'VisaInstrument',
+                 'Parameter', 'ManualParameter', 'validators',
+                 'Measurement', 'load_by_id', 'new_experiment',
+                 'initialise_or_create_database_at', 'test'):
+        assert name in names
+    assert set(qcodes.__all__) <= names
+
+
+def test_lazy_names():
+    from qcodes.dataset.measurements import Measurement
+    from qcodes.instrument.base import Instrument
+    from qcodes.utils import validators
+
+    assert qcodes.Measurement is Measurement
+    assert qcodes.Instrument is Instrument
+    assert qcodes.validators is validators
+    assert 'Measurement' in dir(qcodes)
+
+
+def test_submodules_are_imported_on_access():
+    import qcodes.dataset.sqlite.settings
+    assert qcodes.dataset.sqlite.settings.SQLiteSettings is \
+        qcodes.SQLiteSettings
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError, match='no_such_name'):
+        qcodes.no_such_name
@@ -199,16 +199,17 @@ class TestParameter(TestCase):
 
         p = Parameter('p', set_cmd=None, initial_value=0,
                       vals=BookkeepingValidator())
-        # in the set wrapper the final value is validated
-        # and then subsequently each step is validated.
-        # in this case there is one step so the final value
-        # is validated twice.
-        self.assertEqual(p.vals.values_validated, [0, 0])
+        # in the set wrapper the final value is validated.
+        # without a step there are no intermediate values
+        # so the value is validated once.
+        self.assertEqual(p.vals.values_validated, [0])
 
+        # with a step the final value is validated
+        # and then subsequently each step is validated.
         p.step = 1
         p.set(10)
         self.assertEqual(p.vals.values_validated,
-                         [0, 0, 10, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+                         [0, 10, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
 
     def test_number_of_validations_for_set_cache(self):
         p = Parameter('p', set_cmd=None,
@@ -1820,3 +1821,89 @@ def test_gettable_settable_attributes_with_get_set_raw(baseclass):
 
     assert b.gettable is False
     assert b.settable is False
+
+
+def test_get_set_pipelines_follow_attribute_changes():
+    set_values = []
+    p = Parameter('p', get_cmd=lambda: 4, set_cmd=set_values.append)
+    assert not p._convert_on_get
+    assert not p._convert_on_set
+    assert not p._ramp_on_set
+
+    p.val_mapping = {'on': 4, 'off': 0}
+    assert p._convert_on_get and p._convert_on_set
+    assert p.inverse_val_mapping == {4: 'on', 0: 'off'}
+    assert p() == 'on'
+    p('off')
+    assert set_values == [0]
+
+    p.val_mapping = None
+    p.offset = 1
+    assert p() == 3
+    p.offset = None
+    assert not p._convert_on_get
+    p.get_parser = str
+    assert p() == '4'
+    p.get_parser = None
+    assert p() == 4
+
+    p.set_parser = int
+    p(2.0)
+    assert isinstance(set_values[-1], int)
+    p.set_parser = None
+
+    p.step = 1
+    assert p._ramp_on_set
+    p(6)
+    assert set_values[-2:] == [5, 6]
+    p.step = None
+    assert not p._ramp_on_set
+
+
+def test_pipeline_attributes_can_be_set_before_init():
+    class EarlyParam(Parameter):
+        def __init__(self, name, **kwargs):
+            self.scale = 2
+            self.offset = 1
+            self.val_mapping = None
+            self.get_parser = float
+            self.set_parser = int
+            super().__init__(name, **kwargs)
+
+    p = EarlyParam('p', set_cmd=None, get_cmd=None, scale=2)
+    p(4)
+    assert p.cache.raw_value == 8
+    assert p() == 4
+
+
+def test_overridden_conversions_are_applied():
+    class DoublingParam(Parameter):
+        def _from_raw_value_to_value(self, raw_value):
+            return 2 * raw_value
+
+        def _from_value_to_raw_value(self, value):
+            return value / 2
+
+    p = DoublingParam('p', set_cmd=None, get_cmd=None)
+    assert p._convert_on_get and p._convert_on_set
+    p(10)
+    assert p.cache.raw_value == 5
+    assert p() == 10
+
+
+def test_cache_timestamp():
+    p = Parameter('p', set_cmd=None, get_cmd=None)
+    assert p.cache.timestamp is None
+
+    before = datetime.now()
+    p(1)
+    after = datetime.now()
+    timestamp = p.cache.timestamp
+    assert before - timedelta(milliseconds=1) <= timestamp
+    assert timestamp <= after + timedelta(milliseconds=1)
+    # the datetime is created once per update
+    assert p.cache.timestamp is timestamp
+
+    set_time = datetime(2020, 1, 1, 12, 0, 0, 123456)
+    p.cache._update_with(value=2, raw_value=2, timestamp=set_time)
+    assert p.cache.timestamp == set_time
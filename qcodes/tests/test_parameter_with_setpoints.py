@@ -2,8 +2,9 @@ import numpy as np
 from numpy.random import rand
 import pytest
 
+from qcodes.instrument.base import Instrument
 from qcodes.instrument.parameter import ParameterWithSetpoints, Parameter,\
-    expand_setpoints_helper
+    HardwareSweepSetpoints, expand_setpoints_helper
 import qcodes.utils.validators as vals
 
 
@@ -414,3 +415,54 @@ def test_expand_setpoints_3d(parameters):
     for i in range(sp3.shape[0]):
         for j in range(sp3.shape[1]):
             np.testing.assert_array_equal(sp3[i, j, :], np.arange(sp3.shape[2]))
+
+
+def test_hardware_sweep_setpoints():
+    """
+    Test that hardware sweep setpoints are configured from start, stop and
+    number of points, validate the shape of the traces along them, and arm
+    the sweep with a function or a command written to the instrument.
+    """
+    written = []
+
+    class Sweeper(Instrument):
+        def write_raw(self, cmd):
+            written.append(cmd)
+
+    sweeper = Sweeper('hardware_sweeper')
+    try:
+        for name in ('start', 'stop', 'n_points'):
+            sweeper.add_parameter(name, set_cmd=None, get_cmd=None)
+        sweeper.add_parameter('axis', parameter_class=HardwareSweepSetpoints,
+                              start=sweeper.start, stop=sweeper.stop,
+                              num_points=sweeper.n_points, arm_cmd='INIT')
+        sweeper.add_parameter('trace', parameter_class=ParameterWithSetpoints,
+                              setpoints=(sweeper.axis,),
+                              vals=vals.Arrays(shape=(sweeper.n_points,)),
+                              get_cmd=lambda: np.zeros(sweeper.n_points()))
+
+        sweeper.axis.configure_sweep(1, 2, 5)
+        np.testing.assert_array_equal(sweeper.axis(),
+                                      [1, 1.25, 1.5, 1.75, 2])
+        sweeper.trace.validate_consistent_shape()
+        assert sweeper.trace().shape == (5,)
+
+        sweeper.axis.arm_sweep()
+        assert written == ['INIT']
+    finally:
+        sweeper.close()
+
+    armed = []
+    n_points = Parameter('n_points', initial_value=3, set_cmd=None)
+    axis = HardwareSweepSetpoints('axis', start=n_points, stop=n_points,
+                                  num_points=n_points,
+                                  arm_cmd=lambda: armed.append(True))
+    axis.arm_sweep()
+    assert armed == [True]
+    np.testing.assert_array_equal(axis(), [3, 3, 3])
+
+    not_on_instrument = HardwareSweepSetpoints(
+        'axis', start=n_points, stop=n_points, num_points=n_points,
+        arm_cmd='INIT')
+    with pytest.raises(RuntimeError):
+        not_on_instrument.arm_sweep()
@@ -1,3 +1,6 @@
+import logging
+import time
+
 import pytest
 from contextlib import contextmanager
 import tempfile
@@ -250,6 +253,75 @@ def test_station_after_instrument_is_closed():
         station.remove_component('bob')
 
 
+def _slow_instrument(name, delay):
+    instrument = DummyInstrument(name, gates=['dac'])
+    instrument.add_parameter('slow', get_cmd=lambda: time.sleep(delay) or 1)
+    return instrument
+
+
+def test_parallel_snapshot():
+    instruments = [_slow_instrument(f'slow_{i}', 0.2) for i in range(4)]
+    station = Station(*instruments, parallel_snapshot=True,
+                      update_snapshot=False)
+
+    t0 = time.perf_counter()
+    snapshot = station.snapshot(update=True)
+    duration = time.perf_counter() - t0
+
+    # the instruments are queried concurrently
+    assert duration < 0.6
+    assert list(snapshot['instruments']) == [i.name for i in instruments]
+    for instrument in instruments:
+        assert snapshot['instruments'][instrument.name] == \
+            instrument.snapshot(update=False)
+        assert snapshot['instruments'][instrument.name][
+            'parameters']['slow']['value'] == 1
+
+    timings = station.last_snapshot_timings
+    assert timings.timed_out == []
+    assert set(timings.instruments) == {i.name for i in instruments}
+    assert all(d >= 0.2 for d in timings.instruments.values())
+    assert timings.slowest_parameters(1)[0][0].endswith('_slow')
+    assert timings.slowest_parameters(1)[0][1] >= 0.2
+
+
+def test_parallel_snapshot_timeout(caplog):
+    fast = _slow_instrument('fast', 0)
+    slow = _slow_instrument('slow', 1)
+    station = Station(fast, slow, parallel_snapshot=True,
+                      snapshot_timeout=0.3, update_snapshot=False)
+
+    with caplog.at_level(logging.WARNING):
+        snapshot = station.snapshot(update=True)
+
+    assert 'slow did not respond' in caplog.text
+    timings = station.last_snapshot_timings
+    assert timings.timed_out == ['slow']
+    assert timings.total < 1
+    # the latest values in memory are used for the instrument that timed out
+    assert snapshot['instruments']['slow']['parameters']['slow']['value'] \
+        is None
+    assert snapshot['instruments']['fast']['parameters']['slow']['value'] \
+        == 1
+
+    # the snapshot that timed out holds on to the instrument until it is done
+    assert not slow.thread_lock.acquire(blocking=False)
+    assert slow.thread_lock.acquire(timeout=2)
+    slow.thread_lock.release()
+    assert slow.slow.cache.get(get_if_invalid=False) == 1
+
+
+def test_sequential_snapshot_timings():
+    instruments = [_slow_instrument(f'slow_{i}', 0.05 * i) for i in range(3)]
+    station = Station(*instruments, update_snapshot=False)
+    station.snapshot(update=True)
+
+    timings = station.last_snapshot_timings
+    assert [name for name, _ in timings.slowest_instruments()] == \
+        ['slow_2', 'slow_1', 'slow_0']
+    assert timings.total >= 0.15
+
+
 def test_update_config_schema():
     update_config_schema()
     with open(SCHEMA_PATH) as f:
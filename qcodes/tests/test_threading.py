@@ -1,10 +1,21 @@
 import gc
+import threading
+import time
 
 from unittest import TestCase
 
+import pytest
+
+from qcodes.instrument.base import Instrument
+from qcodes.instrument.parameter import DelegateParameter, Parameter
 from qcodes.loops import Loop
-from qcodes.actions import UnsafeThreadingException
 from qcodes.tests.instrument_mocks import DummyInstrument
+from qcodes.utils.asyncio_helpers import run_coroutine
+from qcodes.utils.threading import (ThreadPoolParamsGetter, get_thread_pool,
+                                    thread_map)
+
+
+GET_DELAY = 0.1
 
 
 class TestUnsafeThreading(TestCase):
@@ -24,9 +35,144 @@ class TestUnsafeThreading(TestCase):
 
         gc.collect()
 
-    def test_unsafe_exception(self):
+    def test_same_instrument_is_read_serially(self):
+        self.inst1.v1.set(1)
+        self.inst1.v2.set(2)
         to_meas = (self.inst1.v1, self.inst1.v2)
         loop = Loop(self.inst2.v1.sweep(0, 1, num=10)).each(*to_meas)
 
-        with self.assertRaises(UnsafeThreadingException):
-            loop.run(use_threads=True)
+        data = loop.run(use_threads=True, location=False, quiet=True)
+
+        self.assertEqual(list(data.inst1_v1), [1] * 10)
+        self.assertEqual(list(data.inst1_v2), [2] * 10)
+
+
+class _SlowInstrument(Instrument):
+    """
+    An instrument whose parameters take ``GET_DELAY`` seconds to get, and
+    which records how many of its parameters were being gotten at once
+    """
+
+    def __init__(self, name, n_parameters=2):
+        super().__init__(name)
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._count_lock = threading.Lock()
+        for i in range(n_parameters):
+            self.add_parameter(f'p{i}', get_cmd=self._make_getter(i))
+
+    def _make_getter(self, value):
+        def get():
+            with self._count_lock:
+                self._in_flight += 1
+                self.max_in_flight = max(self.max_in_flight,
+                                         self._in_flight)
+            time.sleep(GET_DELAY)
+            with self._count_lock:
+                self._in_flight -= 1
+            return value
+        return get
+
+
+class _SlowAskInstrument(Instrument):
+    """
+    An instrument whose queries take ``GET_DELAY`` seconds, and which
+    records how many queries were in flight at once
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._count_lock = threading.Lock()
+
+    def ask_raw(self, cmd):
+        with self._count_lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        time.sleep(GET_DELAY)
+        with self._count_lock:
+            self._in_flight -= 1
+        return cmd
+
+
+@pytest.fixture
+def slow_instruments():
+    instruments = [_SlowInstrument(f'slow_{i}') for i in range(3)]
+    yield instruments
+    for instrument in instruments:
+        instrument.close()
+
+
+def test_params_getter_groups_by_instrument(slow_instruments):
+    parameters = [instrument.parameters[name]
+                  for name in ('p0', 'p1')
+                  for instrument in slow_instruments]
+    getter = ThreadPoolParamsGetter(parameters)
+
+    t0 = time.perf_counter()
+    values = getter()
+    duration = time.perf_counter() - t0
+
+    assert values == [0, 0, 0, 1, 1, 1]
+    assert all(inst.max_in_flight == 1 for inst in slow_instruments)
+    # the instruments are read concurrently, two parameters each
+    assert 2 * GET_DELAY <= duration < 4 * GET_DELAY
+
+
+def test_params_getter_follows_delegates(slow_instruments):
+    instrument = slow_instruments[0]
+    delegate = DelegateParameter('delegate', source=instrument.p1)
+    free = Parameter('free', get_cmd=lambda: 'free', set_cmd=False)
+
+    getter = ThreadPoolParamsGetter([instrument.p0, free, delegate])
+
+    assert getter() == [0, 'free', 1]
+    assert instrument.max_in_flight == 1
+
+
+def test_params_getter_propagates_exceptions(slow_instruments):
+    def fail():
+        raise RuntimeError('broken')
+    broken = Parameter('broken', get_cmd=fail, set_cmd=False)
+    getter = ThreadPoolParamsGetter([slow_instruments[0].p0, broken])
+
+    with pytest.raises(RuntimeError, match='broken'):
+        getter()
+
+
+def test_thread_map_reuses_threads():
+    def name():
+        time.sleep(0.01)
+        return threading.current_thread().name
+
+    def n_pool_threads():
+        return len(get_thread_pool()._threads)
+
+    names = thread_map([name] * 4)
+    n_threads = n_pool_threads()
+    for _ in range(5):
+        thread_map([name] * 4)
+
+    assert n_pool_threads() == n_threads
+    assert threading.current_thread().name not in names
+
+
+def test_nested_thread_map():
+    # tasks of the pool that map in turn must not wait for the pool
+    def inner():
+        return sum(thread_map([lambda: 1] * 64))
+
+    assert thread_map([inner] * 64) == [64] * 64
+
+
+def test_asks_from_threads_and_coroutines_are_serialised():
+    instrument = _SlowAskInstrument('slow_ask')
+    try:
+        answers = thread_map(
+            [lambda: instrument.ask('sync')] * 2
+            + [lambda: run_coroutine(instrument.ask_async('async'))] * 2)
+        assert answers == ['sync', 'sync', 'async', 'async']
+        assert instrument.max_in_flight == 1
+    finally:
+        instrument.close()
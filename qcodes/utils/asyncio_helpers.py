@@ -0,0 +1,70 @@
+"""
+Helpers for getting parameters concurrently with asyncio. The reads are
+issued with :meth:`get_async <qcodes.instrument.parameter._BaseParameter.get_async>`,
+which serialises the communication with each instrument, hence the reads of
+parameters of different instruments overlap while those of one instrument
+are done one after the other.
+"""
+import asyncio
+from typing import Any, Awaitable, List, Sequence, TypeVar, TYPE_CHECKING
+
+from qcodes.utils.threading import RespondingThread
+
+if TYPE_CHECKING:
+    from qcodes.instrument.parameter import _BaseParameter
+
+T = TypeVar('T')
+
+
+async def gather_get(*parameters: '_BaseParameter') -> List[Any]:
+    """
+    Get the given parameters concurrently.
+
+    Args:
+        *parameters: the parameters to get
+
+    Returns:
+        The values of the parameters, in the order of the parameters
+    """
+    return list(await asyncio.gather(*(p.get_async() for p in parameters)))
+
+
+def run_coroutine(coroutine: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion in a new event loop and return its result.
+    If an event loop is already running in this thread, as it is in a
+    Jupyter notebook, the coroutine is run in a new event loop in a separate
+    thread.
+
+    Args:
+        coroutine: the coroutine to run
+    """
+    # ``asyncio.get_running_loop`` is not available on python 3.6
+    if asyncio._get_running_loop() is None:
+        return _run_in_new_loop(coroutine)
+
+    thread = RespondingThread(target=_run_in_new_loop, args=(coroutine,))
+    thread.start()
+    return thread.output()
+
+
+def _run_in_new_loop(coroutine: Awaitable[T]) -> T:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def get_concurrently(parameters: Sequence['_BaseParameter']) -> List[Any]:
+    """
+    Get the given parameters concurrently and wait for their values. This is
+    the blocking counterpart of :func:`gather_get`.
+
+    Args:
+        parameters: the parameters to get
+
+    Returns:
+        The values of the parameters, in the order of the parameters
+    """
+    return run_coroutine(gather_get(*parameters))
@@ -1,15 +1,25 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Callable, Sequence, Union, Tuple, List,\
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Sequence, Union, Tuple, List,\
     Optional, Iterator
+import json
+import logging
 import os
+import time
 
 import numpy as np
 import matplotlib
 
 from qcodes.dataset.data_set import DataSet
-from qcodes.dataset.measurements import Measurement, res_type
+from qcodes.dataset.measurements import DataSaver, Measurement, res_type
 from qcodes.instrument.base import _BaseParameter
+from qcodes.instrument.io_statistics import IOStatistics
+from qcodes.instrument.parameter import (HardwareSweepSetpoints,
+                                         ParameterWithSetpoints)
 from qcodes.dataset.plotting import plot_dataset
+from qcodes.utils.threading import ThreadPoolParamsGetter
 from qcodes import config
 
 ActionsT = Sequence[Callable[[], None]]
@@ -24,8 +34,17 @@ AxesTupleListWithDataSet = Tuple[DataSet, List[matplotlib.axes.Axes],
 
 OutType = List[res_type]
 
+log = logging.getLogger(__name__)
 
-def _process_params_meas(param_meas: Sequence[ParamMeasT]) -> OutType:
+# the number of points that a pipelined sweep may measure ahead of the
+# points that have been added to the dataset, before it waits for them
+_MAX_PENDING_POINTS = 100
+
+
+def _process_params_meas(param_meas: Sequence[ParamMeasT],
+                         use_threads: bool = False) -> OutType:
+    if use_threads:
+        return _process_params_meas_threaded(param_meas)
     output: OutType = []
     for parameter in param_meas:
         if isinstance(parameter, _BaseParameter):
@@ -35,6 +54,64 @@ def _process_params_meas(param_meas: Sequence[ParamMeasT]) -> OutType:
     return output
 
 
+def _process_params_meas_threaded(param_meas: Sequence[ParamMeasT]
+                                  ) -> OutType:
+    """
+    Like ``_process_params_meas``, but the parameters between two functions
+    are gotten concurrently, those of one instrument one after the other.
+    The functions are still called in the order they are supplied.
+    """
+    return _ThreadedParamsMeas(param_meas)()
+
+
+class _ThreadedParamsMeas:
+    """
+    Callable that measures ``param_meas`` as
+    ``_process_params_meas_threaded`` does. The ``ThreadPoolParamsGetter``
+    of the parameters between two functions are built once, on
+    construction, such that a sweep that measures at each point builds them
+    once per sweep rather than once per point.
+    """
+
+    def __init__(self, param_meas: Sequence[ParamMeasT]) -> None:
+        self._steps: List[Union[ThreadPoolParamsGetter,
+                                Callable[[], None]]] = []
+        parameters: List[_BaseParameter] = []
+        for parameter in param_meas:
+            if isinstance(parameter, _BaseParameter):
+                parameters.append(parameter)
+            elif callable(parameter):
+                self._add_getter(parameters)
+                parameters = []
+                self._steps.append(parameter)
+        self._add_getter(parameters)
+
+    def _add_getter(self, parameters: List[_BaseParameter]) -> None:
+        if parameters:
+            self._steps.append(ThreadPoolParamsGetter(parameters))
+
+    def __call__(self) -> OutType:
+        output: OutType = []
+        for step in self._steps:
+            if isinstance(step, ThreadPoolParamsGetter):
+                output.extend(zip(step.parameters, step()))
+            else:
+                step()
+        return output
+
+
+def _params_meas_getter(param_meas: Sequence[ParamMeasT],
+                        use_threads: bool = False) -> Callable[[], OutType]:
+    """
+    Return a function that measures ``param_meas`` as
+    ``_process_params_meas`` does, for the sweeps that measure them at each
+    point.
+    """
+    if use_threads:
+        return _ThreadedParamsMeas(param_meas)
+    return partial(_process_params_meas, param_meas)
+
+
 def _register_parameters(
         meas: Measurement,
         param_meas: Sequence[ParamMeasT],
@@ -58,6 +135,42 @@ def _register_actions(
         meas.add_after_run(action, ())
 
 
+def _register_buffered_parameters(
+        meas: Measurement,
+        sweep_setpoints: HardwareSweepSetpoints,
+        param_meas: Sequence[ParamMeasT],
+        setpoints: Sequence[_BaseParameter]) -> None:
+    """
+    Register the parameters of a buffered sweep: the traces of the
+    ``ParameterWithSetpoints`` along ``sweep_setpoints`` as arrays, and
+    any other parameters as scalars, both with the given setpoints.
+    """
+    n_traces = 0
+    for parameter in param_meas:
+        if isinstance(parameter, ParameterWithSetpoints):
+            if tuple(parameter.setpoints) != (sweep_setpoints,):
+                raise ValueError(
+                    f'{parameter.full_name} is not a trace along '
+                    f'{sweep_setpoints.full_name}, its setpoints are '
+                    f'{[sp.full_name for sp in parameter.setpoints]}')
+            meas.register_parameter(parameter, setpoints=setpoints,
+                                    paramtype='array')
+            n_traces += 1
+        elif isinstance(parameter, _BaseParameter):
+            meas.register_parameter(parameter, setpoints=setpoints)
+    if n_traces == 0:
+        raise ValueError(f'None of the parameters to measure is a trace '
+                         f'along {sweep_setpoints.full_name}')
+
+
+def _process_buffered_params_meas(
+        sweep_setpoints: HardwareSweepSetpoints,
+        setpoint_values: np.ndarray,
+        measure: Callable[[], OutType]) -> OutType:
+    sweep_setpoints.arm_sweep()
+    return [(sweep_setpoints, setpoint_values), *measure()]
+
+
 def _set_write_period(
         meas: Measurement,
         write_period: Optional[float] = None) -> None:
@@ -78,10 +191,170 @@ def _catch_keyboard_interrupts() -> Iterator[Callable[[], bool]]:
         interrupted = True
 
 
+class _Sweep:
+    """
+    The stages of each point of the sweep of :func:`do1d` and :func:`do2d`,
+    one after the other: setting the swept parameters, which wait for their
+    ``post_delay`` to settle, measuring, and adding the results of the point
+    to the dataset.
+    """
+
+    def __init__(self, datasaver: DataSaver,
+                 param_meas: Sequence[ParamMeasT],
+                 use_threads: bool = False) -> None:
+        self.datasaver = datasaver
+        self.param_meas = param_meas
+        self.use_threads = use_threads
+        self._measure = _params_meas_getter(param_meas,
+                                            use_threads=use_threads)
+
+    def __enter__(self) -> '_Sweep':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def set(self, parameter: _BaseParameter, value: float) -> None:
+        parameter.set(value)
+
+    def measure(self) -> OutType:
+        return self._measure()
+
+    def add_result(self, *res: res_type) -> None:
+        self.datasaver.add_result(*res)
+
+    def flush_data_to_database(self) -> None:
+        self.datasaver.flush_data_to_database()
+
+    def report_timings(self) -> None:
+        pass
+
+
+class _PipelinedSweep(_Sweep):
+    """
+    The stages of each point of a sweep, overlapping with each other:
+
+    * the measured parameters of different instruments are gotten
+      concurrently, see ``use_threads``,
+    * the results of a point are added to the dataset in a thread of their
+      own, while the next point is set, settles and is measured, and they
+      are written to the database by the background writer of the dataset,
+    * the swept parameters settle for their ``post_delay`` after each set as
+      usual, yet the sweep waits for them instead of the parameters, such
+      that the settling is timed apart from the setting.
+
+    The durations of the stages are recorded, and by ``report_timings``
+    logged and added to the metadata of the dataset as
+    ``doNd_stage_timings``, which is only safe once the background writer
+    of the dataset has stopped, i.e. after the run.
+
+    Args:
+        datasaver: The datasaver of a measurement that writes in background
+        param_meas: The parameters and functions to measure at each point
+        swept_parameters: The parameters that are set at the points
+    """
+
+    def __init__(self, datasaver: DataSaver,
+                 param_meas: Sequence[ParamMeasT],
+                 swept_parameters: Sequence[_BaseParameter]) -> None:
+        super().__init__(datasaver, param_meas, use_threads=True)
+        self.swept_parameters = swept_parameters
+        self.timings = IOStatistics()
+        self._delays: Dict[_BaseParameter, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Future] = deque()
+
+    def __enter__(self) -> '_PipelinedSweep':
+        for parameter in self.swept_parameters:
+            # a parameter may be swept in both loops of a 2D sweep
+            if parameter not in self._delays:
+                self._delays[parameter] = parameter.post_delay
+                parameter.post_delay = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='qcodes_pipelined_sweep')
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        try:
+            self._wait_for_pending()
+        except Exception:
+            # the sweep is being left because of another exception already
+            if exc_type is None:
+                raise
+            log.exception('Could not add results of the sweep to the '
+                          'dataset')
+        finally:
+            assert self._executor is not None
+            self._executor.shutdown()
+            for parameter, delay in self._delays.items():
+                parameter.post_delay = delay
+
+    def set(self, parameter: _BaseParameter, value: float) -> None:
+        t_start = time.perf_counter()
+        parameter.set(value)
+        t_set = time.perf_counter()
+        self.timings.record('set', t_set - t_start)
+        remaining = self._delays.get(parameter, 0) - (t_set - t_start)
+        if remaining > 0:
+            time.sleep(remaining)
+            self.timings.record('settle', time.perf_counter() - t_set)
+
+    def measure(self) -> OutType:
+        t_start = time.perf_counter()
+        output = super().measure()
+        self.timings.record('measure', time.perf_counter() - t_start)
+        return output
+
+    def add_result(self, *res: res_type) -> None:
+        self._submit(self._add_result, *res)
+
+    def flush_data_to_database(self) -> None:
+        # in order, after the results that are pending
+        self._submit(self.datasaver.flush_data_to_database)
+
+    def _add_result(self, *res: res_type) -> None:
+        t_start = time.perf_counter()
+        self.datasaver.add_result(*res)
+        self.timings.record('add_result', time.perf_counter() - t_start)
+
+    def _submit(self, function: Callable[..., None], *args: Any) -> None:
+        assert self._executor is not None
+        self._pending.append(self._executor.submit(function, *args))
+        # the errors of the points are raised as soon as they are known
+        while self._pending and self._pending[0].done():
+            self._pending.popleft().result()
+        if len(self._pending) > _MAX_PENDING_POINTS:
+            t_start = time.perf_counter()
+            self._pending.popleft().result()
+            self.timings.record('wait', time.perf_counter() - t_start)
+
+    def _wait_for_pending(self) -> None:
+        while self._pending:
+            self._pending.popleft().result()
+
+    def report_timings(self) -> None:
+        summary = self.timings.summary()
+        dataset = self.datasaver.dataset
+        log.info(f'Stage timings of run {dataset.run_id}: ' + ', '.join(
+            f"{stage} {timing['total']:.3g} s in {timing['count']} "
+            f"(p95 {timing['p95']:.3g} s)"
+            for stage, timing in summary.items()))
+        dataset.add_metadata('doNd_stage_timings', json.dumps(summary))
+
+
+def _sweep(datasaver: DataSaver, param_meas: Sequence[ParamMeasT],
+           swept_parameters: Sequence[_BaseParameter],
+           use_threads: bool, pipeline: bool) -> _Sweep:
+    if pipeline:
+        return _PipelinedSweep(datasaver, param_meas, swept_parameters)
+    return _Sweep(datasaver, param_meas, use_threads=use_threads)
+
+
 def do0d(
         *param_meas: ParamMeasT,
         write_period: Optional[float] = None,
-        do_plot: bool = True
+        do_plot: bool = True,
+        use_threads: bool = False
         ) -> AxesTupleListWithDataSet:
     """
     Perform a measurement of a single parameter. This is probably most
@@ -96,6 +369,8 @@ def do0d(
             database.
         do_plot: should png and pdf versions of the images be saved after the
             run.
+        use_threads: If True, the parameters of different instruments are
+            measured concurrently, each instrument in a thread of its own.
 
     Returns:
         The QCoDeS dataset.
@@ -105,7 +380,8 @@ def do0d(
     _set_write_period(meas, write_period)
 
     with meas.run() as datasaver:
-        datasaver.add_result(*_process_params_meas(param_meas))
+        datasaver.add_result(*_process_params_meas(param_meas,
+                                                   use_threads=use_threads))
         dataset = datasaver.dataset
 
     return _handle_plotting(dataset, do_plot)
@@ -120,6 +396,8 @@ def do1d(
         write_period: Optional[float] = None,
         do_plot: bool = True,
         additional_setpoints: Sequence[ParamMeasT] = tuple(),
+        use_threads: bool = False,
+        pipeline: bool = False,
         ) -> AxesTupleListWithDataSet:
     """
     Perform a 1D scan of ``param_set`` from ``start`` to ``stop`` in
@@ -146,6 +424,20 @@ def do1d(
             the measurement but not scanned.
         do_plot: should png and pdf versions of the images be saved after the
             run.
+        use_threads: If True, the parameters of different instruments are
+            measured concurrently, each instrument in a thread of its own.
+        pipeline: If True, the stages of the points overlap: the results of
+            a point are added to the dataset in a thread of their own, and
+            written to the database in background, while the next point is
+            set, settles and is measured, and the parameters of different
+            instruments are measured concurrently as with ``use_threads``.
+            The durations of the stages are logged at the end of the run,
+            and added to its metadata as ``doNd_stage_timings``. This is
+            only safe if the values that the parameters return are not
+            changed once they are returned, and if their setpoints, if any,
+            do not change with the swept parameters; the errors of adding
+            the results of a point are raised one or more points later.
+            ``write_period`` is ignored.
 
     Returns:
         The QCoDeS dataset.
@@ -162,14 +454,18 @@ def do1d(
     # do1D enforces a simple relationship between measured parameters
     # and set parameters. For anything more complicated this should be
     # reimplemented from scratch
-    with _catch_keyboard_interrupts() as interrupted, meas.run() as datasaver:
+    with _catch_keyboard_interrupts() as interrupted, \
+            meas.run(write_in_background=pipeline) as datasaver, \
+            _sweep(datasaver, param_meas, (param_set,),
+                   use_threads, pipeline) as sweep:
         additional_setpoints_data = _process_params_meas(additional_setpoints)
         for set_point in np.linspace(start, stop, num_points):
-            param_set.set(set_point)
-            datasaver.add_result((param_set, set_point),
-                                 *_process_params_meas(param_meas),
-                                 *additional_setpoints_data)
+            sweep.set(param_set, set_point)
+            sweep.add_result((param_set, set_point),
+                             *sweep.measure(),
+                             *additional_setpoints_data)
         dataset = datasaver.dataset
+    sweep.report_timings()
     return _handle_plotting(dataset, do_plot, interrupted())
 
 
@@ -188,6 +484,8 @@ def do2d(
         flush_columns: bool = False,
         do_plot: bool = True,
         additional_setpoints: Sequence[ParamMeasT] = tuple(),
+        use_threads: bool = False,
+        pipeline: bool = False,
         ) -> AxesTupleListWithDataSet:
     """
     Perform a 1D scan of ``param_set1`` from ``start1`` to ``stop1`` in
@@ -225,6 +523,20 @@ def do2d(
             the measurement but not scanned.
         do_plot: should png and pdf versions of the images be saved after the
             run.
+        use_threads: If True, the parameters of different instruments are
+            measured concurrently, each instrument in a thread of its own.
+        pipeline: If True, the stages of the points overlap: the results of
+            a point are added to the dataset in a thread of their own, and
+            written to the database in background, while the next point is
+            set, settles and is measured, and the parameters of different
+            instruments are measured concurrently as with ``use_threads``.
+            The durations of the stages are logged at the end of the run,
+            and added to its metadata as ``doNd_stage_timings``. This is
+            only safe if the values that the parameters return are not
+            changed once they are returned, and if their setpoints, if any,
+            do not change with the swept parameters; the errors of adding
+            the results of a point are raised one or more points later.
+            ``write_period`` is ignored.
 
     Returns:
         The QCoDeS dataset.
@@ -241,13 +553,16 @@ def do2d(
     param_set1.post_delay = delay1
     param_set2.post_delay = delay2
 
-    with _catch_keyboard_interrupts() as interrupted, meas.run() as datasaver:
+    with _catch_keyboard_interrupts() as interrupted, \
+            meas.run(write_in_background=pipeline) as datasaver, \
+            _sweep(datasaver, param_meas, (param_set1, param_set2),
+                   use_threads, pipeline) as sweep:
         additional_setpoints_data = _process_params_meas(additional_setpoints)
         for set_point1 in np.linspace(start1, stop1, num_points1):
             if set_before_sweep:
-                param_set2.set(start2)
+                sweep.set(param_set2, start2)
 
-            param_set1.set(set_point1)
+            sweep.set(param_set1, set_point1)
             for action in before_inner_actions:
                 action()
             for set_point2 in np.linspace(start2, stop2, num_points2):
@@ -255,16 +570,178 @@ def do2d(
                 if set_point2 == start2 and set_before_sweep:
                     pass
                 else:
-                    param_set2.set(set_point2)
+                    sweep.set(param_set2, set_point2)
 
-                datasaver.add_result((param_set1, set_point1),
-                                     (param_set2, set_point2),
-                                     *_process_params_meas(param_meas),
-                                     *additional_setpoints_data)
+                sweep.add_result((param_set1, set_point1),
+                                 (param_set2, set_point2),
+                                 *sweep.measure(),
+                                 *additional_setpoints_data)
             for action in after_inner_actions:
                 action()
             if flush_columns:
-                datasaver.flush_data_to_database()
+                sweep.flush_data_to_database()
+        dataset = datasaver.dataset
+    sweep.report_timings()
+    return _handle_plotting(dataset, do_plot, interrupted())
+
+
+def do1d_buffered(
+        sweep_setpoints: HardwareSweepSetpoints, start: float, stop: float,
+        num_points: int,
+        *param_meas: ParamMeasT,
+        enter_actions: ActionsT = (),
+        exit_actions: ActionsT = (),
+        write_period: Optional[float] = None,
+        do_plot: bool = True,
+        additional_setpoints: Sequence[ParamMeasT] = tuple(),
+        use_threads: bool = False,
+        ) -> AxesTupleListWithDataSet:
+    """
+    Perform a 1D scan of ``sweep_setpoints`` from ``start`` to ``stop`` in
+    ``num_points`` that the instrument does by itself: the sweep is armed
+    once, and the traces of the ``ParameterWithSetpoints`` in ``param_meas``
+    are fetched from the buffer of the instrument, each stored as one array
+    result. This takes one round trip to the instrument rather than one per
+    point.
+
+    Args:
+        sweep_setpoints: The setpoints that the instrument sweeps
+        start: Starting point of sweep
+        stop: End point of sweep
+        num_points: Number of points in sweep
+        *param_meas: Parameter(s) to measure or functions to call after
+          arming the sweep. The parameters with setpoints must have
+          ``sweep_setpoints`` as their only setpoints; any other parameters
+          are measured once. The functions should take no arguments. The
+          parameters and functions are called in the order they are
+          supplied.
+        enter_actions: A list of functions taking no arguments that will be
+            called before the measurements start
+        exit_actions: A list of functions taking no arguments that will be
+            called after the measurements ends
+        write_period: The time after which the data is actually written to the
+            database.
+        additional_setpoints: A list of setpoint parameters to be registered in
+            the measurement but not scanned.
+        do_plot: should png and pdf versions of the images be saved after the
+            run.
+        use_threads: If True, the parameters of different instruments are
+            measured concurrently, each instrument in a thread of its own.
+
+    Returns:
+        The QCoDeS dataset.
+    """
+    meas = Measurement()
+    all_setpoint_params = tuple(s for s in additional_setpoints)
+    _register_parameters(meas, all_setpoint_params)
+    _register_buffered_parameters(meas, sweep_setpoints, param_meas,
+                                  setpoints=all_setpoint_params)
+    _set_write_period(meas, write_period)
+    _register_actions(meas, enter_actions, exit_actions)
+    sweep_setpoints.configure_sweep(start, stop, num_points)
+
+    with _catch_keyboard_interrupts() as interrupted, meas.run() as datasaver:
+        additional_setpoints_data = _process_params_meas(additional_setpoints)
+        setpoint_values = sweep_setpoints.get()
+        datasaver.add_result(*_process_buffered_params_meas(
+                                 sweep_setpoints, setpoint_values,
+                                 _params_meas_getter(
+                                     param_meas, use_threads=use_threads)),
+                             *additional_setpoints_data)
+        dataset = datasaver.dataset
+    return _handle_plotting(dataset, do_plot, interrupted())
+
+
+def do2d_buffered(
+        param_set1: _BaseParameter, start1: float, stop1: float,
+        num_points1: int, delay1: float,
+        sweep_setpoints: HardwareSweepSetpoints, start2: float, stop2: float,
+        num_points2: int,
+        *param_meas: ParamMeasT,
+        enter_actions: ActionsT = (),
+        exit_actions: ActionsT = (),
+        before_inner_actions: ActionsT = (),
+        after_inner_actions: ActionsT = (),
+        write_period: Optional[float] = None,
+        do_plot: bool = True,
+        additional_setpoints: Sequence[ParamMeasT] = tuple(),
+        use_threads: bool = False,
+        ) -> AxesTupleListWithDataSet:
+    """
+    Perform a 2D scan of ``param_set1`` from ``start1`` to ``stop1`` in
+    ``num_points1`` in the outer loop, and of ``sweep_setpoints`` from
+    ``start2`` to ``stop2`` in ``num_points2`` in the inner loop, which the
+    instrument does by itself: at each point of the outer loop, the sweep
+    is armed once, and the traces of the ``ParameterWithSetpoints`` in
+    ``param_meas`` are fetched from the buffer of the instrument, each
+    stored as one array result. The map takes ``num_points1`` round trips to
+    the instrument rather than ``num_points1 * num_points2``.
+
+    Args:
+        param_set1: The QCoDeS parameter to sweep over in the outer loop
+        start1: Starting point of sweep in outer loop
+        stop1: End point of sweep in the outer loop
+        num_points1: Number of points to measure in the outer loop
+        delay1: Delay after setting parameter in the outer loop
+        sweep_setpoints: The setpoints that the instrument sweeps in the
+            inner loop
+        start2: Starting point of sweep in inner loop
+        stop2: End point of sweep in the inner loop
+        num_points2: Number of points to measure in the inner loop
+        *param_meas: Parameter(s) to measure or functions to call after
+          arming the sweep at each point of the outer loop. The parameters
+          with setpoints must have ``sweep_setpoints`` as their only
+          setpoints; any other parameters are measured once per point of
+          the outer loop. The functions should take no arguments. The
+          parameters and functions are called in the order they are
+          supplied.
+        enter_actions: A list of functions taking no arguments that will be
+            called before the measurements start
+        exit_actions: A list of functions taking no arguments that will be
+            called after the measurements ends
+        before_inner_actions: Actions executed before each sweep of the inner
+            loop is armed
+        after_inner_actions: Actions executed after each sweep of the inner
+            loop is measured
+        write_period: The time after which the data is actually written to the
+            database.
+        additional_setpoints: A list of setpoint parameters to be registered in
+            the measurement but not scanned.
+        do_plot: should png and pdf versions of the images be saved after the
+            run.
+        use_threads: If True, the parameters of different instruments are
+            measured concurrently, each instrument in a thread of its own.
+
+    Returns:
+        The QCoDeS dataset.
+    """
+    meas = Measurement()
+    all_setpoint_params = (param_set1,) + tuple(
+        s for s in additional_setpoints)
+    _register_parameters(meas, all_setpoint_params)
+    _register_buffered_parameters(meas, sweep_setpoints, param_meas,
+                                  setpoints=all_setpoint_params)
+    _set_write_period(meas, write_period)
+    _register_actions(meas, enter_actions, exit_actions)
+    sweep_setpoints.configure_sweep(start2, stop2, num_points2)
+
+    param_set1.post_delay = delay1
+
+    with _catch_keyboard_interrupts() as interrupted, meas.run() as datasaver:
+        additional_setpoints_data = _process_params_meas(additional_setpoints)
+        setpoint_values = sweep_setpoints.get()
+        measure = _params_meas_getter(param_meas, use_threads=use_threads)
+        for set_point1 in np.linspace(start1, stop1, num_points1):
+            param_set1.set(set_point1)
+            for action in before_inner_actions:
+                action()
+            datasaver.add_result((param_set1, set_point1),
+                                 *_process_buffered_params_meas(
+                                     sweep_setpoints, setpoint_values,
+                                     measure),
+                                 *additional_setpoints_data)
+            for action in after_inner_actions:
+                action()
         dataset = datasaver.dataset
     return _handle_plotting(dataset, do_plot, interrupted())
 
@@ -8,7 +8,6 @@ from typing import Dict, List, Optional
 import subprocess
 import json
 import logging
-import requirements
 
 if sys.version_info >= (3, 8):
     from importlib.metadata import distribution, version, PackageNotFoundError
@@ -55,6 +54,9 @@ def get_qcodes_requirements() -> List[str]:
     """
     Return a list of the names of the packages that QCoDeS requires
     """
+    # requirements is only needed here and is slow to import
+    import requirements
+
     qc_pkg = distribution('qcodes').requires
     if qc_pkg is None:
         return []
@@ -3,7 +3,51 @@
 # several parameters in parallel), we can parallelize them with threads.
 # That way the things we call need not be rewritten explicitly async.
 
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple,
+                    TYPE_CHECKING)
+
+if TYPE_CHECKING:
+    from qcodes.instrument.parameter import _BaseParameter
+
+
+# the pool is meant for waiting on instruments rather than computing, hence
+# it has more threads than there are cores, as the pools of the standard
+# library have for I/O
+_THREAD_POOL_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_THREAD_POOL_NAME_PREFIX = 'qcodes_thread_pool'
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_lock = threading.Lock()
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """
+    Return the pool of worker threads that parameters are gotten
+    concurrently with. The pool is created on first use and lives as long
+    as the process; its threads are started on demand, and are reused from
+    one call to the next.
+    """
+    global _thread_pool
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=_THREAD_POOL_MAX_WORKERS,
+                    thread_name_prefix=_THREAD_POOL_NAME_PREFIX)
+    return _thread_pool
+
+
+def _in_thread_pool() -> bool:
+    """
+    Is the current thread a worker of the thread pool? A task of the pool
+    that waited for other tasks of the pool could deadlock the pool, hence
+    such tasks run their work serially instead.
+    """
+    return threading.current_thread().name.startswith(
+        _THREAD_POOL_NAME_PREFIX)
 
 
 class RespondingThread(threading.Thread):
@@ -50,8 +94,8 @@ class RespondingThread(threading.Thread):
 
 def thread_map(callables, args=None, kwargs=None):
     """
-    Evaluate a sequence of callables in separate threads, returning
-    a list of their return values.
+    Evaluate a sequence of callables in the threads of the thread pool,
+    returning a list of their return values.
 
     Args:
         callables: A sequence of callables.
@@ -65,10 +109,83 @@ def thread_map(callables, args=None, kwargs=None):
         args = ((),) * len(callables)
     if kwargs is None:
         kwargs = ({},) * len(callables)
-    threads = [RespondingThread(target=c, args=a, kwargs=k)
+    if _in_thread_pool():
+        return [c(*a, **k) for c, a, k in zip(callables, args, kwargs)]
+
+    pool = get_thread_pool()
+    futures = [pool.submit(c, *a, **k)
                for c, a, k in zip(callables, args, kwargs)]
 
-    for t in threads:
-        t.start()
+    return [f.result() for f in futures]
+
+
+def _get_group(lock: Optional[threading.RLock],
+               getters: Sequence[Callable[[], Any]]) -> List[Any]:
+    if lock is None:
+        return [getter() for getter in getters]
+    with lock:
+        return [getter() for getter in getters]
+
+
+class ThreadPoolParamsGetter:
+    """
+    Callable that gets the given parameters concurrently with the thread
+    pool, and returns their values in the order of the parameters.
+
+    The parameters are grouped by their root instrument. The parameters of
+    one instrument are gotten one after the other, by one task that holds
+    the ``thread_lock`` of the instrument, such that the communication with
+    an instrument is never interleaved; the tasks of different instruments
+    run concurrently. The grouping is done once, on construction, hence
+    calling the getter once per point of a measurement is cheap.
+
+    Args:
+        parameters: the parameters to get
+    """
 
-    return [t.output() for t in threads]
+    def __init__(self, parameters: Sequence['_BaseParameter']) -> None:
+        self.parameters = tuple(parameters)
+
+        groups: Dict[int, Tuple[Any, List[int], List[Callable[[], Any]]]] = {}
+        for index, parameter in enumerate(self.parameters):
+            root = _root_instrument(parameter)
+            # parameters without an instrument can all be gotten concurrently
+            key = id(parameter) if root is None else id(root)
+            _, indices, getters = groups.setdefault(
+                key, (getattr(root, 'thread_lock', None), [], []))
+            indices.append(index)
+            getters.append(parameter.get)
+
+        self._groups = [(lock, tuple(indices), tuple(getters))
+                        for lock, indices, getters in groups.values()]
+
+    def __call__(self) -> List[Any]:
+        values: List[Any] = [None] * len(self.parameters)
+        if len(self._groups) <= 1 or _in_thread_pool():
+            results = [_get_group(lock, getters)
+                       for lock, _, getters in self._groups]
+        else:
+            pool = get_thread_pool()
+            futures = [pool.submit(_get_group, lock, getters)
+                       for lock, _, getters in self._groups[1:]]
+            # the calling thread would only wait otherwise, hence it gets
+            # the first group itself
+            lock, _, getters = self._groups[0]
+            results = [_get_group(lock, getters)]
+            results.extend(future.result() for future in futures)
+
+        for (_, indices, _), group_values in zip(self._groups, results):
+            for index, value in zip(indices, group_values):
+                values[index] = value
+        return values
+
+
+def _root_instrument(parameter: '_BaseParameter') -> Any:
+    """
+    The instrument that the value of a parameter comes from. For a
+    ``DelegateParameter`` that is the instrument of its source.
+    """
+    while parameter.root_instrument is None \
+            and getattr(parameter, 'source', None) is not None:
+        parameter = parameter.source  # type: ignore[attr-defined]
+    return parameter.root_instrument